@@ -9,6 +9,9 @@ from redbot.core.bot import Red
 from redbot.core.utils.menus import menu, DEFAULT_CONTROLS
 from discord.ext import tasks
 
+from .buffer import ActivityBuffer, GuildDelta
+from .storage import GLOBAL_USER, UNKNOWN_HOUR, ActivitySQLiteStore, rows_from_config, rows_from_delta
+
 log = logging.getLogger("red.asdas-cogs.activitylogger")
 
 class ActivityLogger(commands.Cog):
@@ -32,15 +35,31 @@ class ActivityLogger(commands.Cog):
             "global_hourly_vc_minutes": [0.0] * 24, # Legacy/Aggregate
         }
         self.config.register_guild(**default_guild)
+        self.config.register_global(flush_interval=60, max_pending=5000, storage_backend="config")
         
         self.vc_joins: Dict[tuple, float] = {}
         self.backtracking_guilds: Set[int] = set()
+        self.buffer = ActivityBuffer()
+        self.store: Optional[ActivitySQLiteStore] = None
+        self.max_pending = 5000
+        self._flush_lock = asyncio.Lock()
+        self._early_flush: Optional[asyncio.Task] = None
         self.cleanup_task.start()
+        self.flush_task.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.cleanup_task.cancel()
+        self.flush_task.cancel()
+        # Persist whatever is still buffered so the loss window ends at unload.
+        await self._flush_all()
+        if self.store:
+            self.store.close()
 
     async def cog_load(self):
+        if await self.config.storage_backend() == "sqlite":
+            self.store = ActivitySQLiteStore(self.bot)
+        self.max_pending = await self.config.max_pending()
+        self.flush_task.change_interval(seconds=await self.config.flush_interval())
         # Repopulate vc_joins for members already in voice channels
         now = datetime.now().timestamp()
         for guild in self.bot.guilds:
@@ -48,71 +67,167 @@ class ActivityLogger(commands.Cog):
                 for member in vc.members:
                     self.vc_joins[(guild.id, member.id)] = now
 
+    @tasks.loop(seconds=60)
+    async def flush_task(self):
+        """Write buffered message/voice counters to Config."""
+        await self._flush_all()
+
+    async def _flush_all(self):
+        for guild_id in self.buffer.guild_ids():
+            await self._flush_guild(guild_id)
+
+    async def _flush_guild(self, guild_id: int):
+        """Apply a guild's pending deltas to storage."""
+        async with self._flush_lock:
+            await self._flush_guild_locked(guild_id)
+
+    async def _flush_guild_locked(self, guild_id: int):
+        """Apply a guild's pending deltas to storage. The caller holds `_flush_lock`."""
+        delta = self.buffer.pop(guild_id)
+        if not delta:
+            return
+        if not self.store:
+            try:
+                await self._write_delta(guild_id, delta)
+            except Exception:
+                log.exception("Failed to flush activity for guild %s, will retry", guild_id)
+                self.buffer.restore(guild_id, delta)
+            return
+        try:
+            await self.store.add_rows(guild_id, rows_from_delta(delta))
+        except Exception:
+            log.exception("Failed to flush activity for guild %s, will retry", guild_id)
+            self.buffer.restore(guild_id, delta)
+            return
+        # Daily history is in SQLite, Config only keeps hourly aggregates and streaks
+        try:
+            await self._write_delta(guild_id, delta, daily=False)
+        except Exception:
+            log.exception("Failed to flush activity metadata for guild %s", guild_id)
+
+    async def _write_delta(self, guild_id: int, delta: GuildDelta, daily: bool = True):
+        """Apply a delta to a copy of the guild's Config and save it in one write, so a failure
+        halfway through saves nothing and the delta can be retried as a whole."""
+        conf_group = self.config.guild_from_id(guild_id)
+        conf = await conf_group.all()
+        self._apply_delta(conf, delta, daily=daily)
+        await conf_group.set(conf)
+
+    def _schedule_early_flush(self):
+        if self._early_flush is None or self._early_flush.done():
+            self._early_flush = asyncio.create_task(self._flush_all())
+
+    def _apply_delta(self, conf: dict, delta: GuildDelta, daily: bool = True):
+        users = conf.setdefault("users", {})
+        gdm = conf.setdefault("global_daily_messages", {})
+        ghm = conf.setdefault("global_hourly_messages", [0] * 24)
+        gdhm = conf.setdefault("global_daily_hourly_messages", {})
+        gdvc = conf.setdefault("global_daily_vc_minutes", {})
+        ghvc = conf.setdefault("global_hourly_vc_minutes", [0.0] * 24)
+        gdhvc = conf.setdefault("global_daily_hourly_vc_minutes", {})
+        active_days: Dict[str, Set[str]] = {}
+
+        for u_id in delta.touched:
+            users.setdefault(u_id, self._get_user_template())
+
+        for (u_id, d_str, hour), count in delta.messages.items():
+            u_data = users.setdefault(u_id, self._get_user_template())
+            u_data.setdefault("hourly_messages", [0] * 24)[hour] += count
+            active_days.setdefault(u_id, set()).add(d_str)
+            ghm[hour] += count
+            if daily:
+                u_data["daily_messages"][d_str] = u_data["daily_messages"].get(d_str, 0) + count
+                gdm[d_str] = gdm.get(d_str, 0) + count
+                gdhm.setdefault(d_str, [0] * 24)[hour] += count
+
+        for (u_id, d_str, hour), mins in delta.vc_minutes.items():
+            u_data = users.setdefault(u_id, self._get_user_template())
+            u_data.setdefault("hourly_vc_minutes", [0.0] * 24)[hour] += mins
+            active_days.setdefault(u_id, set()).add(d_str)
+            ghvc[hour] += mins
+            if daily:
+                u_data["daily_vc_minutes"][d_str] = u_data["daily_vc_minutes"].get(d_str, 0.0) + mins
+                gdvc[d_str] = gdvc.get(d_str, 0.0) + mins
+                gdhvc.setdefault(d_str, [0.0] * 24)[hour] += mins
+
+        # Replay streaks in date order, same as if each event had been written live
+        for u_id, days in active_days.items():
+            for d_str in sorted(days):
+                self._update_streak(users[u_id], date.fromisoformat(d_str))
+
     @tasks.loop(hours=24)
     async def cleanup_task(self):
         """Daily task to anonymize/purge data older than 1 year, and remove users who left 30+ days ago."""
-        all_guilds = await self.config.all_guilds()
         now_date = date.today()
         purge_cutoff = now_date - timedelta(days=365) # 1 year
         leave_cutoff = now_date - timedelta(days=30)
         
-        for guild_id, settings in all_guilds.items():
-            guild = self.bot.get_guild(int(guild_id))
-            users = settings.get("users", {})
-            changed = False
-            to_delete = []
+        for guild_id in await self.config.all_guilds():
+            # Read, purge and write back under the flush lock, so no flush lands in between
+            # and gets overwritten by the stale copy
+            async with self._flush_lock:
+                await self._flush_guild_locked(int(guild_id))
+                settings = await self.config.guild_from_id(guild_id).all()
+                guild = self.bot.get_guild(int(guild_id))
+                users = settings.get("users", {})
+                changed = False
+                to_delete = []
             
-            for u_id, u_data in users.items():
-                if guild:
-                    member = guild.get_member(int(u_id))
-                    if not member:
-                        left_at_str = u_data.get("left_at")
-                        if left_at_str:
-                            if date.fromisoformat(left_at_str) < leave_cutoff:
-                                to_delete.append(u_id)
-                                continue
-                        else:
-                            last_active_str = u_data.get("last_active")
-                            if last_active_str and date.fromisoformat(last_active_str) < leave_cutoff:
-                                to_delete.append(u_id)
-                                continue
+                for u_id, u_data in users.items():
+                    if guild:
+                        member = guild.get_member(int(u_id))
+                        if not member:
+                            left_at_str = u_data.get("left_at")
+                            if left_at_str:
+                                if date.fromisoformat(left_at_str) < leave_cutoff:
+                                    to_delete.append(u_id)
+                                    continue
                             else:
-                                u_data["left_at"] = now_date.isoformat()
-                                changed = True
-                    elif u_data.get("left_at"):
-                        u_data["left_at"] = None
+                                last_active_str = u_data.get("last_active")
+                                if last_active_str and date.fromisoformat(last_active_str) < leave_cutoff:
+                                    to_delete.append(u_id)
+                                    continue
+                                else:
+                                    u_data["left_at"] = now_date.isoformat()
+                                    changed = True
+                        elif u_data.get("left_at"):
+                            u_data["left_at"] = None
+                            changed = True
+
+                    daily_msgs = u_data.get("daily_messages", {})
+                    old_keys = [d for d in daily_msgs if date.fromisoformat(d) < purge_cutoff]
+                    if old_keys:
+                        for k in old_keys: del daily_msgs[k]
                         changed = True
-
-                daily_msgs = u_data.get("daily_messages", {})
-                old_keys = [d for d in daily_msgs if date.fromisoformat(d) < purge_cutoff]
-                if old_keys:
-                    for k in old_keys: del daily_msgs[k]
-                    changed = True
                 
-                daily_vc = u_data.get("daily_vc_minutes", {})
-                old_vc_keys = [d for d in daily_vc if date.fromisoformat(d) < purge_cutoff]
-                if old_vc_keys:
-                    for k in old_vc_keys: del daily_vc[k]
-                    changed = True
+                    daily_vc = u_data.get("daily_vc_minutes", {})
+                    old_vc_keys = [d for d in daily_vc if date.fromisoformat(d) < purge_cutoff]
+                    if old_vc_keys:
+                        for k in old_vc_keys: del daily_vc[k]
+                        changed = True
             
-            for u_id in to_delete:
-                del users[u_id]
-                changed = True
-
-            for key in ["global_daily_messages", "global_daily_vc_minutes", "global_daily_hourly_messages", "global_daily_hourly_vc_minutes"]:
-                data = settings.get(key, {})
-                old_keys = [d for d in data if date.fromisoformat(d) < purge_cutoff]
-                if old_keys:
-                    for k in old_keys: del data[k]
+                for u_id in to_delete:
+                    del users[u_id]
                     changed = True
 
-            if changed:
-                await self.config.guild_from_id(guild_id).users.set(users)
-                guild_conf = self.config.guild_from_id(guild_id)
-                await guild_conf.global_daily_messages.set(settings.get("global_daily_messages", {}))
-                await guild_conf.global_daily_vc_minutes.set(settings.get("global_daily_vc_minutes", {}))
-                await guild_conf.global_daily_hourly_messages.set(settings.get("global_daily_hourly_messages", {}))
-                await guild_conf.global_daily_hourly_vc_minutes.set(settings.get("global_daily_hourly_vc_minutes", {}))
+                for key in ["global_daily_messages", "global_daily_vc_minutes", "global_daily_hourly_messages", "global_daily_hourly_vc_minutes"]:
+                    data = settings.get(key, {})
+                    old_keys = [d for d in data if date.fromisoformat(d) < purge_cutoff]
+                    if old_keys:
+                        for k in old_keys: del data[k]
+                        changed = True
+
+                if self.store:
+                    await self.store.purge_before(int(guild_id), purge_cutoff.isoformat())
+                    await self.store.delete_users(int(guild_id), to_delete)
+
+                if changed:
+                    await self.config.guild_from_id(guild_id).users.set(users)
+                    guild_conf = self.config.guild_from_id(guild_id)
+                    await guild_conf.global_daily_messages.set(settings.get("global_daily_messages", {}))
+                    await guild_conf.global_daily_vc_minutes.set(settings.get("global_daily_vc_minutes", {}))
+                    await guild_conf.global_daily_hourly_messages.set(settings.get("global_daily_hourly_messages", {}))
+                    await guild_conf.global_daily_hourly_vc_minutes.set(settings.get("global_daily_hourly_vc_minutes", {}))
 
     @cleanup_task.before_loop
     async def before_cleanup_task(self):
@@ -167,30 +282,19 @@ class ActivityLogger(commands.Cog):
         prefixes = await self.bot.get_valid_prefixes(message.guild)
         if any(message.content.startswith(p) for p in prefixes): return
 
-        u_id = str(message.author.id)
         now = datetime.now()
-        today_str = now.date().isoformat()
-        hour = now.hour
-
-        async with self.config.guild(message.guild).all() as conf:
-            users = conf.setdefault("users", {})
-            u_data = users.setdefault(u_id, self._get_user_template())
-            u_data["daily_messages"][today_str] = u_data["daily_messages"].get(today_str, 0) + 1
-            u_data.setdefault("hourly_messages", [0] * 24)[hour] += 1
-            self._update_streak(u_data, now.date())
-            
-            gdm = conf.setdefault("global_daily_messages", {})
-            gdm[today_str] = gdm.get(today_str, 0) + 1
-            ghm = conf.setdefault("global_hourly_messages", [0] * 24)
-            ghm[hour] += 1
-            gdhm = conf.setdefault("global_daily_hourly_messages", {})
-            gdhm.setdefault(today_str, [0] * 24)[hour] += 1
+        self.buffer.add_message(message.guild.id, str(message.author.id), now.date().isoformat(), now.hour)
+        if len(self.buffer) >= self.max_pending:
+            self._schedule_early_flush()
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
-        async with self.config.guild(member.guild).users() as users:
-            if str(member.id) in users:
-                users[str(member.id)]["left_at"] = date.today().isoformat()
+        async with self._flush_lock:
+            # Apply activity buffered before the leave first, it clears left_at
+            await self._flush_guild_locked(member.guild.id)
+            async with self.config.guild(member.guild).users() as users:
+                if str(member.id) in users:
+                    users[str(member.id)]["left_at"] = date.today().isoformat()
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -209,26 +313,35 @@ class ActivityLogger(commands.Cog):
 
         if before.channel is None and after.channel is not None:
             self.vc_joins[(guild.id, member.id)] = now.timestamp()
-            async with self.config.guild(guild).users() as users:
-                users.setdefault(u_id, self._get_user_template())
+            self.buffer.touch(guild.id, u_id)
 
         elif before.channel is not None and after.channel is None:
             join_time = self.vc_joins.pop((guild.id, member.id), None)
             if join_time:
                 mins = (now.timestamp() - join_time) / 60
-                async with self.config.guild(guild).all() as conf:
-                    users = conf.setdefault("users", {})
-                    u_data = users.setdefault(u_id, self._get_user_template())
-                    u_data["daily_vc_minutes"][today_str] = u_data["daily_vc_minutes"].get(today_str, 0.0) + mins
-                    u_data.setdefault("hourly_vc_minutes", [0.0] * 24)[hour] += mins
-                    self._update_streak(u_data, now.date())
-                    
-                    gdvc = conf.setdefault("global_daily_vc_minutes", {})
-                    gdvc[today_str] = gdvc.get(today_str, 0.0) + mins
-                    ghvc = conf.setdefault("global_hourly_vc_minutes", [0.0] * 24)
-                    ghvc[hour] += mins
-                    gdhvc = conf.setdefault("global_daily_hourly_vc_minutes", {})
-                    gdhvc.setdefault(today_str, [0.0] * 24)[hour] += mins
+                self.buffer.add_vc_minutes(guild.id, u_id, today_str, hour, mins)
+        if len(self.buffer) >= self.max_pending:
+            self._schedule_early_flush()
+
+    async def _guild_data(self, guild: discord.Guild, after: Optional[str] = None, users: bool = True) -> Dict[str, Any]:
+        """Guild document including daily history, whichever storage backend holds it.
+
+        With SQLite only days after `after` (and only guild-wide history unless `users`) are loaded,
+        so callers must still filter to their own period.
+        """
+        await self._flush_guild(guild.id)
+        conf = await self.config.guild(guild).all()
+        if self.store:
+            await self.store.hydrate(guild.id, conf, after=after, users=users)
+        return conf
+
+    def _period_bounds(self, months: int, start_offset_months: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        """(after, until) ISO bounds matching _get_period_data, None meaning unbounded."""
+        if months <= 0 and start_offset_months == 0: return None, None
+        today = date.today()
+        until = (today - timedelta(days=start_offset_months * 30)).isoformat()
+        after = (today - timedelta(days=(start_offset_months + months) * 30)).isoformat() if months > 0 else None
+        return after, until
 
     def _get_period_data(self, daily_dict: Dict[str, Any], months: int, start_offset_months: int = 0) -> Dict[str, Any]:
         if months <= 0 and start_offset_months == 0: return daily_dict
@@ -276,9 +389,12 @@ class ActivityLogger(commands.Cog):
             if not (is_owner or is_admin or has_staff_role):
                 return await ctx.send("❌ You do not have permission to view other users' statistics.")
 
+        await self._flush_guild(ctx.guild.id)
         users = await self.config.guild(ctx.guild).users()
         data = users.get(str(member.id))
         if not data: return await ctx.send("No data.")
+        if self.store:
+            data["daily_messages"], data["daily_vc_minutes"] = await self.store.user_daily(ctx.guild.id, member.id)
         
         view = ActivityUserStatsView(self, ctx, member, data)
         await view.start()
@@ -286,7 +402,8 @@ class ActivityLogger(commands.Cog):
     @activity.command(name="trends")
     async def activity_trends(self, ctx, months: int = 0):
         """View global server trends."""
-        conf = await self.config.guild(ctx.guild).all()
+        after, _ = self._period_bounds(months)
+        conf = await self._guild_data(ctx.guild, after=after, users=False)
         period_msgs = self._get_period_data(conf["global_daily_messages"], months)
         global_hourly = conf["global_hourly_messages"]
         
@@ -304,14 +421,18 @@ class ActivityLogger(commands.Cog):
     @activity.command(name="leaderboard", aliases=["lb", "top"])
     async def activity_leaderboard(self, ctx, sort_by: str = "messages", months: int = 0):
         """Paginated leaderboard for active members."""
-        users = await self.config.guild(ctx.guild).users()
-        leaderboard = []
-        for u_id, u_data in users.items():
-            p_data = self._get_period_data(u_data.get("daily_messages" if sort_by in ["messages", "msgs"] else "daily_vc_minutes", {}), months)
-            score = sum(p_data.values())
-            if score > 0: leaderboard.append((int(u_id), score))
-        
-        leaderboard.sort(key=lambda x: x[1], reverse=True)
+        await self._flush_guild(ctx.guild.id)
+        if self.store:
+            after, until = self._period_bounds(months)
+            leaderboard = await self.store.top_users(ctx.guild.id, "messages" if sort_by in ["messages", "msgs"] else "vc_minutes", after, until)
+        else:
+            users = await self.config.guild(ctx.guild).users()
+            leaderboard = []
+            for u_id, u_data in users.items():
+                p_data = self._get_period_data(u_data.get("daily_messages" if sort_by in ["messages", "msgs"] else "daily_vc_minutes", {}), months)
+                score = sum(p_data.values())
+                if score > 0: leaderboard.append((int(u_id), score))
+            leaderboard.sort(key=lambda x: x[1], reverse=True)
         if not leaderboard: return await ctx.send("No data.")
 
         pages = []
@@ -325,6 +446,7 @@ class ActivityLogger(commands.Cog):
     @checks.admin_or_permissions(manage_guild=True)
     async def activity_inactive(self, ctx, days: int = 30):
         """Find members inactive for X+ days."""
+        await self._flush_guild(ctx.guild.id)
         users = await self.config.guild(ctx.guild).users()
         cutoff = date.today() - timedelta(days=days)
         inactive = [f"• {ctx.guild.get_member(int(uid)).mention} (Last: {data.get('last_active', 'Never')})" for uid, data in users.items() if ctx.guild.get_member(int(uid)) and (not data.get('last_active') or date.fromisoformat(data['last_active']) < cutoff)]
@@ -335,9 +457,9 @@ class ActivityLogger(commands.Cog):
     @activity.command(name="retention")
     async def activity_retention(self, ctx):
         """View server-wide retention."""
-        users = await self.config.guild(ctx.guild).users()
         t = date.today()
         m1, m2 = t - timedelta(days=30), t - timedelta(days=60)
+        users = (await self._guild_data(ctx.guild, after=(m2 - timedelta(days=1)).isoformat()))["users"]
         a1 = {uid for uid, d in users.items() if any(date.fromisoformat(ds) >= m1 for ds in d.get("daily_messages", {}))}
         a2 = {uid for uid, d in users.items() if any(m2 <= date.fromisoformat(ds) < m1 for ds in d.get("daily_messages", {}))}
         rate = (len(a1 & a2) / len(a2) * 100) if a2 else 0
@@ -349,7 +471,10 @@ class ActivityLogger(commands.Cog):
         """DANGEROUS: Wipe all activity data."""
         if not confirm:
             return await ctx.send("⚠️ Use `[p]activity resetall true` to confirm.")
+        self.buffer.discard(ctx.guild.id)
         await self.config.guild(ctx.guild).clear()
+        if self.store:
+            await self.store.delete_guild(ctx.guild.id)
         await ctx.send("✅ Data wiped.")
 
     @activity.command(name="resetbacktrack")
@@ -359,6 +484,66 @@ class ActivityLogger(commands.Cog):
         await self.config.guild(ctx.guild).backtracked_channels.set([])
         await ctx.send("✅ Backtrack reset.")
 
+    @activity.command(name="flushinterval")
+    @checks.is_owner()
+    async def activity_flush_interval(self, ctx, seconds: Optional[int] = None, max_pending: Optional[int] = None):
+        """Set how often buffered activity is written to storage, and how many pending entries force an early write."""
+        if seconds is None:
+            return await ctx.send(f"Flushing every **{int(self.flush_task.seconds)}s**, or early at **{self.max_pending}** pending entries ({len(self.buffer)} pending now).")
+        if seconds < 5 or seconds > 3600:
+            return await ctx.send("❌ Interval must be between 5 and 3600 seconds.")
+        await self.config.flush_interval.set(seconds)
+        self.flush_task.change_interval(seconds=seconds)
+        if max_pending is not None:
+            self.max_pending = max(1, max_pending)
+            await self.config.max_pending.set(self.max_pending)
+        await ctx.send(f"✅ Flushing every **{seconds}s** (early at {self.max_pending} pending entries).")
+
+    @activity.command(name="storage")
+    @checks.is_owner()
+    async def activity_storage(self, ctx, backend: Optional[str] = None):
+        """Show or switch where daily history is stored (`config` or `sqlite`). Switching migrates existing data."""
+        current = "sqlite" if self.store else "config"
+        if backend is None:
+            return await ctx.send(f"Daily activity history is stored in **{current}**.")
+        backend = backend.lower()
+        if backend not in ("config", "sqlite"):
+            return await ctx.send("❌ Backend must be `config` or `sqlite`.")
+        if backend == current:
+            return await ctx.send(f"Already using **{current}**.")
+
+        msg = await ctx.send(f"🔄 Migrating activity history to {backend}...")
+        await self._flush_all()
+        async with self._flush_lock:
+            all_guilds = await self.config.all_guilds()
+            if backend == "sqlite":
+                store = ActivitySQLiteStore(self.bot)
+                for guild_id, settings in all_guilds.items():
+                    await store.replace_guild(int(guild_id), rows_from_config(settings))
+                # History now lives in SQLite, drop it from the Config blob
+                for guild_id, settings in all_guilds.items():
+                    async with self.config.guild_from_id(guild_id).all() as conf:
+                        for u_data in conf.get("users", {}).values():
+                            u_data["daily_messages"], u_data["daily_vc_minutes"] = {}, {}
+                        for key in ["global_daily_messages", "global_daily_vc_minutes", "global_daily_hourly_messages", "global_daily_hourly_vc_minutes"]:
+                            conf[key] = {}
+                self.store = store
+            else:
+                for guild_id, settings in all_guilds.items():
+                    await self.store.hydrate(int(guild_id), settings)
+                    async with self.config.guild_from_id(guild_id).all() as conf:
+                        for u_id, u_data in conf.get("users", {}).items():
+                            hydrated = settings["users"].get(u_id, {})
+                            u_data["daily_messages"] = hydrated.get("daily_messages", {})
+                            u_data["daily_vc_minutes"] = hydrated.get("daily_vc_minutes", {})
+                        for key in ["global_daily_messages", "global_daily_vc_minutes", "global_daily_hourly_messages", "global_daily_hourly_vc_minutes"]:
+                            conf[key] = settings[key]
+                    await self.store.delete_guild(int(guild_id))
+                self.store.close()
+                self.store = None
+            await self.config.storage_backend.set(backend)
+        await msg.edit(content=f"✅ Migrated {len(all_guilds)} guild(s) to **{backend}**.")
+
     @activity.command(name="dashboard", aliases=["dash", "all"])
     async def activity_dashboard(self, ctx):
         """Interactive dashboard."""
@@ -428,19 +613,25 @@ class ActivityLogger(commands.Cog):
                         count += 1
 
                     if count > 0:
+                        if self.store:
+                            rows = [(int(uid), ds, UNKNOWN_HOUR, c, 0.0) for uid, data in temp_u.items() for ds, c in data["daily"].items()]
+                            rows += [(GLOBAL_USER, ds, h, hrs[h], 0.0) for ds, hrs in temp_global_hourly_daily.items() for h in range(24) if hrs[h]]
+                            await self.store.add_rows(guild.id, rows)
                         async with self.config.guild(guild).all() as conf:
-                            g_daily = conf.setdefault("global_daily_messages", {})
-                            for ds, c in temp_global_daily.items(): g_daily[ds] = g_daily.get(ds, 0) + c
                             g_hourly = conf.setdefault("global_hourly_messages", [0]*24)
                             for h in range(24): g_hourly[h] += temp_global_agg_hourly[h]
-                            g_dh = conf.setdefault("global_daily_hourly_messages", {})
-                            for ds, hrs in temp_global_hourly_daily.items():
-                                curr = g_dh.setdefault(ds, [0]*24)
-                                for h in range(24): curr[h] += hrs[h]
+                            if not self.store:
+                                g_daily = conf.setdefault("global_daily_messages", {})
+                                for ds, c in temp_global_daily.items(): g_daily[ds] = g_daily.get(ds, 0) + c
+                                g_dh = conf.setdefault("global_daily_hourly_messages", {})
+                                for ds, hrs in temp_global_hourly_daily.items():
+                                    curr = g_dh.setdefault(ds, [0]*24)
+                                    for h in range(24): curr[h] += hrs[h]
                             users = conf.setdefault("users", {})
                             for uid, data in temp_u.items():
                                 ud = users.setdefault(uid, self._get_user_template())
-                                for ds, c in data["daily"].items(): ud["daily_messages"][ds] = ud["daily_messages"].get(ds, 0) + c
+                                if not self.store:
+                                    for ds, c in data["daily"].items(): ud["daily_messages"][ds] = ud["daily_messages"].get(ds, 0) + c
                                 if "hourly_messages" not in ud: ud["hourly_messages"] = [0]*24
                                 for h in range(24): ud["hourly_messages"][h] += data["hourly"][h]
                                 lb = max(data["daily"].keys())
@@ -480,10 +671,13 @@ class ActivityDashboardView(discord.ui.View):
         return False
 
     async def make_embed(self):
-        conf = await self.cog.config.guild(self.ctx.guild).all()
-        users, t, stats_months = conf.get("users", {}), date.today(), self.months
+        t, stats_months = date.today(), self.months
         ret_map = {1:(0,1,1,1), 3:(0,3,3,3), 6:(3,3,6,3), 9:(6,3,9,3), 0:(0,1,1,1)}
         r_off, r_win, p_off, p_win = ret_map[self.months]
+        # The previous retention window reaches furthest back, nothing older is needed
+        after = (t - timedelta(days=(p_off+p_win)*30 + 1)).isoformat() if self.months else None
+        conf = await self.cog._guild_data(self.ctx.guild, after=after)
+        users = conf.get("users", {})
         
         p_msgs = self.cog._get_period_data(conf["global_daily_messages"], stats_months, 0)
         total_msgs, total_vc = sum(p_msgs.values()), sum(self.cog._get_period_data(conf["global_daily_vc_minutes"], stats_months, 0).values())
@@ -505,7 +699,11 @@ class ActivityDashboardView(discord.ui.View):
             retention, ret_label, ret_active_count = (len(active_ever) / self.ctx.guild.member_count * 100) if self.ctx.guild.member_count else 0, "Total Participation", len(active_ever)
         else:
             m_curr_end, m_prev_end = t - timedelta(days=(r_off+r_win)*30), t - timedelta(days=(p_off+p_win)*30)
-            oldest = min([date.fromisoformat(d) for d in conf.get("global_daily_messages", {}).keys()]) if conf.get("global_daily_messages") else t
+            if self.cog.store:
+                first_day = await self.cog.store.first_day(self.ctx.guild.id)
+            else:
+                first_day = min(conf.get("global_daily_messages", {}), default=None)
+            oldest = date.fromisoformat(first_day) if first_day else t
             if oldest > m_prev_end: coverage_warning = "\n⚠️ Partial history"
             a_now, a_prev = set(), set()
             for uid, d in users.items():
@@ -0,0 +1,87 @@
+from collections import Counter
+from typing import Dict, Optional, Set, Tuple
+
+# (user_id, date_str, hour) -> amount
+DeltaKey = Tuple[str, str, int]
+
+
+class GuildDelta:
+    """Pending, not yet persisted activity for a single guild."""
+
+    __slots__ = ("messages", "vc_minutes", "touched")
+
+    def __init__(self):
+        self.messages: Counter = Counter()
+        self.vc_minutes: Counter = Counter()
+        self.touched: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.messages) + len(self.vc_minutes) + len(self.touched)
+
+    def merge(self, other: "GuildDelta"):
+        self.messages.update(other.messages)
+        self.vc_minutes.update(other.vc_minutes)
+        self.touched |= other.touched
+
+
+class ActivityBuffer:
+    """
+    Write-behind buffer for activity counters.
+
+    Listeners record deltas here in O(1); the cog periodically swaps a guild's delta
+    out and applies it to Config in a single `all()` transaction.
+    """
+
+    def __init__(self):
+        self._guilds: Dict[int, GuildDelta] = {}
+        # Sum of len() of all guild deltas, kept up to date so the listeners can check it in O(1)
+        self._pending = 0
+
+    def _delta(self, guild_id: int) -> GuildDelta:
+        delta = self._guilds.get(guild_id)
+        if delta is None:
+            delta = self._guilds[guild_id] = GuildDelta()
+        return delta
+
+    def add_message(self, guild_id: int, user_id: str, date_str: str, hour: int, count: int = 1):
+        messages = self._delta(guild_id).messages
+        key = (user_id, date_str, hour)
+        if key not in messages:
+            self._pending += 1
+        messages[key] += count
+
+    def add_vc_minutes(self, guild_id: int, user_id: str, date_str: str, hour: int, mins: float):
+        vc_minutes = self._delta(guild_id).vc_minutes
+        key = (user_id, date_str, hour)
+        if key not in vc_minutes:
+            self._pending += 1
+        vc_minutes[key] += mins
+
+    def touch(self, guild_id: int, user_id: str):
+        """Make sure a user record exists on the next flush."""
+        touched = self._delta(guild_id).touched
+        if user_id not in touched:
+            self._pending += 1
+            touched.add(user_id)
+
+    def guild_ids(self):
+        return list(self._guilds)
+
+    def pop(self, guild_id: int) -> Optional[GuildDelta]:
+        delta = self._guilds.pop(guild_id, None)
+        if delta is not None:
+            self._pending -= len(delta)
+        return delta
+
+    def restore(self, guild_id: int, delta: GuildDelta):
+        """Put a delta back after a failed flush so it is retried next time."""
+        current = self._delta(guild_id)
+        before = len(current)
+        current.merge(delta)
+        self._pending += len(current) - before
+
+    def discard(self, guild_id: int):
+        self.pop(guild_id)
+
+    def __len__(self) -> int:
+        return self._pending
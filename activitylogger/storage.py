@@ -0,0 +1,225 @@
+import concurrent.futures
+import functools
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
+
+# Rows with this user id hold the guild-wide aggregate (the old global_daily_* maps).
+GLOBAL_USER = 0
+# Per-user history migrated from Config has no hour information.
+UNKNOWN_HOUR = -1
+
+# (user_id, day, hour, messages, vc_minutes)
+Row = Tuple[int, str, int, int, float]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activity (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0,
+    vc_minutes REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, user_id, day, hour)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS activity_guild_day ON activity (guild_id, day);
+"""
+
+UPSERT = """
+INSERT INTO activity (guild_id, user_id, day, hour, messages, vc_minutes) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (guild_id, user_id, day, hour) DO UPDATE SET
+    messages = messages + excluded.messages,
+    vc_minutes = vc_minutes + excluded.vc_minutes
+"""
+
+
+class ActivitySQLiteStore:
+    """
+    Indexed SQLite storage for ActivityLogger history.
+
+    Every call runs on a single-thread executor (same approach as vexutils' PandasSQLiteDriver)
+    so the event loop never blocks on disk and writes are serialised.
+    """
+
+    def __init__(self, bot: Red, cog_name: str = "ActivityLogger", filename: str = "activity.db"):
+        self.bot = bot
+        self.sql_executor = concurrent.futures.ThreadPoolExecutor(1, f"{cog_name.lower()}_sql")
+        self.sql_path = str(cog_data_path(raw_name=cog_name) / filename)
+        # Opened on the executor thread by the first call and reused by every later one
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.sql_path)
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def _disconnect(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _run(self, func, *args):
+        return await self.bot.loop.run_in_executor(self.sql_executor, functools.partial(func, *args))
+
+    def close(self):
+        # Queued after any pending calls, shutdown(wait=False) still runs it
+        self.sql_executor.submit(self._disconnect)
+        self.sql_executor.shutdown(wait=False)
+
+    # --- writes ---
+
+    def _add_rows(self, guild_id: int, rows: List[Row]):
+        with self._connect() as connection:
+            connection.executemany(UPSERT, [(guild_id, *row) for row in rows])
+
+    def _replace_guild(self, guild_id: int, rows: List[Row]):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM activity WHERE guild_id = ?", (guild_id,))
+            connection.executemany(UPSERT, [(guild_id, *row) for row in rows])
+
+    def _delete(self, query: str, params: Iterable):
+        with self._connect() as connection:
+            connection.executemany(query, params)
+
+    async def add_rows(self, guild_id: int, rows: List[Row]):
+        """Add message/voice amounts onto existing (user, day, hour) rows."""
+        if rows:
+            await self._run(self._add_rows, guild_id, rows)
+
+    async def replace_guild(self, guild_id: int, rows: List[Row]):
+        """Replace all of a guild's rows. Used by the Config migration, so it can be rerun safely."""
+        await self._run(self._replace_guild, guild_id, rows)
+
+    async def purge_before(self, guild_id: int, cutoff: str):
+        await self._run(self._delete, "DELETE FROM activity WHERE guild_id = ? AND day < ?", [(guild_id, cutoff)])
+
+    async def delete_users(self, guild_id: int, user_ids: Iterable[int]):
+        params = [(guild_id, int(u)) for u in user_ids]
+        if params:
+            await self._run(self._delete, "DELETE FROM activity WHERE guild_id = ? AND user_id = ?", params)
+
+    async def delete_guild(self, guild_id: int):
+        await self._run(self._delete, "DELETE FROM activity WHERE guild_id = ?", [(guild_id,)])
+
+    # --- reads ---
+
+    def _fetch(self, query: str, params: tuple) -> list:
+        return self._connect().execute(query, params).fetchall()
+
+    async def top_users(
+        self, guild_id: int, column: str, after: Optional[str] = None, until: Optional[str] = None
+    ) -> List[Tuple[int, float]]:
+        """(user_id, total) with total > 0 for days in (after, until], highest first."""
+        if column not in ("messages", "vc_minutes"):
+            raise ValueError(column)
+        query = f"SELECT user_id, SUM({column}) AS total FROM activity WHERE guild_id = ? AND user_id != ?"
+        params = [guild_id, GLOBAL_USER]
+        if after:
+            query += " AND day > ?"
+            params.append(after)
+        if until:
+            query += " AND day <= ?"
+            params.append(until)
+        query += " GROUP BY user_id HAVING total > 0 ORDER BY total DESC"
+        return await self._run(self._fetch, query, tuple(params))
+
+    async def user_daily(self, guild_id: int, user_id: int) -> Tuple[Dict[str, int], Dict[str, float]]:
+        rows = await self._run(
+            self._fetch,
+            "SELECT day, SUM(messages), SUM(vc_minutes) FROM activity WHERE guild_id = ? AND user_id = ? GROUP BY day",
+            (guild_id, int(user_id)),
+        )
+        return {d: m for d, m, _ in rows if m}, {d: v for d, _, v in rows if v}
+
+    async def first_day(self, guild_id: int) -> Optional[str]:
+        """Oldest day with guild-wide messages, None if there are none."""
+        rows = await self._run(
+            self._fetch,
+            "SELECT MIN(day) FROM activity WHERE guild_id = ? AND user_id = ? AND messages > 0",
+            (guild_id, GLOBAL_USER),
+        )
+        return rows[0][0]
+
+    async def hydrate(self, guild_id: int, conf: dict, after: Optional[str] = None, users: bool = True):
+        """Fill a Config-shaped guild dict with the daily history kept in SQLite.
+
+        Only days after `after` are loaded if given, and only the guild-wide maps unless `users`.
+        """
+        query = "SELECT user_id, day, hour, messages, vc_minutes FROM activity WHERE guild_id = ?"
+        params = [guild_id]
+        if after:
+            query += " AND day > ?"
+            params.append(after)
+        if not users:
+            query += " AND user_id = ?"
+            params.append(GLOBAL_USER)
+        rows = await self._run(self._fetch, query, tuple(params))
+        conf_users = conf.setdefault("users", {})
+        gdm, gdvc = {}, {}
+        gdhm, gdhvc = {}, {}
+        for user_id, day, hour, msgs, vc in rows:
+            if user_id == GLOBAL_USER:
+                daily_msgs, daily_vc = gdm, gdvc
+                if hour != UNKNOWN_HOUR:
+                    if msgs:
+                        gdhm.setdefault(day, [0] * 24)[hour] += msgs
+                    if vc:
+                        gdhvc.setdefault(day, [0.0] * 24)[hour] += vc
+            else:
+                u_data = conf_users.get(str(user_id))
+                if u_data is None:
+                    continue
+                daily_msgs = u_data.setdefault("daily_messages", {})
+                daily_vc = u_data.setdefault("daily_vc_minutes", {})
+            if msgs:
+                daily_msgs[day] = daily_msgs.get(day, 0) + msgs
+            if vc:
+                daily_vc[day] = daily_vc.get(day, 0.0) + vc
+        conf["global_daily_messages"] = gdm
+        conf["global_daily_vc_minutes"] = gdvc
+        conf["global_daily_hourly_messages"] = gdhm
+        conf["global_daily_hourly_vc_minutes"] = gdhvc
+
+
+def rows_from_config(conf: dict) -> List[Row]:
+    """Convert a Config guild document's daily maps into SQLite rows."""
+    rows: List[Row] = []
+    for u_id, u_data in conf.get("users", {}).items():
+        msgs = u_data.get("daily_messages", {})
+        vc = u_data.get("daily_vc_minutes", {})
+        for day in set(msgs) | set(vc):
+            rows.append((int(u_id), day, UNKNOWN_HOUR, msgs.get(day, 0), vc.get(day, 0.0)))
+
+    for daily_key, hourly_key, idx in (
+        ("global_daily_messages", "global_daily_hourly_messages", 3),
+        ("global_daily_vc_minutes", "global_daily_hourly_vc_minutes", 4),
+    ):
+        daily = conf.get(daily_key, {})
+        hourly = conf.get(hourly_key, {})
+        for day in set(daily) | set(hourly):
+            hours = hourly.get(day, [])
+            for hour, amount in enumerate(hours):
+                if amount:
+                    row = [GLOBAL_USER, day, hour, 0, 0.0]
+                    row[idx] = amount
+                    rows.append(tuple(row))
+            # Daily totals predate the per-hour maps, keep the difference hourless
+            rest = daily.get(day, 0) - sum(hours)
+            if rest > 0:
+                row = [GLOBAL_USER, day, UNKNOWN_HOUR, 0, 0.0]
+                row[idx] = rest
+                rows.append(tuple(row))
+    return rows
+
+
+def rows_from_delta(delta) -> List[Row]:
+    """Convert a buffered GuildDelta into per-user rows plus guild-wide aggregate rows."""
+    merged: Dict[Tuple[int, str, int], List] = {}
+    for idx, counter in ((0, delta.messages), (1, delta.vc_minutes)):
+        for (u_id, day, hour), amount in counter.items():
+            for user in (int(u_id), GLOBAL_USER):
+                merged.setdefault((user, day, hour), [0, 0.0])[idx] += amount
+    return [(user, day, hour, m, v) for (user, day, hour), (m, v) in merged.items()]
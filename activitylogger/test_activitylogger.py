@@ -0,0 +1,310 @@
+"""Tests for ActivityLogger cog."""
+
+import asyncio
+import copy
+import pytest
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from activitylogger import storage
+from activitylogger.activitylogger import ActivityLogger
+from activitylogger.buffer import ActivityBuffer
+from activitylogger.storage import ActivitySQLiteStore, rows_from_config, rows_from_delta
+
+
+def guild_defaults():
+    return {
+        "users": {},
+        "backtracked_channels": [],
+        "staff_roles": [],
+        "global_daily_messages": {},
+        "global_daily_vc_minutes": {},
+        "global_daily_hourly_messages": {},
+        "global_daily_hourly_vc_minutes": {},
+        "global_hourly_messages": [0] * 24,
+        "global_hourly_vc_minutes": [0.0] * 24,
+    }
+
+
+class FakeUsersValue:
+    def __init__(self, group):
+        self.group = group
+
+    def __call__(self):
+        group = self.group
+
+        class _Context:
+            async def __aenter__(self):
+                return group.data["users"]
+
+            async def __aexit__(self, *args):
+                pass
+
+        return _Context()
+
+
+class FakeGuildGroup:
+    """Config guild group: all() returns a copy, set() replaces the stored document."""
+
+    def __init__(self, config, guild_id):
+        self.config = config
+        self.data = config.guilds.setdefault(guild_id, guild_defaults())
+        self.guild_id = guild_id
+        self.users = FakeUsersValue(self)
+
+    async def all(self):
+        await asyncio.sleep(0)
+        return copy.deepcopy(self.data)
+
+    async def set(self, value):
+        await asyncio.sleep(0)
+        if self.config.failing_sets:
+            self.config.failing_sets -= 1
+            raise RuntimeError("Config write failed")
+        self.data.clear()
+        self.data.update(copy.deepcopy(value))
+
+
+class FakeConfig:
+    def __init__(self):
+        self.guilds = {}
+        self.failing_sets = 0
+
+    def guild_from_id(self, guild_id):
+        return FakeGuildGroup(self, guild_id)
+
+    def guild(self, guild):
+        return self.guild_from_id(guild.id)
+
+
+def make_cog():
+    """ActivityLogger without its background loops."""
+    cog = ActivityLogger.__new__(ActivityLogger)
+    cog.config = FakeConfig()
+    cog.buffer = ActivityBuffer()
+    cog.store = None
+    cog.max_pending = 5000
+    cog._flush_lock = asyncio.Lock()
+    cog._early_flush = None
+    return cog
+
+
+class TestActivityBuffer:
+    """Test suite for the write-behind activity buffer."""
+
+    def test_pending_count(self):
+        """Test that len() counts distinct pending entries across guilds."""
+        buffer = ActivityBuffer()
+        buffer.add_message(1, "10", "2025-01-01", 12)
+        buffer.add_message(1, "10", "2025-01-01", 12)
+        buffer.add_message(1, "10", "2025-01-01", 13)
+        buffer.add_vc_minutes(2, "20", "2025-01-01", 12, 5.0)
+        buffer.touch(2, "20")
+        buffer.touch(2, "20")
+        assert len(buffer) == 4
+
+        delta = buffer.pop(1)
+        assert len(buffer) == 2
+        assert delta.messages[("10", "2025-01-01", 12)] == 2
+
+        buffer.add_message(1, "10", "2025-01-01", 12)
+        buffer.restore(1, delta)
+        assert len(buffer) == 4
+        assert buffer.pop(1).messages[("10", "2025-01-01", 12)] == 3
+        buffer.discard(2)
+        assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+class TestActivityFlush:
+    """Test suite for flushing buffered activity to Config."""
+
+    async def test_flush(self):
+        """Test that a flush applies the buffered counters once."""
+        cog = make_cog()
+        today = date.today().isoformat()
+        cog.buffer.add_message(1, "10", today, 12, count=3)
+        cog.buffer.add_vc_minutes(1, "10", today, 12, 5.0)
+        await cog._flush_all()
+        await cog._flush_all()
+
+        conf = cog.config.guilds[1]
+        user = conf["users"]["10"]
+        assert user["daily_messages"] == {today: 3}
+        assert user["daily_vc_minutes"] == {today: 5.0}
+        assert user["current_streak"] == 1 and user["last_active"] == today
+        assert conf["global_daily_messages"] == {today: 3}
+        assert conf["global_hourly_messages"][12] == 3
+        assert len(cog.buffer) == 0
+
+    async def test_failed_write_is_retried_once(self):
+        """Test that a failed write saves nothing and the restored delta is counted once."""
+        cog = make_cog()
+        today = date.today().isoformat()
+        cog.buffer.add_message(1, "10", today, 12, count=2)
+        cog.buffer.add_message(1, "11", today, 12)
+        cog.config.failing_sets = 1
+        await cog._flush_all()
+        assert cog.config.guilds[1]["users"] == {}
+        assert len(cog.buffer) == 2
+
+        await cog._flush_all()
+        conf = cog.config.guilds[1]
+        assert conf["users"]["10"]["daily_messages"] == {today: 2}
+        assert conf["global_daily_messages"] == {today: 3}
+
+    async def test_failed_apply_is_retried_once(self):
+        """Test that an error halfway through applying a delta doesn't save the applied part."""
+        cog = make_cog()
+        today = date.today().isoformat()
+        cog.buffer.add_message(1, "10", today, 12)
+        cog.buffer.add_vc_minutes(1, "10", today, 12, 5.0)
+        apply_delta = cog._apply_delta
+
+        def failing_apply(conf, delta, daily=True):
+            conf["global_hourly_messages"][12] += 1  # part of the delta already applied
+            raise RuntimeError("apply failed")
+
+        cog._apply_delta = failing_apply
+        await cog._flush_all()
+        assert cog.config.guilds[1]["global_hourly_messages"][12] == 0
+
+        cog._apply_delta = apply_delta
+        await cog._flush_all()
+        conf = cog.config.guilds[1]
+        assert conf["global_hourly_messages"][12] == 1
+        assert conf["users"]["10"]["daily_vc_minutes"] == {today: 5.0}
+
+    async def test_leave_after_buffered_activity(self):
+        """Test that activity buffered before a leave doesn't clear left_at on a later flush."""
+        cog = make_cog()
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        cog.buffer.add_message(1, "10", yesterday, 12)
+        await cog._flush_all()
+
+        cog.buffer.add_message(1, "10", date.today().isoformat(), 12)
+        member = MagicMock()
+        member.id = 10
+        member.guild.id = 1
+        await cog.on_member_remove(member)
+        await cog._flush_all()
+
+        user = cog.config.guilds[1]["users"]["10"]
+        assert user["left_at"] == date.today().isoformat()
+        assert user["current_streak"] == 2
+
+
+class FakeBot:
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+
+def history():
+    """Config guild document with a month of daily history."""
+    conf = guild_defaults()
+    start = date(2025, 1, 1)
+    for i in range(31):
+        day = (start + timedelta(days=i)).isoformat()
+        conf["users"].setdefault("10", {"daily_messages": {}, "daily_vc_minutes": {}})["daily_messages"][day] = i + 1
+        if i % 2:
+            conf["users"].setdefault("11", {"daily_messages": {}, "daily_vc_minutes": {}})["daily_vc_minutes"][day] = 2.5
+        hours = [0] * 24
+        hours[i % 24] = i + 1
+        conf["global_daily_hourly_messages"][day] = hours
+        # Older totals than the per-hour map knows about
+        conf["global_daily_messages"][day] = i + 1 + (5 if i < 3 else 0)
+        if i % 2:
+            conf["global_daily_vc_minutes"][day] = 2.5
+    return conf
+
+
+def hydrated_users():
+    conf = guild_defaults()
+    conf["users"] = {"10": {}, "11": {}}
+    return conf
+
+
+@pytest.mark.asyncio
+class TestActivitySQLiteStore:
+    """Test suite for the SQLite history store."""
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(storage, "cog_data_path", lambda raw_name=None: tmp_path)
+        sql_store = ActivitySQLiteStore(FakeBot())
+        yield sql_store
+        sql_store.close()
+
+    async def test_config_round_trip(self, store):
+        """Test that history migrated from Config is read back unchanged."""
+        conf = history()
+        await store.replace_guild(1, rows_from_config(conf))
+        await store.replace_guild(1, rows_from_config(conf))  # migrating twice replaces
+
+        hydrated = hydrated_users()
+        await store.hydrate(1, hydrated)
+        for key in ("global_daily_messages", "global_daily_vc_minutes", "global_daily_hourly_messages"):
+            assert hydrated[key] == conf[key]
+        assert hydrated["users"]["10"]["daily_messages"] == conf["users"]["10"]["daily_messages"]
+        assert hydrated["users"]["11"]["daily_vc_minutes"] == conf["users"]["11"]["daily_vc_minutes"]
+
+    async def test_delta_round_trip(self, store):
+        """Test that flushed deltas add onto existing rows."""
+        for _ in range(2):
+            buffer = ActivityBuffer()
+            buffer.add_message(1, "10", "2025-01-01", 12, count=3)
+            buffer.add_message(1, "11", "2025-01-01", 12)
+            buffer.add_vc_minutes(1, "10", "2025-01-02", 20, 5.0)
+            await store.add_rows(1, rows_from_delta(buffer.pop(1)))
+
+        hydrated = hydrated_users()
+        await store.hydrate(1, hydrated)
+        assert hydrated["users"]["10"]["daily_messages"] == {"2025-01-01": 6}
+        assert hydrated["users"]["10"]["daily_vc_minutes"] == {"2025-01-02": 10.0}
+        assert hydrated["global_daily_messages"] == {"2025-01-01": 8}
+        assert hydrated["global_daily_hourly_messages"]["2025-01-01"][12] == 8
+        assert hydrated["global_daily_hourly_vc_minutes"]["2025-01-02"][20] == 10.0
+
+    async def test_hydrate_range(self, store):
+        """Test that hydrate only loads the requested days and users."""
+        await store.replace_guild(1, rows_from_config(history()))
+        hydrated = hydrated_users()
+        await store.hydrate(1, hydrated, after="2025-01-29", users=False)
+        assert set(hydrated["global_daily_messages"]) == {"2025-01-30", "2025-01-31"}
+        assert hydrated["users"] == {"10": {}, "11": {}}
+
+        await store.hydrate(1, hydrated, after="2025-01-30")
+        assert hydrated["users"]["10"]["daily_messages"] == {"2025-01-31": 31}
+        assert await store.first_day(1) == "2025-01-01"
+        assert await store.first_day(2) is None
+
+    async def test_top_users_period(self, store):
+        """Test that top_users sums days in (after, until] and skips the guild-wide rows."""
+        await store.replace_guild(1, rows_from_config(history()))
+        assert await store.top_users(1, "messages") == [(10, sum(range(1, 32)))]
+        assert await store.top_users(1, "messages", "2025-01-29", "2025-01-30") == [(10, 30)]
+        assert await store.top_users(1, "messages", until="2025-01-02") == [(10, 3)]
+        assert await store.top_users(1, "vc_minutes", after="2025-01-27") == [(11, 5.0)]
+        assert await store.top_users(2, "messages") == []
+        with pytest.raises(ValueError):
+            await store.top_users(1, "day")
+
+    async def test_purge_and_delete(self, store):
+        """Test that purge_before and delete_users only touch their guild."""
+        rows = rows_from_config(history())
+        await store.replace_guild(1, rows)
+        await store.replace_guild(2, rows)
+        await store.purge_before(1, "2025-01-31")
+        await store.delete_users(1, ["11"])
+
+        hydrated = hydrated_users()
+        await store.hydrate(1, hydrated)
+        assert hydrated["users"]["10"]["daily_messages"] == {"2025-01-31": 31}
+        assert hydrated["users"]["11"] == {}
+        assert hydrated["global_daily_messages"] == {"2025-01-31": 31}
+        assert await store.user_daily(2, 11) == ({}, {day: 2.5 for day in history()["global_daily_vc_minutes"]})
@@ -9,6 +9,8 @@ from redbot.core.bot import Red
 from redbot.core.commands import CogMeta
 from redbot.core.config import Config
 
+from .index import BirthdayIndex
+from .roles import RoleChangeExecutor
 from .vexutils.loop import VexLoop
 
 
@@ -31,7 +33,10 @@ class MixinMeta(ABC):
 
     ready: asyncio.Event
 
+    bday_index: BirthdayIndex
+
     coro_queue: asyncio.Queue[Coroutine]
+    role_executor: RoleChangeExecutor
 
     @abstractmethod
     async def check_if_setup(self, guild: discord.Guild) -> bool:
@@ -11,7 +11,9 @@ from redbot.core.config import Config
 
 from .abc import CompositeMetaClass
 from .commands import BirthdayAdminCommands, BirthdayCommands
+from .index import BirthdayIndex
 from .loop import BirthdayLoop
+from .roles import RoleChangeExecutor
 from .vexutils import format_help, format_info, get_vex_logger
 from .vexutils.loop import VexLoop
 
@@ -72,9 +74,13 @@ class Birthday(
         self.loop = self.bot.loop.create_task(self.birthday_loop())
         self.role_manager = self.bot.loop.create_task(self.birthday_role_manager())
         self.coro_queue = asyncio.Queue()
+        self.role_executor = RoleChangeExecutor()
 
         self.ready = asyncio.Event()
 
+        # filled in cog_load, the loop and commands wait for self.ready
+        self.bday_index = BirthdayIndex()
+
         bot.add_dev_env_value("birthday", lambda _: self)
 
     def format_help_for_context(self, ctx: commands.Context) -> str:
@@ -84,6 +90,7 @@ class Birthday(
     async def cog_unload(self):
         self.loop.cancel()
         self.role_manager.cancel()
+        self.role_executor.cancel()
 
         try:
             self.bot.remove_dev_env_value("birthday")
@@ -101,6 +108,7 @@ class Birthday(
         user_data = await self.config.user_from_id(target_u_id).birthday()
         if user_data:
             await self.config.user_from_id(target_u_id).clear()
+            self.bday_index.remove(target_u_id)
             log.debug("Deleted user data for user with ID %s.", target_u_id)
         else:
             log.debug("No user data found for user with ID %s.", target_u_id)
@@ -185,6 +193,9 @@ class Birthday(
         # Automatically set the bot's birthday to its creation date
         await self._set_bot_birthday()
 
+        self.bday_index.rebuild(await self.config.all_users())
+        log.trace("indexed %s birthdays", len(self.bday_index))
+
         self.ready.set()
 
         log.trace("birthday ready")
@@ -87,6 +87,7 @@ class BirthdayCommands(MixinMeta):
             bday["year"] = None
             bday["month"] = birthday.month
             bday["day"] = birthday.day
+        self.bday_index.set(ctx.author.id, bday)
 
         try:
             await ctx.message.add_reaction("✅")
@@ -116,6 +117,7 @@ class BirthdayCommands(MixinMeta):
             return
 
         await self.config.user(ctx.author).birthday.set({})
+        self.bday_index.remove(ctx.author.id)
         await ctx.send("Your birthday has been removed.")
 
     @commands.dm_only()  # type:ignore
@@ -158,43 +160,19 @@ class BirthdayCommands(MixinMeta):
             await ctx.send("You must enter a number of days greater than 0 and smaller than 365.")
             return
 
-        today_dt = datetime.datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        all_birthdays: dict[int, dict[str, dict]] = await self.config.all_users()
-
-        log.trace("raw data for all bdays: %s", all_birthdays)
+        today = datetime.datetime.utcnow().date()
 
         parsed_bdays: dict[int, list[str]] = defaultdict(list)
         number_day_mapping: dict[int, str] = {}
 
-        async for user_id, user_data in AsyncIter(all_birthdays.items(), steps=50):
-            if not user_data.get("birthday"):  # birthday removed or not set
-                continue
-            member = ctx.guild.get_member(user_id)
-            if not isinstance(member, discord.Member):
-                continue
-
-            birthday_dt = datetime.datetime(
-                year=user_data["birthday"]["year"] or 1,
-                month=user_data["birthday"]["month"],
-                day=user_data["birthday"]["day"],
-            )
-
-            if today_dt.month == birthday_dt.month and today_dt.day == birthday_dt.day:
-                parsed_bdays[0].append(member.mention)
-                number_day_mapping[0] = "Today"
-                continue
-
-            this_year_bday = birthday_dt.replace(year=today_dt.year)
-            next_year_bday = birthday_dt.replace(year=today_dt.year + 1)
-            next_birthday_dt = this_year_bday if this_year_bday > today_dt else next_year_bday
-
-            diff = next_birthday_dt - today_dt
-            if diff.days > days:
-                continue
-
-            parsed_bdays[diff.days].append(member.mention)
-            number_day_mapping[diff.days] = next_birthday_dt.strftime("%B %d")
+        # only the buckets of the next `days` days are read, and only their users are looked up
+        for diff_days, day, birthdays in self.bday_index.upcoming(today, days):
+            for user_id in birthdays:
+                member = ctx.guild.get_member(user_id)
+                if not isinstance(member, discord.Member):
+                    continue
+                parsed_bdays[diff_days].append(member.mention)
+                number_day_mapping[diff_days] = "Today" if diff_days == 0 else day.strftime("%B %d")
 
         log.trace("bdays parsed: %s", parsed_bdays)
 
@@ -814,6 +792,7 @@ class BirthdayAdminCommands(MixinMeta):
             bday["year"] = None
             bday["month"] = birthday.month
             bday["day"] = birthday.day
+        self.bday_index.set(user.id, bday)
 
         str_bday = birthday.strftime("%B %d")
         await ctx.send(f"{user.name}'s birthday has been set as {str_bday}. This will apply globally across all servers.")
@@ -843,6 +822,7 @@ class BirthdayAdminCommands(MixinMeta):
             return
 
         await self.config.user(user).birthday.set({})
+        self.bday_index.remove(user.id)
         await ctx.send(f"{user.name}'s birthday has been removed globally.")
 
     @commands.is_owner()
@@ -1414,9 +1394,6 @@ class BirthdayAdminCommands(MixinMeta):
                 hour=0, minute=0, second=0, microsecond=0
             )
 
-            start = today_dt + role_hour_td
-            end = start + datetime.timedelta(days=1)
-
             # Get required roles
             required_role_ids = guild_settings.get("required_roles", [])
             required_roles = []
@@ -1426,15 +1403,10 @@ class BirthdayAdminCommands(MixinMeta):
                     required_roles.append(role)
 
             # Find all members with birthdays today
-            all_birthdays = await self.config.all_users()
-            birthday_members: dict[discord.Member, datetime.datetime] = {}
-
-            for user_id, user_data in all_birthdays.items():
-                birthday = user_data.get("birthday")
-                if not birthday:
-                    continue
+            birthday_members: dict[discord.Member, int] = {}
 
-                member = ctx.guild.get_member(int(user_id))
+            for user_id, year in self.bday_index.on(today_dt.date()).items():
+                member = ctx.guild.get_member(user_id)
                 if member is None:
                     continue
 
@@ -1442,13 +1414,7 @@ class BirthdayAdminCommands(MixinMeta):
                 if required_roles and not any(role in member.roles for role in required_roles):
                     continue
 
-                proper_bday_dt = datetime.datetime(
-                    year=birthday["year"] or 1, month=birthday["month"], day=birthday["day"]
-                )
-                this_year_bday_dt = proper_bday_dt.replace(year=today_dt.year) + role_hour_td
-
-                if start <= this_year_bday_dt < end:  # birthday is today
-                    birthday_members[member] = proper_bday_dt
+                birthday_members[member] = year or 1
 
             if not birthday_members:
                 await ctx.send("No one has a birthday today.")
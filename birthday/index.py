@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import calendar
+import datetime
+from typing import Any, Iterator
+
+
+class BirthdayIndex:
+    """User birthdays bucketed by (month, day).
+
+    Reading the birthdays of a day only touches that day's bucket instead of every user in
+    Config. Kept up to date by the commands that set or remove a birthday and rebuilt from
+    Config on load.
+    """
+
+    def __init__(self) -> None:
+        # (month, day) -> {user_id: birth year, 1 or None if unknown}
+        self._buckets: dict[tuple[int, int], dict[int, int | None]] = {}
+        self._user_days: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._user_days)
+
+    def rebuild(self, all_users: dict[int, dict[str, Any]]) -> None:
+        self._buckets.clear()
+        self._user_days.clear()
+        for user_id, user_data in all_users.items():
+            self.set(int(user_id), user_data.get("birthday"))
+
+    def set(self, user_id: int, birthday: dict[str, Any] | None) -> None:
+        """Set or update a user's birthday, as stored in Config. An empty birthday removes it."""
+        self.remove(user_id)
+        if not birthday or not birthday.get("month") or not birthday.get("day"):
+            return
+        # The Config default (1/1/1) means the birthday was never set
+        if birthday.get("year") == 1 and birthday["month"] == 1 and birthday["day"] == 1:
+            return
+        key = (birthday["month"], birthday["day"])
+        self._buckets.setdefault(key, {})[user_id] = birthday.get("year")
+        self._user_days[user_id] = key
+
+    def remove(self, user_id: int) -> None:
+        if (key := self._user_days.pop(user_id, None)) is None:
+            return
+        bucket = self._buckets[key]
+        del bucket[user_id]
+        if not bucket:
+            del self._buckets[key]
+
+    def on(self, day: datetime.date) -> dict[int, int | None]:
+        """Birthdays on a day, as {user_id: birth year}. 29th Feb birthdays are on the 28th in
+        common years."""
+        birthdays = dict(self._buckets.get((day.month, day.day), {}))
+        if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+            birthdays.update(self._buckets.get((2, 29), {}))
+        return birthdays
+
+    def upcoming(
+        self, today: datetime.date, days: int
+    ) -> Iterator[tuple[int, datetime.date, dict[int, int | None]]]:
+        """Yield (days from today, date, birthdays) for today and the next `days` days that have
+        birthdays, reading one bucket per day."""
+        seen: set[tuple[int, int]] = set()
+        for offset in range(days + 1):
+            day = today + datetime.timedelta(days=offset)
+            if (day.month, day.day) in seen:  # Went round a whole year
+                break
+            seen.add((day.month, day.day))
+            if birthdays := self.on(day):
+                yield offset, day, birthdays
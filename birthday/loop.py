@@ -7,10 +7,11 @@ from typing import Any, NoReturn
 import discord
 from redbot.core import commands
 from redbot.core.utils import AsyncIter
+from rich.table import Table  # type:ignore
 
 from .abc import MixinMeta
 from .utils import channel_perm_check, format_bday_message, role_perm_check
-from .vexutils import get_vex_logger
+from .vexutils import get_vex_logger, no_colour_rich_markup
 
 log = get_vex_logger(__name__)
 
@@ -22,11 +23,33 @@ class BirthdayLoop(MixinMeta):
         """
         Sends the current state of the Birthday loop.
         """
-        await ctx.send(embed=self.loop_meta.get_debug_embed())
+        embed = self.loop_meta.get_debug_embed()
+
+        runs = sorted(self.role_executor.last_runs.values(), key=lambda r: r.duration, reverse=True)
+        if runs:
+            table = Table("Guild", "Added", "Removed", "Failed", "Seconds")
+            for run in runs[:8]:
+                table.add_row(
+                    str(run.guild_id),
+                    f"{run.added}/{run.to_add}",
+                    f"{run.removed}/{run.to_remove}",
+                    str(run.failed),
+                    f"{run.duration:.2f}" + ("" if run.finished else " (running)"),
+                )
+            value = no_colour_rich_markup(table)
+        else:
+            value = "No role changes yet."
+        embed.add_field(
+            name=f"Role changes, slowest guilds ({len(runs)} guilds)", value=value, inline=False
+        )
+
+        await ctx.send(embed=embed)
 
     async def birthday_role_manager(self) -> None:
         """Birthday role manager to handle coros, so they don't slow
-        down the main loop. Remember d.py handles ratelimits."""
+        down the main loop. Remember d.py handles ratelimits.
+
+        Role changes don't go through here, see `RoleChangeExecutor`."""
         while True:
             try:
                 coro = await self.coro_queue.get()
@@ -35,39 +58,6 @@ class BirthdayLoop(MixinMeta):
             except discord.HTTPException as e:
                 log.warning("A queued coro failed to run.", exc_info=e)
 
-        # just using one task for all guilds is okay. maybe it's not the fastest as no async-ness
-        # to get them doe faster as (some) rate limits are per-guild
-        # but it's fine for now and the loop is hourly
-
-    async def add_role(self, me: discord.Member, member: discord.Member, role: discord.Role):
-        if error := role_perm_check(me, role):
-            log.warning(
-                "Not adding role %s to %s in guild %s because %s",
-                role.id,
-                member.id,
-                member.guild.id,
-                error,
-            )
-            return
-        log.trace("Queued birthday role add for %s in guild %s", member.id, member.guild.id)
-        self.coro_queue.put_nowait(
-            member.add_roles(role, reason="Birthday cog - birthday starts today")
-        )
-
-    async def remove_role(self, me: discord.Member, member: discord.Member, role: discord.Role):
-        if error := role_perm_check(me, role):
-            log.warning(
-                "Not removing role to %s in guild %s because %s",
-                member.id,
-                member.guild.id,
-                error,
-            )
-            return
-        log.trace("Queued birthday role remove for %s in guild %s", member.id, member.guild.id)
-        self.coro_queue.put_nowait(
-            member.remove_roles(role, reason="Birthday cog - birthday ends today")
-        )
-
     async def send_announcement(
         self, channel: discord.TextChannel, message: str, role_mention: bool, image_path: str | None = None, reactions: list[str] | None = None
     ):
@@ -175,7 +165,6 @@ class BirthdayLoop(MixinMeta):
 
     async def _update_birthdays(self):
         """Update birthdays - handle roles and messages at different times"""
-        all_birthdays: dict[int, dict[str, Any]] = await self.config.all_users()
         all_settings: dict[int, dict[str, Any]] = await self.config.all_guilds()
 
         async for guild_id, guild_settings in AsyncIter(all_settings.items(), steps=5):
@@ -223,9 +212,7 @@ class BirthdayLoop(MixinMeta):
             today_dt = (datetime.datetime.utcnow() - role_hour_td).replace(
                 hour=0, minute=0, second=0, microsecond=0
             )
-
-            start = today_dt + role_hour_td
-            end = start + datetime.timedelta(days=1)
+            birthdays_today = self.bday_index.on(today_dt.date())
 
             # Get required roles (migrate from old config if needed)
             old_required_role = guild_settings.get("required_role")
@@ -244,33 +231,18 @@ class BirthdayLoop(MixinMeta):
                 if role:
                     required_roles.append(role)
 
-            birthday_members: dict[discord.Member, datetime.datetime] = {}
-
-            # Iterate through all users and check if they're in this guild
-            async for user_id, user_data in AsyncIter(all_birthdays.items(), steps=50):
-                birthday = user_data.get("birthday")
-                if not birthday:  # birthday not set
-                    continue
-
-                # Skip users with default placeholder birthday (1/1/1) - they haven't set their birthday
-                # When a user sets their birthday via command, year is set to None, not 1
-                # So year=1 with default month/day means birthday was never set
-                if birthday["year"] == 1 and birthday["month"] == 1 and birthday["day"] == 1:
-                    log.trace("User %s has default birthday (1/1/1), skipping", user_id)
-                    continue
+            # member -> birth year, 1 if unknown
+            birthday_members: dict[discord.Member, int] = {}
 
-                member = guild.get_member(int(user_id))
+            # Only today's bucket of the index is read. Each user in it is looked up in the
+            # guild's member cache, so guild size doesn't matter - only today's birthdays do.
+            # (The 1/1/1 Config default of users who never set a birthday isn't indexed.)
+            for user_id, year in birthdays_today.items():
+                member = guild.get_member(user_id)
                 if member is None:
                     # User not in this guild, skip
                     continue
 
-                # Convert None year to 1 for datetime creation
-                # A real year value means the birthday includes birth year (e.g., bot's birthday)
-                proper_bday_dt = datetime.datetime(
-                    year=birthday["year"] or 1, month=birthday["month"], day=birthday["day"]
-                )
-                this_year_bday_dt = proper_bday_dt.replace(year=today_dt.year) + role_hour_td
-
                 # Check if member has at least one required role (if any are set)
                 if required_roles and not any(role in member.roles for role in required_roles):
                     log.trace(
@@ -280,8 +252,8 @@ class BirthdayLoop(MixinMeta):
                     )
                     continue
 
-                if start <= this_year_bday_dt < end:  # birthday is today
-                    birthday_members[member] = proper_bday_dt
+                # A real year means the birthday includes birth year (e.g., bot's birthday)
+                birthday_members[member] = year or 1
 
             role = guild.get_role(guild_settings["role_id"])
             if role is None:
@@ -297,14 +269,20 @@ class BirthdayLoop(MixinMeta):
 
             # Handle role assignments/removals at role time
             if is_role_time:
-                log.trace("Processing role updates for guild %s", guild_id)
-                for member, dt in birthday_members.items():
-                    if member not in role.members:
-                        await self.add_role(guild.me, member, role)
-
-                for member in role.members:
-                    if member not in birthday_members:
-                        await self.remove_role(guild.me, member, role)
+                if error := role_perm_check(guild.me, role):
+                    log.warning(
+                        "Not updating role %s in guild %s because %s", role.id, guild_id, error
+                    )
+                else:
+                    to_add, to_remove = self.role_executor.diff(role, birthday_members)
+                    log.trace(
+                        "Queued %s birthday role adds and %s removes for guild %s",
+                        len(to_add),
+                        len(to_remove),
+                        guild_id,
+                    )
+                    # runs in the background, in parallel with the other guilds
+                    self.role_executor.submit(guild, role, to_add, to_remove)
 
             # Handle message sending at message time
             if is_message_time:
@@ -341,18 +319,18 @@ class BirthdayLoop(MixinMeta):
                     announced_today = []
                     await self.config.guild(guild).announced_today.set([])
 
-                for member, dt in birthday_members.items():
+                for member, year in birthday_members.items():
                     # Skip if already announced today
                     if member.id in announced_today:
                         log.trace("Member %s already announced today in guild %s, skipping", member.id, guild_id)
                         continue
 
                     # Check if birthday has a year and try to use message_w_year with age
-                    if dt.year != 1:
+                    if year != 1:
                         message_template = guild_settings.get("message_w_year")
                         if message_template:
                             # Birthday has a year and message_w_year is configured
-                            new_age = today_dt.year - dt.year
+                            new_age = today_dt.year - year
                             message = format_bday_message(message_template, member, new_age)
                         else:
                             # Birthday has a year but message_w_year not configured, fallback to message_wo_year
@@ -397,3 +375,6 @@ class BirthdayLoop(MixinMeta):
                 await self.config.guild(guild).announced_today.set(announced_today)
 
             log.trace("Potential updates for %s have been queued", guild_id)
+
+        # so the iteration's timing includes the role changes, and iterations don't overlap
+        await self.role_executor.join()
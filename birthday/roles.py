@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import discord
+
+from .vexutils import get_vex_logger
+
+log = get_vex_logger(__name__)
+
+# Role changes in flight for one guild. They all hit the same per-guild rate limit bucket, which
+# d.py's HTTP client waits on (and retries 429s for), so more than a few at once only queues up
+MAX_CONCURRENT_PER_GUILD = 5
+# Role changes in flight across all guilds, well under Discord's global limit of 50/s
+MAX_CONCURRENT = 25
+
+
+@dataclass
+class RoleRun:
+    """Role changes applied to a guild in one loop iteration."""
+
+    guild_id: int
+    to_add: int
+    to_remove: int
+    added: int = 0
+    removed: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def duration(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+
+class RoleChangeExecutor:
+    """Apply the birthday role changes of each guild concurrently.
+
+    Each guild's batch runs in its own task, so guilds don't wait on each other. Within a guild
+    at most `per_guild` changes are in flight, and at most `max_concurrent` overall. A batch for a
+    guild waits for the previous batch of that guild to finish, so changes are never applied out
+    of order.
+    """
+
+    def __init__(
+        self, max_concurrent: int = MAX_CONCURRENT, per_guild: int = MAX_CONCURRENT_PER_GUILD
+    ) -> None:
+        self.per_guild = per_guild
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tasks: dict[int, asyncio.Task] = {}
+
+        # guild ID -> latest batch of role changes, for bdloopdebug
+        self.last_runs: dict[int, RoleRun] = {}
+
+    @staticmethod
+    def diff(
+        role: discord.Role, birthday_members: Iterable[discord.Member]
+    ) -> tuple[set[discord.Member], set[discord.Member]]:
+        """Members to give the role to, and members to take it from."""
+        have = set(role.members)
+        want = set(birthday_members)
+        return want - have, have - want
+
+    @property
+    def running(self) -> int:
+        return len(self._tasks)
+
+    def submit(
+        self,
+        guild: discord.Guild,
+        role: discord.Role,
+        to_add: set[discord.Member],
+        to_remove: set[discord.Member],
+    ) -> None:
+        if not to_add and not to_remove:
+            return
+
+        previous = self._tasks.get(guild.id)
+        task = asyncio.create_task(self._run(guild.id, role, to_add, to_remove, previous))
+        self._tasks[guild.id] = task
+        task.add_done_callback(functools.partial(self._forget, guild.id))
+
+    def _forget(self, guild_id: int, task: asyncio.Task) -> None:
+        if self._tasks.get(guild_id) is task:
+            del self._tasks[guild_id]
+
+    async def join(self) -> None:
+        """Wait until all submitted changes have been applied."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def cancel(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    async def _run(
+        self,
+        guild_id: int,
+        role: discord.Role,
+        to_add: set[discord.Member],
+        to_remove: set[discord.Member],
+        previous: asyncio.Task | None,
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+
+        run = RoleRun(guild_id, len(to_add), len(to_remove))
+        self.last_runs[guild_id] = run
+        guild_semaphore = asyncio.Semaphore(self.per_guild)
+
+        async def apply(member: discord.Member, add: bool) -> None:
+            async with guild_semaphore, self._semaphore:
+                try:
+                    if add:
+                        await member.add_roles(role, reason="Birthday cog - birthday starts today")
+                    else:
+                        await member.remove_roles(role, reason="Birthday cog - birthday ends today")
+                except discord.HTTPException as e:
+                    run.failed += 1
+                    log.warning(
+                        "Failed to %s birthday role for %s in guild %s",
+                        "add" if add else "remove",
+                        member.id,
+                        guild_id,
+                        exc_info=e,
+                    )
+                    return
+                except Exception as e:
+                    run.failed += 1
+                    log.exception(
+                        "Something went wrong trying to %s birthday role for %s in guild %s",
+                        "add" if add else "remove",
+                        member.id,
+                        guild_id,
+                        exc_info=e,
+                    )
+                    return
+            if add:
+                run.added += 1
+            else:
+                run.removed += 1
+            log.trace(
+                "Birthday role %s for %s in guild %s", "added" if add else "removed", member.id, guild_id
+            )
+
+        try:
+            await asyncio.gather(
+                *(apply(member, True) for member in to_add),
+                *(apply(member, False) for member in to_remove),
+                return_exceptions=True,
+            )
+        finally:
+            run.finished = time.monotonic()
+            log.trace(
+                "Role changes for guild %s done in %.2fs: %s added, %s removed, %s failed",
+                guild_id,
+                run.duration,
+                run.added,
+                run.removed,
+                run.failed,
+            )
@@ -1,5 +1,7 @@
 """Tests for Birthday cog."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import date
@@ -10,6 +12,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from birthday.birthday import Birthday
+from birthday.index import BirthdayIndex
+from birthday.roles import RoleChangeExecutor
 
 
 @pytest.mark.asyncio
@@ -39,3 +43,152 @@ class TestBirthdayCog:
         # Birthday cog should have bday and bdset commands
         assert hasattr(cog, 'bday')
         assert hasattr(cog, 'bdset')
+
+
+class TestBirthdayIndex:
+    """Test suite for the (month, day) birthday index."""
+
+    @pytest.fixture
+    def index(self):
+        index = BirthdayIndex()
+        index.rebuild({
+            1: {"birthday": {"year": None, "month": 3, "day": 14}},
+            2: {"birthday": {"year": 2016, "month": 3, "day": 14}},
+            3: {"birthday": {"year": None, "month": 12, "day": 31}},
+            4: {"birthday": {"year": None, "month": 2, "day": 29}},
+            5: {"birthday": {}},  # removed
+            6: {"birthday": {"year": 1, "month": 1, "day": 1}},  # Config default, never set
+        })
+        return index
+
+    def test_rebuild(self, index):
+        """Test that only set birthdays are indexed."""
+        assert len(index) == 4
+        assert index.on(date(2025, 3, 14)) == {1: None, 2: 2016}
+        assert index.on(date(2025, 1, 1)) == {}
+
+    def test_set_and_remove(self, index):
+        """Test that the index follows set and remove."""
+        index.set(1, {"year": None, "month": 12, "day": 31})
+        assert index.on(date(2025, 3, 14)) == {2: 2016}
+        assert index.on(date(2025, 12, 31)) == {1: None, 3: None}
+        index.remove(1)
+        index.remove(1)  # removing twice is fine
+        index.set(2, {})
+        assert index.on(date(2025, 12, 31)) == {3: None}
+        assert index.on(date(2025, 3, 14)) == {}
+        assert len(index) == 2
+
+    def test_leap_day(self, index):
+        """Test that 29th Feb birthdays are on the 28th in common years."""
+        assert index.on(date(2025, 2, 28)) == {4: None}
+        assert index.on(date(2024, 2, 28)) == {}
+        assert index.on(date(2024, 2, 29)) == {4: None}
+
+    def test_upcoming(self, index):
+        """Test that upcoming reads only the requested days, in order."""
+        upcoming = list(index.upcoming(date(2025, 12, 30), 7))
+        assert upcoming == [(1, date(2025, 12, 31), {3: None})]
+        assert list(index.upcoming(date(2025, 3, 14), 0)) == [(0, date(2025, 3, 14), {1: None, 2: 2016})]
+        # a whole year only lists each day once
+        assert [offset for offset, _, _ in index.upcoming(date(2025, 1, 1), 365)] == [58, 72, 364]
+
+
+class FakeMember:
+    """Member whose role changes take a while, tracking how many run at once."""
+
+    def __init__(self, member_id, tracker):
+        self.id = member_id
+        self.tracker = tracker
+
+    async def _change(self, op, role):
+        self.tracker["in_flight"] += 1
+        self.tracker["max_in_flight"] = max(self.tracker["max_in_flight"], self.tracker["in_flight"])
+        await asyncio.sleep(0.01)
+        self.tracker["in_flight"] -= 1
+        self.tracker["changes"].append((op, self.id))
+
+    async def add_roles(self, role, reason=None):
+        await self._change("add", role)
+
+    async def remove_roles(self, role, reason=None):
+        await self._change("remove", role)
+
+
+@pytest.mark.asyncio
+class TestRoleChangeExecutor:
+    """Test suite for the concurrent birthday role changes."""
+
+    @pytest.fixture(autouse=True)
+    def log(self):
+        """Stand-in for the vexutils logger, which only has .trace once Red has set up logging."""
+        with patch("birthday.roles.log") as log:
+            yield log
+
+    def make_guild(self, guild_id, members_with_role):
+        tracker = {"in_flight": 0, "max_in_flight": 0, "changes": []}
+        role = MagicMock()
+        role.members = [FakeMember(i, tracker) for i in members_with_role]
+        guild = MagicMock()
+        guild.id = guild_id
+        return guild, role, tracker
+
+    async def test_diff(self):
+        """Test that only the members whose role must change are returned."""
+        guild, role, tracker = self.make_guild(1, [1, 2])
+        keep, remove = role.members
+        new = FakeMember(3, tracker)
+        to_add, to_remove = RoleChangeExecutor.diff(role, [keep, new])
+        assert to_add == {new}
+        assert to_remove == {remove}
+
+    async def test_bounded_concurrency(self):
+        """Test that a guild's changes run concurrently, at most per_guild at a time."""
+        guild, role, tracker = self.make_guild(1, range(20))
+        executor = RoleChangeExecutor(per_guild=4)
+        executor.submit(guild, role, set(), set(role.members))
+        await executor.join()
+        assert len(tracker["changes"]) == 20
+        assert tracker["max_in_flight"] == 4
+        run = executor.last_runs[1]
+        assert (run.removed, run.failed, run.to_remove) == (20, 0, 20)
+        assert run.finished is not None
+        assert executor.running == 0
+
+    async def test_unexpected_error(self, log):
+        """Test that an unexpected error only fails its own member and the run still finishes."""
+        guild, role, tracker = self.make_guild(1, range(10))
+        broken = role.members[0]
+        broken.remove_roles = AsyncMock(side_effect=RuntimeError("boom"))
+        executor = RoleChangeExecutor(per_guild=2)
+        executor.submit(guild, role, set(), set(role.members))
+        await executor.join()
+        assert len(tracker["changes"]) == 9
+        run = executor.last_runs[1]
+        assert (run.removed, run.failed) == (9, 1)
+        assert run.finished is not None
+        log.exception.assert_called_once()
+
+    async def test_guilds_in_parallel(self):
+        """Test that guilds don't wait for each other."""
+        guilds = [self.make_guild(i, range(5)) for i in range(10)]
+        executor = RoleChangeExecutor(per_guild=5)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for guild, role, _ in guilds:
+            executor.submit(guild, role, set(), set(role.members))
+        await executor.join()
+        # 10 guilds x 5 changes of 10ms each, all at once instead of 0.5s one after the other
+        assert loop.time() - start < 0.25
+        assert all(len(tracker["changes"]) == 5 for _, _, tracker in guilds)
+        assert len(executor.last_runs) == 10
+
+    async def test_batches_of_a_guild_in_order(self):
+        """Test that a guild's next batch waits for the previous one."""
+        guild, role, tracker = self.make_guild(1, [1])
+        member = role.members[0]
+        executor = RoleChangeExecutor()
+        executor.submit(guild, role, {member}, set())
+        executor.submit(guild, role, set(), {member})
+        await executor.join()
+        assert tracker["changes"] == [("add", 1), ("remove", 1)]
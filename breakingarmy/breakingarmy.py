@@ -384,16 +384,8 @@ class BreakingArmy(commands.Cog):
                     await self._refresh_live_season_view(guild)
 
                 # 3. Schedule Trigger
-                polling_cog = self.bot.get_cog("EventPolling")
-                if not polling_cog: continue
-                polls = await polling_cog.config.guild(guild).polls()
-                if not polls: continue
-                latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-                poll_data = polls[latest_poll_id]
-                snapshot = poll_data.get("weekly_snapshot_winning_times")
-                winners = snapshot if snapshot else polling_cog._calculate_winning_times_weighted(poll_data.get("selections", {}))
-                
-                ba_winners = winners.get("Breaking Army", {})
+                ba_winners = await self._get_ba_winners(guild)
+                if ba_winners is None: continue
                 trigger = False
                 for slot in ba_winners.values():
                     win_day = slot[0][0]
@@ -493,21 +485,21 @@ class BreakingArmy(commands.Cog):
         embed.add_field(name="Guests", value="\n".join([f"{i+1}. {fmt(x)}" for i, x in enumerate(g)]), inline=True)
         return embed
 
+    async def _get_ba_winners(self, guild: discord.Guild) -> Optional[dict]:
+        """Breaking Army slots of the guild's current EventPolling schedule, None without polls.
+
+        Served from EventPolling's in-memory schedule, which is only recomputed after votes or the weekly snapshot change.
+        """
+        polling_cog = self.bot.get_cog("EventPolling")
+        if not polling_cog: return None
+        schedule = await polling_cog.get_current_schedule(guild.id)
+        if schedule.poll_id is None: return None
+        return schedule.winning_times.get("Breaking Army", {})
+
     async def _get_boss_index_for_day(self, guild: discord.Guild, day_name: str) -> int:
         """Determines which boss index (0 or 1) corresponds to a given day name."""
-        polling_cog = self.bot.get_cog("EventPolling")
-        if not polling_cog: return 0
-        
-        polls = await polling_cog.config.guild(guild).polls()
-        if not polls: return 0
-        
-        latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-        poll_data = polls[latest_poll_id]
-        winners = poll_data.get("weekly_snapshot_winning_times")
-        if not winners:
-            winners = polling_cog._calculate_winning_times_weighted(poll_data.get("selections", {}))
-            
-        ba_winners = winners.get("Breaking Army", {})
+        ba_winners = await self._get_ba_winners(guild)
+        if ba_winners is None: return 0
         dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         # Get unique days and sort them chronologically
         win_days = sorted(list(set(s[0][0] for s in ba_winners.values())), key=lambda d: dow_order.index(d))
@@ -624,22 +616,14 @@ class BreakingArmy(commands.Cog):
         # Determine which boss index to use based on day_name chronological order
         idx = slot_idx
         if day_name:
-            polling_cog = self.bot.get_cog("EventPolling")
-            if polling_cog:
-                polls = await polling_cog.config.guild(guild).polls()
-                if polls:
-                    latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-                    poll_data = polls[latest_poll_id]
-                    snap = poll_data.get("weekly_snapshot_winning_times")
-                    winners = snap if snap else polling_cog._calculate_winning_times_weighted(poll_data.get("selections", {}))
-                    ba_winners = winners.get("Breaking Army", {})
-                    
-                    dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                    # Get unique days and sort them chronologically to map to boss indices
-                    win_days = sorted(list(set(s[0][0] for s in ba_winners.values())), key=lambda d: dow_order.index(d))
-                    
-                    if day_name in win_days:
-                        idx = win_days.index(day_name)
+            ba_winners = await self._get_ba_winners(guild)
+            if ba_winners is not None:
+                dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+                # Get unique days and sort them chronologically to map to boss indices
+                win_days = sorted(list(set(s[0][0] for s in ba_winners.values())), key=lambda d: dow_order.index(d))
+                
+                if day_name in win_days:
+                    idx = win_days.index(day_name)
 
         if idx is not None and 0 <= idx < len(bosses):
             return format_boss(bosses[idx])
@@ -1105,19 +1089,12 @@ class BreakingArmy(commands.Cog):
         priority = season.get("priority_bosses", [])
         
         days = []
-        polling_cog = self.bot.get_cog("EventPolling")
-        if polling_cog:
-            polls = await polling_cog.config.guild(guild).polls()
-            if polls:
-                latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-                poll_data = polls[latest_poll_id]
-                snap = poll_data.get("weekly_snapshot_winning_times")
-                winners = snap if snap else polling_cog._calculate_winning_times_weighted(poll_data.get("selections", {}))
-                ba_winners = winners.get("Breaking Army", {})
-                dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                raw_days = list(set(slot[0][0] for slot in ba_winners.values()))
-                raw_days.sort(key=lambda d: dow_order.index(d))
-                days = [d[:3] for d in raw_days]
+        ba_winners = await self._get_ba_winners(guild)
+        if ba_winners is not None:
+            dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+            raw_days = list(set(slot[0][0] for slot in ba_winners.values()))
+            raw_days.sort(key=lambda d: dow_order.index(d))
+            days = [d[:3] for d in raw_days]
 
         for i, b in enumerate(boss_list):
             e = pool.get(b, "⚔️")
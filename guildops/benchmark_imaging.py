@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NumPy OCR preprocessing against the original pure-Python/PIL pipeline.
+
+Usage: python -m guildops.benchmark_imaging [--runs N]
+"""
+
+import argparse
+import random
+import time
+from io import BytesIO
+
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageOps
+
+from guildops.imaging import process_image
+
+
+def legacy_process_image(img_data: bytes, threshold: int, use_filter: bool, use_connectivity: bool = True) -> Image.Image:
+    """The pre-NumPy pipeline, kept as the reference implementation."""
+    img = Image.open(BytesIO(img_data)).convert('L')
+    img = ImageOps.autocontrast(img, cutoff=2)
+    img = img.filter(ImageFilter.SMOOTH_MORE)
+    mask = img.point(lambda x: x if x >= threshold else 0)
+
+    if use_filter:
+        width, height = mask.size
+        line_threshold = max(40, width // 25)
+        pixels = list(mask.getdata())
+        new_pixels = list(pixels)
+        for y in range(height):
+            row_start = y * width
+            start_x = -1
+            for x in range(width):
+                idx = row_start + x
+                if pixels[idx] > 0:
+                    if start_x == -1:
+                        start_x = x
+                else:
+                    if start_x != -1:
+                        length = x - start_x
+                        if length > line_threshold:
+                            for i in range(start_x, x):
+                                new_pixels[row_start + i] = 0
+                        start_x = -1
+            if start_x != -1:
+                length = width - start_x
+                if length > line_threshold:
+                    for i in range(start_x, width):
+                        new_pixels[row_start + i] = 0
+        mask.putdata(new_pixels)
+
+    if use_connectivity:
+        seed = mask.point(lambda x: 255 if x >= 140 else 0)
+        candidate = mask.point(lambda x: 255 if x > 0 else 0)
+        connected = seed
+        for _ in range(8):
+            dilated = connected.filter(ImageFilter.MaxFilter(3))
+            new_connected = ImageChops.darker(dilated, candidate)
+            if not ImageChops.difference(new_connected, connected).getbbox():
+                break
+            connected = new_connected
+        mask = ImageChops.darker(mask, connected)
+
+    return mask
+
+
+def synthetic_screenshot(width: int = 1920, height: int = 1080, rows: int = 20, seed: int = 0) -> bytes:
+    """A dark roster-like screenshot: gray text lines, underlines, noise and edge-touching bars."""
+    rng = random.Random(seed)
+    img = Image.new('RGB', (width, height), (24, 26, 30))
+    draw = ImageDraw.Draw(img)
+    row_height = height // (rows + 1)
+    for r in range(rows):
+        y = row_height * (r + 1)
+        x = rng.randint(10, 80)
+        shade = rng.randint(120, 255)
+        draw.text((x, y), f"Player{rng.randint(0, 99999)}  Active  {rng.randint(1, 28):02d}/05/2026", fill=(shade,) * 3)
+        if rng.random() < 0.5:
+            draw.line((x, y + 14, x + rng.randint(30, 600), y + 14), fill=(200, 200, 200), width=1)
+    # Bar touching the right edge and scattered anti-aliasing noise
+    draw.rectangle((width - 300, 5, width - 1, 8), fill=(230, 230, 230))
+    for _ in range(width * height // 200):
+        px, py = rng.randrange(width), rng.randrange(height)
+        draw.point((px, py), fill=(rng.randint(60, 200),) * 3)
+    out = BytesIO()
+    img.save(out, format='PNG')
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in ((960, 540), (1920, 1080)):
+        img_data = synthetic_screenshot(*size)
+        for name, func in (("legacy", legacy_process_image), ("numpy", process_image)):
+            start = time.perf_counter()
+            for _ in range(args.runs):
+                out = func(img_data, 160, True, True)
+            elapsed = (time.perf_counter() - start) / args.runs
+            print(f"{size[0]}x{size[1]} {name:>6}: {elapsed * 1000:8.1f} ms/image")
+        identical = legacy_process_image(img_data, 160, True, True).tobytes() == process_image(img_data, 160, True, True).tobytes()
+        print(f"{size[0]}x{size[1]} pixel-identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
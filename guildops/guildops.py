@@ -1,19 +1,24 @@
 import discord
+import hashlib
+import json
 import logging
 import re
 import gspread
-import pytesseract
 import asyncio
 import aiohttp
 from datetime import datetime
 from io import BytesIO
-from PIL import Image, ImageChops, ImageOps, ImageFilter
+from PIL import Image
 from typing import Optional, List, Dict, Any, Tuple
 
 from redbot.core import commands, Config, data_manager, checks
 from redbot.core.bot import Red
 from discord.ext import tasks
 
+from .imaging import process_image
+from .ocr_pool import OCRQueueFull, OCRWorkerPool, render_debug_image, run_ocr
+from .sheet_cache import SheetHandleCache, credentials
+
 log = logging.getLogger("red.asdas-cogs.guildops")
 
 class GuildOps(commands.Cog):
@@ -50,10 +55,15 @@ class GuildOps(commands.Cog):
         else:
             log.warning(f"GuildOps: Service account file not found at {self.creds_file}. Google Sheets sync will not work.")
 
+        self.ocr_pool = OCRWorkerPool(max_workers=2, max_queue=20)
+        self.sheet_cache = SheetHandleCache()
+        # (spreadsheet id, worksheet id) -> (content hash, Drive modified time) after the last sort
+        self._sort_state: Dict[Tuple[str, int], Tuple[str, Optional[str]]] = {}
         self.auto_sort_loop.start()
 
     def cog_unload(self):
         self.auto_sort_loop.cancel()
+        self.ocr_pool.close()
 
     async def _get_worksheet(self, guild: discord.Guild, sh: gspread.Spreadsheet):
         """Helper to get the configured worksheet or the last one."""
@@ -66,6 +76,22 @@ class GuildOps(commands.Cog):
         
         return await self.bot.loop.run_in_executor(None, lambda: sh.worksheets()[-1])
 
+    async def _open_worksheet(self, guild: discord.Guild, sheet_id: str):
+        """
+        Returns the guild's worksheet, reusing the cached client and handles when possible.
+        Returns None if the service account file is missing.
+        """
+        gc = await self._get_gc()
+        if not gc:
+            return None
+        ws_name = await self.config.guild(guild).worksheet_name()
+        ws = self.sheet_cache.worksheet(guild.id, sheet_id, ws_name)
+        if ws is None:
+            sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
+            ws = await self._get_worksheet(guild, sh)
+            self.sheet_cache.set_worksheet(guild.id, sheet_id, ws_name, sh, ws)
+        return ws
+
     @tasks.loop(minutes=1)
     async def auto_sort_loop(self):
         """Background loop to periodically sort configured sheets."""
@@ -85,32 +111,32 @@ class GuildOps(commands.Cog):
                 if not guild:
                     continue
                 
-                gc = await self._get_gc()
-                if not gc:
-                    continue
-                
                 try:
-                    sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
-                    ws = await self._get_worksheet(guild, sh)
-                    await self._do_custom_sort(ws)
+                    ws = await self._open_worksheet(guild, sheet_id)
+                    if not ws:
+                        continue
+                    await self._auto_sort(ws)
                     await self.config.guild_from_id(guild_id).last_auto_sort.set(now)
                     # log.info(f"GuildOps: Auto-sorted sheet for guild {guild.name} ({guild_id})")
                 except Exception as e:
+                    self.sheet_cache.invalidate(guild_id)
                     log.error(f"GuildOps: Error in auto-sort for guild {guild_id}: {e}")
 
     @auto_sort_loop.before_loop
     async def before_auto_sort_loop(self):
         await self.bot.wait_until_ready()
 
-    async def _do_custom_sort(self, ws):
+    async def _do_custom_sort(self, ws, values: Optional[List[List[str]]] = None):
         """
         Performs a complex custom sort on the worksheet.
         Order: Status (Active > Left), UID (None > Has), Roles (Manual) (Custom List), IGN (A-Z)
+        Only rows whose position changed are written. Returns the sorted values including the
+        header row, or None if the custom sort didn't run.
         """
         def _work():
-            all_values = ws.get_all_values()
+            all_values = values if values is not None else ws.get_all_values()
             if len(all_values) <= 1:
-                return
+                return None
             
             headers = [h.lower().strip() for h in all_values[0]]
             data = all_values[1:]
@@ -126,7 +152,7 @@ class GuildOps(commands.Cog):
             except ValueError:
                 # Fallback to basic sort if columns missing
                 ws.sort((1, 'asc')) 
-                return
+                return None
 
             role_priority = {
                 "guild leader": 1,
@@ -161,42 +187,126 @@ class GuildOps(commands.Cog):
                 
                 return (s_prio, u_prio, r_prio, ign)
 
-            data.sort(key=sort_key)
-            
-            # Write back to sheet (Range: A2 to end)
-            num_rows = len(data)
+            sorted_data = sorted(data, key=sort_key)
+            blocks = self._changed_row_blocks(data, sorted_data)
+            if not blocks:
+                # Already in order, nothing to write
+                return all_values
+
+            # Write back only the contiguous runs of rows that moved (row 1 is the header)
             num_cols = len(headers)
-            if num_rows > 0:
-                range_end = gspread.utils.rowcol_to_a1(num_rows + 1, num_cols)
-                ws.update(range_name=f"A2:{range_end}", values=data, value_input_option='USER_ENTERED')
+            updates = []
+            for start, end in blocks:
+                range_start = gspread.utils.rowcol_to_a1(start + 2, 1)
+                range_end = gspread.utils.rowcol_to_a1(end + 1, num_cols)
+                updates.append({'range': f"{range_start}:{range_end}", 'values': sorted_data[start:end]})
+            ws.batch_update(updates, value_input_option='USER_ENTERED')
+            return [all_values[0]] + sorted_data
+
+        final_values = await self.bot.loop.run_in_executor(None, _work)
+        if final_values is not None:
+            self._sort_state[self._sheet_key(ws)] = (self._content_hash(final_values), None)
+        return final_values
+
+    @staticmethod
+    def _changed_row_blocks(old: List[List[str]], new: List[List[str]]) -> List[Tuple[int, int]]:
+        """Half-open [start, end) index ranges of rows that differ between two orderings."""
+        blocks = []
+        start = None
+        for i, (a, b) in enumerate(zip(old, new)):
+            if a != b:
+                if start is None:
+                    start = i
+            elif start is not None:
+                blocks.append((start, i))
+                start = None
+        if start is not None:
+            blocks.append((start, len(new)))
+        return blocks
+
+    @staticmethod
+    def _content_hash(values: List[List[str]]) -> str:
+        return hashlib.sha1(json.dumps(values, ensure_ascii=False).encode()).hexdigest()
+
+    @staticmethod
+    def _sheet_key(ws) -> Tuple[str, int]:
+        return (ws.spreadsheet.id, ws.id)
+
+    async def _last_update_time(self, ws) -> Optional[str]:
+        """Spreadsheet modification time from Drive metadata, or None if unavailable."""
+        def _get():
+            sh = ws.spreadsheet
+            getter = getattr(sh, "get_lastUpdateTime", None)
+            return getter() if getter else sh.lastUpdateTime
+        try:
+            return await self.bot.loop.run_in_executor(None, _get)
+        except Exception:
+            return None
+
+    async def _auto_sort(self, ws):
+        """
+        Sorts a sheet unless it is unchanged since the last sort.
+        The Drive modification time is checked first, so unchanged sheets aren't downloaded at all;
+        if it moved, the content hash still skips sheets whose values match the last sorted state.
+        """
+        key = self._sheet_key(ws)
+        modified = await self._last_update_time(ws)
+        last_hash, last_modified = self._sort_state.get(key, (None, None))
+        if modified and modified == last_modified:
+            return
 
-        await self.bot.loop.run_in_executor(None, _work)
+        values = None
+        if last_hash is not None:
+            values = await self.bot.loop.run_in_executor(None, ws.get_all_values)
+            if self._content_hash(values) == last_hash:
+                self._sort_state[key] = (last_hash, modified)
+                return
+
+        final_values = await self._do_custom_sort(ws, values)
+        if final_values is not None:
+            # Our own write bumps the modification time, remember the post-write one
+            self._sort_state[key] = (self._content_hash(final_values), await self._last_update_time(ws))
 
     async def _get_gc(self):
         """
         Returns a gspread client, running in an executor to avoid blocking.
+        The client is cached and rebuilt when the credentials file changes or its TTL passes.
         """
         if not self.creds_file.exists():
+            self.sheet_cache.reset()
             return None
+
+        gc = self.sheet_cache.client(self.creds_file)
+        if gc:
+            creds = credentials(gc)
+            if creds is None or not getattr(creds, "expired", False):
+                return gc
+            # Refresh the token up front instead of on the next API call
+            try:
+                from google.auth.transport.requests import Request
+                await self.bot.loop.run_in_executor(None, lambda: creds.refresh(Request()))
+                return gc
+            except Exception as e:
+                log.warning(f"GuildOps: Token refresh failed, re-authenticating: {e}")
+                self.sheet_cache.reset()
         
         def _connect():
             return gspread.service_account(filename=str(self.creds_file))
         
-        return await self.bot.loop.run_in_executor(None, _connect)
+        gc = await self.bot.loop.run_in_executor(None, _connect)
+        self.sheet_cache.set_client(gc, self.creds_file)
+        return gc
 
     async def _sync_data_to_sheet(self, guild: discord.Guild, sheet_id: str, new_data: List[Dict[str, str]]):
         """
         Syncs a list of user data to the sheet.
         new_data: List of dicts with keys 'discord_id', 'ign', 'date_accepted'
         """
-        gc = await self._get_gc()
-        if not gc:
-            return False, "Service account file not found."
-
         async def _do_work():
             try:
-                sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
-                ws = await self._get_worksheet(guild, sh)
+                ws = await self._open_worksheet(guild, sheet_id)
+                if not ws:
+                    return False, "Service account file not found."
                 
                 # ensure headers
                 headers = await self.bot.loop.run_in_executor(None, lambda: ws.row_values(1))
@@ -311,6 +421,7 @@ class GuildOps(commands.Cog):
                 # Sort by Status (Active > Left), Role (Custom), then IGN (A-Z)
                 return True, ws
             except Exception as e:
+                self.sheet_cache.invalidate(guild.id)
                 return False, str(e)
 
         success, result = await _do_work()
@@ -322,109 +433,127 @@ class GuildOps(commands.Cog):
 
     async def _process_ocr_result(self, sheet_id: str, ign: str, status: str, guild: discord.Guild, date_accepted: str):
         """
-        Handles OCR result:
-        1. Updates sheet (Add if missing).
-        2. Handles Role changes for "Left" status.
+        Handles a single OCR result. See `_process_ocr_batch`.
         Returns: (success: bool, message: str)
         """
-        gc = await self._get_gc()
-        if not gc:
-            return False, "Service account file not found."
+        success, result = await self._process_ocr_batch(sheet_id, [(ign, status)], guild, date_accepted)
+        if not success:
+            return False, result
+        return True, result[0]
 
-        async def _do_sheet_work():
-            try:
-                sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
-                ws = await self._get_worksheet(guild, sh)
-                
-                headers = await self.bot.loop.run_in_executor(None, lambda: ws.row_values(1))
-                header_map = {h.lower().strip(): i for i, h in enumerate(headers)}
-                
-                if "ign" not in header_map or "status" not in header_map:
-                    return False, None, "Sheet missing IGN or Status columns."
-                
-                ign_col = header_map["ign"] + 1
-                status_col = header_map["status"] + 1
-                discord_id_col = header_map.get("discord id", -1) + 1
-                date_acc_col = header_map.get("date added", -1) + 1
-                import_col = header_map.get("import", -1) + 1
-                uid_man_col = header_map.get("uid (manual)", -1) + 1
-                roles_man_col = header_map.get("roles (manual)", -1) + 1
-                
-                # Find the cell with the IGN
-                cell = await self.bot.loop.run_in_executor(None, lambda: ws.find(ign, in_column=ign_col, case_sensitive=False))
-                
-                discord_id = None
-                
-                if cell:
-                    # Update existing
-                    await self.bot.loop.run_in_executor(None, lambda: ws.update(range_name=f"{gspread.utils.rowcol_to_a1(cell.row, status_col)}", values=[[status]], value_input_option='USER_ENTERED'))
-                    
+    async def _process_ocr_batch(self, sheet_id: str, entries: List[Tuple[str, str]], guild: discord.Guild, date_accepted: str):
+        """
+        Handles all (ign, status) pairs parsed from one screenshot:
+        1. Reads the worksheet once and resolves every IGN against an in-memory index.
+        2. Writes all cell changes with one batch_update and all new rows with one append_rows.
+        3. Sorts once, then applies role changes for members marked "Left".
+        Returns: (success: bool, messages: List[str] | error: str)
+        """
+
+        def _do_sheet_work(ws):
+            all_values = ws.get_all_values()
+            headers = all_values[0] if all_values else []
+            header_map = {h.lower().strip(): i for i, h in enumerate(headers)}
+
+            if "ign" not in header_map or "status" not in header_map:
+                return False, "Sheet missing IGN or Status columns."
+
+            ign_idx = header_map["ign"]
+            status_idx = header_map["status"]
+            discord_id_idx = header_map.get("discord id")
+            date_acc_idx = header_map.get("date added")
+            import_idx = header_map.get("import")
+            roles_man_idx = header_map.get("roles (manual)")
+
+            # IGN (case-insensitive) -> row number, first match wins like ws.find
+            ign_index = {}
+            for i, row in enumerate(all_values[1:], start=2):
+                if len(row) > ign_idx:
+                    key = str(row[ign_idx]).strip().lower()
+                    if key and key not in ign_index:
+                        ign_index[key] = i
+
+            cell_updates = {}  # A1 -> value, later entries overwrite earlier ones
+            appends = {}  # IGN key -> new row
+            discord_ids = {}  # IGN key -> Discord ID
+
+            for ign, status in entries:
+                key = ign.strip().lower()
+                row_idx = ign_index.get(key)
+                if row_idx:
+                    cell_updates[gspread.utils.rowcol_to_a1(row_idx, status_idx + 1)] = status
                     # If status changed to 'Left', clear manual roles
-                    if status.capitalize() == "Left":
-                        if roles_man_col > 0:
-                            await self.bot.loop.run_in_executor(None, lambda: ws.update(range_name=f"{gspread.utils.rowcol_to_a1(cell.row, roles_man_col)}", values=[[""]], value_input_option='USER_ENTERED'))
-
-                    # Fetch Discord ID if available
-                    if discord_id_col > 0:
-                        row_vals = await self.bot.loop.run_in_executor(None, lambda: ws.row_values(cell.row))
-                        if len(row_vals) >= discord_id_col:
-                            val = row_vals[discord_id_col - 1]
-                            if val:
-                                discord_id = str(val).strip()
-                        
-                    return True, discord_id, ws
+                    if status.capitalize() == "Left" and roles_man_idx is not None:
+                        cell_updates[gspread.utils.rowcol_to_a1(row_idx, roles_man_idx + 1)] = ""
+                    row_vals = all_values[row_idx - 1]
+                    if discord_id_idx is not None and len(row_vals) > discord_id_idx and row_vals[discord_id_idx]:
+                        discord_ids[key] = str(row_vals[discord_id_idx]).strip()
+                elif key in appends:
+                    # Same IGN twice in one screenshot, keep the latest status
+                    appends[key][status_idx] = status
                 else:
-                    # Append new row
                     new_row = [""] * len(headers)
-                    new_row[ign_col - 1] = ign
-                    new_row[status_col - 1] = status
-                    if date_acc_col > 0:
-                        new_row[date_acc_col - 1] = date_accepted
-                    if import_col > 0:
-                        new_row[import_col - 1] = "OCR"
-                    
-                    await self.bot.loop.run_in_executor(None, lambda: ws.append_row(new_row, value_input_option='USER_ENTERED'))
-                        
-                    return True, None, ws
-                
-            except Exception as e:
-                return False, None, str(e)
+                    new_row[ign_idx] = ign
+                    new_row[status_idx] = status
+                    if date_acc_idx is not None:
+                        new_row[date_acc_idx] = date_accepted
+                    if import_idx is not None:
+                        new_row[import_idx] = "OCR"
+                    appends[key] = new_row
+
+            if cell_updates:
+                ws.batch_update([{'range': a1, 'values': [[v]]} for a1, v in cell_updates.items()], value_input_option='USER_ENTERED')
+            if appends:
+                ws.append_rows(list(appends.values()), value_input_option='USER_ENTERED')
+            return True, discord_ids
+
+        try:
+            ws = await self._open_worksheet(guild, sheet_id)
+            if not ws:
+                return False, "Service account file not found."
+            success, result = await self.bot.loop.run_in_executor(None, lambda: _do_sheet_work(ws))
+        except Exception as e:
+            self.sheet_cache.invalidate(guild.id)
+            return False, str(e)
 
-        # Run sheet update
-        success, discord_id, result = await _do_sheet_work()
-        
         if not success:
             return False, result
 
-        # result is ws
-        await self._do_custom_sort(result)
-        msg = f"Processed {ign} -> {status}."
-
-        # Handle Roles if Left and Discord ID known
-        if status == "Left" and discord_id:
-            try:
-                member = guild.get_member(int(discord_id))
-                if member:
-                    member_role_id = await self.config.guild(guild).member_role()
-                    left_role_id = await self.config.guild(guild).left_role()
-                    
-                    if member_role_id:
-                        r_mem = guild.get_role(member_role_id)
-                        if r_mem:
-                            await member.remove_roles(r_mem, reason="GuildOps: Left Guild")
-                            
-                    if left_role_id:
-                        r_left = guild.get_role(left_role_id)
-                        if r_left:
-                            await member.add_roles(r_left, reason="GuildOps: Left Guild")
-                            
-                    msg += " (Roles Updated)"
-                else:
-                    msg += " (Member not found in server)"
-            except Exception as e:
-                msg += f" (Role Error: {e})"
-                
-        return True, msg
+        await self._do_custom_sort(ws)
+
+        # Role changes go last, after every sheet write has landed
+        discord_ids = result
+        messages = []
+        for ign, status in entries:
+            msg = f"Processed {ign} -> {status}."
+            discord_id = discord_ids.get(ign.strip().lower())
+            if status == "Left" and discord_id:
+                msg += await self._apply_left_roles(guild, discord_id)
+            messages.append(msg)
+        return True, messages
+
+    async def _apply_left_roles(self, guild: discord.Guild, discord_id: str) -> str:
+        """Swaps the member role for the left role. Returns a suffix for the result message."""
+        try:
+            member = guild.get_member(int(discord_id))
+            if not member:
+                return " (Member not found in server)"
+            member_role_id = await self.config.guild(guild).member_role()
+            left_role_id = await self.config.guild(guild).left_role()
+
+            if member_role_id:
+                r_mem = guild.get_role(member_role_id)
+                if r_mem:
+                    await member.remove_roles(r_mem, reason="GuildOps: Left Guild")
+
+            if left_role_id:
+                r_left = guild.get_role(left_role_id)
+                if r_left:
+                    await member.add_roles(r_left, reason="GuildOps: Left Guild")
+
+            return " (Roles Updated)"
+        except Exception as e:
+            return f" (Role Error: {e})"
 
     def _extract_all_text(self, components: List[Any]) -> str:
         """Recursively extracts all text from a list of components."""
@@ -616,80 +745,7 @@ class GuildOps(commands.Cog):
 
     def _get_processed_image(self, img_data: bytes, threshold: int, use_filter: bool, use_connectivity: bool = True) -> Image.Image:
         """Applies the processing pipeline to an image and returns the PIL Image object."""
-        # 1. Load and Grayscale
-        img = Image.open(BytesIO(img_data)).convert('L')
-        
-        # 2. Contrast stretch (2% cutoff helps stretch light gray into pure white)
-        img = ImageOps.autocontrast(img, cutoff=2)
-        
-        # 3. Subtle smoothing to help anti-aliased / light gray edges stay connected
-        img = img.filter(ImageFilter.SMOOTH_MORE)
-        
-        # 4. Clipping: Preserve original gray/white intensities for text, black out background
-        mask = img.point(lambda x: x if x >= threshold else 0)
-
-        # 5. Underline Removal (Horizontal Segment Eraser) - Run this BEFORE connectivity
-        if use_filter:
-            width, height = mask.size
-            # Heuristic for "2 characters" width based on image size
-            line_threshold = max(40, width // 25) 
-            
-            pixels = list(mask.getdata())
-            new_pixels = list(pixels)
-            
-            for y in range(height):
-                row_start = y * width
-                start_x = -1
-                for x in range(width):
-                    idx = row_start + x
-                    if pixels[idx] > 0: # Non-black (text/line)
-                        if start_x == -1:
-                            start_x = x
-                    else:
-                        if start_x != -1:
-                            # We found the end of a white segment
-                            length = x - start_x
-                            if length > line_threshold:
-                                # This is likely an underline, wipe it
-                                for i in range(start_x, x):
-                                    new_pixels[row_start + i] = 0
-                            start_x = -1
-                
-                # Check if a segment went all the way to the right edge
-                if start_x != -1:
-                    length = width - start_x
-                    if length > line_threshold:
-                        for i in range(start_x, width):
-                            new_pixels[row_start + i] = 0
-            
-            mask.putdata(new_pixels)
-
-        # 6. Connectivity Filter (Seed Reconstruction)
-        if use_connectivity:
-            # Create a seed mask of bright pixels (white to gray #8c8c8c)
-            # These act as starting points for the connectivity growth.
-            seed = mask.point(lambda x: 255 if x >= 140 else 0)
-            # Create a candidate mask of all potential text pixels
-            candidate = mask.point(lambda x: 255 if x > 0 else 0)
-            
-            # Use morphological reconstruction to grow seeds into candidates
-            # We do 8 iterations of 3x3 dilation, which covers most anti-aliasing ranges
-            connected = seed
-            for _ in range(8):
-                # Dilate seeds
-                dilated = connected.filter(ImageFilter.MaxFilter(3))
-                # Intersect with candidate mask
-                new_connected = ImageChops.darker(dilated, candidate)
-                
-                # Check for convergence (no more growth)
-                if not ImageChops.difference(new_connected, connected).getbbox():
-                    break
-                connected = new_connected
-            
-            # Apply the connectivity mask back to our soft-thresholded image
-            mask = ImageChops.darker(mask, connected)
-        
-        return mask
+        return process_image(img_data, threshold, use_filter, use_connectivity)
 
     async def _handle_ocr_message(self, message):
         log.info(f"GuildOps: Handling OCR message {message.id} with {len(message.attachments)} attachments.")
@@ -721,12 +777,15 @@ class GuildOps(commands.Cog):
                 use_connectivity = await self.config.guild(message.guild).ocr_connectivity()
                 debug_enabled = await self.config.guild(message.guild).ocr_debug()
 
-                def _ocr_task():
-                    processed_img = self._get_processed_image(img_data, threshold, use_filter, use_connectivity)
-                    return pytesseract.image_to_string(processed_img, lang='eng+chi_sim+chi_tra', config='--psm 6')
-                
-                log.info(f"GuildOps: Running OCR on {att.filename}...")
-                text = await self.bot.loop.run_in_executor(None, _ocr_task)
+                log.info(f"GuildOps: Queueing OCR for {att.filename} ({self.ocr_pool.queue_depth(message.guild.id)} waiting)...")
+                try:
+                    text = await self.ocr_pool.submit(message.guild.id, run_ocr, img_data, threshold, use_filter, use_connectivity)
+                except OCRQueueFull:
+                    log.warning(f"GuildOps: OCR queue full for guild {message.guild.id}, rejecting {att.filename}")
+                    await message.add_reaction("⏳")
+                    prefix = (await self.bot.get_valid_prefixes(message.guild))[0]
+                    await message.channel.send(f"⏳ OCR queue is full, skipped `{att.filename}` and any later attachments. Retry later with `{prefix}guildops processocr {message.id}`.")
+                    return
                 
                 if debug_enabled:
                     # Send raw OCR to channel for debugging
@@ -740,18 +799,22 @@ class GuildOps(commands.Cog):
                 results = []
                 date_acc = message.created_at.strftime("%d/%m/%Y")
                 
+                valid_entries = []
                 for ign, status in parsed_entries:
                     log.info(f"GuildOps: Found potential entry: {ign} -> {status}")
                     
                     if len(ign) > 2: # Min length sanity check
-                        success, result_msg = await self._process_ocr_result(sheet_id, ign, status, message.guild, date_acc)
-                        if success:
-                            processed_count += 1
-                            results.append(f"• {result_msg}")
-                        else:
-                            results.append(f"• ❌ Error processing {ign}: {result_msg}")
+                        valid_entries.append((ign, status))
                     else:
                         log.info(f"GuildOps: IGN '{ign}' too short, skipping.")
+
+                if valid_entries:
+                    success, batch_result = await self._process_ocr_batch(sheet_id, valid_entries, message.guild, date_acc)
+                    if success:
+                        processed_count = len(batch_result)
+                        results = [f"• {result_msg}" for result_msg in batch_result]
+                    else:
+                        results = [f"• ❌ Error processing {ign}: {batch_result}" for ign, _ in valid_entries]
                 
                 log.info(f"GuildOps: Processed {processed_count} valid entries from {att.filename}")
                 if processed_count > 0:
@@ -781,12 +844,14 @@ class GuildOps(commands.Cog):
     async def sheet(self, ctx, sheet_id: str):
         """Set the Google Sheet ID."""
         await self.config.guild(ctx.guild).sheet_id.set(sheet_id)
+        self.sheet_cache.invalidate(ctx.guild.id)
         await ctx.send(f"Sheet ID set to `{sheet_id}`.")
 
     @opset.command()
     async def worksheet(self, ctx, *, name: str):
         """Set the name of the worksheet to use (e.g. 'Sheet1'). If not set, uses the last one."""
         await self.config.guild(ctx.guild).worksheet_name.set(name)
+        self.sheet_cache.invalidate(ctx.guild.id)
         await ctx.send(f"Worksheet name set to `{name}`.")
 
     @opset.command()
@@ -969,6 +1034,18 @@ class GuildOps(commands.Cog):
             await self._handle_ocr_message(message)
             await ctx.send("✅ OCR processing triggered. Check the message for reaction status.")
 
+    @guildops.command(name="ocrqueue")
+    async def guildops_ocr_queue(self, ctx):
+        """Show the OCR worker pool status and this server's queue depth."""
+        pool = self.ocr_pool
+        embed = discord.Embed(title="OCR Worker Pool", color=discord.Color.blue())
+        embed.add_field(name="Workers", value=f"{pool.max_workers} ({'processes' if pool.using_processes else 'threads'})", inline=True)
+        embed.add_field(name="This Server", value=f"{pool.running(ctx.guild.id)} running, {pool.queue_depth(ctx.guild.id)}/{pool.max_queue} queued", inline=True)
+        embed.add_field(name="All Servers", value=f"{pool.total_depth()} queued", inline=True)
+        embed.add_field(name="Average Job Time", value=f"{pool.average_time:.2f}s", inline=True)
+        embed.add_field(name="Jobs", value=f"{pool.completed} done, {pool.failed} failed, {pool.rejected} rejected", inline=True)
+        await ctx.send(embed=embed)
+
     @guildops.command(name="debugimage")
     async def guildops_debug_image(self, ctx, message_id: int):
         """
@@ -1006,15 +1083,12 @@ class GuildOps(commands.Cog):
                 
                 img_data = await att.read()
                 
-                def _process():
-                    processed_img = self._get_processed_image(img_data, threshold, use_filter, use_connectivity)
-                    final_io = BytesIO()
-                    processed_img.save(final_io, format="PNG")
-                    final_io.seek(0)
-                    return final_io
-
-                final_io = await self.bot.loop.run_in_executor(None, _process)
-                file = discord.File(final_io, filename=f"debug_{att.filename}")
+                try:
+                    png = await self.ocr_pool.submit(ctx.guild.id, render_debug_image, img_data, threshold, use_filter, use_connectivity)
+                except OCRQueueFull:
+                    await ctx.send("⏳ OCR queue is full, try again once it has drained.")
+                    return
+                file = discord.File(BytesIO(png), filename=f"debug_{att.filename}")
                 await ctx.send(f"🖼️ **Processed Image for {att.filename}:**\n(Threshold: {threshold}, Filter: {use_filter}, Connectivity: {use_connectivity})", file=file)
 
     @guildops.command(name="synchistory")
@@ -1114,8 +1188,7 @@ class GuildOps(commands.Cog):
         async with ctx.typing():
             async def _do_sort():
                 try:
-                    sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
-                    ws = await self._get_worksheet(ctx.guild, sh)
+                    ws = await self._open_worksheet(ctx.guild, sheet_id)
                     all_values = await self.bot.loop.run_in_executor(None, lambda: ws.get_all_values())
                     if not all_values:
                         return False, "Sheet is empty."
@@ -1150,6 +1223,7 @@ class GuildOps(commands.Cog):
 
                     return True, ws
                 except Exception as e:
+                    self.sheet_cache.invalidate(ctx.guild.id)
                     return False, str(e)
 
             success, result = await _do_sort()
@@ -1204,8 +1278,7 @@ class GuildOps(commands.Cog):
             # 1. Get Discord IDs from Sheet
             async def _get_sheet_ids():
                 try:
-                    sh = await self.bot.loop.run_in_executor(None, lambda: gc.open_by_key(sheet_id))
-                    ws = await self._get_worksheet(ctx.guild, sh)
+                    ws = await self._open_worksheet(ctx.guild, sheet_id)
                     all_values = await self.bot.loop.run_in_executor(None, lambda: ws.get_all_values())
                     if not all_values: return set()
                     
@@ -1221,6 +1294,7 @@ class GuildOps(commands.Cog):
                                 ids.add(int(val))
                     return ids
                 except:
+                    self.sheet_cache.invalidate(ctx.guild.id)
                     return None
 
             sheet_ids = await _get_sheet_ids()
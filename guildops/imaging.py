@@ -0,0 +1,97 @@
+"""Image preprocessing for GuildOps OCR, implemented on NumPy arrays."""
+
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, ImageFilter, ImageOps
+
+# Pixels at or above this value seed the connectivity reconstruction (white to gray #8c8c8c)
+SEED_THRESHOLD = 140
+# Number of 3x3 dilation steps, which covers most anti-aliasing ranges
+CONNECTIVITY_ITERATIONS = 8
+
+
+def underline_threshold(width: int) -> int:
+    """Heuristic for "2 characters" width based on image size."""
+    return max(40, width // 25)
+
+
+def remove_underlines(mask: np.ndarray, line_threshold: int) -> np.ndarray:
+    """
+    Horizontal segment eraser.
+
+    Blacks out every run of non-black pixels in a row that is longer than `line_threshold`.
+    Runs are found for all rows at once from the edges of a zero-padded occupancy mask.
+    """
+    height, width = mask.shape
+    lit = np.zeros((height, width + 2), dtype=np.int8)
+    lit[:, 1:-1] = mask > 0
+    edges = np.diff(lit, axis=1)
+    # nonzero() is row-major, so the n-th start and n-th end always belong to the same run
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+
+    long_runs = (ends - starts) > line_threshold
+    if not long_runs.any():
+        return mask
+
+    rows, starts, ends = rows[long_runs], starts[long_runs], ends[long_runs]
+    marks = np.zeros((height, width + 1), dtype=np.int32)
+    marks[rows, starts] = 1
+    marks[rows, ends] = -1
+    erase = np.cumsum(marks, axis=1)[:, :width] > 0
+
+    result = mask.copy()
+    result[erase] = 0
+    return result
+
+
+def _dilate3x3(arr: np.ndarray) -> np.ndarray:
+    """3x3 maximum filter, treating out-of-bounds pixels as black (same as PIL's MaxFilter(3))."""
+    padded = np.pad(arr, 1)
+    height, width = arr.shape
+    rows = np.maximum(np.maximum(padded[:-2], padded[1:-1]), padded[2:])
+    return np.maximum(np.maximum(rows[:, : width], rows[:, 1 : width + 1]), rows[:, 2:])
+
+
+def filter_connected(mask: np.ndarray, iterations: int = CONNECTIVITY_ITERATIONS) -> np.ndarray:
+    """
+    Seed reconstruction: keep candidate pixels reachable from bright seeds.
+
+    Seeds are grown by a bounded number of 3x3 dilations, each clipped to the candidate mask,
+    stopping early once growth converges.
+    """
+    candidate = mask > 0
+    connected = mask >= SEED_THRESHOLD
+    for _ in range(iterations):
+        grown = _dilate3x3(connected) & candidate
+        if np.array_equal(grown, connected):
+            break
+        connected = grown
+    return np.where(connected, mask, 0).astype(np.uint8)
+
+
+def process_image(img_data: bytes, threshold: int, use_filter: bool, use_connectivity: bool = True) -> Image.Image:
+    """Applies the OCR processing pipeline to raw image bytes and returns the processed image."""
+    # 1. Load and Grayscale
+    img = Image.open(BytesIO(img_data)).convert('L')
+
+    # 2. Contrast stretch (2% cutoff helps stretch light gray into pure white)
+    img = ImageOps.autocontrast(img, cutoff=2)
+
+    # 3. Subtle smoothing to help anti-aliased / light gray edges stay connected
+    img = img.filter(ImageFilter.SMOOTH_MORE)
+
+    # 4. Clipping: Preserve original gray/white intensities for text, black out background
+    arr = np.asarray(img, dtype=np.uint8)
+    mask = np.where(arr >= threshold, arr, 0).astype(np.uint8)
+
+    # 5. Underline Removal - Run this BEFORE connectivity
+    if use_filter:
+        mask = remove_underlines(mask, underline_threshold(mask.shape[1]))
+
+    # 6. Connectivity Filter
+    if use_connectivity:
+        mask = filter_connected(mask)
+
+    return Image.fromarray(mask)
@@ -0,0 +1,166 @@
+"""Dedicated worker pool for OCR jobs, with a bounded job queue per guild."""
+
+import asyncio
+import concurrent.futures
+import logging
+import pickle
+import time
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pytesseract
+
+from .imaging import process_image
+
+log = logging.getLogger("red.asdas-cogs.guildops")
+
+OCR_LANG = 'eng+chi_sim+chi_tra'
+OCR_CONFIG = '--psm 6'
+
+
+def run_ocr(img_data: bytes, threshold: int, use_filter: bool, use_connectivity: bool) -> str:
+    """Preprocess an image and run tesseract on it. Runs inside a worker process."""
+    processed_img = process_image(img_data, threshold, use_filter, use_connectivity)
+    return pytesseract.image_to_string(processed_img, lang=OCR_LANG, config=OCR_CONFIG)
+
+
+def render_debug_image(img_data: bytes, threshold: int, use_filter: bool, use_connectivity: bool) -> bytes:
+    """Preprocess an image and return it as PNG bytes. Runs inside a worker process."""
+    processed_img = process_image(img_data, threshold, use_filter, use_connectivity)
+    final_io = BytesIO()
+    processed_img.save(final_io, format="PNG")
+    return final_io.getvalue()
+
+
+class OCRQueueFull(Exception):
+    """Raised when a guild already has the maximum number of OCR jobs waiting."""
+
+
+class OCRWorkerPool:
+    """
+    A size-bounded process pool shared by all guilds.
+
+    Each guild gets its own FIFO queue drained by a single consumer, so one guild dumping a
+    pile of screenshots only ever occupies one worker while other guilds keep flowing.
+    If worker processes cannot be used (e.g. the cog package can't be imported by a spawned
+    child), the pool falls back to a dedicated thread pool of the same size.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 20):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._consumers: Dict[int, asyncio.Task] = {}
+        self._running: Dict[int, int] = {}
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_time = 0.0
+        self.using_processes = True
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.using_processes:
+                self._executor = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.max_workers, "guildops_ocr")
+        return self._executor
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.completed if self.completed else 0.0
+
+    def queue_depth(self, guild_id: int) -> int:
+        queue = self._queues.get(guild_id)
+        return queue.qsize() if queue else 0
+
+    def running(self, guild_id: int) -> int:
+        return self._running.get(guild_id, 0)
+
+    def total_depth(self) -> int:
+        return sum(q.qsize() for q in self._queues.values())
+
+    async def submit(self, guild_id: int, func: Callable, *args: Any) -> Any:
+        """Queue `func(*args)` for a guild and wait for its result.
+
+        Raises OCRQueueFull instead of waiting when the guild's queue is at capacity.
+        """
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            queue = self._queues[guild_id] = asyncio.Queue(self.max_queue)
+        consumer = self._consumers.get(guild_id)
+        if consumer is None or consumer.done():
+            self._consumers[guild_id] = asyncio.create_task(self._consume(guild_id, queue))
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            queue.put_nowait((future, func, args))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise OCRQueueFull(f"{queue.qsize()} OCR jobs already queued") from None
+        return await future
+
+    async def _consume(self, guild_id: int, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            future, func, args = await queue.get()
+            if future.cancelled():
+                queue.task_done()
+                continue
+            self._running[guild_id] = 1
+            start = time.perf_counter()
+            try:
+                result = await self._run(loop, func, args)
+            except Exception as e:
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.completed += 1
+                self.total_time += time.perf_counter() - start
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._running[guild_id] = 0
+                queue.task_done()
+
+    async def _run(self, loop: asyncio.AbstractEventLoop, func: Callable, args: Tuple) -> Any:
+        if self.using_processes:
+            try:
+                # Functions are pickled by reference; fails here if the child couldn't find it
+                pickle.dumps(func)
+                executor = self.executor
+            except (pickle.PicklingError, AttributeError, TypeError, OSError, NotImplementedError) as e:
+                self._fall_back(e)
+            else:
+                try:
+                    return await loop.run_in_executor(executor, func, *args)
+                except BrokenProcessPool as e:
+                    # A worker couldn't start or died, e.g. the cog package can't be imported by a
+                    # spawned child. Errors raised by the job itself propagate as they are.
+                    self._fall_back(e)
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _fall_back(self, e: BaseException):
+        log.warning(f"GuildOps: OCR process pool unusable ({e!r}), falling back to threads.")
+        self._shutdown_executor()
+        self.using_processes = False
+
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def close(self):
+        for task in self._consumers.values():
+            task.cancel()
+        for queue in self._queues.values():
+            while not queue.empty():
+                future, _, _ = queue.get_nowait()
+                future.cancel()
+        self._consumers.clear()
+        self._queues.clear()
+        self._shutdown_executor()
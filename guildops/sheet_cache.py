@@ -0,0 +1,79 @@
+"""Long-lived gspread client and per-guild Spreadsheet/Worksheet handles."""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import gspread
+
+# Rebuild the client at least this often, even if the credentials still look valid
+CLIENT_TTL = 45 * 60
+# Re-resolve spreadsheet/worksheet metadata after this long
+HANDLE_TTL = 10 * 60
+
+
+def credentials(gc: gspread.Client) -> Any:
+    # gspread >= 6 keeps credentials on the HTTP client, older versions on the client itself
+    http_client = getattr(gc, "http_client", None)
+    return getattr(http_client, "auth", None) or getattr(gc, "auth", None)
+
+
+class SheetHandleCache:
+    """
+    Caches the authorized client once, and Spreadsheet/Worksheet objects per guild.
+
+    Entries are keyed on the configured sheet ID and worksheet name, so changing either via
+    `opset` misses the cache; `invalidate()` is still called there to drop stale handles early.
+    """
+
+    def __init__(self, client_ttl: float = CLIENT_TTL, handle_ttl: float = HANDLE_TTL):
+        self.client_ttl = client_ttl
+        self.handle_ttl = handle_ttl
+        self._client: Optional[gspread.Client] = None
+        self._client_key: Optional[Tuple[str, float]] = None
+        self._client_at = 0.0
+        # guild_id -> (sheet_id, worksheet_name, spreadsheet, worksheet, created_at)
+        self._handles: Dict[int, Tuple[str, Optional[str], Any, Any, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def client(self, creds_file: Path) -> Optional[gspread.Client]:
+        """The cached client, or None when it must be (re)built."""
+        if self._client is None:
+            return None
+        key = (str(creds_file), creds_file.stat().st_mtime)
+        if key != self._client_key or time.monotonic() - self._client_at > self.client_ttl:
+            self.reset()
+            return None
+        return self._client
+
+    def set_client(self, gc: gspread.Client, creds_file: Path):
+        self._client = gc
+        self._client_key = (str(creds_file), creds_file.stat().st_mtime)
+        self._client_at = time.monotonic()
+        # Handles hold a reference to the old client's session
+        self._handles.clear()
+
+    def worksheet(self, guild_id: int, sheet_id: str, worksheet_name: Optional[str]) -> Optional[Any]:
+        entry = self._handles.get(guild_id)
+        if (
+            entry is None
+            or entry[0] != sheet_id
+            or entry[1] != worksheet_name
+            or time.monotonic() - entry[4] > self.handle_ttl
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[3]
+
+    def set_worksheet(self, guild_id: int, sheet_id: str, worksheet_name: Optional[str], sh: Any, ws: Any):
+        self._handles[guild_id] = (sheet_id, worksheet_name, sh, ws, time.monotonic())
+
+    def invalidate(self, guild_id: int):
+        self._handles.pop(guild_id, None)
+
+    def reset(self):
+        self._client = None
+        self._client_key = None
+        self._handles.clear()
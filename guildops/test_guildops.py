@@ -1,5 +1,6 @@
 """Tests for GuildOps cog."""
 
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 import discord
@@ -114,6 +115,72 @@ flourishes!
             assert found_id_update, "Did not update Discord ID on existing row"
             assert found_import_update, "Did not update Import source to Form"
 
+    async def test_process_ocr_batch(self, cog):
+        """Test that one screenshot's entries are written with a single batch_update and append_rows."""
+        mock_ws = MagicMock()
+        mock_ws.get_all_values.return_value = [
+            ["Discord ID", "IGN", "Date Added", "Status", "Import", "Roles (Manual)"],
+            ["111", "Known", "", "Active", "Form", "Officer"],
+            ["", "Other", "", "Active", "OCR", ""],
+        ]
+
+        async def mock_executor(executor, func):
+            return func()
+        cog.bot.loop.run_in_executor = mock_executor
+        cog._open_worksheet = AsyncMock(return_value=mock_ws)
+        cog._do_custom_sort = AsyncMock()
+        cog._apply_left_roles = AsyncMock(return_value=" (Roles Updated)")
+
+        entries = [("known", "Left"), ("NewGuy", "Active"), ("Other", "Left"), ("NewGuy", "Left")]
+        success, messages = await cog._process_ocr_batch("sheet_id", entries, MagicMock(), "01/01/2026")
+
+        assert success is True
+        assert len(messages) == 4
+        mock_ws.batch_update.assert_called_once()
+        updates = {u['range']: u['values'] for u in mock_ws.batch_update.call_args[0][0]}
+        assert updates == {"D2": [["Left"]], "F2": [[""]], "D3": [["Left"]]}
+        mock_ws.append_rows.assert_called_once()
+        appended = mock_ws.append_rows.call_args[0][0]
+        assert appended == [["", "NewGuy", "01/01/2026", "Left", "OCR", ""]]
+        cog._do_custom_sort.assert_awaited_once()
+        # Only the row with a Discord ID gets role changes
+        cog._apply_left_roles.assert_awaited_once()
+        assert messages[0].endswith("(Roles Updated)")
+
+    async def test_custom_sort_writes_only_moved_rows(self, cog):
+        """Test that sorting skips in-order sheets and only rewrites rows that moved."""
+        header = ["IGN", "Status", "UID", "Roles (Manual)"]
+        rows = [
+            ["Alpha", "Active", "", "Officer"],
+            ["Bravo", "Active", "", "Members"],
+            ["Delta", "Left", "", ""],
+            ["Charlie", "Left", "", ""],
+        ]
+        mock_ws = MagicMock()
+        mock_ws.get_all_values.return_value = [header] + rows
+
+        async def mock_executor(executor, func):
+            return func()
+        cog.bot.loop.run_in_executor = mock_executor
+
+        result = await cog._do_custom_sort(mock_ws)
+        mock_ws.batch_update.assert_called_once()
+        updates = mock_ws.batch_update.call_args[0][0]
+        assert updates == [{'range': "A4:D5", 'values': [rows[3], rows[2]]}]
+        assert result[1:] == rows[:2] + [rows[3], rows[2]]
+
+        mock_ws.batch_update.reset_mock()
+        mock_ws.get_all_values.return_value = result
+        await cog._do_custom_sort(mock_ws)
+        mock_ws.batch_update.assert_not_called()
+
+    async def test_changed_row_blocks(self, cog):
+        """Test contiguous block detection between two row orders."""
+        old = [["a"], ["b"], ["c"], ["d"], ["e"]]
+        new = [["b"], ["a"], ["c"], ["e"], ["d"]]
+        assert cog._changed_row_blocks(old, new) == [(0, 2), (3, 5)]
+        assert cog._changed_row_blocks(old, old) == []
+
     async def test_synchistory_forms(self, cog):
         """Test synchistory command for forms."""
         ctx = MagicMock()
@@ -157,4 +224,220 @@ flourishes!
         call_args = cog._sync_data_to_sheet.call_args
         assert call_args[0][0] == "SHEET_ID"
         assert len(call_args[0][1]) == 1 # Only one valid form
-        assert call_args[0][1][0]['ign'] == "A"
\ No newline at end of file
+        assert call_args[0][1][0]['ign'] == "A"
+
+class TestImaging:
+    """The NumPy preprocessing must stay pixel-identical to the original PIL pipeline."""
+
+    @pytest.mark.parametrize("threshold", [0, 160, 250])
+    @pytest.mark.parametrize("use_filter", [True, False])
+    @pytest.mark.parametrize("use_connectivity", [True, False])
+    def test_matches_legacy_pipeline(self, threshold, use_filter, use_connectivity):
+        from guildops.benchmark_imaging import legacy_process_image, synthetic_screenshot
+        from guildops.imaging import process_image
+
+        for seed in range(3):
+            img_data = synthetic_screenshot(320, 200, rows=8, seed=seed)
+            expected = legacy_process_image(img_data, threshold, use_filter, use_connectivity)
+            actual = process_image(img_data, threshold, use_filter, use_connectivity)
+            assert actual.mode == expected.mode
+            assert actual.tobytes() == expected.tobytes()
+
+    def test_underline_touching_right_edge(self):
+        import numpy as np
+        from guildops.imaging import remove_underlines
+
+        mask = np.zeros((3, 100), dtype=np.uint8)
+        mask[0, 10:20] = 200  # short run, kept
+        mask[1, 50:] = 200  # long run up to the edge, erased
+        mask[2, :] = 200  # whole row, erased
+        out = remove_underlines(mask, 40)
+        assert out[0, 10:20].tolist() == [200] * 10
+        assert not out[1:].any()
+
+
+@pytest.mark.asyncio
+class TestOCRWorkerPool:
+    """Per-guild queueing and back-pressure of the OCR pool."""
+
+    async def test_queue_full_rejects(self):
+        from guildops.ocr_pool import OCRQueueFull, OCRWorkerPool
+
+        pool = OCRWorkerPool(max_workers=1, max_queue=2)
+        pool.using_processes = False
+        try:
+            first = [asyncio.ensure_future(pool.submit(1, pow, 2, n)) for n in range(2)]
+            await asyncio.sleep(0)  # let both jobs enqueue before the consumer picks one up
+            with pytest.raises(OCRQueueFull):
+                await pool.submit(1, pow, 2, 5)
+            # Other guilds have their own queue
+            assert await pool.submit(2, pow, 2, 3) == 8
+            assert await asyncio.gather(*first) == [1, 2]
+            assert pool.rejected == 1
+            assert pool.completed == 3
+        finally:
+            pool.close()
+
+    async def test_job_errors_do_not_fall_back(self):
+        from guildops.ocr_pool import OCRWorkerPool
+
+        pool = OCRWorkerPool(max_workers=1)
+        try:
+            # Raised by the job in the worker process, not a pool failure
+            with pytest.raises(AttributeError):
+                await pool.submit(1, getattr, 0, "missing")
+            assert pool.using_processes
+            assert await pool.submit(1, pow, 2, 3) == 8
+            # A local function can't be sent to a worker process
+            assert await pool.submit(1, lambda: 5) == 5
+            assert not pool.using_processes
+        finally:
+            pool.close()
+
+
+class TestSheetHandleCache:
+    """Client and worksheet handle caching."""
+
+    def test_handles_keyed_on_sheet_and_worksheet(self, tmp_path):
+        from guildops.sheet_cache import SheetHandleCache
+
+        creds = tmp_path / "service_account.json"
+        creds.write_text("{}")
+        cache = SheetHandleCache()
+        assert cache.client(creds) is None
+        gc = MagicMock()
+        cache.set_client(gc, creds)
+        assert cache.client(creds) is gc
+
+        cache.set_worksheet(1, "sheet", None, "sh", "ws")
+        assert cache.worksheet(1, "sheet", None) == "ws"
+        assert cache.worksheet(1, "sheet", "Roster") is None
+        assert cache.worksheet(1, "other", None) is None
+        cache.invalidate(1)
+        assert cache.worksheet(1, "sheet", None) is None
+
+    def test_expired_ttl_drops_client(self, tmp_path):
+        from guildops.sheet_cache import SheetHandleCache
+
+        creds = tmp_path / "service_account.json"
+        creds.write_text("{}")
+        cache = SheetHandleCache(client_ttl=-1)
+        cache.set_client(MagicMock(), creds)
+        cache.set_worksheet(1, "sheet", None, "sh", "ws")
+        assert cache.client(creds) is None
+        assert cache.worksheet(1, "sheet", None) is None
+
+
+class FakeWorksheet:
+    """Worksheet whose batch updates change its values and bump the Drive modification time."""
+
+    id = 0
+
+    def __init__(self, values):
+        self.values = [list(row) for row in values]
+        self.revision = 0
+        self.spreadsheet = MagicMock(id="sheet")
+        self.spreadsheet.get_lastUpdateTime.side_effect = lambda: f"2025-01-01T00:00:{self.revision:02d}Z"
+        self.get_all_values = MagicMock(side_effect=lambda: [list(row) for row in self.values])
+        self.batch_update = MagicMock(side_effect=self._batch_update)
+        self.update = MagicMock()
+
+    def _batch_update(self, updates, value_input_option=None):
+        import gspread
+
+        for update in updates:
+            row, _ = gspread.utils.a1_to_rowcol(update["range"].split(":")[0])
+            for offset, values in enumerate(update["values"]):
+                self.values[row - 1 + offset] = list(values)
+        self.revision += 1
+
+    def edit(self, row, values):
+        """A user edit in the Sheets UI."""
+        self.values[row] = list(values)
+        self.revision += 1
+
+    def reset_mock(self):
+        self.get_all_values.reset_mock()
+        self.batch_update.reset_mock()
+        self.update.reset_mock()
+
+
+@pytest.mark.asyncio
+class TestAutoSort:
+    """Incremental auto-sort: skip unchanged sheets, write back only the rows that moved."""
+
+    HEADER = ["IGN", "Status", "UID", "Roles (Manual)"]
+    ROWS = [
+        ["Alpha", "Active", "", "Officer"],
+        ["Bravo", "Active", "", "Members"],
+        ["Charlie", "Left", "", ""],
+        ["Delta", "Left", "", ""],
+    ]
+
+    @pytest.fixture
+    def cog(self):
+        """GuildOps without its background loop, running executor jobs inline."""
+        cog = GuildOps.__new__(GuildOps)
+        cog.bot = MagicMock()
+        cog._sort_state = {}
+
+        async def mock_executor(executor, func):
+            return func()
+        cog.bot.loop.run_in_executor = mock_executor
+        return cog
+
+    async def sorted_sheet(self, cog):
+        """A sheet that has been auto-sorted once."""
+        ws = FakeWorksheet([self.HEADER] + self.ROWS)
+        await cog._auto_sort(ws)
+        ws.batch_update.assert_not_called()  # already in order
+        ws.reset_mock()
+        return ws
+
+    async def test_unchanged_sheet_is_skipped(self, cog):
+        """Test that an unchanged modification time or content hash writes nothing."""
+        sorted_ws = await self.sorted_sheet(cog)
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_not_called()
+
+        # Touched but the values are the same (e.g. an edit that was undone)
+        sorted_ws.edit(1, self.ROWS[0])
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_called_once()
+        sorted_ws.batch_update.assert_not_called()
+        sorted_ws.update.assert_not_called()
+
+        # The new modification time was remembered
+        sorted_ws.reset_mock()
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_not_called()
+
+    async def test_changed_row_writes_only_its_block(self, cog):
+        """Test that a row edited out of order only rewrites the rows it moved across."""
+        sorted_ws = await self.sorted_sheet(cog)
+        sorted_ws.edit(4, ["Aaron", "Left", "", ""])
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_called_once()
+        sorted_ws.update.assert_not_called()
+        updates = sorted_ws.batch_update.call_args[0][0]
+        assert updates == [{'range': "A4:D5", 'values': [["Aaron", "Left", "", ""], self.ROWS[2]]}]
+        assert sorted_ws.values[1:3] == self.ROWS[:2]
+
+        # Our own write isn't mistaken for a user edit
+        sorted_ws.reset_mock()
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_not_called()
+
+    async def test_changed_hash_resorts(self, cog):
+        """Test that changed content is re-sorted from the values already downloaded."""
+        sorted_ws = await self.sorted_sheet(cog)
+        sorted_ws.spreadsheet.get_lastUpdateTime.side_effect = Exception("Drive unavailable")
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.batch_update.assert_not_called()
+
+        sorted_ws.reset_mock()
+        sorted_ws.edit(1, ["Alpha", "Left", "", "Officer"])
+        await cog._auto_sort(sorted_ws)
+        sorted_ws.get_all_values.assert_called_once()
+        sorted_ws.batch_update.assert_called_once()
+        assert sorted_ws.values[1:] == [self.ROWS[1], ["Alpha", "Left", "", "Officer"]] + self.ROWS[2:]
@@ -6,9 +6,12 @@ from redbot.core import Config, commands
 import discord
 from discord import Webhook
 
-from .utils import msgFormatter, webhookSettings, webhookFinder, WEBHOOK_EMPTY_AVATAR, WEBHOOK_EMPTY_NAME
+from .utils import msgFormatter, webhookSettings, webhookFinder, edit_webhook_message, WEBHOOK_EMPTY_AVATAR, WEBHOOK_EMPTY_NAME
 from .utils_copy import timestampEmbed
-from .utils_relay import relayGetData, relayAddChannel, relayRemoveChannel, relayCheckInput, fixMsgrelayStoreV2alpha, isRelayWebhook
+from .utils_relay import relayAddChannel, relayRemoveChannel, relayCheckInput
+from .utils_routes import RelayRoutes
+from .utils_tracking import RelayedMessages
+from .utils_webhooks import WebhookPool
 
 import logging
 logger = logging.getLogger(__name__)
@@ -47,6 +50,32 @@ class Msgmover(commands.Cog):
             }
         """
         self.config.register_guild(**default_guild)
+        # Shared HTTP session and cached Webhook objects for relays
+        self.webhooks = WebhookPool()
+        # Relays of every guild, so on_message doesn't read Config
+        self.relayRoutes = RelayRoutes()
+        # Copies of recently relayed messages, to forward their edits/deletes
+        self.relayedMessages = RelayedMessages()
+
+    async def cog_load(self):
+        allGuilds = await self.config.all_guilds()
+        for guildId, guildData in allGuilds.items():
+            # Migrate data to multi-hook support if needed
+            relayStore = guildData.get("msgrelayStoreV2", {})
+            if any(not isinstance(relayList, list) for relayList in relayStore.values()):
+                relayStore = {chanId: relayList if isinstance(relayList, list) else [relayList] for chanId, relayList in relayStore.items()}
+                guildData["msgrelayStoreV2"] = relayStore
+                await self.config.guild_from_id(guildId).msgrelayStoreV2.set(relayStore)
+        self.relayRoutes.load(allGuilds)
+
+    async def cog_unload(self):
+        await self.webhooks.close()
+
+    async def reloadRelayRoutes(self, guild):
+        """Pick up relay changes of a guild"""
+        guildData = await self.config.guild(guild).all()
+        self.relayRoutes.setGuild(guild.id, guildData["msgrelayStoreV2"], guildData["relayTimer"])
+        self.webhooks.invalidate()
 
     # This cog does not store any End User Data
     async def red_get_data_for_user(self, *, user_id: int):
@@ -200,6 +229,7 @@ class Msgmover(commands.Cog):
             return await ctx.send("Setup was stopped. Exited.")
         else:
             await self.config.guild(ctx.guild).msgrelayStoreV2.set(relayAdd)
+            await self.reloadRelayRoutes(ctx.guild)
 
         # Test
         try:
@@ -236,6 +266,7 @@ class Msgmover(commands.Cog):
             await self.config.guild(ctx.guild).msgrelayStoreV2.set(relayAdd)
             # Delete old entry
             await relayRemoveChannel(self, ctx, fromChannel, itemToEdit)
+            await self.reloadRelayRoutes(ctx.guild)
 
         # Test
         try:
@@ -255,6 +286,7 @@ class Msgmover(commands.Cog):
         
         To delete all relays for a fromChannel, set itemToDelete to 0 (zero)."""
         result = await relayRemoveChannel(self, ctx, fromChannel, itemToDelete)
+        await self.reloadRelayRoutes(ctx.guild)
         if result == False:
             return await ctx.send("Deletion failed. Please report this error to the support server at <https://coffeebank.github.io/discord>.")
         await ctx.message.add_reaction("✅")
@@ -262,10 +294,11 @@ class Msgmover(commands.Cog):
     @msgrelay.command(name="settimer")
     @commands.bot_has_permissions(add_reactions=True)
     async def mmmrsettimer(self, ctx, seconds: int):
-        """Seconds after the relay checks for edited/deleted messages
+        """Seconds during which edited/deleted messages are updated in relays
         
-        To disable checking for edits/deleted messages after sending, set seconds to 0 (zero)."""
+        To disable updating edited/deleted messages after sending, set seconds to 0 (zero)."""
         await self.config.guild(ctx.guild).relayTimer.set(seconds)
+        self.relayRoutes.setTimer(ctx.guild.id, seconds)
         await ctx.message.add_reaction("✅")
 
 
@@ -283,53 +316,54 @@ class Msgmover(commands.Cog):
         # However, we DO want to relay messages from OTHER webhooks (channel integrations, followed channels, etc.)
         # TO STOP A TWO-WAY REDIRECT, USE [p]msgrelay delete #channel
         if message.webhook_id:
-            if await isRelayWebhook(self, message.guild, message.webhook_id):
+            if self.relayRoutes.isRelayWebhook(message.guild.id, message.webhook_id):
                 return
             # If we get here, it's a webhook message but NOT from our relay system
             # This means it's from a channel integration (followed channel, other webhooks, etc.)
             # Allow it to be relayed
 
-        # Retrieve webhook info from channel store
-        relayStore = await self.config.guild(message.guild).msgrelayStoreV2()
-        if not str(message.channel.id) in relayStore:
+        # Retrieve webhook info from the routing table
+        hookData = self.relayRoutes.relays(message.guild.id, message.channel.id)
+        if not hookData:
             return
-
-        hookData = relayStore[str(message.channel.id)]
-        relayTimer = await self.config.guild(message.guild).relayTimer()
-        
-        # Migrate data to multi-hook support if needed
-        try:
-            assert isinstance(hookData, list)
-        except AssertionError:
-            hookData = await fixMsgrelayStoreV2alpha(self, message)
+        relayTimer = self.relayRoutes.timer(message.guild.id)
 
         # Send along webhook for each in array
-        try:
-            async with aiohttp.ClientSession() as session:
-                for wh in hookData:
-                    configJson = relayGetData(wh)
-                    webhook = Webhook.from_url(wh["toWebhook"], session=session)
-                    whResult = await msgFormatter(self, webhook, message, configJson)
-                    wh["whResult"] = whResult.id
-                # Wait, then check for edits/deletes
-                if relayTimer <= 0:
-                    return
-                else:
-                    await asyncio.sleep(relayTimer)
-                    try:
-                        endMsg = await message.channel.fetch_message(message.id)
-                    except discord.NotFound:
-                        for wf in hookData:
-                            configJson = relayGetData(wf)
-                            webhook = Webhook.from_url(wf["toWebhook"], session=session)
-                            await msgFormatter(self, webhook, message, configJson, deleteMsgId=wf.get("whResult", None))
-                    else:
-                        if endMsg.edited_at:
-                            for wf in hookData:
-                                configJson = relayGetData(wf)
-                                webhook = Webhook.from_url(wf["toWebhook"], session=session)
-                                await msgFormatter(self, webhook, endMsg, configJson, editMsgId=wf.get("whResult", None))
-        finally:
-            await session.close()
+        # Remember where it was sent, so that edits/deletes within relayTimer are forwarded
+        copies = self.relayedMessages.track(message.id, relayTimer) if relayTimer > 0 else []
+        for configJson in hookData:
+            webhook = self.webhooks.get(configJson["toWebhook"])
+            whResult = await msgFormatter(self, webhook, message, configJson)
+            if whResult:
+                copies.append((configJson, whResult.id))
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        copies = self.relayedMessages.get(payload.message_id)
+        if not copies:
+            return
+        # Only forward actual edits, not embeds being added to the message
+        if not payload.data.get("edited_timestamp") or "content" not in payload.data:
+            return
+        for configJson, whMsgId in list(copies):
+            webhook = self.webhooks.get(configJson["toWebhook"])
+            await edit_webhook_message(webhook, whMsgId, payload.data["content"])
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        await self.deleteRelayedCopies(payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        for messageId in payload.message_ids:
+            await self.deleteRelayedCopies(messageId)
+
+    async def deleteRelayedCopies(self, messageId):
+        copies = self.relayedMessages.pop(messageId)
+        if not copies:
+            return
+        for configJson, whMsgId in copies:
+            webhook = self.webhooks.get(configJson["toWebhook"])
+            await msgFormatter(self, webhook, None, configJson, deleteMsgId=whMsgId)
 
 # Force update
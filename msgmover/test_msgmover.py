@@ -1,13 +1,24 @@
 """Tests for MsgMover cog."""
 
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 import os
+import json
+import time
+
+import aiohttp
+import discord
+from aiohttp import web
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from msgmover.msgmover import MsgMover
+from msgmover.msgmover import Msgmover as MsgMover
+from msgmover.utils import msgFormatter, webhookSettings
+from msgmover.utils_routes import RelayRoutes
+from msgmover.utils_tracking import RelayedMessages
+from msgmover.utils_webhooks import WebhookPool
 
 
 @pytest.mark.asyncio
@@ -44,3 +55,244 @@ class TestMsgMoverCog:
         assert utils is not None
         assert utils_copy is not None
         assert utils_relay is not None
+
+
+WEBHOOK_URL = "https://discord.com/api/webhooks/123456789012345678/" + "t" * 68
+RELAY_BENCHMARK_MESSAGES = 200
+
+# Benchmarks are slow and only print their numbers: run them with RUN_BENCHMARKS=1.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="benchmark, set RUN_BENCHMARKS=1 to run"
+)
+
+
+@pytest.mark.asyncio
+class TestWebhookPool:
+    """Test suite for the shared relay session and Webhook cache."""
+
+    async def test_webhooks_cached_per_url(self):
+        """Test that a URL is parsed once, until invalidated."""
+        pool = WebhookPool()
+        try:
+            webhook = pool.get(WEBHOOK_URL)
+            assert pool.get(WEBHOOK_URL) is webhook
+            pool.invalidate(WEBHOOK_URL)
+            assert pool.get(WEBHOOK_URL) is not webhook
+            webhook = pool.get(WEBHOOK_URL)
+            pool.invalidate()
+            assert pool.get(WEBHOOK_URL) is not webhook
+        finally:
+            await pool.close()
+
+    async def test_session_reused_until_closed(self):
+        """Test that one session serves every relay, and a closed one is replaced."""
+        pool = WebhookPool()
+        session = pool.session
+        assert pool.session is session
+        webhook = pool.get(WEBHOOK_URL)
+        await pool.close()
+        assert session.closed
+        assert pool.session is not session
+        assert pool.get(WEBHOOK_URL) is not webhook
+        await pool.close()
+
+
+class TestRelayRoutes:
+    """Test suite for the in-memory relay routing table."""
+
+    @pytest.fixture
+    def routes(self):
+        routes = RelayRoutes()
+        routes.load({
+            1: {
+                "msgrelayStoreV2": {
+                    "10": [
+                        {"toWebhook": "https://discord.com/api/webhooks/111/token", "attachsAsUrl": False},
+                        {"toWebhook": "https://discord.com/api/webhooks/222/token"},
+                    ],
+                    "11": {"toWebhook": "https://discord.com/api/webhooks/333/token"},  # legacy
+                    "12": [],
+                },
+                "relayTimer": 5,
+            },
+            2: {"msgrelayStoreV2": {}, "relayTimer": 0},
+        })
+        return routes
+
+    def test_routes(self, routes):
+        """Test that channels route to their parsed relays."""
+        relays = routes.relays(1, 10)
+        assert [relay["toWebhook"] for relay in relays] == [
+            "https://discord.com/api/webhooks/111/token",
+            "https://discord.com/api/webhooks/222/token",
+        ]
+        assert relays[0]["attachsAsUrl"] is False and relays[1]["attachsAsUrl"] is True
+        assert len(routes.relays(1, 11)) == 1
+        assert routes.relays(1, 12) == []
+        assert routes.relays(1, 99) == [] and routes.relays(3, 10) == []
+        assert routes.timer(1) == 5 and routes.timer(2) == 0 and routes.timer(3) == 20
+
+    def test_relay_webhooks(self, routes):
+        """Test that only the guild's own relay webhooks are recognised."""
+        assert routes.isRelayWebhook(1, 111)
+        assert routes.isRelayWebhook(1, 333)
+        assert not routes.isRelayWebhook(1, 444)
+        assert not routes.isRelayWebhook(2, 111)
+        assert not routes.isRelayWebhook(1, None)
+
+    def test_set_guild(self, routes):
+        """Test that relay changes replace the guild's routes."""
+        routes.setGuild(1, {"12": [{"toWebhook": "https://discord.com/api/webhooks/444/token"}]})
+        assert routes.relays(1, 10) == []
+        assert len(routes.relays(1, 12)) == 1
+        assert routes.isRelayWebhook(1, 444) and not routes.isRelayWebhook(1, 111)
+        assert routes.timer(1) == 5
+        routes.setTimer(1, 30)
+        assert routes.timer(1) == 30
+        routes.setGuild(1, {})
+        assert routes.relays(1, 12) == [] and not routes.isRelayWebhook(1, 444)
+
+
+class TestRelayedMessages:
+    """Test suite for the bounded TTL map of relayed messages."""
+
+    @pytest.fixture
+    def clock(self):
+        clock = MagicMock(return_value=0.0)
+        return clock
+
+    def test_track_and_expire(self, clock):
+        """Test that copies are found until the message's TTL runs out."""
+        relayed = RelayedMessages(clock=clock)
+        copies = relayed.track(1, 20)
+        copies.append(({"toWebhook": "url"}, 100))
+        relayed.track(2, 5).append(({"toWebhook": "url"}, 200))
+        clock.return_value = 10.0
+        assert relayed.get(1) == [({"toWebhook": "url"}, 100)]
+        assert relayed.get(2) is None
+        clock.return_value = 20.0
+        assert relayed.get(1) is None
+        assert len(relayed) == 0
+
+    def test_pop(self, clock):
+        """Test that a deleted message is forgotten."""
+        relayed = RelayedMessages(clock=clock)
+        relayed.track(1, 20).append(({}, 100))
+        assert relayed.pop(1) == [({}, 100)]
+        assert relayed.pop(1) is None
+        assert relayed.get(1) is None
+
+    def test_bounded(self, clock):
+        """Test that the oldest messages are forgotten when full, and expired ones on insert."""
+        relayed = RelayedMessages(maxSize=3, clock=clock)
+        for messageId in range(5):
+            relayed.track(messageId, 20)
+        assert len(relayed) == 3
+        assert relayed.get(0) is None and relayed.get(1) is None
+        assert relayed.get(4) == []
+        clock.return_value = 30.0
+        relayed.track(5, 20)
+        assert len(relayed) == 1
+
+
+@benchmark
+@pytest.mark.asyncio
+class TestRelaySessionBenchmark:
+    """Relay messages through msgFormatter to a local stand-in for Discord's webhook endpoint."""
+
+    @pytest_asyncio.fixture
+    async def standin(self, monkeypatch):
+        """Local HTTP server answering webhook executes, recording each request's client address.
+
+        discord.py's webhook routes are pointed at it, so `Webhook.send` really goes over HTTP.
+        """
+        clients = []
+
+        async def execute(request):
+            clients.append(request.transport.get_extra_info("peername"))
+            payload = await request.json()
+            webhook_id = request.match_info["webhook_id"]
+            message = {
+                "id": str(1000 + len(clients)),
+                "channel_id": "2000",
+                "webhook_id": webhook_id,
+                "author": {"id": webhook_id, "username": payload.get("username", "Relay"), "discriminator": "0000", "avatar": None, "bot": True},
+                "content": payload.get("content", ""),
+                "timestamp": "2025-01-01T00:00:00+00:00",
+                "edited_timestamp": None,
+                "tts": False,
+                "mention_everyone": False,
+                "mentions": [],
+                "mention_roles": [],
+                "attachments": [],
+                "embeds": [],
+                "pinned": False,
+                "type": 0,
+                "flags": 0,
+            }
+            # discord.py only parses the body if the Content-Type is exactly application/json
+            return web.Response(body=json.dumps(message).encode(), headers={"Content-Type": "application/json"})
+
+        app = web.Application()
+        app.router.add_post("/api/v10/webhooks/{webhook_id}/{token}", execute)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        monkeypatch.setattr(discord.webhook.async_.Route, "BASE", f"http://127.0.0.1:{port}/api/v10")
+        yield clients
+        await runner.cleanup()
+
+    def message(self, i):
+        """Plain text message from a member, as the relay listener receives it."""
+        message = MagicMock()
+        message.type = discord.MessageType.default
+        message.content = f"Relayed message {i}"
+        message.reference = None
+        message.embeds = []
+        message.attachments = []
+        message.activity = None
+        message.application = None
+        message.stickers = []
+        message.author.display_name = "Member"
+        message.author.display_avatar.url = "https://cdn.discordapp.com/embed/avatars/0.png"
+        return message
+
+    async def test_pooled_webhook_vs_session_per_message(self, standin):
+        """Test that relays reuse one cached Webhook and connection instead of one per message."""
+        clients = standin
+        relayInfo = webhookSettings({"toWebhook": WEBHOOK_URL})
+
+        # Before the pool: a new session and Webhook for every relayed message
+        start = time.perf_counter()
+        for i in range(RELAY_BENCHMARK_MESSAGES):
+            async with aiohttp.ClientSession() as session:
+                webhook = discord.Webhook.from_url(WEBHOOK_URL, session=session)
+                assert await msgFormatter(None, webhook, self.message(i), relayInfo)
+        per_message = time.perf_counter() - start
+        per_message_connections = len(set(clients))
+        clients.clear()
+
+        pool = WebhookPool()
+        try:
+            webhooks = set()
+            start = time.perf_counter()
+            for i in range(RELAY_BENCHMARK_MESSAGES):
+                webhook = pool.get(relayInfo["toWebhook"])
+                webhooks.add(id(webhook))  # Webhooks hash by webhook ID, compare the objects
+                whMsg = await msgFormatter(None, webhook, self.message(i), relayInfo)
+                assert whMsg.content == f"Relayed message {i}"
+            pooled = time.perf_counter() - start
+            assert len(webhooks) == 1
+        finally:
+            await pool.close()
+
+        print(
+            f"\n{RELAY_BENCHMARK_MESSAGES} relays: session per message {per_message:.3f}s "
+            f"({per_message_connections} connections), pooled webhook {pooled:.3f}s "
+            f"({len(set(clients))} connections)"
+        )
+        assert len(clients) == RELAY_BENCHMARK_MESSAGES
+        assert len(set(clients)) == 1
+        assert per_message_connections > 1
@@ -136,24 +136,35 @@ async def handle_message_lifecycle(
 
     # Edit the message if requested
     if edit_msg_id is not None:
-        try:
-            return await webhook.edit_message(
-                message_id=edit_msg_id,
-                content=message.content.replace("@everyone", "@\u200beveryone").replace("@here", "@\u200bhere")
-            )
-        except discord.HTTPException:
-            try:
-                return await webhook.edit_message(
-                    message_id=edit_msg_id,
-                    content="**Discord:** Unsupported content\n" + str(message.content.replace("@everyone", "@\u200beveryone").replace("@here", "@\u200bhere"))
-                )
-            except (discord.HTTPException, discord.NotFound):
-                return False
+        return await edit_webhook_message(webhook, edit_msg_id, message.content)
 
     # No lifecycle operation requested
     return True
 
 
+async def edit_webhook_message(
+    webhook: discord.Webhook,
+    message_id: int,
+    content: str
+) -> bool | discord.WebhookMessage:
+    """Replace the content of a relayed message.
+
+    Returns:
+        bool | WebhookMessage: False if the edit failed, the edited message otherwise
+    """
+    content = content.replace("@everyone", "@\u200beveryone").replace("@here", "@\u200bhere")
+    try:
+        return await webhook.edit_message(message_id=message_id, content=content)
+    except discord.HTTPException:
+        try:
+            return await webhook.edit_message(
+                message_id=message_id,
+                content="**Discord:** Unsupported content\n" + str(content)
+            )
+        except (discord.HTTPException, discord.NotFound):
+            return False
+
+
 async def msgFormatter(self, webhook, message, json, editMsgId=None, deleteMsgId=None):
     """Format and send a message through a webhook.
 
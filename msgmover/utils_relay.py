@@ -103,26 +103,8 @@ async def isRelayWebhook(self, guild, webhook_id):
     Returns:
         bool: True if the webhook is one of our relay webhooks, False otherwise
     """
-    if not webhook_id:
-        return False
-
-    # Get all relay data for this guild
-    relayStore = await self.config.guild(guild).msgrelayStoreV2()
-
-    # Check all channels and their relay webhooks
-    for channel_id, relay_list in relayStore.items():
-        # Ensure relay_list is a list (handle legacy data)
-        if not isinstance(relay_list, list):
-            relay_list = [relay_list]
-
-        # Check each relay webhook
-        for relay in relay_list:
-            webhook_url = relay.get("toWebhook", "")
-            # Extract webhook ID from URL (format: https://discord.com/api/webhooks/{webhook_id}/{token})
-            if webhook_url and f"/{webhook_id}/" in webhook_url:
-                return True
-
-    return False
+    # Served from the routing table built at load, see RelayRoutes
+    return self.relayRoutes.isRelayWebhook(guild.id, webhook_id)
 
 
 async def fixMsgrelayStoreV2alpha(self, ctx):
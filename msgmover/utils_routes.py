@@ -0,0 +1,76 @@
+import re
+
+from .utils import webhookSettings
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RELAY_TIMER = 20
+# Numeric path segments of a webhook URL (format: https://discord.com/api/webhooks/{webhook_id}/{token})
+WEBHOOK_ID_PATTERN = re.compile(r"/(\d+)(?=/)")
+
+
+def webhookIdsFromUrl(url):
+    """IDs a relay webhook URL can send as, i.e. its numeric path segments"""
+    return {int(webhookId) for webhookId in WEBHOOK_ID_PATTERN.findall(url or "")}
+
+
+class RelayRoutes:
+    """In-memory copy of every guild's relays, so the message listener never reads Config
+
+    Built from Config when the cog loads, and updated by the commands that change relays.
+
+    - `relays(guildId, channelId)`: the relays of a channel, with their settings already parsed
+    - `isRelayWebhook(guildId, webhookId)`: whether a webhook is one of the guild's relay webhooks
+    - `timer(guildId)`: the guild's relayTimer
+    """
+
+    def __init__(self):
+        # guildId -> {channelId: [relay settings]}
+        self._routes: dict[int, dict[int, list[dict]]] = {}
+        # guildId -> IDs of the guild's relay webhooks
+        self._webhookIds: dict[int, set[int]] = {}
+        self._timers: dict[int, int] = {}
+
+    def load(self, allGuilds):
+        self._routes.clear()
+        self._webhookIds.clear()
+        self._timers.clear()
+        for guildId, guildData in allGuilds.items():
+            self.setGuild(int(guildId), guildData.get("msgrelayStoreV2", {}), guildData.get("relayTimer", DEFAULT_RELAY_TIMER))
+
+    def setGuild(self, guildId, msgrelayStoreV2, relayTimer=None):
+        routes = {}
+        webhookIds = set()
+        for channelId, relayList in msgrelayStoreV2.items():
+            # Handle legacy data (single relay per channel)
+            if not isinstance(relayList, list):
+                relayList = [relayList]
+            relays = [webhookSettings(relay) for relay in relayList]
+            if relays:
+                routes[int(channelId)] = relays
+            for relay in relays:
+                webhookIds |= webhookIdsFromUrl(relay["toWebhook"])
+
+        if routes:
+            self._routes[guildId] = routes
+            self._webhookIds[guildId] = webhookIds
+        else:
+            self._routes.pop(guildId, None)
+            self._webhookIds.pop(guildId, None)
+        if relayTimer is not None:
+            self.setTimer(guildId, relayTimer)
+
+    def setTimer(self, guildId, relayTimer):
+        self._timers[guildId] = relayTimer
+
+    def relays(self, guildId, channelId):
+        """Relay settings of a channel (treat as read-only), empty if it has no relays"""
+        return self._routes.get(guildId, {}).get(channelId, [])
+
+    def isRelayWebhook(self, guildId, webhookId):
+        return bool(webhookId) and webhookId in self._webhookIds.get(guildId, ())
+
+    def timer(self, guildId):
+        return self._timers.get(guildId, DEFAULT_RELAY_TIMER)
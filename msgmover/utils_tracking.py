@@ -0,0 +1,57 @@
+import collections
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# Relayed messages remembered at once; the oldest are forgotten first
+MAX_TRACKED_MESSAGES = 10000
+
+
+class RelayedMessages:
+    """Where each recently relayed message was sent, for forwarding its edits and deletes
+
+    Maps a source message ID to its copies, as (relay settings, webhook message ID) pairs. A
+    message is remembered for its guild's relayTimer, and at most `maxSize` messages are
+    remembered. Nothing is scheduled per message: expired entries are dropped when looked up or
+    when new messages are tracked.
+    """
+
+    def __init__(self, maxSize=MAX_TRACKED_MESSAGES, clock=time.monotonic):
+        self.maxSize = maxSize
+        self.clock = clock
+        # Source message ID -> (expiry time, [(relay settings, webhook message ID)]), oldest first
+        self._messages: collections.OrderedDict[int, tuple[float, list]] = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._messages)
+
+    def track(self, messageId, ttl):
+        """Start tracking a message; append its copies to the returned list as they are sent"""
+        now = self.clock()
+        # Drop expired messages from the front, then the oldest while full
+        while self._messages:
+            oldestId, (expiresAt, _) = next(iter(self._messages.items()))
+            if expiresAt > now and len(self._messages) < self.maxSize:
+                break
+            del self._messages[oldestId]
+        copies = []
+        self._messages[messageId] = (now + ttl, copies)
+        return copies
+
+    def get(self, messageId):
+        """Copies of a message, None if it isn't (or no longer) tracked"""
+        entry = self._messages.get(messageId)
+        if entry is None:
+            return None
+        if entry[0] <= self.clock():
+            del self._messages[messageId]
+            return None
+        return entry[1]
+
+    def pop(self, messageId):
+        """Copies of a deleted message, which stops being tracked"""
+        copies = self.get(messageId)
+        self._messages.pop(messageId, None)
+        return copies
@@ -0,0 +1,57 @@
+import aiohttp
+
+from discord import Webhook
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+# Open connections for all relays. Discord rate limits webhooks per webhook, so a few kept-alive
+# connections are enough; more would only sit idle.
+RELAY_CONNECTION_LIMIT = 20
+RELAY_KEEPALIVE_TIMEOUT = 60  # seconds
+
+
+class WebhookPool:
+    """One pooled HTTP session for all relayed messages, and parsed Webhooks cached per URL
+
+    The session is created on first use and kept until the cog unloads, so relays reuse
+    kept-alive connections to Discord instead of paying TCP + TLS setup for every message.
+    Cached Webhooks are bound to the session; call `invalidate` when the relay store changes.
+    """
+
+    def __init__(self, limit=RELAY_CONNECTION_LIMIT, keepaliveTimeout=RELAY_KEEPALIVE_TIMEOUT):
+        self.limit = limit
+        self.keepaliveTimeout = keepaliveTimeout
+        self._session: aiohttp.ClientSession | None = None
+        self._webhooks: dict[str, Webhook] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Webhooks bound to a closed session can't be reused
+            self._webhooks.clear()
+            connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=self.keepaliveTimeout)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def get(self, url: str) -> Webhook:
+        """Webhook for a URL, parsed once and bound to the pooled session"""
+        session = self.session
+        webhook = self._webhooks.get(url)
+        if webhook is None:
+            webhook = self._webhooks[url] = Webhook.from_url(url, session=session)
+        return webhook
+
+    def invalidate(self, url: str | None = None):
+        """Forget the cached Webhook of a URL, or all of them"""
+        if url is None:
+            self._webhooks.clear()
+        else:
+            self._webhooks.pop(url, None)
+
+    async def close(self):
+        self._webhooks.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
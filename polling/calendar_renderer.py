@@ -1,8 +1,64 @@
 """Calendar image rendering using PIL with emoji support via pilmoji"""
 
 from PIL import Image, ImageDraw, ImageFont
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import hashlib
 import io
+import json
+import threading
+
+from . import time_slots as slot_index
+
+
+class EmojiAtlas:
+    """Process-wide emoji bitmap cache, kept in memory and optionally mirrored to disk
+
+    Once an emoji has been fetched (or loaded from disk) it is never requested over the network again.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory
+        self._images: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def set_directory(self, directory: Path):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+
+    def _path(self, emoji: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / ("-".join(f"{ord(c):x}" for c in emoji) + ".png")
+
+    def get(self, emoji: str) -> Optional[bytes]:
+        data = self._images.get(emoji)
+        if data is None:
+            path = self._path(emoji)
+            if path is not None and path.exists():
+                data = path.read_bytes()
+                with self._lock:
+                    self._images[emoji] = data
+        return data
+
+    def put(self, emoji: str, data: bytes):
+        with self._lock:
+            self._images[emoji] = data
+        path = self._path(emoji)
+        if path is not None:
+            try:
+                path.write_bytes(data)
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+
+EMOJI_ATLAS = EmojiAtlas()
 
 try:
     from pilmoji import Pilmoji
@@ -15,12 +71,194 @@ try:
             # Add a 10s timeout to avoid hanging indefinitely
             with self._requests_session.get(url, timeout=10, **self.REQUEST_KWARGS) as response:
                 return response.content
+
+    class AtlasTwemoji(TwemojiWithTimeout):
+        """Twemoji source that serves emojis from EMOJI_ATLAS, fetching each one at most once"""
+        def get_emoji(self, emoji: str, /) -> Optional[io.BytesIO]:
+            data = EMOJI_ATLAS.get(emoji)
+            if data is None:
+                stream = super().get_emoji(emoji)
+                if stream is None:
+                    return None
+                data = stream.getvalue()
+                EMOJI_ATLAS.fetches += 1
+                EMOJI_ATLAS.put(emoji, data)
+            return io.BytesIO(data)
 except ImportError:
     PILMOJI_AVAILABLE = False
 
 
+def warm_emoji_atlas(emojis) -> int:
+    """Fetch any emojis missing from the atlas (blocking). Returns how many are now available."""
+    if not PILMOJI_AVAILABLE:
+        return 0
+    source = AtlasTwemoji()
+    available = 0
+    for emoji in emojis:
+        try:
+            if source.get_emoji(emoji) is not None:
+                available += 1
+        except Exception:
+            continue
+    return available
+
+
+# Font paths with multiple fallbacks (Windows & Linux)
+FONT_PATHS = [
+    # Windows paths
+    "C:\\Windows\\Fonts\\arial.ttf",
+    "C:\\Windows\\Fonts\\DejaVuSans.ttf",
+    # Linux paths
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/dejavu-sans/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+]
+
+FONT_BOLD_PATHS = [
+    # Windows paths
+    "C:\\Windows\\Fonts\\arialbd.ttf",
+    "C:\\Windows\\Fonts\\DejaVuSans-Bold.ttf",
+    # Linux paths
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu-sans/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
+]
+
+_font_paths: Optional[Tuple[Optional[str], Optional[str]]] = None
+_font_paths_lock = threading.Lock()
+_thread_fonts = threading.local()
+
+
+def _resolve_font_paths() -> Tuple[Optional[str], Optional[str]]:
+    """Find the regular and bold font files once per process (None = PIL default font)"""
+    global _font_paths
+    with _font_paths_lock:
+        if _font_paths is not None:
+            return _font_paths
+
+        regular = bold = None
+        # Try loading fonts without layout_engine parameter (may cause compatibility issues)
+        for font_path in FONT_PATHS:
+            try:
+                ImageFont.truetype(font_path, 13)
+                print(f"Successfully loaded regular font from: {font_path}")
+                regular = font_path
+                break
+            except Exception as e:
+                print(f"Failed to load font from {font_path}: {e}")
+        if regular is None:
+            print("ERROR: Could not load regular font from any path, using default")
+
+        for font_bold_path in FONT_BOLD_PATHS:
+            try:
+                ImageFont.truetype(font_bold_path, 17)
+                print(f"Successfully loaded bold font from: {font_bold_path}")
+                bold = font_bold_path
+                break
+            except Exception as e:
+                print(f"Failed to load bold font from {font_bold_path}: {e}")
+        if bold is None:
+            print("ERROR: Could not load bold font from any path, using default")
+
+        _font_paths = (regular, bold)
+        return _font_paths
+
+
+def load_fonts() -> Dict[str, ImageFont.ImageFont]:
+    """Renderer fonts, shared by every CalendarRenderer on the calling thread
+
+    FreeType faces must not be used from several threads at once, so each render thread
+    gets its own font objects; the font files are only looked up once per process.
+    """
+    fonts = getattr(_thread_fonts, "fonts", None)
+    if fonts is None:
+        regular, bold = _resolve_font_paths()
+
+        def font(path, size):
+            return ImageFont.truetype(path, size) if path else ImageFont.load_default()
+
+        fonts = {
+            "font": font(regular, 13),
+            "font_small": font(regular, 11),
+            "font_bold": font(bold, 17),
+            "font_large": font(bold, 19),
+            "font_small_bold": font(bold, 11),
+        }
+        _thread_fonts.fonts = fonts
+    return fonts
+
+
+def _canonical(obj):
+    """JSON-ready copy of calendar data with string keys (slot indexes may be int or str)"""
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    return obj
+
+
+class RenderCache:
+    """Content-addressed LRU cache of rendered calendar PNGs"""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts) -> str:
+        payload = json.dumps(_canonical(parts), sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+RENDER_CACHE = RenderCache()
+
+
+class RenderContext:
+    """Per-call render state, so one CalendarRenderer can render on several threads at once"""
+
+    __slots__ = ("timezone", "now", "emoji_positions", "legend_emoji_positions")
+
+    def __init__(self, timezone: str, now: datetime):
+        self.timezone = timezone
+        self.now = now
+        # (x, y, text, font) drawn with pilmoji after the grid
+        self.emoji_positions: List[Tuple[int, int, str, ImageFont.ImageFont]] = []
+        self.legend_emoji_positions: List[Tuple[int, int, str, ImageFont.ImageFont]] = []
+
+
 class CalendarRenderer:
-    """Renders event calendar as an image"""
+    """Renders event calendar as an image
+
+    Rendering keeps no state on the instance (see RenderContext), so a shared renderer is safe
+    to use from several worker threads.
+    """
 
     # Color scheme - Catppuccin Frappé
     BG_COLOR = (48, 52, 70)  # Base - #303446
@@ -84,6 +322,9 @@ class CalendarRenderer:
         "Guild War": "Guild War"
     }
 
+    # Bump whenever the drawing code changes, so cached PNGs from older layouts are not served
+    RENDERER_VERSION = 1
+
     def __init__(self, timezone: str = "UTC"):
         """Initialize calendar renderer
 
@@ -92,63 +333,29 @@ class CalendarRenderer:
         """
         self.timezone = timezone
 
-        # Try to load fonts with multiple fallback paths (Windows & Linux)
-        font_paths = [
-            # Windows paths
-            "C:\\Windows\\Fonts\\arial.ttf",
-            "C:\\Windows\\Fonts\\DejaVuSans.ttf",
-            # Linux paths
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu-sans/DejaVuSans.ttf",
-            "/usr/share/fonts/dejavu/DejaVuSans.ttf",
-        ]
+        # Resolve the font files now so load logs appear when the renderer is created
+        load_fonts()
 
-        font_bold_paths = [
-            # Windows paths
-            "C:\\Windows\\Fonts\\arialbd.ttf",
-            "C:\\Windows\\Fonts\\DejaVuSans-Bold.ttf",
-            # Linux paths
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/dejavu-sans/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/dejavu/DejaVuSans-Bold.ttf",
-        ]
+    # Fonts are looked up per thread, see load_fonts()
+    @property
+    def font(self) -> ImageFont.ImageFont:
+        return load_fonts()["font"]
 
-        # Try loading fonts without layout_engine parameter (may cause compatibility issues)
-        loaded = False
-        for font_path in font_paths:
-            try:
-                self.font = ImageFont.truetype(font_path, 13)
-                self.font_small = ImageFont.truetype(font_path, 11)
-                print(f"Successfully loaded regular font from: {font_path}")
-                loaded = True
-                break
-            except Exception as e:
-                print(f"Failed to load font from {font_path}: {e}")
-                continue
+    @property
+    def font_small(self) -> ImageFont.ImageFont:
+        return load_fonts()["font_small"]
 
-        if not loaded:
-            print("ERROR: Could not load regular font from any path, using default")
-            self.font = ImageFont.load_default()
-            self.font_small = ImageFont.load_default()
+    @property
+    def font_bold(self) -> ImageFont.ImageFont:
+        return load_fonts()["font_bold"]
 
-        loaded_bold = False
-        for font_bold_path in font_bold_paths:
-            try:
-                self.font_bold = ImageFont.truetype(font_bold_path, 17)
-                self.font_large = ImageFont.truetype(font_bold_path, 19)
-                self.font_small_bold = ImageFont.truetype(font_bold_path, 11)
-                print(f"Successfully loaded bold font from: {font_bold_path}")
-                loaded_bold = True
-                break
-            except Exception as e:
-                print(f"Failed to load bold font from {font_bold_path}: {e}")
-                continue
+    @property
+    def font_large(self) -> ImageFont.ImageFont:
+        return load_fonts()["font_large"]
 
-        if not loaded_bold:
-            print("ERROR: Could not load bold font from any path, using default")
-            self.font_bold = ImageFont.load_default()
-            self.font_large = ImageFont.load_default()
-            self.font_small_bold = ImageFont.load_default()
+    @property
+    def font_small_bold(self) -> ImageFont.ImageFont:
+        return load_fonts()["font_small_bold"]
 
     def _fade_color(self, color: Tuple[int, int, int]) -> Tuple[int, int, int]:
         """Fade a color by blending with background for better text readability
@@ -240,7 +447,8 @@ class CalendarRenderer:
         winning_times: Dict[str, Dict[str, str]],
         events: Dict,
         blocked_times: List[Dict] = None,
-        total_voters: int = 0
+        total_voters: int = 0,
+        rendered_at: Optional[datetime] = None
     ) -> io.BytesIO:
         """Render calendar as PNG image
 
@@ -248,6 +456,7 @@ class CalendarRenderer:
             winning_times: Dict mapping event names to {day: time} for winning times
             events: Event configuration dict
             blocked_times: List of blocked time periods
+            rendered_at: UTC time shown in the footer (default: now)
 
         Returns:
             BytesIO object containing PNG image
@@ -258,6 +467,17 @@ class CalendarRenderer:
                 {"day": "Sunday", "start": "20:30", "end": "22:00"}
             ]
 
+        # Snapshot the timezone; the cog may change it while we render
+        ctx = RenderContext(self.timezone, rendered_at or datetime.utcnow())
+
+        # Identical calendars are served from the PNG cache
+        cache_key = RENDER_CACHE.key(
+            winning_times, events, blocked_times, ctx.timezone, total_voters, self.RENDERER_VERSION
+        )
+        cached = RENDER_CACHE.get(cache_key)
+        if cached is not None:
+            return io.BytesIO(cached)
+
         # Build schedule data structure
         schedule = self._build_schedule(winning_times, events, blocked_times)
 
@@ -265,30 +485,20 @@ class CalendarRenderer:
         days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
         # Sort time slots with custom logic: times after midnight (00:xx, 01:xx) go after 23:xx
-        def sort_time_key(time_str: str) -> int:
-            """Convert time string to sortable integer (handle wraparound)"""
-            hour, minute = map(int, time_str.split(':'))
-            # Times 00:00-02:59 are treated as next day (add 24 hours)
-            if hour < 3:
-                hour += 24
-            return hour * 60 + minute
-
-        time_slots = sorted(schedule.keys(), key=sort_time_key)
+        time_slots = sorted(schedule.keys(), key=slot_index.minutes)
 
         # Crop empty hours from extremities - find first and last slots with events
         time_slots = self._crop_empty_hours(time_slots, schedule, days)
 
         # Fill in gaps between start and end time to show continuous schedule
         if time_slots:
-            start_minutes = sort_time_key(time_slots[0])
-            end_minutes = sort_time_key(time_slots[-1])
+            start_minutes = slot_index.minutes(time_slots[0])
+            end_minutes = slot_index.minutes(time_slots[-1])
             
             full_time_slots = []
             for minutes in range(start_minutes, end_minutes + 30, 30):
                 # Convert back to HH:MM
-                h = (minutes // 60) % 24
-                m = minutes % 60
-                time_str = f"{h:02d}:{m:02d}"
+                time_str = slot_index.format_minutes(minutes)
                 full_time_slots.append(time_str)
                 
                 # Ensure slot exists in schedule (init with empty days if missing)
@@ -305,25 +515,22 @@ class CalendarRenderer:
         draw = ImageDraw.Draw(img)
         draw.fontmode = "L"  # Use antialiased text (8-bit grayscale) instead of 1-bit monochrome
 
-        # Initialize emoji positions list
-        self._emoji_positions = []
-
         # Draw column headers (days)
         self._draw_day_headers(draw, days)
 
         # Draw time labels and calendar grid
-        self._draw_calendar_grid(img, draw, days, time_slots, schedule, blocked_times, events)
+        self._draw_calendar_grid(ctx, img, draw, days, time_slots, schedule, blocked_times, events)
 
         # Draw footer with timestamp and voter count
-        self._draw_footer(draw, width, height, total_voters)
+        self._draw_footer(ctx, draw, width, height, total_voters)
 
         # Render all emojis using pilmoji if available
         if PILMOJI_AVAILABLE:
             # Use emoji_scale_factor to make emojis larger and more prominent
-            # Use TwemojiWithTimeout to avoid hanging the process if network is slow
-            with Pilmoji(img, emoji_scale_factor=0.95, source=TwemojiWithTimeout) as pilmoji:
+            # AtlasTwemoji serves emoji bitmaps from the shared atlas instead of the network
+            with Pilmoji(img, emoji_scale_factor=0.95, source=AtlasTwemoji) as pilmoji:
                 # Draw calendar cell emojis
-                for text_x, text_y, display_text, font in self._emoji_positions:
+                for text_x, text_y, display_text, font in ctx.emoji_positions:
                     # Guild War emoji gets moved up by an additional 2px (total 4px)
                     if "🏰" in display_text:
                         pilmoji.text((text_x, text_y), display_text, font=font, fill=self.HEADER_TEXT, emoji_position_offset=(0, -4))
@@ -331,7 +538,7 @@ class CalendarRenderer:
                         pilmoji.text((text_x, text_y), display_text, font=font, fill=self.HEADER_TEXT, emoji_position_offset=(0, -2))
         else:
             # Fallback to text labels if pilmoji not available
-            for text_x, text_y, display_text, font in self._emoji_positions:
+            for text_x, text_y, display_text, font in ctx.emoji_positions:
                 # Use text labels instead of emojis
                 label_text = display_text
                 # Try to extract label from text (fallback)
@@ -346,6 +553,7 @@ class CalendarRenderer:
         buffer = io.BytesIO()
         img.save(buffer, format='PNG')
         buffer.seek(0)
+        RENDER_CACHE.put(cache_key, buffer.getvalue())
 
         return buffer
 
@@ -408,24 +616,12 @@ class CalendarRenderer:
                 # Determine slot number for this event
                 slot_num = day_slot_map.get(day, 0)  # 0 means single slot or not applicable
 
-                # Calculate how many time slots this event spans (based on duration)
+                # All time slots this event spans (e.g., 19:00 and 19:30 for 60-min event),
+                # normalized to 30-minute boundaries for cell assignment
                 duration = event_info.get("duration", 30)
-                # Use ceiling division to account for any partial slot overlaps
-                time_slots_spanned = (duration + 29) // 30
-
-                # Generate all time slots for this event (e.g., 19:00 and 19:30 for 60-min event)
-                from datetime import datetime, timedelta
-                start_time = datetime.strptime(time_str, "%H:%M")
-                time_slots_for_event = []
-                for i in range(time_slots_spanned):
-                    slot_time = start_time + timedelta(minutes=i * 30)
-                    # Normalize to 30-minute slot boundary for cell assignment
-                    normalized_m = (slot_time.minute // 30) * 30
-                    slot_time_str = f"{slot_time.hour:02d}:{normalized_m:02d}"
-                    time_slots_for_event.append(slot_time_str)
 
                 # Add event to all relevant time slots and days
-                for slot_time_str in time_slots_for_event:
+                for slot_time_str in slot_index.calendar_cells(time_str, duration):
                     if slot_time_str not in schedule:
                         schedule[slot_time_str] = {d: [] for d in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]}
 
@@ -448,7 +644,6 @@ class CalendarRenderer:
                         schedule[time_str][d] = []
 
         # Add locked events (Hero's Realm Reset, Sword Trial Echo, Guild War) - these always show
-        from datetime import datetime, timedelta
         for event_name, event_info in events.items():
             if event_info.get("type") == "locked":
                 # Skip if already added via winning_times (to avoid duplicates)
@@ -463,17 +658,7 @@ class CalendarRenderer:
                 if not fixed_time_str or not event_days:
                     continue
 
-                # Parse time
-                start_dt = datetime.strptime(fixed_time_str, "%H:%M")
-                # Use ceiling division to account for any partial slot overlaps
-                time_slots_spanned = (duration + 29) // 30
-
-                for i in range(time_slots_spanned):
-                    slot_time = start_dt + timedelta(minutes=i * 30)
-                    # Normalize to 30-minute slot boundary for cell assignment
-                    normalized_m = (slot_time.minute // 30) * 30
-                    slot_time_str = f"{slot_time.hour:02d}:{normalized_m:02d}"
-
+                for slot_time_str in slot_index.calendar_cells(fixed_time_str, duration):
                     # Create time slot if it doesn't exist
                     if slot_time_str not in schedule:
                         schedule[slot_time_str] = {d: [] for d in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]}
@@ -515,9 +700,9 @@ class CalendarRenderer:
         other_sorted = sorted(other_events, key=lambda x: x[0], reverse=True)
         return party_events + other_sorted
 
-    def _draw_timezone_header(self, draw: ImageDraw, width: int):
+    def _draw_timezone_header(self, ctx: RenderContext, draw: ImageDraw, width: int):
         """Draw timezone at top of calendar"""
-        text = f"Schedule (Timezone: {self.timezone})"
+        text = f"Schedule (Timezone: {ctx.timezone})"
         # Get text size for centering
         bbox = draw.textbbox((0, 0), text, font=self.font_large)
         text_width = bbox[2] - bbox[0]
@@ -557,6 +742,7 @@ class CalendarRenderer:
 
     def _draw_calendar_grid(
         self,
+        ctx: RenderContext,
         img: Image.Image,
         draw: ImageDraw,
         days: List[str],
@@ -950,9 +1136,6 @@ class CalendarRenderer:
                     y_offset = -2 if event_name == "Party" else 0
                     base_y = rect_y + (rect_height - total_text_height) // 2 + y_offset
 
-                    if not hasattr(self, '_emoji_positions'):
-                        self._emoji_positions = []
-
                     for line_idx, line_text in enumerate(display_lines):
                         bbox = draw.textbbox((0, 0), line_text, font=font_to_use)
                         text_width = bbox[2] - bbox[0]
@@ -963,7 +1146,7 @@ class CalendarRenderer:
                         
                         # Add boundary checks to avoid drawing outside rect
                         if text_y >= rect_y - 2 and text_y + line_height <= rect_y2 + 5:
-                             self._emoji_positions.append((text_x, text_y, line_text, font_to_use))
+                             ctx.emoji_positions.append((text_x, text_y, line_text, font_to_use))
 
                     # Collect Overlays
                     h_st, m_st = map(int, start_time.split(':'))
@@ -1005,7 +1188,7 @@ class CalendarRenderer:
             
             img.paste(rotated_txt, (paste_x, paste_y), rotated_txt)
 
-    def _draw_legend(self, draw: ImageDraw, width: int, start_y: int, events: Dict):
+    def _draw_legend(self, ctx: RenderContext, draw: ImageDraw, width: int, start_y: int, events: Dict):
         """Draw legend showing event labels and names"""
         # Draw legend background
         legend_y = start_y + 5
@@ -1063,9 +1246,7 @@ class CalendarRenderer:
                 text_part = f" {label}: {event_name}"
 
             # Store emoji position for pilmoji rendering
-            if not hasattr(self, '_legend_emoji_positions'):
-                self._legend_emoji_positions = []
-            self._legend_emoji_positions.append((current_x, current_y, emoji_part, self.font_small))
+            ctx.legend_emoji_positions.append((current_x, current_y, emoji_part, self.font_small))
 
             # Draw the text part (after emoji space)
             text_x = current_x + 5  # Space for emoji (reduced for smaller fonts)
@@ -1078,19 +1259,16 @@ class CalendarRenderer:
             else:
                 current_y += 9
 
-    def _draw_footer(self, draw: ImageDraw, width: int, height: int, total_voters: int):
+    def _draw_footer(self, ctx: RenderContext, draw: ImageDraw, width: int, height: int, total_voters: int):
         """Draw footer with timestamp and voter count"""
-        from datetime import datetime
-
         # Calculate footer position
         footer_y = height - self.FOOTER_HEIGHT
 
-        # Get current timestamp
-        now = datetime.utcnow()
-        timestamp = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+        # Timestamp of this render
+        timestamp = ctx.now.strftime("%Y-%m-%d %H:%M:%S UTC")
 
         # Create footer text
-        footer_text = f"Timezone: {self.timezone} | Total voters: {total_voters} | Last updated: {timestamp}"
+        footer_text = f"Timezone: {ctx.timezone} | Total voters: {total_voters} | Last updated: {timestamp}"
 
         # Draw footer text centered
         bbox = draw.textbbox((0, 0), footer_text, font=self.font_small)
@@ -1102,22 +1280,15 @@ class CalendarRenderer:
 
     def _is_time_blocked(self, day: str, time_str: str, blocked_times: List[Dict]) -> bool:
         """Check if a time slot is blocked"""
-        from datetime import datetime, timedelta
-
         for blocked in blocked_times:
             if blocked["day"] != day:
                 continue
 
-            # Parse times
-            slot_time = datetime.strptime(time_str, "%H:%M")
-            blocked_start = datetime.strptime(blocked["start"], "%H:%M")
-            blocked_end = datetime.strptime(blocked["end"], "%H:%M")
-
-            # Check if slot falls within blocked period (30 min duration)
-            slot_end = slot_time + timedelta(minutes=30)
-
-            # Check overlap
-            if slot_time.time() < blocked_end.time() and slot_end.time() > blocked_start.time():
+            # Check if slot (30 min duration) overlaps the blocked period. Plain times of day,
+            # without the night wrap: a slot or block crossing midnight doesn't match past it
+            slot_start = slot_index.clock_minutes(time_str)
+            slot_end = (slot_start + 30) % slot_index.MINUTES_PER_DAY
+            if slot_start < slot_index.clock_minutes(blocked["end"]) and slot_end > slot_index.clock_minutes(blocked["start"]):
                 return True
 
         return False
@@ -0,0 +1,207 @@
+"""Conflict resolution between winning event times for EventPolling.
+
+Every event occurrence covers a run of 30-minute cells (time_slots.occupied_slots) on each day it
+affects. Cells are kept as bits of one integer per day (one bit per minute of day a cell starts
+at), so finding conflicts, checking whether an alternative time is free and taking over cells are
+a few AND/OR operations per day instead of expanding every candidate into (day, "HH:MM") keys.
+
+Resolution rules (unchanged from the dict-based implementation):
+- Party may share cells with any event; other events may not share cells with each other.
+- In a contested cell the highest-priority events get +3 points, then the most points wins,
+  then the higher priority, then the later start time.
+- Losers move to the first alternative in their ranked entries whose cells are free, in event
+  order; if none is free they keep their original time.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from . import time_slots
+
+log = logging.getLogger("red.asdas-cogs.polling")
+
+# The only event allowed to share cells with other events (for table splitting)
+SHARED_EVENT = "Party"
+PRIORITY_BONUS = 3
+
+SlotKey = Tuple[str, int]  # (event_name, slot_index)
+
+
+def affected_days(event_info: Dict, day: str, days_of_week: Sequence[str]) -> List[str]:
+    """Days an event occurrence keyed by `day` takes place on"""
+    if event_info["type"] == "daily" or day == "Daily":
+        return list(days_of_week)
+    elif event_info["type"] == "fixed_days":
+        if day in days_of_week:
+            return [day]
+        else:
+            return event_info.get("days", [])
+    else:
+        return [day] if day in days_of_week else []
+
+
+class _Candidate:
+    """One winning event slot competing for cells"""
+
+    __slots__ = ("event_name", "slot_index", "points", "priority", "start_time")
+
+    def __init__(self, event_name: str, slot_index: int, points: int, priority: int, start_time: str):
+        self.event_name = event_name
+        self.slot_index = slot_index
+        self.points = points
+        self.priority = priority
+        self.start_time = start_time
+
+
+class ConflictResolver:
+    """Resolves overlapping winning times using per-day cell bitsets.
+
+    Args:
+        events: Event configuration (EventPolling.events); its order is the reassignment order
+        days_of_week: Ordered weekday names
+    """
+
+    def __init__(self, events: Dict, days_of_week: Sequence[str]):
+        self.events = events
+        self.days_of_week = list(days_of_week)
+
+    def _mask(self, event_name: str, time: str) -> int:
+        return time_slots.cell_mask(time, self.events[event_name].get("duration", 30))
+
+    def resolve(self, winning_times: Dict) -> Dict:
+        """Return winning_times ({event: {slot: (key, points, entries)}}) with conflicts resolved"""
+        # day -> [(candidate, cell mask)] in registration (event, slot) order
+        by_day: Dict[str, List[Tuple[_Candidate, int]]] = {}
+        for event_name, event_info in self.events.items():
+            if event_name not in winning_times:
+                continue
+            priority = event_info.get("priority", 0)
+            for slot_index, slot_data in winning_times[event_name].items():
+                (day, time), points, _ = slot_data
+                candidate = _Candidate(event_name, slot_index, points, priority, time)
+                mask = self._mask(event_name, time)
+                for affected_day in affected_days(event_info, day, self.days_of_week):
+                    by_day.setdefault(affected_day, []).append((candidate, mask))
+
+        # day -> {event_name: mask of cells it holds}; every cell has exactly one holder
+        owners: Dict[str, Dict[str, int]] = {}
+        needs_reassignment: Set[SlotKey] = set()
+        for day, entries in by_day.items():
+            owned = owners[day] = {}
+            seen = contested = 0
+            for _, mask in entries:
+                contested |= seen & mask
+                seen |= mask
+            for candidate, mask in entries:
+                free = mask & ~contested
+                if free:
+                    owned[candidate.event_name] = owned.get(candidate.event_name, 0) | free
+            bits = contested
+            while bits:
+                cell = bits & -bits
+                bits ^= cell
+                competing = [candidate for candidate, mask in entries if mask & cell]
+                holder = self._resolve_cell(day, cell, competing, needs_reassignment)
+                owned[holder] = owned.get(holder, 0) | cell
+
+        # Winners keep their times
+        adjusted_winning_times = {}
+        for event_name in self.events:
+            if event_name not in winning_times:
+                continue
+            adjusted_winning_times[event_name] = {
+                slot_index: slot_data
+                for slot_index, slot_data in winning_times[event_name].items()
+                if (event_name, slot_index) not in needs_reassignment
+            }
+
+        # Losers take their best free alternative
+        for event_name in self.events:
+            if event_name not in winning_times:
+                continue
+            for slot_index, slot_data in winning_times[event_name].items():
+                if (event_name, slot_index) not in needs_reassignment:
+                    continue
+                winner_key, _, all_entries = slot_data
+                log.info(f"Reassigning {event_name} slot {slot_index} from {winner_key}")
+                for candidate_key, candidate_points in all_entries:
+                    if self.is_available(event_name, candidate_key, owners, slot_index, adjusted_winning_times):
+                        log.info(f"  Found alternative: {candidate_key[0]} at {candidate_key[1]} ({candidate_points} pts)")
+                        self.occupy(event_name, candidate_key, owners)
+                        adjusted_winning_times[event_name][slot_index] = (candidate_key, candidate_points, all_entries)
+                        break
+                else:
+                    log.warning(f"  No alternative found! Keeping original time {winner_key}")
+                    adjusted_winning_times[event_name][slot_index] = slot_data
+
+        return adjusted_winning_times
+
+    def _resolve_cell(self, day: str, cell: int, competing: List[_Candidate], needs_reassignment: Set[SlotKey]) -> str:
+        """Pick the holder of one contested cell, recording the losers"""
+        cell_time = time_slots.CLOCK[cell.bit_length() - 1]
+        log.info(f"Conflict at {(day, cell_time)}: {[f'{c.event_name} slot {c.slot_index}' for c in competing]}")
+
+        shared = any(c.event_name == SHARED_EVENT for c in competing)
+        if shared and any(c.event_name != SHARED_EVENT for c in competing):
+            # Party coexists with the other events - all keep their times
+            log.info(f"  Party coexistence allowed - all events keep their times")
+            return competing[-1].event_name
+
+        max_priority = max(c.priority for c in competing)
+        ranked = sorted(
+            competing,
+            key=lambda c: (
+                -(c.points + PRIORITY_BONUS if c.priority == max_priority else c.points),
+                -c.priority,
+                -time_slots.sort_key(c.start_time),
+            ),
+        )
+        winner = ranked[0]
+        log.info(f"  Winner: {winner.event_name} slot {winner.slot_index}")
+        for loser in ranked[1:]:
+            needs_reassignment.add((loser.event_name, loser.slot_index))
+            log.info(f"  Loser needs reassignment: {loser.event_name} slot {loser.slot_index}")
+        return winner.event_name
+
+    def is_available(
+        self,
+        event_name: str,
+        time_key: Tuple[str, str],
+        owners: Dict[str, Dict[str, int]],
+        current_slot_index: Optional[int] = None,
+        adjusted_winning_times: Optional[Dict] = None,
+    ) -> bool:
+        """Whether an event can take (day, time) without sharing cells with a non-Party event"""
+        day, time = time_key
+        event_info = self.events[event_name]
+
+        # Multi-slot weekly events can't have two slots on the same day
+        if event_info.get("type") == "once" and event_info.get("slots", 1) > 1:
+            if adjusted_winning_times and event_name in adjusted_winning_times:
+                for slot_idx, slot_data in adjusted_winning_times[event_name].items():
+                    if current_slot_index is not None and slot_idx == current_slot_index:
+                        continue
+                    existing_day, existing_time = slot_data[0]
+                    if existing_day == day:
+                        log.debug(f"    Rejected {time_key}: {event_name} slot {slot_idx} already on {existing_day} at {existing_time}")
+                        return False
+
+        if event_name == SHARED_EVENT:
+            return True
+
+        mask = self._mask(event_name, time)
+        for affected_day in affected_days(event_info, day, self.days_of_week):
+            for holder, held in owners.get(affected_day, {}).items():
+                if held & mask and holder not in (event_name, SHARED_EVENT):
+                    return False
+        return True
+
+    def occupy(self, event_name: str, time_key: Tuple[str, str], owners: Dict[str, Dict[str, int]]):
+        """Give all cells of (day, time) to the event"""
+        day, time = time_key
+        mask = self._mask(event_name, time)
+        for affected_day in affected_days(self.events[event_name], day, self.days_of_week):
+            owned = owners.setdefault(affected_day, {})
+            for holder in owned:
+                owned[holder] &= ~mask
+            owned[event_name] = owned.get(event_name, 0) | mask
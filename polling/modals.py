@@ -320,12 +320,9 @@ class EventVotingModal(Modal, title="Vote for Event Times"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
 
                 # Update all selections
-                for event_name, selection in parsed_selections.items():
-                    polls[self.poll_id]["selections"][user_id_str][event_name] = selection
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, parsed_selections)
 
                 # Clear events that weren't selected (implied by loop above, but good for safety)
                 # Or specifically handle explicit clears
@@ -0,0 +1,200 @@
+"""Event-driven scheduling of event start notifications."""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import time_slots
+
+log = logging.getLogger("red.asdas-cogs.polling")
+
+# Notifications use the fixed server time (UTC+1), like the rest of the cog's tasks
+SERVER_TZ = timezone(timedelta(hours=1))
+# Notifications that became due while the bot was down are still sent if at most this late
+CATCH_UP = timedelta(minutes=10)
+# Re-check the wall clock at least this often while sleeping
+MAX_SLEEP = 300
+
+
+class NotificationSlot(NamedTuple):
+    """One notifying event slot of a guild's current schedule"""
+
+    event_name: str
+    slot_index: int
+    win_day: str  # Day key of the winning time ("Daily", "Fixed" or a weekday)
+    time_str: str  # HH:MM server time
+    days: Optional[FrozenSet[str]]  # Evenings the event runs on, None for every day
+
+    @property
+    def key(self) -> str:
+        """Key in the guild's sent_notifications"""
+        return f"{self.event_name}_{self.slot_index}"
+
+
+def next_fire_time(slot: NotificationSlot, after: datetime) -> Optional[datetime]:
+    """First start of `slot` strictly after `after` (an aware datetime)
+
+    Times 00:00-02:59 belong to the previous day's evening: "Monday 01:00" fires on Tuesday.
+    """
+    hour, minute = divmod(time_slots.clock_minutes(slot.time_str), 60)
+    # An evening's next-day start happens one calendar day later
+    offset = 1 if time_slots.is_next_day(slot.time_str) else 0
+    after = after.astimezone(SERVER_TZ)
+    first_evening = after.date() - timedelta(days=offset)
+    for i in range(9):
+        evening = first_evening + timedelta(days=i)
+        if slot.days is not None and time_slots.DAYS[evening.weekday()] not in slot.days:
+            continue
+        fire_at = datetime(evening.year, evening.month, evening.day, hour, minute, tzinfo=SERVER_TZ) + timedelta(days=offset)
+        if fire_at > after:
+            return fire_at
+    return None
+
+
+class _Entry(NamedTuple):
+    fire_at: datetime
+    seq: int
+    guild_id: int
+    version: int
+    slot: NotificationSlot
+
+
+class NotificationScheduler:
+    """
+    Keeps the next start time of every (guild, event, slot) in a heap and sleeps until the
+    earliest one is due.
+
+    A guild's slots are reloaded via `load(guild_id)` whenever it is invalidated (votes, snapshot
+    or notification settings changed); entries from before the reload are dropped lazily. Every
+    minute between two wake-ups is covered, so a late wake-up still sends what became due in the
+    meantime, and on start the last CATCH_UP of notifications is re-checked.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[int], Awaitable[List[NotificationSlot]]],
+        fire: Callable[[int, NotificationSlot, datetime], Awaitable],
+        catch_up: timedelta = CATCH_UP,
+    ):
+        self._load = load
+        self._fire = fire
+        self.catch_up = catch_up
+        self._heap: List[_Entry] = []
+        self._versions: Dict[int, int] = {}
+        self._dirty: set = set()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._seq = 0
+        # Everything due up to here has been handled
+        self._processed_until: Optional[datetime] = None
+        # (guild_id, slot key) -> fire time of the last notification handled
+        self._handled: Dict[Tuple[int, str], datetime] = {}
+        self.sent = 0
+        self.skipped_late = 0
+        self.failed = 0
+        self.wakeups = 0
+
+    @staticmethod
+    def now() -> datetime:
+        return datetime.now(SERVER_TZ)
+
+    @property
+    def scheduled(self) -> int:
+        return sum(1 for entry in self._heap if self._versions.get(entry.guild_id) == entry.version)
+
+    @property
+    def next_due(self) -> Optional[datetime]:
+        # Superseded entries at the top are dropped, like the loop would when they came due
+        while self._heap and self._versions.get(self._heap[0].guild_id) != self._heap[0].version:
+            heapq.heappop(self._heap)
+        return self._heap[0].fire_at if self._heap else None
+
+    def start(self, guild_ids: Iterable[int]):
+        self._processed_until = self.now() - self.catch_up
+        self._dirty.update(guild_ids)
+        self._task = asyncio.create_task(self._run())
+
+    def invalidate(self, guild_id: int):
+        """Reload the guild's notification slots before the next due check"""
+        self._dirty.add(guild_id)
+        self._wake.set()
+
+    async def _reload(self):
+        reloaded = False
+        while self._dirty:
+            guild_id = self._dirty.pop()
+            try:
+                slots = await self._load(guild_id)
+            except Exception as e:
+                # Keep the previous entries
+                log.error(f"Error loading notification schedule for guild {guild_id}: {e}", exc_info=True)
+                continue
+            version = self._versions.get(guild_id, 0) + 1
+            self._versions[guild_id] = version
+            for slot in slots:
+                self._push(guild_id, version, slot, self._processed_until)
+            reloaded = True
+
+        if reloaded:
+            # Drop superseded entries once they outnumber the live ones
+            live = [entry for entry in self._heap if self._versions.get(entry.guild_id) == entry.version]
+            if len(self._heap) > 2 * len(live) + 64:
+                heapq.heapify(live)
+                self._heap = live
+
+    def _push(self, guild_id: int, version: int, slot: NotificationSlot, after: datetime):
+        fire_at = next_fire_time(slot, after)
+        if fire_at is not None:
+            self._seq += 1
+            heapq.heappush(self._heap, _Entry(fire_at, self._seq, guild_id, version, slot))
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            await self._reload()
+
+            now = self.now()
+            while self._heap and self._heap[0].fire_at <= now:
+                entry = heapq.heappop(self._heap)
+                if self._versions.get(entry.guild_id) != entry.version:
+                    continue
+                await self._handle(entry, now)
+                self._push(entry.guild_id, entry.version, entry.slot, entry.fire_at)
+            self._processed_until = now
+            # Reloads only queue starts after _processed_until, older handled starts can't come back
+            handled_cutoff = now - self.catch_up
+            self._handled = {key: fire_at for key, fire_at in self._handled.items() if fire_at >= handled_cutoff}
+
+            timeout = MAX_SLEEP
+            if self._heap:
+                timeout = min(MAX_SLEEP, max(0.0, (self._heap[0].fire_at - self.now()).total_seconds()))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+    async def _handle(self, entry: _Entry, now: datetime):
+        handled_key = (entry.guild_id, entry.slot.key)
+        if self._handled.get(handled_key) == entry.fire_at:
+            # Same start re-queued by a reload
+            return
+        self._handled[handled_key] = entry.fire_at
+        if now - entry.fire_at > self.catch_up:
+            self.skipped_late += 1
+            log.warning(f"Skipping notification for {entry.slot.event_name} due at {entry.fire_at}, now {now}")
+            return
+        try:
+            if await self._fire(entry.guild_id, entry.slot, entry.fire_at):
+                self.sent += 1
+        except Exception as e:
+            self.failed += 1
+            log.error(f"Error sending notification for {entry.slot.event_name}: {e}", exc_info=True)
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._heap.clear()
@@ -14,11 +14,17 @@ import hashlib
 from pathlib import Path
 import importlib
 import logging
-import functools
 import pytz
 
 from .views import EventPollView
 from . import calendar_renderer
+from .scoring import ScoringEngine, VoteTally, is_pooled, rank_grid
+from .update_scheduler import PollUpdateScheduler, UPDATE_INTERVAL
+from .render_pool import CalendarRenderPool
+from .conflicts import ConflictResolver
+from .notification_scheduler import NotificationScheduler, NotificationSlot
+from .schedule_service import Schedule, ScheduleService
+from . import time_slots
 
 log = logging.getLogger("red.asdas-cogs.polling")
 # log.setLevel(logging.ERROR)  # Removed to allow info messages
@@ -49,7 +55,8 @@ class EventPolling(commands.Cog):
             export_guild_id=None,
             last_weekly_results_update=None,
             last_weekly_calendar_update=None,
-            is_dst=False  # Track current DST status for Europe/Berlin
+            is_dst=False,  # Track current DST status for Europe/Berlin
+            update_interval=UPDATE_INTERVAL,  # Minimum seconds between two re-renders of the same poll
         )
 
         # Event definitions (ordered: Party, Guild War, Hero's Realm, Sword Trial, Breaking Army, Showdown)
@@ -168,6 +175,11 @@ class EventPolling(commands.Cog):
             "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
         ]
 
+        # Vote scoring with cached per-time points kernels
+        self.scoring = ScoringEngine(self._calculate_weighted_points, self.days_of_week, self._time_to_sort_key)
+        # Conflict resolution between winning times on per-day cell bitsets
+        self.conflict_resolver = ConflictResolver(self.events, self.days_of_week)
+
         # Blocked time slots: (Legacy, Guild War is now handled via events list)
         self.blocked_times = []
 
@@ -186,6 +198,19 @@ class EventPolling(commands.Cog):
         # Initialize calendar renderer
         self.calendar_renderer = calendar_renderer.CalendarRenderer(timezone=self.timezone_display)
 
+        # Coalesces vote bursts into at most one poll/calendar re-render per interval
+        self.update_scheduler = PollUpdateScheduler(self._run_poll_update)
+
+        # Every calendar image is rendered on this pool, off the event loop
+        self.render_pool = CalendarRenderPool()
+
+        # Current winning schedule per guild, shared with other cogs (e.g. BreakingArmy)
+        self.schedule = ScheduleService(self._compute_schedule)
+
+        # Sleeps until the next event start instead of scanning every minute
+        self.notification_scheduler = NotificationScheduler(self._load_notification_slots, self._send_event_notification)
+        self.schedule.subscribe(self.notification_scheduler.invalidate)
+
         # Backup directory path
         self.backups_dir = Path.cwd() / "data" / "eventpolling" / "backups"
         self.backups_dir.mkdir(parents=True, exist_ok=True)
@@ -197,6 +222,13 @@ class EventPolling(commands.Cog):
         importlib.reload(calendar_renderer)
         # Reinitialize the calendar renderer with the reloaded class
         self.calendar_renderer = calendar_renderer.CalendarRenderer(timezone=self.timezone_display)
+        # Emoji bitmaps are kept on disk so renders don't need the network after the first fetch
+        calendar_renderer.EMOJI_ATLAS.set_directory(Path.cwd() / "data" / "eventpolling" / "emoji")
+
+        self.update_scheduler.interval = await self.config.update_interval()
+
+        # Running vote tallies are derived data, rebuild them in case selections changed outside the cog
+        await self._rebuild_all_tallies()
 
         # Start initialization task to restore views after bot is ready
         self.bot.loop.create_task(self.initialize())
@@ -204,7 +236,6 @@ class EventPolling(commands.Cog):
         self.backup_task.start()
         self.weekly_results_update.start()
         self.weekly_calendar_update.start()
-        self.event_notification_task.start()
         self.website_export_task.start()
         self.dst_check_task.start()
 
@@ -212,6 +243,10 @@ class EventPolling(commands.Cog):
         """Wait for bot to be ready and restore persistent views"""
         await self.bot.wait_until_red_ready()
 
+        # Event notifications are scheduled from the persisted polls, so nothing is lost across restarts
+        all_guilds = await self.config.all_guilds()
+        self.notification_scheduler.start(int(guild_id) for guild_id in all_guilds)
+
         # Check if ModalPatch is loaded
         if not self.bot.get_cog("ModalPatch"):
             log.error("CRITICAL: ModalPatch cog is not loaded! EventPoll voting modals will fail with 'Interaction failed'.")
@@ -252,14 +287,25 @@ class EventPolling(commands.Cog):
                 
         log.info("EventPolling: All persistent views have been restored.")
 
+        # 3. Warm up the emoji atlas so calendar renders stay off the network
+        emojis = {info["emoji"] for info in self.events.values() if info.get("emoji")}
+        emojis.update(["🛡️", "⚔️", "🎉", "⚡", "🏆", "🏰"])
+        try:
+            available = await self.bot.loop.run_in_executor(None, calendar_renderer.warm_emoji_atlas, sorted(emojis))
+            log.info(f"EventPolling: Emoji atlas ready ({available}/{len(emojis)} emojis).")
+        except Exception as e:
+            log.error(f"Failed to warm up emoji atlas: {e}")
+
     def cog_unload(self):
         """Called when the cog is unloaded"""
         self.backup_task.cancel()
         self.weekly_results_update.cancel()
         self.weekly_calendar_update.cancel()
-        self.event_notification_task.cancel()
+        self.notification_scheduler.close()
         self.website_export_task.cancel()
         self.dst_check_task.cancel()
+        self.update_scheduler.close()
+        self.render_pool.close()
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
@@ -268,14 +314,14 @@ class EventPolling(commands.Cog):
             user_id_str = str(member.id)
             updated = False
             for poll_id, poll_data in polls.items():
-                if user_id_str in poll_data.get("selections", {}):
-                    del poll_data["selections"][user_id_str]
+                if self._clear_user_votes(poll_data, user_id_str):
                     updated = True
                     log.info(f"Removed EventPolling votes for user {member.id} in poll {poll_id} because they left.")
                     # Update results messages for this poll
                     await self._update_results_messages(member.guild, poll_data, poll_id)
             
             if updated:
+                self._invalidate_schedule(member.guild.id)
                 # Trigger a manual backup and website export if votes were removed
                 await self._export_to_json()
 
@@ -293,14 +339,14 @@ class EventPolling(commands.Cog):
                 user_id_str = str(after.id)
                 updated = False
                 for poll_id, poll_data in polls.items():
-                    if user_id_str in poll_data.get("selections", {}):
-                        del poll_data["selections"][user_id_str]
+                    if self._clear_user_votes(poll_data, user_id_str):
                         updated = True
                         log.info(f"Removed EventPolling votes for user {after.id} in poll {poll_id} because they lost member roles.")
                         # Update results messages for this poll
                         await self._update_results_messages(after.guild, poll_data, poll_id)
                 
                 if updated:
+                    self._invalidate_schedule(after.guild.id)
                     # Trigger a manual backup and website export if votes were removed
                     await self._export_to_json()
 
@@ -438,7 +484,7 @@ class EventPolling(commands.Cog):
                         # 1. Store Old winners for comparison
                         old_snapshot = poll_data.get("weekly_snapshot_winning_times", {})
                         
-                        # 2. Update all weekly calendar messages for this poll
+                        # 2. Update all weekly calendar messages for this poll (stores a new snapshot)
                         await self._update_weekly_calendar_messages(guild, poll_data, poll_id)
                         
                         # 3. Notify owner if schedule changed
@@ -515,224 +561,187 @@ class EventPolling(commands.Cog):
         """Wait for bot to be ready before starting weekly calendar update task"""
         await self.bot.wait_until_ready()
 
-    @tasks.loop(minutes=1)
-    async def event_notification_task(self):
-        """Check for upcoming events and send notifications"""
-        try:
-            # Use UTC+1 (CET) as server time, consistent with other tasks
-            from datetime import timezone
-            server_tz = timezone(timedelta(hours=1))
-            now = datetime.now(server_tz)
-            today_str = now.strftime("%Y-%m-%d")
-            day_name = now.strftime("%A")
-            prev_day_name = (now - timedelta(days=1)).strftime("%A")
+    def _invalidate_schedule(self, guild_id: int):
+        """Votes or the weekly snapshot of a guild changed"""
+        self.schedule.invalidate(guild_id)
 
-            all_guilds = await self.config.all_guilds()
+    async def _compute_schedule(self, guild_id: int):
+        """Schedule service callback: (poll_id, winning_times, from_snapshot) of a guild's latest poll"""
+        polls = await self.config.guild_from_id(guild_id).polls()
+        if not polls:
+            return None, {}, False
 
-            for guild_id_str, guild_data in all_guilds.items():
-                guild_id = int(guild_id_str)
-                channel_id = guild_data.get("notification_channel_id")
-                if not channel_id:
-                    continue
+        latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
+        poll_data = polls[latest_poll_id]
 
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
+        # Prefer the weekly snapshot (stable schedule), fall back to live data
+        winning_times = poll_data.get("weekly_snapshot_winning_times")
+        if winning_times:
+            return latest_poll_id, winning_times, True
+        return latest_poll_id, self._calculate_winning_times_weighted(poll_data.get("selections", {}), poll_data.get("tally")), False
+
+    async def get_current_schedule(self, guild_id: int) -> Schedule:
+        """The winning schedule a guild currently runs on, for use by other cogs.
+
+        Served from memory until votes or the weekly snapshot change; don't modify the result.
+        Use `self.schedule.subscribe(callback)` to be told when it changes.
+        """
+        return await self.schedule.get(guild_id)
+
+    async def _load_notification_slots(self, guild_id: int) -> List[NotificationSlot]:
+        """Notification scheduler callback: the notifying event slots of a guild's current schedule"""
+        if not await self.config.guild_from_id(guild_id).notification_channel_id():
+            return []
+
+        schedule = await self.schedule.get(guild_id)
+        if schedule.poll_id is None:
+            return []
+        winning_times = schedule.winning_times
+
+        # Merge voted winning times with locked events and defaults for notification checking
+        all_checks = winning_times.copy()
+        for event_name, event_info in self.events.items():
+            # If event is missing or has no slots, try to populate from defaults/fixed
+            if event_name not in all_checks or not all_checks[event_name]:
+                all_checks[event_name] = {}
+
+                # Handle locked events (fixed time)
+                if event_info.get("type") == "locked":
+                    fixed_time = event_info.get("fixed_time")
+                    days = event_info.get("days", [])
+                    if fixed_time and days:
+                        all_checks[event_name][0] = (("Fixed", fixed_time), 0, [])
                     continue
-                
-                channel = guild.get_channel(channel_id)
-                if not channel:
+
+                # Handle other events with defaults
+                defaults = event_info.get("default_times", {})
+                if defaults:
+                    if event_info["type"] == "daily":
+                        if "default" in defaults:
+                            all_checks[event_name][0] = (("Daily", defaults["default"]), 0, [])
+                    elif event_info["type"] == "fixed_days":
+                        for i, day in enumerate(event_info.get("days", [])):
+                            if day in defaults:
+                                all_checks[event_name][i] = ((day, defaults[day]), 0, [])
+                    else:
+                        # once/weekly/once
+                        sorted_defaults = sorted(
+                            [(k, v) for k, v in defaults.items() if k != "default"],
+                            key=lambda x: self.days_of_week.index(x[0]) if x[0] in self.days_of_week else 999
+                        )
+                        for i, (day, time) in enumerate(sorted_defaults):
+                            if i < event_info.get("slots", 1):
+                                all_checks[event_name][i] = ((day, time), 0, [])
+
+        # Events to notify
+        target_events = ["Party", "Showdown", "Breaking Army"]
+
+        slots = []
+        for event_name, event_slots in all_checks.items():
+            if not any(event_name.startswith(t) for t in target_events):
+                continue
+            event_info = self.events.get(event_name)
+            if not event_info:
+                continue
+
+            for slot_idx, slot_data in event_slots.items():
+                winner_key = slot_data[0]
+                win_day, win_time_str = winner_key[0], winner_key[1]
+
+                # Evenings the event takes place on
+                if event_info["type"] == "daily":
+                    days = None
+                elif event_info["type"] == "locked":
+                    days = frozenset(event_info.get("days", []))
+                elif event_info["type"] == "fixed_days" and win_day == "Fixed":
+                    # Fixed days with single slot (legacy or fixed_time)
+                    days = frozenset(event_info.get("days", []))
+                elif event_info["type"] in ["fixed_days", "once", "weekly"]:
+                    days = frozenset([win_day])
+                else:
                     continue
 
-                polls = guild_data.get("polls", {})
-                if not polls:
+                try:
+                    time_slots.clock_minutes(win_time_str)
+                except (ValueError, AttributeError) as e:
+                    log.debug(f"Error processing notification for {event_name}: {e}")
                     continue
+                slots.append(NotificationSlot(event_name, int(slot_idx), win_day, win_time_str, days))
 
-                # Get latest poll
-                latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-                poll_data = polls[latest_poll_id]
-                selections = poll_data.get("selections", {})
-                
-                # Get winning times - prefer weekly snapshot if available (stable schedule)
-                winning_times = poll_data.get("weekly_snapshot_winning_times")
-                if not winning_times:
-                    # Fallback to live data if no snapshot exists
-                    winning_times = self._calculate_winning_times_weighted(selections)
-                
-                # Get sent notifications for this guild
-                sent_notifs = guild_data.get("sent_notifications", {})
-                event_roles = guild_data.get("event_roles", {})
-                
-                # Merge voted winning times with locked events and defaults for notification checking
-                all_checks = winning_times.copy()
-                for event_name, event_info in self.events.items():
-                    # If event is missing or has no slots, try to populate from defaults/fixed
-                    if event_name not in all_checks or not all_checks[event_name]:
-                        all_checks[event_name] = {}
-                        
-                        # Handle locked events (fixed time)
-                        if event_info.get("type") == "locked":
-                            fixed_time = event_info.get("fixed_time")
-                            days = event_info.get("days", [])
-                            if fixed_time and days:
-                                all_checks[event_name][0] = (("Fixed", fixed_time), 0, [])
-                            continue
-                            
-                        # Handle other events with defaults
-                        defaults = event_info.get("default_times", {})
-                        if defaults:
-                            if event_info["type"] == "daily":
-                                if "default" in defaults:
-                                    all_checks[event_name][0] = (("Daily", defaults["default"]), 0, [])
-                            elif event_info["type"] == "fixed_days":
-                                for i, day in enumerate(event_info.get("days", [])):
-                                    if day in defaults:
-                                        all_checks[event_name][i] = ((day, defaults[day]), 0, [])
-                            else:
-                                # once/weekly/once
-                                sorted_defaults = sorted(
-                                    [(k, v) for k, v in defaults.items() if k != "default"],
-                                    key=lambda x: self.days_of_week.index(x[0]) if x[0] in self.days_of_week else 999
-                                )
-                                for i, (day, time) in enumerate(sorted_defaults):
-                                    if i < event_info.get("slots", 1):
-                                        all_checks[event_name][i] = ((day, time), 0, [])
+        return slots
 
-                # Events to check
-                target_events = ["Party", "Showdown", "Breaking Army"]
-                
-                for event_name in all_checks:
-                    # Check if this is a target event
-                    if not any(event_name.startswith(t) for t in target_events):
-                        continue
-                        
-                    event_slots = all_checks[event_name]
-                    event_info = self.events.get(event_name)
-                    if not event_info:
-                        continue
+    async def _send_event_notification(self, guild_id: int, slot: NotificationSlot, fire_at: datetime) -> bool:
+        """Notification scheduler callback: announce an event starting at fire_at (server time)"""
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return False
 
-                    for slot_idx, slot_data in event_slots.items():
-                        winner_key, points, _ = slot_data
-                        
-                        # Determine winning day/time
-                        if event_info["type"] == "daily":
-                            win_day = day_name 
-                            win_time_str = winner_key[1]
-                        elif event_info["type"] == "locked":
-                            win_day = "Fixed" # Handled below
-                            win_time_str = winner_key[1]
-                        elif event_info["type"] in ["fixed_days", "once", "weekly"]:
-                             win_day = winner_key[0]
-                             win_time_str = winner_key[1]
-                        else:
-                            continue
-                            
-                        # Parse time
-                        try:
-                            h, m = map(int, win_time_str.split(":"))
-
-                            # Determine actual day/time of event
-                            # Times 00:00 - 02:59 are considered part of the "night" of the previous day
-                            # We use 03:00 as the cutoff to match EventPolling's next-day threshold
-                            is_next_day = h < 3 
-
-                            should_fire = False
-
-                            if is_next_day:
-                                # For post-midnight events, "Monday 01:00" means Monday night (Tuesday morning).
-                                # So if today is Tuesday and h:m is 01:00, we check if win_day was Monday.
-                                check_day = prev_day_name
-                            else:
-                                # Same day event (03:00 - 23:59)
-                                check_day = day_name
+        guild_data = await self.config.guild(guild).all()
+        channel_id = guild_data.get("notification_channel_id")
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if not channel:
+            return False
 
-                            # Validate against winning day
-                            if event_info["type"] == "daily":
-                                if now.hour == h and now.minute == m:
-                                    should_fire = True
-                            elif event_info["type"] == "locked":
-                                if check_day in event_info.get("days", []) and now.hour == h and now.minute == m:
-                                    should_fire = True
-                            elif event_info["type"] == "fixed_days" and win_day == "Fixed":
-                                # Fixed days with single slot (legacy or fixed_time)
-                                if check_day in event_info.get("days", []) and now.hour == h and now.minute == m:
-                                    should_fire = True
-                            else:
-                                if win_day == check_day and now.hour == h and now.minute == m:
-                                    should_fire = True
-                                    
-                            if should_fire:
-                                # Unique key for this notification instance: event_name + slot + date
-                                notif_key = f"{event_name}_{slot_idx}"
-                                last_sent = sent_notifs.get(notif_key)
-                                
-                                if last_sent != today_str:
-                                    # Send notification
-                                    # Check for event-specific message first
-                                    custom_msgs = guild_data.get("notification_messages", {})
-                                    msg_tmpl = custom_msgs.get(event_name)
-                                    
-                                    if not msg_tmpl:
-                                        msg_tmpl = guild_data.get("notification_message", "{event} is starting at {timestamp}!")
-                                    
-                                    # Create timestamp
-                                    event_dt = now.replace(second=0, microsecond=0)
-                                    ts = int(event_dt.timestamp())
-                                    discord_ts = f"<t:{ts}:R>" # Relative format (e.g. "in 2 minutes")
-                                    
-                                    # Determine display name (Role mention or Bold Text)
-                                    role_id = event_roles.get(event_name)
-                                    if role_id:
-                                        event_display_name = f"<@&{role_id}>"
-                                    else:
-                                        event_display_name = f"**{event_name}**"
-
-                                    message = msg_tmpl.replace("{event}", event_display_name)\
-                                                      .replace("{timestamp}", discord_ts)\
-                                                      .replace("{time_str}", f"{now.hour:02d}:{now.minute:02d}")
-                                    
-                                    # Handle {boss} variable for Breaking Army
-                                    if "{boss}" in message and "Breaking Army" in event_name:
-                                        ba_cog = self.bot.get_cog("BreakingArmy")
-                                        if ba_cog:
-                                            boss_info = await ba_cog._get_upcoming_boss_info(guild, day_name=win_day)
-                                            message = message.replace("{boss}", boss_info or "Unknown Boss")
-                                        else:
-                                            message = message.replace("{boss}", "Unknown Boss")
-                                    
-                                    # Calculate auto-delete duration
-                                    delete_duration = None
-                                    if "Showdown" in event_name or "Breaking Army" in event_name:
-                                        delete_duration = 180 * 60 # 180 minutes
-                                    elif "Party" in event_name:
-                                        delete_duration = 90 * 60 # 90 minutes
+        event_name = slot.event_name
+        # Unique key for this notification instance: event_name + slot + date
+        day_str = fire_at.strftime("%Y-%m-%d")
+        if guild_data.get("sent_notifications", {}).get(slot.key) == day_str:
+            return False
 
-                                    try:
-                                        log.info(f"Sending reminder for {event_name} to channel {channel.id} in guild {guild.id}")
-                                        if delete_duration:
-                                            log.info(f"Reminder for {event_name} will be deleted in {delete_duration // 60} minutes")
-                                            
-                                        await channel.send(
-                                            message,
-                                            delete_after=delete_duration,
-                                            allowed_mentions=discord.AllowedMentions(roles=True)
-                                        )
-                                        sent_notifs[notif_key] = today_str
-                                        # Save config
-                                        async with self.config.guild(guild).sent_notifications() as s:
-                                            s[notif_key] = today_str
-                                    except Exception as e:
-                                        log.error(f"Failed to send notification: {e}")
-
-                        except Exception as e:
-                            log.debug(f"Error processing notification for {event_name}: {e}")
-                            continue
+        # Check for event-specific message first
+        custom_msgs = guild_data.get("notification_messages", {})
+        msg_tmpl = custom_msgs.get(event_name)
+        if not msg_tmpl:
+            msg_tmpl = guild_data.get("notification_message", "{event} is starting at {timestamp}!")
 
-        except Exception as e:
-            log.error(f"Error in event notification task: {e}")
+        # Create timestamp
+        ts = int(fire_at.timestamp())
+        discord_ts = f"<t:{ts}:R>" # Relative format (e.g. "in 2 minutes")
 
-    @event_notification_task.before_loop
-    async def before_event_notification_task(self):
-        await self.bot.wait_until_ready()
+        # Determine display name (Role mention or Bold Text)
+        role_id = guild_data.get("event_roles", {}).get(event_name)
+        if role_id:
+            event_display_name = f"<@&{role_id}>"
+        else:
+            event_display_name = f"**{event_name}**"
+
+        message = msg_tmpl.replace("{event}", event_display_name)\
+                          .replace("{timestamp}", discord_ts)\
+                          .replace("{time_str}", f"{fire_at.hour:02d}:{fire_at.minute:02d}")
+
+        # Handle {boss} variable for Breaking Army
+        if "{boss}" in message and "Breaking Army" in event_name:
+            ba_cog = self.bot.get_cog("BreakingArmy")
+            if ba_cog:
+                boss_info = await ba_cog._get_upcoming_boss_info(guild, day_name=slot.win_day)
+                message = message.replace("{boss}", boss_info or "Unknown Boss")
+            else:
+                message = message.replace("{boss}", "Unknown Boss")
+
+        # Calculate auto-delete duration
+        delete_duration = None
+        if "Showdown" in event_name or "Breaking Army" in event_name:
+            delete_duration = 180 * 60 # 180 minutes
+        elif "Party" in event_name:
+            delete_duration = 90 * 60 # 90 minutes
+
+        try:
+            log.info(f"Sending reminder for {event_name} to channel {channel.id} in guild {guild.id}")
+            if delete_duration:
+                log.info(f"Reminder for {event_name} will be deleted in {delete_duration // 60} minutes")
+
+            await channel.send(
+                message,
+                delete_after=delete_duration,
+                allowed_mentions=discord.AllowedMentions(roles=True)
+            )
+            # Save config
+            async with self.config.guild(guild).sent_notifications() as s:
+                s[slot.key] = day_str
+            return True
+        except Exception as e:
+            log.error(f"Failed to send notification: {e}")
+            return False
 
     def _update_timezone_display(self):
         """Update self.timezone_display based on current Europe/Berlin DST status"""
@@ -815,6 +824,9 @@ class EventPolling(commands.Cog):
                                 if "time" in event_data:
                                     event_data["time"] = self._adjust_time_string(event_data["time"], hour_delta)
 
+                    # Time options moved with DST, so the running tally is recomputed
+                    self._rebuild_tally(poll_data)
+
                     # Also adjust the weekly snapshot if it exists
                     if "weekly_snapshot_winning_times" in poll_data:
                         # weekly_snapshot_winning_times: {event_name: {slot_index: (winner_key, points, all_entries)}}
@@ -826,6 +838,7 @@ class EventPolling(commands.Cog):
                                     winner_key = list(slot_val[0])
                                     winner_key[1] = self._adjust_time_string(winner_key[1], hour_delta)
                                     slot_val[0] = tuple(winner_key)
+            self._invalidate_schedule(guild_id)
 
     def _adjust_time_string(self, time_str: str, hour_delta: int) -> str:
         """Adjust a HH:MM time string by a number of hours, wrapping around 24h"""
@@ -981,14 +994,9 @@ class EventPolling(commands.Cog):
                 # If no polls, we still might want Discord events
                 polling_events = []
             else:
-                # Get latest poll
-                latest_poll_id = max(polls.keys(), key=lambda pid: int(pid))
-                poll_data = polls[latest_poll_id]
-                
-                # Use weekly snapshot if available, otherwise calculate live winning times
-                winning_times = poll_data.get("weekly_snapshot_winning_times")
-                if not winning_times:
-                    winning_times = self._calculate_winning_times_weighted(poll_data.get("selections", {}))
+                # Weekly snapshot if available, otherwise live winning times
+                schedule = await self.schedule.get(guild_id)
+                winning_times = schedule.winning_times
                 
                 # Prepare polling events
                 polling_events = []
@@ -1100,16 +1108,13 @@ class EventPolling(commands.Cog):
             # Export calendar image for this guild (if it's the target guild)
             try:
                 # Generate calendar image
-                image_buffer = await self.bot.loop.run_in_executor(
-                    None,
-                    functools.partial(
-                        self.calendar_renderer.render_calendar,
-                        prepared_data,
-                        self.events,
-                        self.blocked_times,
-                        len(guild_data.get("polls", {}).get(latest_poll_id, {}).get("selections", {})) if polls else 0
-                    )
-                )
+                image_buffer = io.BytesIO(await self.render_pool.render(
+                    self.calendar_renderer.render_calendar,
+                    prepared_data,
+                    self.events,
+                    self.blocked_times,
+                    len(polls.get(schedule.poll_id, {}).get("selections", {})) if polls else 0
+                ))
                 img_path = Path(export_path).parent / "calendar.png"
                 
                 def save_image():
@@ -1216,8 +1221,30 @@ class EventPolling(commands.Cog):
                 except Exception as e:
                     log.error(f"Could not restore weekly calendar view for poll {poll_id}: {e}")
 
-    async def _update_poll_message(self, guild_id: int, poll_id: str, poll_data: Dict):
-        """Update the poll message embed and related calendar messages"""
+    async def _queue_poll_update(self, guild_id: int, poll_id: str, full: bool = True):
+        """Mark a poll as changed; its messages are re-rendered by the update scheduler
+
+        Args:
+            guild_id: Guild ID
+            poll_id: Poll ID
+            full: Also update weekly calendars and the website export
+        """
+        self.update_scheduler.mark_dirty(guild_id, poll_id, full)
+        self._invalidate_schedule(guild_id)
+
+    async def _run_poll_update(self, guild_id: int, poll_id: str, full: bool):
+        """Update scheduler callback: re-render a poll with its latest stored state"""
+        polls = await self.config.guild_from_id(guild_id).polls()
+        poll_data = polls.get(poll_id)
+        if poll_data:
+            await self._update_poll_message(guild_id, poll_id, poll_data, full=full)
+
+    async def _update_poll_message(self, guild_id: int, poll_id: str, poll_data: Dict, full: bool = True):
+        """Update the poll message embed and related calendar messages
+
+        Args:
+            full: Also update weekly calendar messages and the website export
+        """
         try:
             guild = self.bot.get_guild(guild_id)
             if not guild:
@@ -1252,6 +1279,9 @@ class EventPolling(commands.Cog):
             # Check if we need to create initial weekly snapshot (for first vote)
             await self._check_and_create_initial_snapshot(guild, poll_id)
 
+            if not full:
+                return
+
             # Update any weekly calendar messages for this poll
             await self._update_weekly_calendar_messages(guild, poll_data, poll_id)
             
@@ -1294,9 +1324,11 @@ class EventPolling(commands.Cog):
                 else:
                     # Replace: Completely replace all votes
                     poll_data["selections"] = imported_votes
+                self._rebuild_tally(poll_data)
 
                 # Update the poll in config
                 polls[target_poll_id] = poll_data
+                self._invalidate_schedule(ctx.guild.id)
 
                 # Update the poll message embed to reflect new votes
                 try:
@@ -1384,6 +1416,7 @@ class EventPolling(commands.Cog):
 
             # Set the view's poll ID
             view.poll_id = new_poll_id
+            self._invalidate_schedule(ctx.guild.id)
 
             return True
 
@@ -1554,6 +1587,7 @@ class EventPolling(commands.Cog):
                 "selections": {},
                 "created_at": datetime.utcnow().isoformat()
             }
+        self._invalidate_schedule(ctx.guild.id)
 
         view.poll_id = poll_id
         await ctx.tick()
@@ -1647,6 +1681,7 @@ class EventPolling(commands.Cog):
                 "selections": {},
                 "created_at": datetime.utcnow().isoformat()
             }
+        self._invalidate_schedule(ctx.guild.id)
 
         view.poll_id = poll_id
         await ctx.send(f"Successfully overwrote message with new poll: {message.jump_url}")
@@ -1867,6 +1902,7 @@ class EventPolling(commands.Cog):
                 return
 
             del polls[poll_id]
+        self._invalidate_schedule(ctx.guild.id)
 
         await ctx.send("Poll ended and removed from database.")
 
@@ -1908,8 +1944,8 @@ class EventPolling(commands.Cog):
             poll_data = polls[poll_id]
             user_id_str = str(user.id)
 
-            if user_id_str in poll_data["selections"]:
-                del poll_data["selections"][user_id_str]
+            if self._clear_user_votes(poll_data, user_id_str):
+                self._invalidate_schedule(ctx.guild.id)
                 await ctx.send(f"Cleared votes for {user.mention}")
             else:
                 await ctx.send(f"{user.mention} hasn't voted in this poll.")
@@ -1946,7 +1982,7 @@ class EventPolling(commands.Cog):
                             reason = "lost member roles"
                     
                     if should_remove:
-                        del selections[user_id_str]
+                        self._clear_user_votes(poll_data, user_id_str)
                         poll_removed_count += 1
                         total_removed += 1
                         log.info(f"Cleanup: Removed EventPolling votes for user {user_id} in poll {poll_id} because they {reason}.")
@@ -1957,6 +1993,7 @@ class EventPolling(commands.Cog):
                     await self._update_results_messages(ctx.guild, poll_data, poll_id)
         
         if any_updated:
+            self._invalidate_schedule(ctx.guild.id)
             # Trigger a manual backup and website export if votes were removed
             await self._export_to_json()
             await ctx.send(f"✅ Cleanup complete. Removed **{total_removed}** ineligible vote(s) across all polls.")
@@ -2034,6 +2071,7 @@ class EventPolling(commands.Cog):
             if poll_id in polls:
                 # Store the winning_times snapshot for timezone conversions
                 polls[poll_id]["weekly_snapshot_winning_times"] = winning_times
+                self._invalidate_schedule(ctx.guild.id)
 
                 if "weekly_calendar_messages" not in polls[poll_id]:
                     polls[poll_id]["weekly_calendar_messages"] = []
@@ -2190,6 +2228,7 @@ class EventPolling(commands.Cog):
             if poll_id in polls:
                 # Store the winning_times snapshot for timezone conversions
                 polls[poll_id]["weekly_snapshot_winning_times"] = winning_times
+                self._invalidate_schedule(ctx.guild.id)
 
                 if "weekly_calendar_messages" not in polls[poll_id]:
                     polls[poll_id]["weekly_calendar_messages"] = []
@@ -2231,9 +2270,10 @@ class EventPolling(commands.Cog):
             
             # 1. Update Snapshot (for weekly calendars)
             selections = poll_data.get("selections", {})
-            winning_times = self._calculate_winning_times_weighted(selections)
+            winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
             async with self.config.guild(ctx.guild).polls() as p:
                 p[poll_id]["weekly_snapshot_winning_times"] = winning_times
+            self._invalidate_schedule(ctx.guild.id)
             
             # 2. Update Main Poll Message
             try:
@@ -2293,12 +2333,13 @@ class EventPolling(commands.Cog):
 
         # Calculate current winning times from live selections
         selections = poll_data.get("selections", {})
-        winning_times = self._calculate_winning_times_weighted(selections)
+        winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
         # Store the new snapshot
         async with self.config.guild(ctx.guild).polls() as polls:
             if poll_id in polls:
                 polls[poll_id]["weekly_snapshot_winning_times"] = winning_times
+        self._invalidate_schedule(ctx.guild.id)
 
         # Update all related messages
         try:
@@ -2379,9 +2420,11 @@ class EventPolling(commands.Cog):
         """Set the channel for event notifications. Leave empty to disable."""
         if channel:
             await self.config.guild(ctx.guild).notification_channel_id.set(channel.id)
+            self.notification_scheduler.invalidate(ctx.guild.id)
             await ctx.send(f"✅ Event notifications will be sent to {channel.mention}")
         else:
             await self.config.guild(ctx.guild).notification_channel_id.set(None)
+            self.notification_scheduler.invalidate(ctx.guild.id)
             await ctx.send("✅ Event notifications disabled")
 
     @eventpoll.command(name="setmessage")
@@ -2561,12 +2604,9 @@ class EventPolling(commands.Cog):
                     pass 
                 elif ba_run["current_index"] >= 0:
                     # If not running but index set, today might be done. Find next day.
-                    polls = await self.config.guild(ctx.guild).polls()
-                    if polls:
-                        latest_id = max(polls.keys(), key=lambda pid: int(pid))
-                        poll = polls[latest_id]
-                        snap = poll.get("weekly_snapshot_winning_times")
-                        win = snap if snap else self._calculate_winning_times_weighted(poll.get("selections", {}))
+                    schedule = await self.schedule.get(ctx.guild.id)
+                    if schedule.poll_id is not None:
+                        win = schedule.winning_times
                         ba_win = win.get("Breaking Army", {})
                         
                         dow = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -2936,6 +2976,43 @@ class EventPolling(commands.Cog):
         await self._export_to_json()
         await ctx.send("✅ Schedule JSON exported.")
 
+    @eventpoll.command(name="updaterate")
+    @commands.is_owner()
+    async def eventpoll_updaterate(self, ctx: commands.Context, seconds: Optional[float] = None):
+        """Show poll re-render stats, or set the minimum seconds between re-renders of a poll.
+
+        Votes arriving within this window are folded into a single update.
+        Example: [p]eventpoll updaterate 15
+        """
+        scheduler = self.update_scheduler
+        if seconds is not None:
+            if seconds < 0:
+                await ctx.send("❌ The interval can't be negative.")
+                return
+            await self.config.update_interval.set(seconds)
+            scheduler.interval = seconds
+            await ctx.send(f"✅ Polls are now re-rendered at most once every {seconds:g}s.")
+            return
+
+        notifications = self.notification_scheduler
+        next_due = notifications.next_due
+        next_due = next_due.strftime("%a %H:%M") if next_due else "none"
+        await ctx.send(
+            f"**Poll updates** (at most once every {scheduler.interval:g}s per poll)\n"
+            f"Requested: {scheduler.requested}\n"
+            f"Rendered: {scheduler.performed} ({scheduler.failed} failed)\n"
+            f"Saved by coalescing: {scheduler.coalesced}\n"
+            f"Pending: {scheduler.pending}\n"
+            f"Calendar image cache: {calendar_renderer.RENDER_CACHE.hits} hits, {calendar_renderer.RENDER_CACHE.misses} misses\n"
+            f"Render pool: {self.render_pool.completed} renders (avg {self.render_pool.average_time:.2f}s), "
+            f"{self.render_pool.depth} queued, {self.render_pool.coalesced} coalesced, "
+            f"{self.render_pool.rate_limited} rate limited, {self.render_pool.rejected} rejected\n"
+            f"Emoji atlas: {len(calendar_renderer.EMOJI_ATLAS)} emojis ({calendar_renderer.EMOJI_ATLAS.fetches} fetched)\n"
+            f"Notifications: {notifications.scheduled} scheduled, next {next_due}, "
+            f"{notifications.sent} sent, {notifications.skipped_late} skipped as too late, {notifications.failed} failed\n"
+            f"Schedule: {self.schedule.computed} computed, {self.schedule.hits} served from memory"
+        )
+
     def _format_file_size(self, file_path: Path) -> str:
         """Format file size in human-readable format"""
         size = file_path.stat().st_size
@@ -2971,20 +3048,17 @@ class EventPolling(commands.Cog):
         selections = poll_data.get("selections", {})
 
         # Calculate winning times using weighted point system
-        winning_times = self._calculate_winning_times_weighted(selections)
+        winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
         # Generate calendar image
         calendar_data = self._prepare_calendar_data(winning_times)
-        image_buffer = await self.bot.loop.run_in_executor(
-            None,
-            functools.partial(
-                self.calendar_renderer.render_calendar,
-                calendar_data,
-                self.events,
-                self.blocked_times,
-                len(selections)
-            )
-        )
+        image_buffer = io.BytesIO(await self.render_pool.render(
+            self.calendar_renderer.render_calendar,
+            calendar_data,
+            self.events,
+            self.blocked_times,
+            len(selections)
+        ))
 
         # Create file attachment
         calendar_file = discord.File(image_buffer, filename="calendar.png")
@@ -3022,20 +3096,17 @@ class EventPolling(commands.Cog):
         selections = poll_data.get("selections", {})
 
         # Calculate winning times using weighted point system
-        winning_times = self._calculate_winning_times_weighted(selections)
+        winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
         # Generate calendar image
         calendar_data = self._prepare_calendar_data(winning_times)
-        image_buffer = await self.bot.loop.run_in_executor(
-            None,
-            functools.partial(
-                self.calendar_renderer.render_calendar,
-                calendar_data,
-                self.events,
-                self.blocked_times,
-                len(selections)
-            )
-        )
+        image_buffer = io.BytesIO(await self.render_pool.render(
+            self.calendar_renderer.render_calendar,
+            calendar_data,
+            self.events,
+            self.blocked_times,
+            len(selections)
+        ))
 
         # Create file attachment
         calendar_file = discord.File(image_buffer, filename="calendar.png")
@@ -3087,8 +3158,9 @@ class EventPolling(commands.Cog):
             if not selections:
                 return
 
-            winning_times = self._calculate_winning_times_weighted(selections)
+            winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
             polls[poll_id]["weekly_snapshot_winning_times"] = winning_times
+        self._invalidate_schedule(guild.id)
 
         # Update the weekly calendar images with the new snapshot
         try:
@@ -3114,6 +3186,7 @@ class EventPolling(commands.Cog):
         async with self.config.guild(guild).polls() as polls:
             if poll_id in polls:
                 polls[poll_id]["weekly_snapshot_winning_times"] = winning_times
+        self._invalidate_schedule(guild.id)
 
         # Update all weekly calendar messages
         for idx, cal_msg_data in enumerate(weekly_calendar_messages):
@@ -3165,7 +3238,7 @@ class EventPolling(commands.Cog):
             return embed
 
         # Calculate winning times using weighted point system
-        winning_times = self._calculate_winning_times_weighted(selections)
+        winning_times = self._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
         # Format results for each event
         for event_name, event_info in self.events.items():
@@ -3722,23 +3795,11 @@ class EventPolling(commands.Cog):
         # Add Guild Wars emoji to blocked time slots (priority 0 - always shows last)
         for blocked in self.blocked_times:
             blocked_day = blocked["day"]
-            blocked_start = blocked["start"]
-            blocked_end = blocked["end"]
-
-            # Parse blocked times
-            start_time = datetime.strptime(blocked_start, "%H:%M")
-            end_time = datetime.strptime(blocked_end, "%H:%M")
 
             # Add Guild Wars emoji to all time slots in the blocked range
             for label, value in times:
-                # Handle 24:00 special case (treat as 00:00 next day)
-                if value == "24:00":
-                    slot_time = datetime.strptime("00:00", "%H:%M")
-                else:
-                    slot_time = datetime.strptime(value, "%H:%M")
-
                 # Check if this time slot is within the blocked range (inclusive start, exclusive end)
-                if start_time <= slot_time < end_time:
+                if time_slots.in_period(value, blocked["start"], blocked["end"]):
                     schedule[value][blocked_day].append((0, self.guild_wars_emoji))
 
         # Build the table using code block for monospace formatting
@@ -3784,11 +3845,12 @@ class EventPolling(commands.Cog):
 
         return "\n".join(lines) if len(lines) > 3 else ""
 
-    def _calculate_winning_times_weighted(self, selections: Dict) -> Dict:
+    def _calculate_winning_times_weighted(self, selections: Dict, tally: Optional[Dict] = None) -> Dict:
         """Calculate winning times using weighted point system
 
         Args:
             selections: User selections dict
+            tally: The poll's persisted running tally (poll_data["tally"]), if available
 
         Returns:
             Dict of winning times with points: {event_name: {slot_index: (winner_key, points, all_entries)}}
@@ -3802,6 +3864,8 @@ class EventPolling(commands.Cog):
         # Generate all possible times (Server Time / UTC+1 values)
         all_times_tuples = self.generate_time_options(17, 26, 30)
         all_times = [t[1] for t in all_times_tuples]
+        # Running totals make ranking independent of the number of voters
+        vote_tally = VoteTally.from_dict(self.scoring, self.events, all_times, tally)
 
         for event_name, event_info in self.events.items():
             num_slots = event_info.get("slots", 1)
@@ -3821,57 +3885,10 @@ class EventPolling(commands.Cog):
 
             # Special handling for weekly events with multiple slots (Breaking Army, Showdown, Guild War)
             # Pool all votes together and select top N
-            if (event_info["type"] == "weekly" or event_info["type"] == "once") and num_slots > 1:
-                # Pool votes from all slots
-                point_totals = {}
-
-                # Process each user's vote (pool both slots together)
-                for user_id, user_selections in selections.items():
-                    if event_name not in user_selections:
-                        continue
-
-                    selection = user_selections[event_name]
-
-                    # Collect all voted times from all slots for this user
-                    voted_entries = []
-                    if isinstance(selection, list):
-                        for slot_data in selection:
-                            if slot_data:
-                                voted_time = slot_data.get("time")
-                                voted_day = slot_data.get("day")
-                                if voted_time and voted_day:
-                                    voted_entries.append((voted_day, voted_time))
-                    else:
-                        # Single-slot format
-                        voted_time = selection.get("time")
-                        voted_day = selection.get("day")
-                        if voted_time and voted_day:
-                            voted_entries.append((voted_day, voted_time))
-
-                    # Award points for each voted entry
-                    for voted_day, voted_time in voted_entries:
-                        # Main points for the voted day
-                        is_weighted = event_name != "Guild War"
-                        for target_time in all_times:
-                            points = self._calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
-                            if points > 0:
-                                key = (voted_day, target_time)
-                                # If it's Guild War, only award points if day matches target day
-                                # (redundant but safe since voted_day is now specific)
-                                point_totals[key] = point_totals.get(key, 0) + points
-
+            if is_pooled(event_info):
                 # Sort by points (desc), then by distance to Saturday (asc), then by time (desc)
-                def saturday_distance(day_name: str) -> int:
-                    """Calculate distance from Saturday (0 = Saturday, 1 = Fri/Sun, etc.)"""
-                    day_index = self.days_of_week.index(day_name)
-                    saturday_index = 5  # Saturday
-                    return min(abs(day_index - saturday_index), 7 - abs(day_index - saturday_index))
-
-                if point_totals:
-                    sorted_entries = sorted(
-                        point_totals.items(),
-                        key=lambda x: (-x[1], saturday_distance(x[0][0]), -self._time_to_sort_key(x[0][1])),
-                    )
+                sorted_entries = self._ranked_votes(event_name, None, selections, vote_tally, all_times)
+                if sorted_entries:
 
                     # Assign top winners to slots
                     if event_name == "Guild War":
@@ -3916,93 +3933,9 @@ class EventPolling(commands.Cog):
             else:
                 # Original slot-by-slot logic for other event types
                 for slot_index in range(num_slots):
-                    # Dictionary to store points: key -> total_points
-                    point_totals = {}
-
-                    # Process each user's vote
-                    for user_id, user_selections in selections.items():
-                        if event_name not in user_selections:
-                            continue
-
-                        selection = user_selections[event_name]
-                        is_weighted = event_name != "Guild War"
-
-                        # Get the voted time for this slot
-                        voted_time = None
-                        voted_day = None
-
-                        if isinstance(selection, list):
-                            if slot_index < len(selection) and selection[slot_index]:
-                                slot_data = selection[slot_index]
-                                voted_time = slot_data["time"]
-                                voted_day = slot_data.get("day")
-                        else:
-                            # Single-slot format
-                            if slot_index == 0:
-                                if isinstance(selection, str):
-                                    voted_time = selection
-                                    voted_day = None
-                                else:
-                                    voted_time = selection["time"]
-                                    voted_day = selection.get("day")
-
-                        if not voted_time:
-                            continue
-
-                        # Calculate points for all possible times
-                        if event_info["type"] == "daily":
-                            # Daily events
-                            for target_time in all_times:
-                                points = self._calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
-                                if points > 0:
-                                    key = ("Daily", target_time)
-                                    point_totals[key] = point_totals.get(key, 0) + points
-
-                        elif event_info["type"] == "fixed_days":
-                            # Fixed-day events
-                            if event_info["slots"] > 1 and voted_day:
-                                # Multi-slot: specific day
-                                for target_time in all_times:
-                                    points = self._calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
-                                    if points > 0:
-                                        key = (voted_day, target_time)
-                                        point_totals[key] = point_totals.get(key, 0) + points
-                            else:
-                                # Single slot for all fixed days
-                                for target_time in all_times:
-                                    points = self._calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
-                                    if points > 0:
-                                        key = ("Fixed", target_time)
-                                        point_totals[key] = point_totals.get(key, 0) + points
-
-                        else:
-                            # Weekly events (single slot only, legacy path)
-                            if not voted_day:
-                                continue
-
-                            # Main points for the voted day
-                            for target_time in all_times:
-                                points = self._calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
-                                if points > 0:
-                                    key = (voted_day, target_time)
-                                    point_totals[key] = point_totals.get(key, 0) + points
-
-                            # Special case: 1 point to same time on all other days
-                            if is_weighted:
-                                for day in self.days_of_week:
-                                    if day != voted_day:
-                                        key = (day, voted_time)
-                                        point_totals[key] = point_totals.get(key, 0) + 1
-
                     # Select winner (highest points, latest time for ties)
-                    if point_totals:
-                        # Sort by points (descending) then by time (descending for tie-breaking)
-                        sorted_entries = sorted(
-                            point_totals.items(),
-                            key=lambda x: (x[1], x[0][1]),  # Sort by points, then by time
-                            reverse=True
-                        )
-
+                    sorted_entries = self._ranked_votes(event_name, slot_index, selections, vote_tally, all_times)
+                    if sorted_entries:
                         winner_key, winner_points = sorted_entries[0]
                         winning_times[event_name][slot_index] = (winner_key, winner_points, sorted_entries[:3])
                     else:
@@ -4059,263 +3992,92 @@ class EventPolling(commands.Cog):
 
         return winning_times
 
-    def _resolve_event_conflicts(self, winning_times: Dict) -> Dict:
-        """Resolve conflicts between events based on priority bonus system
+    def _ranked_votes(
+        self, event_name: str, slot_index: Optional[int], selections: Dict, vote_tally: Optional[VoteTally], all_times: List[str]
+    ) -> List[Tuple[Tuple[str, str], int]]:
+        """Ranked (key, points) entries for one event slot (slot_index None = pooled slots)"""
+        if vote_tally is not None:
+            needed = max(3, self.events[event_name].get("slots", 1))
+            return vote_tally.ranked(event_name, slot_index, selections, needed)
+        return rank_grid(self.scoring, event_name, self.events[event_name], slot_index, selections, all_times)
+
+    def _poll_tally(self, poll_data: Dict) -> VoteTally:
+        """The poll's running tally, rebuilt from its selections if missing or made for other time options"""
+        all_times = [t[1] for t in self.generate_time_options(17, 26, 30)]
+        tally = VoteTally.from_dict(self.scoring, self.events, all_times, poll_data.get("tally"))
+        if tally is None:
+            tally = VoteTally.build(self.scoring, self.events, all_times, poll_data.get("selections", {}))
+        return tally
+
+    def _rebuild_tally(self, poll_data: Dict):
+        """Recompute a poll's running tally from scratch (after bulk changes to its selections)"""
+        poll_data.pop("tally", None)
+        poll_data["tally"] = self._poll_tally(poll_data).to_dict()
+
+    async def _rebuild_all_tallies(self):
+        """Recompute the running tally of every poll in every guild"""
+        all_guilds_data = await self.config.all_guilds()
+        for guild_id_str, guild_data in all_guilds_data.items():
+            if not guild_data.get("polls"):
+                continue
+            async with self.config.guild_from_id(int(guild_id_str)).polls() as polls:
+                for poll_data in polls.values():
+                    try:
+                        self._rebuild_tally(poll_data)
+                    except Exception as e:
+                        log.error(f"Error rebuilding vote tally: {e}", exc_info=True)
 
-        When events conflict at the same time:
-        - Higher priority events get +3 point bonus
-        - After bonus, higher points wins
-        - If still tied, use regular tiebreak rules
+    def _set_user_votes(self, poll_data: Dict, user_id_str: str, votes: Dict):
+        """Store a user's votes for one or more events and update the poll's running tally
 
         Args:
-            winning_times: Initial winning times from voting
-
-        Returns:
-            Adjusted winning times with conflicts resolved
+            poll_data: Poll dict (inside a config context manager)
+            user_id_str: Voter's user ID
+            votes: {event_name: selection}
         """
-        log.info("=== Starting conflict resolution ===")
-
-        # Build a mapping of (day, time) -> [(event_name, slot_index, points, priority)]
-        time_slot_candidates = {}
-
-        for event_name, event_info in self.events.items():
-            if event_name not in winning_times:
-                continue
-
-            priority = event_info.get("priority", 0)
-
-            for slot_index, slot_data in winning_times[event_name].items():
-                winner_key, winner_points, all_entries = slot_data
-                day, time = winner_key
-
-                # Get all days this event affects
-                affected_days = self._get_affected_days(event_name, day)
-
-                # Register this event for all time slots it occupies
-                for affected_day in affected_days:
-                    # Find all 30-min slots this event occupies
-                    from datetime import datetime, timedelta
-                    current_time = datetime.strptime(time, "%H:%M")
-                    duration = event_info.get("duration", 30)
-                    slots_needed = max(1, duration // 30)
-
-                    for i in range(slots_needed):
-                        slot_time = current_time + timedelta(minutes=i * 30)
-                        slot_time_str = slot_time.strftime("%H:%M")
-                        slot_key = (affected_day, slot_time_str)
-
-                        if slot_key not in time_slot_candidates:
-                            time_slot_candidates[slot_key] = []
-
-                        time_slot_candidates[slot_key].append({
-                            'event_name': event_name,
-                            'slot_index': slot_index,
-                            'points': winner_points,
-                            'priority': priority,
-                            'start_time': time,
-                            'all_entries': all_entries
-                        })
-
-        # Resolve conflicts for each time slot
-        occupied_by = {}  # {(day, time): event_name} - tracks which event won each slot
-        adjusted_winning_times = {}
-        events_needing_reassignment = set()  # Events that lost their preferred time
-
-        for slot_key, candidates in time_slot_candidates.items():
-            if len(candidates) == 1:
-                # No conflict, event gets this time
-                candidate = candidates[0]
-                occupied_by[slot_key] = candidate['event_name']
-            else:
-                # Conflict! Check if Party can coexist with other events
-                conflict_msg = [f"{c['event_name']} slot {c['slot_index']}" for c in candidates]
-                log.info(f"Conflict at {slot_key}: {conflict_msg}")
-                party_candidate = None
-                other_candidates = []
-
-                for candidate in candidates:
-                    if candidate['event_name'] == 'Party':
-                        party_candidate = candidate
-                    else:
-                        other_candidates.append(candidate)
-
-                # If Party is involved, allow coexistence (like Guild War)
-                # Only Party can share cells with other events
-                # Other events cannot share cells with each other
-                if party_candidate and len(other_candidates) > 0:
-                    # Both Party and the other event(s) keep their times
-                    # Mark all as occupying this slot (for table splitting)
-                    log.info(f"  Party coexistence allowed - all events keep their times")
-                    for candidate in candidates:
-                        occupied_by[slot_key] = candidate['event_name']
-                    # Don't mark anyone for reassignment - they can coexist
-                else:
-                    # Standard conflict resolution when Party is not involved
-                    # Apply priority bonuses and resolve
-                    max_priority = max(c['priority'] for c in candidates)
-
-                    for candidate in candidates:
-                        # Higher priority gets +3 bonus
-                        if candidate['priority'] == max_priority:
-                            candidate['adjusted_points'] = candidate['points'] + 3
-                        else:
-                            candidate['adjusted_points'] = candidate['points']
+        tally = self._poll_tally(poll_data)
+        user_selections = poll_data["selections"].setdefault(user_id_str, {})
+        for event_name, selection in votes.items():
+            tally.apply(event_name, user_selections.get(event_name), -1)
+            user_selections[event_name] = selection
+            tally.apply(event_name, selection, 1)
+        poll_data["tally"] = tally.to_dict()
 
-                    # Sort by adjusted points (desc), then by priority (desc), then by time (desc for tiebreak)
-                    candidates.sort(key=lambda x: (-x['adjusted_points'], -x['priority'], -self._time_to_sort_key(x['start_time'])))
-
-                    winner = candidates[0]
-                    occupied_by[slot_key] = winner['event_name']
-                    log.info(f"  Winner: {winner['event_name']} slot {winner['slot_index']} ({winner['adjusted_points']} pts)")
-
-                    # Mark losers for reassignment
-                    for loser in candidates[1:]:
-                        events_needing_reassignment.add((loser['event_name'], loser['slot_index']))
-                        log.info(f"  Loser needs reassignment: {loser['event_name']} slot {loser['slot_index']}")
-
-        # Assign winning times to events
-        # First pass: Add all winners to adjusted_winning_times
-        for event_name, event_info in self.events.items():
-            if event_name not in winning_times:
-                continue
-
-            adjusted_winning_times[event_name] = {}
-
-            for slot_index, slot_data in winning_times[event_name].items():
-                # Check if this event needs reassignment
-                if (event_name, slot_index) not in events_needing_reassignment:
-                    # Event won its preferred time
-                    adjusted_winning_times[event_name][slot_index] = slot_data
-
-        # Second pass: Process losers and find alternatives
-        for event_name, event_info in self.events.items():
-            if event_name not in winning_times:
-                continue
-
-            for slot_index, slot_data in winning_times[event_name].items():
-                winner_key, winner_points, all_entries = slot_data
-                day, time = winner_key
-
-                # Check if this event needs reassignment
-                if (event_name, slot_index) in events_needing_reassignment:
-                    # Event needs to find alternative time
-                    log.info(f"Reassigning {event_name} slot {slot_index} from {winner_key}")
-                    selected_entry = None
-                    for candidate_key, candidate_points in all_entries:
-                        if self._is_time_available(event_name, candidate_key, occupied_by, slot_index, adjusted_winning_times):
-                            selected_entry = (candidate_key, candidate_points)
-                            log.info(f"  Found alternative: {candidate_key[0]} at {candidate_key[1]} ({candidate_points} pts)")
-                            # Mark this time as occupied
-                            self._mark_time_occupied(event_name, candidate_key, occupied_by)
-                            # Update adjusted_winning_times immediately so next slot can check against it
-                            adjusted_winning_times[event_name][slot_index] = (selected_entry[0], selected_entry[1], all_entries)
-                            break
-
-                    if not selected_entry:
-                        # Fallback to original
-                        log.warning(f"  No alternative found! Keeping original time {winner_key}")
-                        adjusted_winning_times[event_name][slot_index] = slot_data
-
-        return adjusted_winning_times
-
-    def _get_affected_days(self, event_name: str, day: str) -> list:
-        """Get list of days affected by an event
-
-        Args:
-            event_name: Name of the event
-            day: Day key from winning time
+    def _clear_user_votes(self, poll_data: Dict, user_id_str: str, event_name: Optional[str] = None) -> bool:
+        """Remove a user's vote for one event, or all their votes, and update the poll's running tally
 
         Returns:
-            List of day names affected
+            True if anything was removed
         """
-        event_info = self.events[event_name]
-
-        if event_info["type"] == "daily" or day == "Daily":
-            return self.days_of_week
-        elif event_info["type"] == "fixed_days":
-            if day in self.days_of_week:
-                return [day]
-            else:
-                return event_info.get("days", [])
+        user_selections = poll_data.get("selections", {}).get(user_id_str)
+        if user_selections is None or (event_name is not None and event_name not in user_selections):
+            return False
+        tally = self._poll_tally(poll_data)
+        if event_name is None:
+            for name, selection in user_selections.items():
+                tally.apply(name, selection, -1)
+            del poll_data["selections"][user_id_str]
         else:
-            return [day] if day in self.days_of_week else []
+            tally.apply(event_name, user_selections.pop(event_name), -1)
+        poll_data["tally"] = tally.to_dict()
+        return True
 
-    def _is_time_available(self, event_name: str, time_key: tuple, occupied_by: Dict, current_slot_index: Optional[int] = None, adjusted_winning_times: Optional[Dict] = None) -> bool:
-        """Check if a time slot is available for an event
+    def _resolve_event_conflicts(self, winning_times: Dict) -> Dict:
+        """Resolve conflicts between events based on priority bonus system
+
+        When events conflict at the same time:
+        - Higher priority events get +3 point bonus
+        - After bonus, higher points wins
+        - If still tied, use regular tiebreak rules
 
         Args:
-            event_name: Name of the event
-            time_key: (day, time) tuple
-            occupied_by: Dictionary mapping slot keys to event names
-            current_slot_index: Index of the slot being placed (for multi-slot events)
-            adjusted_winning_times: Current winning times to check for same-event conflicts
+            winning_times: Initial winning times from voting
 
         Returns:
-            True if available, False otherwise
-        """
-        day, time = time_key
-        event_info = self.events[event_name]
-        affected_days = self._get_affected_days(event_name, day)
-
-        # For multi-slot weekly events, check if another slot from the same event is already on this day
-        if event_info.get("type") == "once" and event_info.get("slots", 1) > 1:
-            if adjusted_winning_times and event_name in adjusted_winning_times:
-                for slot_idx, slot_data in adjusted_winning_times[event_name].items():
-                    # Don't check against the current slot being placed
-                    if current_slot_index is not None and slot_idx == current_slot_index:
-                        continue
-                    winner_key, _, _ = slot_data
-                    existing_day, existing_time = winner_key
-                    # If same event already has a slot on this day, reject
-                    if existing_day == day:
-                        log.debug(f"    Rejected {time_key}: {event_name} slot {slot_idx} already on {existing_day} at {existing_time}")
-                        return False
-
-        from datetime import datetime, timedelta
-        current_time = datetime.strptime(time, "%H:%M")
-        duration = event_info.get("duration", 30)
-        slots_needed = max(1, duration // 30)
-
-        for affected_day in affected_days:
-            for i in range(slots_needed):
-                slot_time = current_time + timedelta(minutes=i * 30)
-                slot_time_str = slot_time.strftime("%H:%M")
-                slot_key = (affected_day, slot_time_str)
-
-                if slot_key in occupied_by and occupied_by[slot_key] != event_name:
-                    occupying_event = occupied_by[slot_key]
-                    # Only Party can coexist with other events (for table splitting)
-                    # Other events cannot share cells with each other
-                    if event_name == 'Party' or occupying_event == 'Party':
-                        continue
-                    # Other events cannot share slots
-                    return False
-
-        return True
-
-    def _mark_time_occupied(self, event_name: str, time_key: tuple, occupied_by: Dict):
-        """Mark a time slot as occupied by an event
-
-        Args:
-            event_name: Name of the event
-            time_key: (day, time) tuple
-            occupied_by: Dictionary to update
+            Adjusted winning times with conflicts resolved
         """
-        day, time = time_key
-        event_info = self.events[event_name]
-        affected_days = self._get_affected_days(event_name, day)
-
-        from datetime import datetime, timedelta
-        current_time = datetime.strptime(time, "%H:%M")
-        duration = event_info.get("duration", 30)
-        slots_needed = max(1, duration // 30)
-
-        for affected_day in affected_days:
-            for i in range(slots_needed):
-                slot_time = current_time + timedelta(minutes=i * 30)
-                slot_time_str = slot_time.strftime("%H:%M")
-                slot_key = (affected_day, slot_time_str)
-                occupied_by[slot_key] = event_name
+        log.info("=== Starting conflict resolution ===")
+        return self.conflict_resolver.resolve(winning_times)
 
     def _time_to_sort_key(self, time_str: str) -> int:
         """Convert time string to sortable integer for sorting
@@ -4326,12 +4088,7 @@ class EventPolling(commands.Cog):
         Returns:
             Integer representing minutes since 17:00 (start of event window)
         """
-        hour, minute = map(int, time_str.split(':'))
-        # Handle wraparound: times 00:00-02:59 are treated as next day
-        if hour < 3:
-            hour += 24
-        # Convert to minutes since 17:00
-        return (hour - 17) * 60 + minute
+        return time_slots.sort_key(time_str)
 
     def _calculate_weighted_points(self, voted_time: str, target_time: str, weighted: bool = True) -> int:
         """Calculate weighted points based on time difference
@@ -4345,22 +4102,8 @@ class EventPolling(commands.Cog):
             Points: 5 for exact match, 2 for ±30min, 1 for ±60min, 0 otherwise.
             If weighted is False, returns 5 for exact match, 0 otherwise.
         """
-        # Convert time strings to minutes since midnight (handles wrap-around)
-        def time_to_minutes(time_str: str) -> int:
-            """Convert HH:MM to minutes since midnight"""
-            parts = time_str.split(":")
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            # Handle times after midnight (00:00, 01:00, etc.) as next day
-            if hours < 17:  # Times 00:00-16:59 are considered next day
-                hours += 24
-            return hours * 60 + minutes
-
-        voted_mins = time_to_minutes(voted_time)
-        target_mins = time_to_minutes(target_time)
-
-        # Calculate absolute difference in minutes
-        diff_minutes = abs(target_mins - voted_mins)
+        # Absolute difference in minutes (times 00:00-16:59 are considered next day)
+        diff_minutes = abs(time_slots.vote_minutes(target_time) - time_slots.vote_minutes(voted_time))
 
         if diff_minutes == 0:
             return 5  # Exact match
@@ -4391,31 +4134,8 @@ class EventPolling(commands.Cog):
             return False
 
         blocked = self.event_blocked_times[event_name]
-        blocked_start_str = blocked["start"]
-        blocked_end_str = blocked["end"]
-
-        # Parse times - handle times past midnight
-        def parse_time_to_minutes(time_str: str) -> int:
-            """Convert HH:MM to minutes since start of day"""
-            parts = time_str.split(":")
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            # Handle next-day times (00:00-02:00 should be treated as 24:00-26:00)
-            if hours < 3:  # Assume times 00:00-02:59 are next day
-                hours += 24
-            return hours * 60 + minutes
-
-        # Convert event start time to minutes
-        event_start_mins = parse_time_to_minutes(time_str)
-        event_end_mins = event_start_mins + duration
-
-        # Convert blocked period to minutes
-        blocked_start_mins = parse_time_to_minutes(blocked_start_str)
-        blocked_end_mins = parse_time_to_minutes(blocked_end_str)
-
-        # Check for overlap
-        # Two ranges overlap if: start1 < end2 AND start2 < end1
-        return event_start_mins < blocked_end_mins and blocked_start_mins < event_end_mins
+        # Times 00:00-02:59 count as next day, so periods past midnight compare correctly
+        return time_slots.overlaps_period(time_str, duration, blocked["start"], blocked["end"])
 
     def generate_time_options(self, start_hour: int = 17, end_hour: int = 26, interval: int = 30, duration: int = 0, event_name: Optional[str] = None) -> List[Tuple[str, str]]:
         """Generate time options as (label, value) tuples in HH:MM format
@@ -0,0 +1,118 @@
+"""Bounded worker pool that every calendar render goes through."""
+
+import asyncio
+import concurrent.futures
+import functools
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Threads dedicated to rendering calendar images
+RENDER_WORKERS = 2
+# Renders waiting or running before new requests are turned away
+RENDER_QUEUE_SIZE = 32
+# Seconds a user has to wait between two personal (timezone) renders
+USER_COOLDOWN = 10
+
+
+class RenderQueueFull(Exception):
+    """Raised when too many renders are already waiting."""
+
+
+class RenderRateLimited(Exception):
+    """Raised when a user requests renders faster than the cooldown allows."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CalendarRenderPool:
+    """
+    Runs render functions on a small dedicated thread pool instead of the event loop (or the
+    loop's shared default executor).
+
+    Requests with the same key that arrive while one is already queued or running share its
+    result, and user-triggered requests are rate limited per user.
+    """
+
+    def __init__(self, max_workers: int = RENDER_WORKERS, max_queue: int = RENDER_QUEUE_SIZE, user_cooldown: float = USER_COOLDOWN):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.user_cooldown = user_cooldown
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers, "eventpolling_render")
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._last_user_request: Dict[int, float] = {}
+        self._queued = 0
+        self.completed = 0
+        self.coalesced = 0
+        self.rate_limited = 0
+        self.rejected = 0
+        self.total_time = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Renders waiting or running"""
+        return self._queued
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.completed if self.completed else 0.0
+
+    def check_user(self, user_id: int):
+        """Record a user-triggered request, raising RenderRateLimited if it comes too soon."""
+        now = time.monotonic()
+        last = self._last_user_request.get(user_id)
+        if last is not None and now - last < self.user_cooldown:
+            self.rate_limited += 1
+            raise RenderRateLimited(self.user_cooldown - (now - last))
+        self._last_user_request[user_id] = now
+        # Forget users whose cooldown is over
+        if len(self._last_user_request) > 1000:
+            self._last_user_request = {
+                uid: t for uid, t in self._last_user_request.items() if now - t < self.user_cooldown
+            }
+
+    async def render(self, func: Callable, *args: Any, key: Optional[Hashable] = None, user_id: Optional[int] = None) -> bytes:
+        """Run `func(*args)` (returning a BytesIO) on the pool and return the image bytes.
+
+        Args:
+            key: Identical requests with the same key are coalesced into one render
+            user_id: Apply the per-user rate limit for this user
+        """
+        if user_id is not None:
+            self.check_user(user_id)
+
+        if key is not None:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self.coalesced += 1
+                data, _ = await asyncio.shield(pending)
+                return data
+
+        if self._queued >= self.max_queue:
+            self.rejected += 1
+            raise RenderQueueFull(f"{self._queued} renders already queued")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(self._run, func, args))
+        self._queued += 1
+        if key is not None:
+            self._inflight[key] = future
+        try:
+            data, elapsed = await asyncio.shield(future)
+        finally:
+            self._queued -= 1
+            if key is not None and self._inflight.get(key) is future:
+                del self._inflight[key]
+        self.completed += 1
+        self.total_time += elapsed
+        return data
+
+    @staticmethod
+    def _run(func: Callable, args: tuple):
+        start = time.perf_counter()
+        buffer = func(*args)
+        return buffer.getvalue(), time.perf_counter() - start
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,90 @@
+"""Versioned, in-memory "current winning schedule" per guild, shared by every consumer."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger("red.asdas-cogs.polling")
+
+
+class Schedule:
+    """The winning times a guild currently runs on: the latest poll's weekly snapshot, else its live winners.
+
+    Instances are shared between all consumers - treat `winning_times` as read-only.
+    """
+
+    __slots__ = ("guild_id", "version", "poll_id", "winning_times", "from_snapshot")
+
+    def __init__(self, guild_id: int, version: int, poll_id: Optional[str], winning_times: Dict, from_snapshot: bool):
+        self.guild_id = guild_id
+        self.version = version
+        self.poll_id = poll_id
+        self.winning_times = winning_times
+        self.from_snapshot = from_snapshot
+
+
+class ScheduleService:
+    """
+    Computes a guild's schedule once and serves it from memory until the guild is invalidated
+    (a vote or the weekly snapshot changed). Each invalidation bumps the guild's version and
+    notifies subscribers with the guild ID.
+
+    Args:
+        compute: guild_id -> (poll_id, winning_times, from_snapshot), poll_id None if there are no polls
+    """
+
+    def __init__(self, compute: Callable[[int], Awaitable[Tuple[Optional[str], Dict, bool]]]):
+        self._compute = compute
+        self._schedules: Dict[int, Schedule] = {}
+        self._versions: Dict[int, int] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._subscribers: List[Callable[[int], None]] = []
+        self.computed = 0
+        self.hits = 0
+
+    def version(self, guild_id: int) -> int:
+        return self._versions.get(guild_id, 0)
+
+    def peek(self, guild_id: int) -> Optional[Schedule]:
+        """The current schedule if it has been computed since the last change"""
+        return self._schedules.get(guild_id)
+
+    async def get(self, guild_id: int) -> Schedule:
+        """The current schedule, computing it if needed (concurrent callers share one computation)"""
+        schedule = self._schedules.get(guild_id)
+        if schedule is not None:
+            self.hits += 1
+            return schedule
+
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            schedule = self._schedules.get(guild_id)
+            if schedule is not None:
+                self.hits += 1
+                return schedule
+            version = self.version(guild_id)
+            poll_id, winning_times, from_snapshot = await self._compute(guild_id)
+            self.computed += 1
+            schedule = Schedule(guild_id, version, poll_id, winning_times, from_snapshot)
+            # Don't cache a result that was already outdated while it was being computed
+            if self.version(guild_id) == version:
+                self._schedules[guild_id] = schedule
+            return schedule
+
+    def invalidate(self, guild_id: int):
+        self._versions[guild_id] = self.version(guild_id) + 1
+        self._schedules.pop(guild_id, None)
+        for callback in list(self._subscribers):
+            try:
+                callback(guild_id)
+            except Exception as e:
+                log.error(f"Error in schedule change subscriber {callback!r}: {e}", exc_info=True)
+
+    def subscribe(self, callback: Callable[[int], None]):
+        """Call `callback(guild_id)` whenever a guild's schedule changes"""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[int], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
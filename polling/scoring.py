@@ -0,0 +1,359 @@
+"""Vectorised vote scoring for EventPolling.
+
+Votes are accumulated into a (day x time) NumPy score matrix using a precomputed points
+kernel per voted time, instead of calling the points function for every
+(user, entry, target time) combination. Rankings reproduce the original dict-based
+implementation exactly, including its tie-breaks: the original relied on stable sorting
+over dict insertion order, so every cell also remembers when it was first touched.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Entry = Tuple[Optional[str], str]  # (voted day, voted time)
+Ranked = List[Tuple[Tuple[str, str], int]]  # [((day, time), points), ...]
+
+
+class ScoringEngine:
+    """Builds score grids and caches points kernels between calculations.
+
+    Args:
+        points_fn: (voted_time, target_time, weighted) -> points, e.g. EventPolling._calculate_weighted_points
+        days_of_week: Ordered weekday names; "Saturday" is used for the pooled tie-break
+        time_sort_key: HH:MM -> sortable int, e.g. EventPolling._time_to_sort_key
+    """
+
+    def __init__(self, points_fn: Callable[[str, str, bool], int], days_of_week: Sequence[str], time_sort_key: Callable[[str], int]):
+        self._points_fn = points_fn
+        self.days_of_week = list(days_of_week)
+        self._time_sort_key = time_sort_key
+        self._kernels: Dict[Tuple[Tuple[str, ...], bool, str], np.ndarray] = {}
+
+    def kernel(self, target_times: Tuple[str, ...], voted_time: str, weighted: bool) -> np.ndarray:
+        """Points a vote for `voted_time` awards to each target time."""
+        key = (target_times, weighted, voted_time)
+        row = self._kernels.get(key)
+        if row is None:
+            row = np.array([self._points_fn(voted_time, t, weighted) for t in target_times], dtype=np.int64)
+            self._kernels[key] = row
+        return row
+
+    def grid(self, target_times: Sequence[str]) -> "ScoreGrid":
+        return ScoreGrid(self, tuple(target_times))
+
+    def saturday_distance(self, day_name: str) -> int:
+        """Distance from Saturday (0 = Saturday, 1 = Fri/Sun, etc.)"""
+        day_index = self.days_of_week.index(day_name)
+        saturday_index = 5
+        return min(abs(day_index - saturday_index), 7 - abs(day_index - saturday_index))
+
+
+class ScoreGrid:
+    """Score matrix for one event slot.
+
+    Rows are days (weekdays first, then pseudo-days such as "Daily"/"Fixed"), columns are the
+    target times followed by any voted times outside them.
+    """
+
+    def __init__(self, engine: ScoringEngine, target_times: Tuple[str, ...]):
+        self.engine = engine
+        self.target_times = target_times
+        self.days: List[str] = list(engine.days_of_week)
+        self._day_index = {d: i for i, d in enumerate(self.days)}
+        self.times: List[str] = list(dict.fromkeys(target_times))
+        self._time_index = {t: i for i, t in enumerate(self.times)}
+        # Kernel column -> matrix column (repeated target times share a cell)
+        self._columns = np.array([self._time_index[t] for t in target_times], dtype=np.int64)
+        self.scores = np.zeros((len(self.days), len(self.times)), dtype=np.int64)
+        self.first_seen = np.full(self.scores.shape, np.iinfo(np.int64).max, dtype=np.int64)
+        self._seq = 0
+
+    def _day(self, day: Optional[str]) -> int:
+        idx = self._day_index.get(day)
+        if idx is None:
+            idx = self._day_index[day] = len(self.days)
+            self.days.append(day)
+        return idx
+
+    def _time(self, time_str: str) -> int:
+        idx = self._time_index.get(time_str)
+        if idx is None:
+            idx = self._time_index[time_str] = len(self.times)
+            self.times.append(time_str)
+        return idx
+
+    def _fit(self):
+        rows, cols = len(self.days), len(self.times)
+        pad = ((0, rows - self.scores.shape[0]), (0, cols - self.scores.shape[1]))
+        if any(p[1] for p in pad):
+            self.scores = np.pad(self.scores, pad)
+            self.first_seen = np.pad(self.first_seen, pad, constant_values=np.iinfo(np.int64).max)
+
+    def add(self, entries: List[Entry], weighted: bool, other_day_bonus: bool = False):
+        """Accumulate votes.
+
+        Each entry awards kernel points to (voted day, target time) for every target time.
+        With `other_day_bonus`, it also awards 1 point to (day, voted time) on every other weekday.
+        """
+        if not entries:
+            return
+        n = len(entries)
+        num_targets = len(self.target_times)
+        stride = num_targets + len(self.engine.days_of_week)
+
+        day_idx = np.fromiter((self._day(d) for d, _ in entries), dtype=np.int64, count=n)
+        voted = [t for _, t in entries]
+        unique_times = list(dict.fromkeys(voted))
+        table = np.stack([self.engine.kernel(self.target_times, t, weighted) for t in unique_times])
+        pos = {t: i for i, t in enumerate(unique_times)}
+        points = table[[pos[t] for t in voted]]  # n x targets
+
+        # Kernel touches, in (entry, target time) order
+        ent, col = np.nonzero(points > 0)
+        cell_rows = [day_idx[ent]]
+        cell_cols = [self._columns[col]]
+        cell_pts = [points[ent, col]]
+        cell_seq = [self._seq + ent * stride + col]
+
+        if other_day_bonus:
+            voted_col = np.fromiter((self._time(t) for t in voted), dtype=np.int64, count=n)
+            weekdays = np.arange(len(self.engine.days_of_week))
+            ent, wd = np.nonzero(day_idx[:, None] != weekdays[None, :])
+            cell_rows.append(wd)
+            cell_cols.append(voted_col[ent])
+            cell_pts.append(np.ones(len(ent), dtype=np.int64))
+            cell_seq.append(self._seq + ent * stride + num_targets + wd)
+
+        self._fit()
+        rows = np.concatenate(cell_rows)
+        cols = np.concatenate(cell_cols)
+        np.add.at(self.scores, (rows, cols), np.concatenate(cell_pts))
+        np.minimum.at(self.first_seen, (rows, cols), np.concatenate(cell_seq))
+        self._seq += n * stride
+
+    def _cells(self):
+        d, c = np.nonzero(self.scores)
+        return d, c, self.scores[d, c], self.first_seen[d, c]
+
+    def _result(self, d, c, s, order) -> Ranked:
+        return [((self.days[d[i]], self.times[c[i]]), int(s[i])) for i in order]
+
+    def ranked_pooled(self) -> Ranked:
+        """Points desc, then distance to Saturday asc, then time desc (event-window order)."""
+        d, c, s, f = self._cells()
+        sat = np.array([self.engine.saturday_distance(self.days[i]) for i in d], dtype=np.int64)
+        tkey = np.array([self.engine._time_sort_key(t) for t in self.times], dtype=np.int64)
+        order = np.lexsort((f, -tkey[c], sat, -s))
+        return self._result(d, c, s, order)
+
+    def ranked_latest(self) -> Ranked:
+        """Points desc, then time string desc."""
+        d, c, s, f = self._cells()
+        rank = {t: i for i, t in enumerate(sorted(set(self.times)))}
+        trank = np.array([rank[t] for t in self.times], dtype=np.int64)
+        order = np.lexsort((f, -trank[c], -s))
+        return self._result(d, c, s, order)
+
+
+def is_pooled(event_info: Dict) -> bool:
+    """Multi-slot weekly events (Breaking Army, Showdown, Guild War) pool all slots and pick the top N."""
+    return event_info["type"] in ("weekly", "once") and event_info.get("slots", 1) > 1
+
+
+def slot_groups(event_info: Dict) -> List[Optional[int]]:
+    """Scoring groups of an event: None for the pooled group, otherwise one per slot."""
+    if event_info["type"] == "locked":
+        return []
+    if is_pooled(event_info):
+        return [None]
+    return list(range(event_info.get("slots", 1)))
+
+
+def is_weighted(event_name: str) -> bool:
+    return event_name != "Guild War"
+
+
+def has_other_day_bonus(event_name: str, event_info: Dict) -> bool:
+    """Legacy weekly votes also give 1 point to the same time on all other days."""
+    return is_weighted(event_name) and event_info["type"] not in ("daily", "fixed_days")
+
+
+def group_entries(event_info: Dict, selection, slot_index: Optional[int]) -> List[Entry]:
+    """(day, time) entries one user's selection contributes to a scoring group."""
+    if selection is None:
+        return []
+    if slot_index is None:
+        # Collect all voted times from all slots for this user
+        entries = []
+        for slot_data in selection if isinstance(selection, list) else [selection]:
+            if slot_data:
+                voted_time = slot_data.get("time")
+                voted_day = slot_data.get("day")
+                if voted_time and voted_day:
+                    entries.append((voted_day, voted_time))
+        return entries
+
+    # Get the voted time for this slot
+    voted_time = None
+    voted_day = None
+    if isinstance(selection, list):
+        if slot_index < len(selection) and selection[slot_index]:
+            slot_data = selection[slot_index]
+            voted_time = slot_data["time"]
+            voted_day = slot_data.get("day")
+    elif slot_index == 0:
+        # Single-slot format
+        if isinstance(selection, str):
+            voted_time = selection
+        else:
+            voted_time = selection["time"]
+            voted_day = selection.get("day")
+
+    if not voted_time:
+        return []
+    if event_info["type"] == "daily":
+        return [("Daily", voted_time)]
+    if event_info["type"] == "fixed_days":
+        # Multi-slot: specific day, otherwise a single slot for all fixed days
+        if event_info["slots"] > 1 and voted_day:
+            return [(voted_day, voted_time)]
+        return [("Fixed", voted_time)]
+    # Weekly events (single slot only, legacy path)
+    if not voted_day:
+        return []
+    return [(voted_day, voted_time)]
+
+
+def rank_grid(engine: ScoringEngine, event_name: str, event_info: Dict, slot_index: Optional[int], selections: Dict, target_times: Sequence[str]) -> Ranked:
+    """Score a group from scratch over all selections."""
+    entries = []
+    for user_selections in selections.values():
+        if event_name in user_selections:
+            entries.extend(group_entries(event_info, user_selections[event_name], slot_index))
+    grid = engine.grid(target_times)
+    grid.add(entries, weighted=is_weighted(event_name), other_day_bonus=slot_index is not None and has_other_day_bonus(event_name, event_info))
+    return grid.ranked_pooled() if slot_index is None else grid.ranked_latest()
+
+
+class VoteTally:
+    """
+    Running point totals for one poll: {event: {group: {(day, time): points}}}.
+
+    Each submit or clear subtracts the user's old contribution and adds the new one, so ranking
+    only sorts the (day, time) cells. Ties fall back to a scan of the selections for the cells
+    involved, because the original ranking broke them by which vote touched a cell first.
+    """
+
+    def __init__(self, engine: ScoringEngine, events: Dict, target_times: Sequence[str]):
+        self.engine = engine
+        self.events = events
+        self.target_times = tuple(target_times)
+        self.totals: Dict[str, Dict[str, Dict[Tuple[str, str], int]]] = {}
+
+    @classmethod
+    def build(cls, engine: ScoringEngine, events: Dict, target_times: Sequence[str], selections: Dict) -> "VoteTally":
+        tally = cls(engine, events, target_times)
+        for user_selections in selections.values():
+            for event_name, selection in user_selections.items():
+                tally.apply(event_name, selection, 1)
+        return tally
+
+    @classmethod
+    def from_dict(cls, engine: ScoringEngine, events: Dict, target_times: Sequence[str], data: Optional[Dict]) -> Optional["VoteTally"]:
+        """Load a persisted tally, or None if there is none or it was made for other time options."""
+        if not data or tuple(data.get("times", ())) != tuple(target_times):
+            return None
+        tally = cls(engine, events, target_times)
+        for event_name, groups in data.get("totals", {}).items():
+            tally.totals[event_name] = {
+                group: {tuple(cell.split("|", 1)): points for cell, points in cells.items()}
+                for group, cells in groups.items()
+            }
+        return tally
+
+    def to_dict(self) -> Dict:
+        return {
+            "times": list(self.target_times),
+            "totals": {
+                event_name: {
+                    group: {f"{day}|{time_str}": points for (day, time_str), points in cells.items()}
+                    for group, cells in groups.items()
+                }
+                for event_name, groups in self.totals.items()
+            },
+        }
+
+    def _contributions(self, event_name: str, selection, slot_index: Optional[int]):
+        """((day, time), points) a selection adds to a group, in the order the original loop touched them."""
+        event_info = self.events[event_name]
+        weighted = is_weighted(event_name)
+        bonus = slot_index is not None and has_other_day_bonus(event_name, event_info)
+        for voted_day, voted_time in group_entries(event_info, selection, slot_index):
+            row = self.engine.kernel(self.target_times, voted_time, weighted)
+            for col in np.flatnonzero(row):
+                yield (voted_day, self.target_times[col]), int(row[col])
+            if bonus:
+                for day in self.engine.days_of_week:
+                    if day != voted_day:
+                        yield (day, voted_time), 1
+
+    def apply(self, event_name: str, selection, sign: int):
+        """Add (sign=1) or subtract (sign=-1) one user's selection for an event."""
+        if selection is None or event_name not in self.events:
+            return
+        for slot_index in slot_groups(self.events[event_name]):
+            cells = self.totals.setdefault(event_name, {}).setdefault(str(slot_index), {})
+            for key, points in self._contributions(event_name, selection, slot_index):
+                total = cells.get(key, 0) + sign * points
+                if total:
+                    cells[key] = total
+                else:
+                    cells.pop(key, None)
+
+    def _first_touch(self, event_name: str, slot_index: Optional[int], selections: Dict, wanted: set) -> Dict[Tuple[str, str], int]:
+        seen = {}
+        seq = 0
+        for user_selections in selections.values():
+            if event_name not in user_selections:
+                continue
+            for key, _ in self._contributions(event_name, user_selections[event_name], slot_index):
+                if key in wanted and key not in seen:
+                    seen[key] = seq
+                    if len(seen) == len(wanted):
+                        return seen
+                seq += 1
+        return seen
+
+    def ranked(self, event_name: str, slot_index: Optional[int], selections: Dict, needed: int = 3) -> Ranked:
+        """Same ranking as rank_grid, with ties resolved within the first `needed` positions."""
+        cells = self.totals.get(event_name, {}).get(str(slot_index), {})
+        if slot_index is None:
+            engine = self.engine
+
+            def primary(item):
+                return -item[1], engine.saturday_distance(item[0][0]), -engine._time_sort_key(item[0][1])
+
+            ordered = sorted(cells.items(), key=primary)
+        else:
+            def primary(item):
+                return item[1], item[0][1]
+
+            ordered = sorted(cells.items(), key=primary, reverse=True)
+
+        # Tie groups overlapping the positions callers look at
+        tied = []
+        start = 0
+        while start < min(needed, len(ordered)):
+            end = start + 1
+            while end < len(ordered) and primary(ordered[end]) == primary(ordered[start]):
+                end += 1
+            if end - start > 1:
+                tied.append((start, end))
+            start = end
+        if tied:
+            wanted = {key for s, e in tied for key, _ in ordered[s:e]}
+            first = self._first_touch(event_name, slot_index, selections, wanted)
+            for s, e in tied:
+                ordered[s:e] = sorted(ordered[s:e], key=lambda item: first.get(item[0], 0))
+        return ordered
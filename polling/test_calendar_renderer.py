@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Concurrency stress test: parallel CalendarRenderer renders must match serial ones byte for byte"""
+
+import importlib
+import random
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# Import the renderer as part of the package without running the cog's __init__ (needs redbot)
+package = types.ModuleType("polling")
+package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("polling", package)
+calendar_renderer = importlib.import_module("polling.calendar_renderer")
+
+# Bypass the PNG cache so every call really renders
+calendar_renderer.RENDER_CACHE.maxsize = 0
+
+EVENTS = {
+    "Party": {"type": "daily", "duration": 10, "slots": 1, "emoji": "🎉", "priority": 3},
+    "Guild War": {"type": "locked", "days": ["Saturday", "Sunday"], "fixed_time": "20:30", "duration": 90, "emoji": "🏰", "priority": 6, "slots": 2},
+    "Hero's Realm (Catch-up)": {"type": "once", "duration": 30, "slots": 1, "emoji": "🛡️", "priority": 5},
+    "Hero's Realm (Reset)": {"type": "locked", "days": ["Monday"], "fixed_time": "19:15", "duration": 15, "emoji": "🛡️", "priority": 5, "slots": 1},
+    "Sword Trial": {"type": "fixed_days", "days": ["Wednesday", "Friday"], "duration": 30, "slots": 2, "emoji": "⚔️", "priority": 4},
+    "Sword Trial (Echo)": {"type": "fixed_days", "days": ["Monday"], "duration": 30, "slots": 1, "emoji": "⚔️", "priority": 4},
+    "Breaking Army": {"type": "once", "duration": 120, "slots": 2, "emoji": "⚡", "priority": 2},
+    "Showdown": {"type": "once", "duration": 60, "slots": 2, "emoji": "🏆", "priority": 1},
+}
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+RENDERED_AT = datetime(2025, 1, 5, 22, 0, 0)
+
+
+def random_calendar(rng):
+    """Calendar data in the format produced by EventPolling._prepare_calendar_data"""
+    def time_str():
+        return f"{rng.randrange(17, 26) % 24:02d}:{rng.choice((0, 30)):02d}"
+
+    return {
+        "Party": {"Daily": time_str()},
+        "Hero's Realm (Catch-up)": {rng.choice(DAYS[:6]): time_str()},
+        "Hero's Realm (Reset)": {"Monday": "19:15"},
+        "Sword Trial": {"Wednesday": time_str(), "Friday": time_str()},
+        "Sword Trial (Echo)": {"Monday": time_str()},
+        "Breaking Army": {day: time_str() for day in rng.sample(DAYS, 2)},
+        "Showdown": {day: time_str() for day in rng.sample(DAYS, 2)},
+        "Guild War": {"Saturday": "20:30", "Sunday": "20:30"},
+    }
+
+
+renderer = calendar_renderer.CalendarRenderer(timezone="UTC+1")
+rng = random.Random(7)
+jobs = [(random_calendar(rng), rng.randrange(100)) for _ in range(12)]
+
+
+def render(job):
+    calendar_data, voters = job
+    return renderer.render_calendar(calendar_data, EVENTS, [], voters, rendered_at=RENDERED_AT).getvalue()
+
+
+# Test 1: Rendering is deterministic
+print("Test 1: Same input renders the same bytes")
+print("-" * 70)
+serial = [render(job) for job in jobs]
+assert serial == [render(job) for job in jobs]
+print(f"Rendered {len(serial)} calendars ({sum(map(len, serial)) // len(serial)} bytes on average)")
+print("✅ PASSED\n")
+
+# Test 2: One shared renderer used from many threads at once
+print("Test 2: Parallel renders on a shared renderer match serial renders")
+print("-" * 70)
+with ThreadPoolExecutor(max_workers=8) as executor:
+    for round_idx in range(3):
+        order = list(range(len(jobs))) * 3
+        rng.shuffle(order)
+        results = list(executor.map(lambda i: (i, render(jobs[i])), order))
+        for i, data in results:
+            assert data == serial[i], f"round {round_idx}: calendar {i} differs from its serial render"
+print("✅ PASSED\n")
+
+# Test 3: Renderers with different timezones interleaved
+print("Test 3: Interleaved renderers keep their own timezone")
+print("-" * 70)
+other = calendar_renderer.CalendarRenderer(timezone="America/New_York")
+with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = [
+        executor.submit(lambda r=r: r.render_calendar(jobs[0][0], EVENTS, [], 1, rendered_at=RENDERED_AT).getvalue())
+        for r in [renderer, other] * 10
+    ]
+    outputs = [f.result() for f in futures]
+assert len(set(outputs[0::2])) == 1 and len(set(outputs[1::2])) == 1
+assert outputs[0] != outputs[1]
+print("✅ PASSED\n")
+
+# Test 4: Blocked slots compare plain times of day, as before the time-slot index
+print("Test 4: Blocked periods next to midnight")
+print("-" * 70)
+def blocked(time_str, start, end):
+    return renderer._is_time_blocked("Mon", time_str, [{"day": "Mon", "start": start, "end": end}])
+
+assert blocked("20:00", "19:00", "21:00") and not blocked("21:00", "19:00", "21:00")
+assert not blocked("18:30", "19:00", "21:00") and blocked("18:45", "19:00", "21:00")
+# The slot ending at midnight ends at 00:00, before any block starts
+assert not blocked("23:30", "23:00", "23:59")
+# A block crossing midnight has its end before its start and matches nothing
+assert not blocked("23:30", "23:00", "01:00") and not blocked("00:30", "23:00", "01:00")
+assert blocked("00:30", "00:00", "01:00") and not blocked("00:30", "22:00", "23:00")
+print("✅ PASSED\n")
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Check the bitset conflict resolver against the original dict-of-cells implementation"""
+
+import importlib
+import logging
+import random
+import sys
+import time
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Import the modules as part of the package without running the cog's __init__ (needs redbot)
+package = types.ModuleType("polling")
+package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("polling", package)
+conflicts = importlib.import_module("polling.conflicts")
+scoring = importlib.import_module("polling.scoring")
+time_slots = importlib.import_module("polling.time_slots")
+
+logging.getLogger("red.asdas-cogs.polling").setLevel(logging.ERROR)
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+EVENTS = {
+    "Party": {"type": "daily", "duration": 10, "slots": 1, "priority": 3},
+    "Hero's Realm (Catch-up)": {"type": "once", "duration": 30, "slots": 1, "priority": 5},
+    "Hero's Realm (Reset)": {"type": "locked", "days": ["Monday"], "fixed_time": "19:15", "duration": 15, "priority": 5, "slots": 1},
+    "Sword Trial": {"type": "fixed_days", "days": ["Wednesday", "Friday"], "duration": 30, "slots": 2, "priority": 4},
+    "Sword Trial (Echo)": {"type": "fixed_days", "days": ["Monday"], "duration": 30, "slots": 1, "priority": 4},
+    "Breaking Army": {"type": "once", "duration": 120, "slots": 2, "priority": 2},
+    "Showdown": {"type": "once", "duration": 60, "slots": 2, "priority": 1},
+}
+
+
+class ReferenceResolver:
+    """The original EventPolling._resolve_event_conflicts and helpers"""
+
+    def __init__(self, events):
+        self.events = events
+        self.days_of_week = DAYS
+
+    def _time_to_sort_key(self, time_str):
+        hour, minute = map(int, time_str.split(':'))
+        if hour < 3:
+            hour += 24
+        return (hour - 17) * 60 + minute
+
+    def resolve(self, winning_times):
+        time_slot_candidates = {}
+        for event_name, event_info in self.events.items():
+            if event_name not in winning_times:
+                continue
+            priority = event_info.get("priority", 0)
+            for slot_index, slot_data in winning_times[event_name].items():
+                winner_key, winner_points, all_entries = slot_data
+                day, time = winner_key
+                for affected_day in self._get_affected_days(event_name, day):
+                    current_time = datetime.strptime(time, "%H:%M")
+                    slots_needed = max(1, event_info.get("duration", 30) // 30)
+                    for i in range(slots_needed):
+                        slot_key = (affected_day, (current_time + timedelta(minutes=i * 30)).strftime("%H:%M"))
+                        time_slot_candidates.setdefault(slot_key, []).append({
+                            'event_name': event_name, 'slot_index': slot_index, 'points': winner_points,
+                            'priority': priority, 'start_time': time,
+                        })
+
+        occupied_by = {}
+        adjusted_winning_times = {}
+        events_needing_reassignment = set()
+        for slot_key, candidates in time_slot_candidates.items():
+            if len(candidates) == 1:
+                occupied_by[slot_key] = candidates[0]['event_name']
+                continue
+            party_candidate = any(c['event_name'] == 'Party' for c in candidates)
+            other_candidates = [c for c in candidates if c['event_name'] != 'Party']
+            if party_candidate and other_candidates:
+                for candidate in candidates:
+                    occupied_by[slot_key] = candidate['event_name']
+            else:
+                max_priority = max(c['priority'] for c in candidates)
+                for candidate in candidates:
+                    candidate['adjusted_points'] = candidate['points'] + (3 if candidate['priority'] == max_priority else 0)
+                candidates.sort(key=lambda x: (-x['adjusted_points'], -x['priority'], -self._time_to_sort_key(x['start_time'])))
+                occupied_by[slot_key] = candidates[0]['event_name']
+                for loser in candidates[1:]:
+                    events_needing_reassignment.add((loser['event_name'], loser['slot_index']))
+
+        for event_name in self.events:
+            if event_name not in winning_times:
+                continue
+            adjusted_winning_times[event_name] = {}
+            for slot_index, slot_data in winning_times[event_name].items():
+                if (event_name, slot_index) not in events_needing_reassignment:
+                    adjusted_winning_times[event_name][slot_index] = slot_data
+
+        for event_name in self.events:
+            if event_name not in winning_times:
+                continue
+            for slot_index, slot_data in winning_times[event_name].items():
+                winner_key, winner_points, all_entries = slot_data
+                if (event_name, slot_index) in events_needing_reassignment:
+                    selected_entry = None
+                    for candidate_key, candidate_points in all_entries:
+                        if self._is_time_available(event_name, candidate_key, occupied_by, slot_index, adjusted_winning_times):
+                            selected_entry = (candidate_key, candidate_points)
+                            self._mark_time_occupied(event_name, candidate_key, occupied_by)
+                            adjusted_winning_times[event_name][slot_index] = (selected_entry[0], selected_entry[1], all_entries)
+                            break
+                    if not selected_entry:
+                        adjusted_winning_times[event_name][slot_index] = slot_data
+        return adjusted_winning_times
+
+    def _get_affected_days(self, event_name, day):
+        event_info = self.events[event_name]
+        if event_info["type"] == "daily" or day == "Daily":
+            return self.days_of_week
+        elif event_info["type"] == "fixed_days":
+            return [day] if day in self.days_of_week else event_info.get("days", [])
+        return [day] if day in self.days_of_week else []
+
+    def _cells(self, event_name, time_key):
+        day, time = time_key
+        current_time = datetime.strptime(time, "%H:%M")
+        slots_needed = max(1, self.events[event_name].get("duration", 30) // 30)
+        for affected_day in self._get_affected_days(event_name, day):
+            for i in range(slots_needed):
+                yield affected_day, (current_time + timedelta(minutes=i * 30)).strftime("%H:%M")
+
+    def _is_time_available(self, event_name, time_key, occupied_by, current_slot_index=None, adjusted_winning_times=None):
+        day, time = time_key
+        event_info = self.events[event_name]
+        if event_info.get("type") == "once" and event_info.get("slots", 1) > 1:
+            if adjusted_winning_times and event_name in adjusted_winning_times:
+                for slot_idx, slot_data in adjusted_winning_times[event_name].items():
+                    if current_slot_index is not None and slot_idx == current_slot_index:
+                        continue
+                    if slot_data[0][0] == day:
+                        return False
+        for slot_key in self._cells(event_name, time_key):
+            if slot_key in occupied_by and occupied_by[slot_key] != event_name:
+                if event_name == 'Party' or occupied_by[slot_key] == 'Party':
+                    continue
+                return False
+        return True
+
+    def _mark_time_occupied(self, event_name, time_key, occupied_by):
+        for slot_key in self._cells(event_name, time_key):
+            occupied_by[slot_key] = event_name
+
+
+def as_lists(winning_times):
+    """Comparable form that also checks dict order"""
+    return [(event, list(slots.items())) for event, slots in winning_times.items()]
+
+
+def random_key(rng, event_name, slot_index, times):
+    event_info = EVENTS[event_name]
+    if event_info["type"] == "daily":
+        return ("Daily", rng.choice(times))
+    if event_info["type"] == "fixed_days":
+        day = event_info["days"][slot_index] if event_info["slots"] > 1 else "Fixed"
+        return (day, rng.choice(times))
+    return (rng.choice(DAYS), rng.choice(times))
+
+
+def random_winning_times(rng, times):
+    """Winning times shaped like _calculate_winning_times_weighted output, crowded into few times"""
+    winning_times = {}
+    for event_name, event_info in EVENTS.items():
+        winning_times[event_name] = {}
+        if event_info["type"] == "locked":
+            winning_times[event_name][0] = ((event_info["days"][0], event_info["fixed_time"]), 9999, [])
+            continue
+        for slot_index in range(event_info["slots"]):
+            if rng.random() < 0.1:
+                continue
+            entries = [(random_key(rng, event_name, slot_index, times), rng.randrange(0, 40)) for _ in range(rng.randrange(0, 4))]
+            entries.sort(key=lambda e: -e[1])
+            if entries and rng.random() < 0.8:
+                winner_key, points = entries[0]
+            else:
+                winner_key, points = random_key(rng, event_name, slot_index, times), 0
+            winning_times[event_name][slot_index] = (winner_key, points, entries)
+    return winning_times
+
+
+resolver = conflicts.ConflictResolver(EVENTS, DAYS)
+reference = ReferenceResolver(EVENTS)
+
+# Test 1: Scenarios from test_logic.py / test_updated_logic.py
+print("Test 1: Hand-written scenarios")
+print("-" * 70)
+scenarios = {
+    "Party and Breaking Army share 20:00": {
+        "Party": {0: (("Daily", "20:00"), 10, [])},
+        "Breaking Army": {0: (("Monday", "20:00"), 20, []), 1: (("Friday", "19:30"), 15, [])},
+    },
+    "Showdown loses to higher priority Breaking Army": {
+        "Breaking Army": {0: (("Saturday", "20:00"), 10, [(("Saturday", "20:00"), 10)])},
+        "Showdown": {0: (("Saturday", "21:00"), 12, [(("Saturday", "21:00"), 12), (("Saturday", "22:30"), 8)])},
+    },
+    "Both Breaking Army slots on the same time": {
+        "Breaking Army": {
+            0: (("Wednesday", "23:30"), 30, [(("Wednesday", "23:30"), 30), (("Wednesday", "20:00"), 25), (("Friday", "23:30"), 20)]),
+            1: (("Wednesday", "23:30"), 30, [(("Wednesday", "23:30"), 30), (("Wednesday", "20:00"), 25), (("Friday", "23:30"), 20)]),
+        },
+    },
+    "Sword Trial vs Hero's Realm Reset at 19:15": {
+        "Hero's Realm (Reset)": {0: (("Monday", "19:15"), 9999, [])},
+        "Sword Trial (Echo)": {0: (("Fixed", "19:00"), 5, [(("Fixed", "19:00"), 5)])},
+        "Hero's Realm (Catch-up)": {0: (("Monday", "19:00"), 5, [(("Monday", "19:00"), 5), (("Tuesday", "19:00"), 4)])},
+    },
+    "Past midnight": {
+        "Breaking Army": {0: (("Friday", "23:30"), 10, [(("Friday", "23:30"), 10)]), 1: (("Sunday", "01:00"), 10, [])},
+        "Showdown": {0: (("Friday", "00:00"), 10, [(("Friday", "00:00"), 10), (("Friday", "01:30"), 9)])},
+    },
+}
+for name, winning_times in scenarios.items():
+    expected = reference.resolve(winning_times)
+    assert as_lists(resolver.resolve(winning_times)) == as_lists(expected), name
+    print(f"{name}: {[(e, [s[1][0] for s in slots.items()]) for e, slots in expected.items()]}")
+print("✅ PASSED\n")
+
+# Test 2: Randomised crowded schedules
+print("Test 2: Randomised schedules match the reference exactly")
+print("-" * 70)
+rng = random.Random(2024)
+crowded = ["19:00", "19:30", "20:00", "20:30", "23:30", "00:00", "00:30"]
+all_times = [f"{h % 24:02d}:{m:02d}" for h in range(17, 26) for m in (0, 30)] + ["02:00"]
+for times in (crowded, all_times):
+    for _ in range(3000):
+        winning_times = random_winning_times(rng, times)
+        assert as_lists(resolver.resolve(winning_times)) == as_lists(reference.resolve(winning_times))
+print("✅ PASSED\n")
+
+
+# Test 3: Benchmark on winning times from synthetic 1000-voter polls
+def weighted_points(voted_time, target_time, weighted=True):
+    diff_minutes = abs(time_slots.vote_minutes(target_time) - time_slots.vote_minutes(voted_time))
+    if diff_minutes == 0:
+        return 5
+    if not weighted:
+        return 0
+    return {30: 2, 60: 1}.get(diff_minutes, 0)
+
+
+def poll_winning_times(engine, selections):
+    """Top entries per slot, assembled like _calculate_winning_times_weighted"""
+    winning_times = {}
+    for event_name, event_info in EVENTS.items():
+        winning_times[event_name] = {}
+        if event_info["type"] == "locked":
+            winning_times[event_name][0] = ((event_info["days"][0], event_info["fixed_time"]), 9999, [])
+        elif scoring.is_pooled(event_info):
+            ranked = scoring.rank_grid(engine, event_name, event_info, None, selections, all_times)
+            for slot_index in range(min(event_info["slots"], len(ranked))):
+                winning_times[event_name][slot_index] = (ranked[slot_index][0], ranked[slot_index][1], ranked[:3])
+        else:
+            for slot_index in range(event_info["slots"]):
+                ranked = scoring.rank_grid(engine, event_name, event_info, slot_index, selections, all_times)
+                if ranked:
+                    winning_times[event_name][slot_index] = (ranked[0][0], ranked[0][1], ranked[:3])
+    return winning_times
+
+
+print("Test 3: Benchmark (synthetic 1000-voter polls)")
+print("-" * 70)
+engine = scoring.ScoringEngine(weighted_points, DAYS, time_slots.sort_key)
+polls = []
+for _ in range(20):
+    selections = {}
+    for user_id in range(1000):
+        user = {}
+        for event_name, event_info in EVENTS.items():
+            if event_info["type"] == "locked" or rng.random() < 0.2:
+                continue
+            slots = []
+            for slot_index in range(event_info["slots"]):
+                day, voted_time = random_key(rng, event_name, slot_index, crowded)
+                slots.append({"time": voted_time, "day": None if day in ("Daily", "Fixed") else day})
+            user[event_name] = slots
+        selections[str(user_id)] = user
+    polls.append(poll_winning_times(engine, selections))
+
+for winning_times in polls:
+    assert as_lists(resolver.resolve(winning_times)) == as_lists(reference.resolve(winning_times))
+rounds = 50
+start = time.perf_counter()
+for _ in range(rounds):
+    for winning_times in polls:
+        reference.resolve(winning_times)
+reference_time = (time.perf_counter() - start) / (rounds * len(polls))
+start = time.perf_counter()
+for _ in range(rounds):
+    for winning_times in polls:
+        resolver.resolve(winning_times)
+resolver_time = (time.perf_counter() - start) / (rounds * len(polls))
+print(f"Per poll - reference: {reference_time * 1e6:.0f} µs, bitsets: {resolver_time * 1e6:.0f} µs")
+print("✅ PASSED\n")
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
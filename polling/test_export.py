@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Check the website export: JSON data and calendar image of the latest poll"""
+
+import asyncio
+import importlib
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Import the module as part of the package without running the cog's __init__
+package = types.ModuleType("polling")
+package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("polling", package)
+polling = importlib.import_module("polling.polling")
+
+logging.getLogger("red.asdas-cogs.polling").setLevel(logging.CRITICAL)
+
+
+class FakeValue:
+    def __init__(self, value):
+        self.value = value
+
+    async def __call__(self):
+        return self.value
+
+
+class FakeConfig:
+    """Just the Config reads the export and the schedule service make"""
+
+    def __init__(self, export_path, guilds):
+        self.website_export_path = FakeValue(export_path)
+        self.export_guild_id = FakeValue(None)
+        self.guilds = guilds
+
+    def register_guild(self, **defaults):
+        pass
+
+    def register_global(self, **defaults):
+        pass
+
+    async def all_guilds(self):
+        return self.guilds
+
+    def guild_from_id(self, guild_id):
+        return types.SimpleNamespace(polls=FakeValue(self.guilds[guild_id]["polls"]))
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.calls = []
+
+    def render_calendar(self, *args):
+        self.calls.append(args)
+        return io.BytesIO(b"calendar png")
+
+
+def make_guild(guild_id):
+    guild = MagicMock()
+    guild.id = guild_id
+    guild.name = "Test Guild"
+    guild.icon = guild.banner = guild.splash = None
+    guild.scheduled_events = []
+    guild.get_role.return_value = None
+    return guild
+
+
+async def run_tests():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        export_path = tmp / "site" / "data.json"
+        # Favicons already exported, so nothing is downloaded
+        export_path.parent.mkdir()
+        (export_path.parent / "favicon.svg").write_text("svg")
+        (export_path.parent / "favicon.png").write_text("png")
+
+        snapshot = {"Party": {"0": [["Daily", "20:00"], 5, []]}}
+        guilds = {
+            1: {
+                "polls": {
+                    "9": {"selections": {"100": {}}},
+                    "10": {"selections": {"100": {}, "101": {}, "102": {}}, "weekly_snapshot_winning_times": snapshot},
+                }
+            }
+        }
+        config = FakeConfig(str(export_path), guilds)
+
+        bot = MagicMock()
+        bot.loop = asyncio.get_running_loop()
+        bot.get_guild.side_effect = make_guild
+        bot.get_cog.return_value = None
+
+        cwd = os.getcwd()
+        os.chdir(tmp)  # The cog keeps its backups under the working directory
+        try:
+            with patch.object(polling.Config, "get_conf", return_value=config):
+                cog = polling.EventPolling(bot)
+        finally:
+            os.chdir(cwd)
+        cog.calendar_renderer = renderer = FakeRenderer()
+
+        # Test 1: A guild with polls exports the latest poll's schedule and calendar
+        print("Test 1: Export a guild with polls")
+        print("-" * 70)
+        await cog._export_to_json()
+
+        data = json.loads(export_path.read_text(encoding="utf-8"))
+        guild = data["guilds"]["1"]
+        party = [event for event in guild["polling_events"] if event["name"] == "Party"]
+        assert len(party) == 7 and all(event["type"] == "polling" for event in party)
+
+        assert len(renderer.calls) == 1
+        prepared_data, events, blocked_times, voters = renderer.calls[0]
+        assert set(prepared_data["Party"]) == set(cog.days_of_week)
+        assert voters == 3  # Selections of the latest poll
+        assert (export_path.parent / "calendar.png").read_bytes() == b"calendar png"
+        print(f"{len(guild['polling_events'])} polling events, calendar rendered for {voters} voters")
+        print("✅ PASSED\n")
+
+        cog.render_pool.close()
+
+
+asyncio.run(run_tests())
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
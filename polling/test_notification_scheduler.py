@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Check the notification scheduler against the old once-a-minute matching"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Import the modules as part of the package without running the cog's __init__ (needs redbot)
+package = types.ModuleType("polling")
+package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("polling", package)
+notification_scheduler = importlib.import_module("polling.notification_scheduler")
+
+logging.getLogger("red.asdas-cogs.polling").setLevel(logging.ERROR)
+
+NotificationSlot = notification_scheduler.NotificationSlot
+SERVER_TZ = notification_scheduler.SERVER_TZ
+START = datetime(2025, 3, 24, 0, 0, tzinfo=SERVER_TZ)  # A Monday
+
+SLOTS = [
+    NotificationSlot("Party", 0, "Daily", "20:00", None),
+    NotificationSlot("Party", 0, "Daily", "00:30", None),
+    NotificationSlot("Breaking Army", 0, "Wednesday", "19:30", frozenset(["Wednesday"])),
+    NotificationSlot("Breaking Army", 1, "Friday", "01:00", frozenset(["Friday"])),
+    NotificationSlot("Showdown", 0, "Sunday", "23:30", frozenset(["Sunday"])),
+    NotificationSlot("Showdown", 1, "Sunday", "02:30", frozenset(["Sunday"])),
+    NotificationSlot("Sword Trial", 0, "Fixed", "21:00", frozenset(["Wednesday", "Friday"])),
+]
+
+
+def minute_scan_fires(slot, start, minutes):
+    """The old event_notification_task rule, evaluated once per minute"""
+    hour, minute = map(int, slot.time_str.split(":"))
+    fires = []
+    for i in range(minutes):
+        now = start + timedelta(minutes=i)
+        check_day = (now - timedelta(days=1)).strftime("%A") if hour < 3 else now.strftime("%A")
+        if now.hour == hour and now.minute == minute and (slot.days is None or check_day in slot.days):
+            fires.append(now)
+    return fires
+
+
+# Test 1: Fire times match the minute scan
+print("Test 1: next_fire_time matches the per-minute scan over 3 weeks")
+print("-" * 70)
+span = 21 * 24 * 60
+for slot in SLOTS:
+    expected = minute_scan_fires(slot, START, span)
+    fires = []
+    fire_at = notification_scheduler.next_fire_time(slot, START - timedelta(microseconds=1))
+    while fire_at < START + timedelta(minutes=span):
+        fires.append(fire_at)
+        fire_at = notification_scheduler.next_fire_time(slot, fire_at)
+    assert fires == expected, slot
+    print(f"{slot.event_name} {slot.win_day} {slot.time_str}: first {fires[0]:%a %d %H:%M}, {len(fires)} fires")
+print("✅ PASSED\n")
+
+
+class FakeClockScheduler(notification_scheduler.NotificationScheduler):
+    clock = START
+
+    def now(self):
+        return self.clock
+
+
+async def step(scheduler, clock):
+    """Move the clock and let the scheduler loop run"""
+    scheduler.clock = clock
+    scheduler._wake.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def run_scheduler_tests():
+    schedules = {1: [SLOTS[0], SLOTS[2]], 2: [SLOTS[1]]}
+    sent = []
+
+    async def load(guild_id):
+        return schedules.get(guild_id, [])
+
+    async def fire(guild_id, slot, fire_at):
+        sent.append((guild_id, slot.event_name, fire_at))
+        return True
+
+    # Test 2: Fires on time, and a late wake-up still covers the skipped minutes
+    print("Test 2: On-time and late wake-ups")
+    print("-" * 70)
+    scheduler = FakeClockScheduler(load, fire)
+    scheduler.clock = START + timedelta(hours=12)
+    scheduler.start([1, 2])
+    await step(scheduler, START + timedelta(hours=12))
+    assert scheduler.scheduled == 3 and not sent
+    assert scheduler.next_due == START + timedelta(hours=20)
+    await step(scheduler, START + timedelta(hours=20))
+    assert sent == [(1, "Party", START + timedelta(hours=20))]
+    # Loop drifted: it only wakes up 3 minutes after 00:30
+    await step(scheduler, START + timedelta(days=1, minutes=33))
+    assert sent[-1] == (2, "Party", START + timedelta(days=1, minutes=30))
+    print("✅ PASSED\n")
+
+    # Test 3: Changing the schedule replaces the guild's entries
+    print("Test 3: Invalidation reloads the guild's schedule")
+    print("-" * 70)
+    schedules[1] = [SLOTS[0]._replace(time_str="21:00")]
+    scheduler.invalidate(1)
+    await step(scheduler, START + timedelta(days=1, hours=20))
+    assert sent[-1][2] != START + timedelta(days=1, hours=20)
+    await step(scheduler, START + timedelta(days=1, hours=21))
+    assert sent[-1] == (1, "Party", START + timedelta(days=1, hours=21))
+    # A reload right after a send doesn't send it again
+    scheduler.invalidate(1)
+    await step(scheduler, START + timedelta(days=1, hours=21, seconds=30))
+    assert sent.count((1, "Party", START + timedelta(days=1, hours=21))) == 1
+    # Superseded entries are dropped from the top of the heap, handled starts once out of catch-up
+    assert scheduler.next_due == START + timedelta(days=2, minutes=30)
+    assert scheduler._heap[0].version == scheduler._versions[scheduler._heap[0].guild_id]
+    # Guild 2's 00:30 start is out of catch-up and already forgotten
+    assert list(scheduler._handled) == [(1, "Party_0")]
+    await step(scheduler, START + timedelta(days=1, hours=21, minutes=20))
+    assert list(scheduler._handled) == []
+    scheduler.close()
+    print("✅ PASSED\n")
+
+    # Test 4: Restart recomputes from persisted state and catches up
+    print("Test 4: Restart")
+    print("-" * 70)
+    sent.clear()
+    restarted = FakeClockScheduler(load, fire)
+    restarted.clock = START + timedelta(days=2, hours=21, minutes=4)
+    restarted.start([1, 2])
+    await step(restarted, restarted.clock)
+    assert sent == [(1, "Party", START + timedelta(days=2, hours=21))]
+    # Far too late is skipped instead of announcing an event that's long over
+    restarted.close()
+    sent.clear()
+    late = FakeClockScheduler(load, fire)
+    late.clock = START + timedelta(days=2, hours=21, minutes=4)
+    late.start([1])
+    await step(late, late.clock)
+    await step(late, START + timedelta(days=3, hours=21, minutes=30))
+    assert sent == [(1, "Party", START + timedelta(days=2, hours=21))]
+    assert late.skipped_late == 1
+    late.close()
+    print("✅ PASSED\n")
+
+
+asyncio.run(run_scheduler_tests())
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Check the shared schedule service: cached reads, versions and change notifications"""
+
+import asyncio
+import importlib
+import logging
+import sys
+import types
+from pathlib import Path
+
+# Import the module as part of the package without running the cog's __init__ (needs redbot)
+package = types.ModuleType("polling")
+package.__path__ = [str(Path(__file__).parent)]
+sys.modules.setdefault("polling", package)
+schedule_service = importlib.import_module("polling.schedule_service")
+
+logging.getLogger("red.asdas-cogs.polling").setLevel(logging.CRITICAL)
+
+
+async def run_tests():
+    stored = {1: {"Party": {0: (("Daily", "20:00"), 5, [])}}}
+    calls = []
+    gate = asyncio.Event()
+    gate.set()
+
+    async def compute(guild_id):
+        calls.append(guild_id)
+        await gate.wait()
+        if guild_id not in stored:
+            return None, {}, False
+        return "1", dict(stored[guild_id]), False
+
+    service = schedule_service.ScheduleService(compute)
+
+    # Test 1: Computed once, then served from memory
+    print("Test 1: Repeated and concurrent reads compute once")
+    print("-" * 70)
+    assert service.peek(1) is None
+    gate.clear()
+    readers = [asyncio.create_task(service.get(1)) for _ in range(10)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*readers)
+    assert calls == [1] and all(result is results[0] for result in results)
+    assert await service.get(1) is results[0] and service.peek(1) is results[0]
+    assert results[0].winning_times["Party"][0][0] == ("Daily", "20:00")
+    assert service.computed == 1 and service.hits == 10
+    no_polls = await service.get(2)
+    assert no_polls.poll_id is None and no_polls.winning_times == {}
+    print(f"{service.computed} computations, {service.hits} reads from memory")
+    print("✅ PASSED\n")
+
+    # Test 2: Invalidation bumps the version and notifies subscribers
+    print("Test 2: Invalidation")
+    print("-" * 70)
+    changed = []
+    service.subscribe(changed.append)
+    service.subscribe(changed.append)  # Subscribing twice doesn't notify twice
+
+    def broken(guild_id):
+        raise RuntimeError("subscriber failure")
+
+    service.subscribe(broken)
+    stored[1] = {"Party": {0: (("Daily", "21:00"), 6, [])}}
+    service.invalidate(1)
+    assert changed == [1] and service.version(1) == 1 and service.peek(1) is None
+    schedule = await service.get(1)
+    assert schedule.version == 1 and schedule.winning_times["Party"][0][0] == ("Daily", "21:00")
+    service.unsubscribe(changed.append)
+    service.invalidate(1)
+    assert changed == [1]
+    print("✅ PASSED\n")
+
+    # Test 3: A result computed from data that changed meanwhile isn't cached
+    print("Test 3: Invalidation during a computation")
+    print("-" * 70)
+    gate.clear()
+    pending = asyncio.create_task(service.get(1))
+    await asyncio.sleep(0)
+    stored[1] = {"Party": {0: (("Daily", "22:00"), 7, [])}}
+    service.invalidate(1)
+    gate.set()
+    stale = await pending
+    assert stale.version == 2 and service.peek(1) is None
+    fresh = await service.get(1)
+    assert fresh.version == 3 and fresh.winning_times["Party"][0][0] == ("Daily", "22:00")
+    print("✅ PASSED\n")
+
+
+asyncio.run(run_tests())
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
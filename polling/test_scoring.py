@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Check the vectorised scoring grid against the original dict-based vote tallies"""
+
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("scoring", Path(__file__).with_name("scoring.py"))
+scoring = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(scoring)
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+EVENTS = {
+    "Party": {"type": "daily", "slots": 1},
+    "Hero's Realm (Catch-up)": {"type": "once", "slots": 1},
+    "Sword Trial": {"type": "fixed_days", "slots": 2, "days": ["Wednesday", "Friday"]},
+    "Sword Trial (Echo)": {"type": "fixed_days", "slots": 1, "days": ["Monday"]},
+    "Breaking Army": {"type": "once", "slots": 2},
+    "Showdown": {"type": "once", "slots": 2},
+    "Guild War": {"type": "weekly", "slots": 2},
+}
+
+
+def time_to_sort_key(time_str: str) -> int:
+    """Minutes since 17:00, times 00:00-02:59 are treated as next day"""
+    hour, minute = map(int, time_str.split(':'))
+    if hour < 3:
+        hour += 24
+    return (hour - 17) * 60 + minute
+
+
+def calculate_weighted_points(voted_time: str, target_time: str, weighted: bool = True) -> int:
+    """5 for exact match, 2 for ±30min, 1 for ±60min, 0 otherwise"""
+    def time_to_minutes(time_str: str) -> int:
+        hours, minutes = map(int, time_str.split(":"))
+        if hours < 17:
+            hours += 24
+        return hours * 60 + minutes
+
+    diff_minutes = abs(time_to_minutes(target_time) - time_to_minutes(voted_time))
+    if diff_minutes == 0:
+        return 5
+    if not weighted:
+        return 0
+    elif diff_minutes == 30:
+        return 2
+    elif diff_minutes == 60:
+        return 1
+    return 0
+
+
+def saturday_distance(day_name: str) -> int:
+    day_index = DAYS.index(day_name)
+    return min(abs(day_index - 5), 7 - abs(day_index - 5))
+
+
+def slot_vote(selection, slot_index):
+    """(voted_time, voted_day) for one slot, same rules as the cog"""
+    if isinstance(selection, list):
+        if slot_index < len(selection) and selection[slot_index]:
+            return selection[slot_index]["time"], selection[slot_index].get("day")
+    elif slot_index == 0:
+        if isinstance(selection, str):
+            return selection, None
+        return selection["time"], selection.get("day")
+    return None, None
+
+
+def reference_rankings(selections, all_times):
+    """Original implementation: accumulate into dicts, then stable-sort"""
+    results = {}
+    for event_name, event_info in EVENTS.items():
+        is_weighted = event_name != "Guild War"
+        results[event_name] = {}
+        if event_info["type"] in ("weekly", "once") and event_info["slots"] > 1:
+            point_totals = {}
+            for user_selections in selections.values():
+                selection = user_selections.get(event_name)
+                if selection is None:
+                    continue
+                for slot_data in selection if isinstance(selection, list) else [selection]:
+                    if not slot_data or not slot_data.get("time") or not slot_data.get("day"):
+                        continue
+                    for target_time in all_times:
+                        points = calculate_weighted_points(slot_data["time"], target_time, weighted=is_weighted)
+                        if points > 0:
+                            key = (slot_data["day"], target_time)
+                            point_totals[key] = point_totals.get(key, 0) + points
+            results[event_name][0] = sorted(
+                point_totals.items(),
+                key=lambda x: (-x[1], saturday_distance(x[0][0]), -time_to_sort_key(x[0][1])),
+            )
+            continue
+
+        for slot_index in range(event_info["slots"]):
+            point_totals = {}
+            for user_selections in selections.values():
+                if event_name not in user_selections:
+                    continue
+                voted_time, voted_day = slot_vote(user_selections[event_name], slot_index)
+                if not voted_time:
+                    continue
+                if event_info["type"] == "daily":
+                    day = "Daily"
+                elif event_info["type"] == "fixed_days":
+                    day = voted_day if event_info["slots"] > 1 and voted_day else "Fixed"
+                elif voted_day:
+                    day = voted_day
+                else:
+                    continue
+                for target_time in all_times:
+                    points = calculate_weighted_points(voted_time, target_time, weighted=is_weighted)
+                    if points > 0:
+                        point_totals[(day, target_time)] = point_totals.get((day, target_time), 0) + points
+                if event_info["type"] not in ("daily", "fixed_days") and is_weighted:
+                    for other_day in DAYS:
+                        if other_day != voted_day:
+                            point_totals[(other_day, voted_time)] = point_totals.get((other_day, voted_time), 0) + 1
+            results[event_name][slot_index] = sorted(point_totals.items(), key=lambda x: (x[1], x[0][1]), reverse=True)
+    return results
+
+
+def grid_rankings(engine, selections, all_times):
+    """Same rankings through the scoring grid"""
+    results = {}
+    for event_name, event_info in EVENTS.items():
+        results[event_name] = {}
+        for slot_index in scoring.slot_groups(event_info):
+            group = 0 if slot_index is None else slot_index
+            results[event_name][group] = scoring.rank_grid(engine, event_name, event_info, slot_index, selections, all_times)
+    return results
+
+
+def tally_rankings(tally, selections):
+    """Rankings from a running tally, as (top entries, all totals) per group"""
+    results = {}
+    for event_name, event_info in EVENTS.items():
+        results[event_name] = {}
+        needed = max(3, event_info["slots"])
+        for slot_index in scoring.slot_groups(event_info):
+            group = 0 if slot_index is None else slot_index
+            ranked = tally.ranked(event_name, slot_index, selections, needed)
+            results[event_name][group] = (ranked[:needed], sorted(ranked))
+    return results
+
+
+def expected_tally_rankings(selections, all_times):
+    results = {}
+    for event_name, groups in reference_rankings(selections, all_times).items():
+        needed = max(3, EVENTS[event_name]["slots"])
+        results[event_name] = {group: (ranked[:needed], sorted(ranked)) for group, ranked in groups.items()}
+    return results
+
+
+def random_selections(rng, num_users, all_times):
+    # Include a few off-grid times to exercise the legacy "same time on other days" columns
+    vote_times = all_times + ["18:15", "23:45", "00:15"]
+    selections = {}
+    for user_id in range(num_users):
+        user = {}
+        for event_name, event_info in EVENTS.items():
+            if rng.random() < 0.2:
+                continue
+            slots = []
+            for slot_index in range(event_info["slots"]):
+                if rng.random() < 0.1:
+                    slots.append(None)
+                    continue
+                if event_info["type"] == "fixed_days" and event_info["slots"] > 1:
+                    day = event_info["days"][slot_index]
+                elif event_info["type"] == "daily":
+                    day = None
+                else:
+                    day = rng.choice(DAYS)
+                slots.append({"time": rng.choice(vote_times), "day": day})
+            if event_info["slots"] == 1 and slots[0] is not None and rng.random() < 0.5:
+                # Legacy single-slot formats
+                user[event_name] = slots[0]["time"] if rng.random() < 0.3 else slots[0]
+            else:
+                user[event_name] = slots
+        selections[str(user_id)] = user
+    return selections
+
+
+all_times = [f"{h % 24:02d}:{m:02d}" for h in range(17, 26) for m in (0, 30)] + ["02:00"]
+engine = scoring.ScoringEngine(calculate_weighted_points, DAYS, time_to_sort_key)
+
+# Test 1: Empty poll
+print("Test 1: Empty poll has no rankings")
+print("-" * 70)
+assert grid_rankings(engine, {}, all_times) == reference_rankings({}, all_times)
+print("✅ PASSED\n")
+
+# Test 2: Ties are broken exactly like the stable dict sort
+print("Test 2: Tie-breaks")
+print("-" * 70)
+ties = {
+    "1": {"Breaking Army": [{"time": "20:00", "day": "Saturday"}, {"time": "20:00", "day": "Friday"}]},
+    "2": {"Breaking Army": [{"time": "20:00", "day": "Sunday"}, None], "Party": {"time": "19:00"}},
+    "3": {"Hero's Realm (Catch-up)": {"time": "21:00", "day": "Monday"}, "Party": {"time": "21:00"}},
+    "4": {"Hero's Realm (Catch-up)": {"time": "21:00", "day": "Tuesday"}},
+}
+expected = reference_rankings(ties, all_times)
+assert grid_rankings(engine, ties, all_times) == expected
+print(f"Breaking Army top 3: {expected['Breaking Army'][0][:3]}")
+print(f"Party top 3: {expected['Party'][0][:3]}")
+print("✅ PASSED\n")
+
+# Test 3: Randomised polls of varying size
+print("Test 3: Randomised polls match the reference exactly")
+print("-" * 70)
+rng = random.Random(1234)
+for num_users in (1, 2, 5, 20, 100, 300):
+    for _ in range(5):
+        selections = random_selections(rng, num_users, all_times)
+        assert grid_rankings(engine, selections, all_times) == reference_rankings(selections, all_times), num_users
+print("✅ PASSED\n")
+
+# Test 4: Running tally stays equal to a full recompute
+print("Test 4: Incremental tally through submits and clears")
+print("-" * 70)
+rng = random.Random(99)
+pool = random_selections(rng, 60, all_times)
+selections = {}
+tally = scoring.VoteTally.build(engine, EVENTS, all_times, selections)
+for step in range(400):
+    user_id = str(rng.randrange(40))
+    action = rng.random()
+    user_selections = selections.get(user_id)
+    if action < 0.6:
+        # Submit one or two events (the cog keeps the user's position in the dict)
+        votes = {name: vote for name, vote in pool[str(rng.randrange(60))].items() if rng.random() < 0.5}
+        user_selections = selections.setdefault(user_id, {})
+        for event_name, selection in votes.items():
+            tally.apply(event_name, user_selections.get(event_name), -1)
+            user_selections[event_name] = selection
+            tally.apply(event_name, selection, 1)
+    elif action < 0.8 and user_selections:
+        # Clear one event
+        event_name = rng.choice(list(user_selections))
+        tally.apply(event_name, user_selections.pop(event_name), -1)
+    elif user_selections is not None:
+        # User left: remove all votes
+        for event_name, selection in selections.pop(user_id).items():
+            tally.apply(event_name, selection, -1)
+    if step % 20 == 0:
+        # Persisted form round-trips
+        tally = scoring.VoteTally.from_dict(engine, EVENTS, all_times, tally.to_dict())
+    assert tally_rankings(tally, selections) == expected_tally_rankings(selections, all_times), step
+assert scoring.VoteTally.from_dict(engine, EVENTS, all_times[1:], tally.to_dict()) is None
+print("✅ PASSED\n")
+
+# Test 5: Timing on a large poll
+print("Test 5: Timing (1000 voters)")
+print("-" * 70)
+selections = random_selections(rng, 1000, all_times)
+start = time.perf_counter()
+expected = reference_rankings(selections, all_times)
+reference_time = time.perf_counter() - start
+start = time.perf_counter()
+assert grid_rankings(engine, selections, all_times) == expected
+grid_time = time.perf_counter() - start
+tally = scoring.VoteTally.build(engine, EVENTS, all_times, selections)
+start = time.perf_counter()
+tally_rankings(tally, selections)
+tally_time = time.perf_counter() - start
+print(f"Reference: {reference_time * 1000:.1f} ms, grid: {grid_time * 1000:.1f} ms, tally: {tally_time * 1000:.1f} ms")
+print("✅ PASSED\n")
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
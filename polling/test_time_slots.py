@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Check the precomputed time-slot index against the original per-call parsing"""
+
+import importlib.util
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location("time_slots", Path(__file__).with_name("time_slots.py"))
+time_slots = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(time_slots)
+
+ALL_TIMES = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)]
+DURATIONS = [10, 15, 30, 45, 60, 90, 120]
+
+
+def time_to_sort_key(time_str):
+    hour, minute = map(int, time_str.split(':'))
+    if hour < 3:
+        hour += 24
+    return (hour - 17) * 60 + minute
+
+
+def vote_time_to_minutes(time_str):
+    hours, minutes = map(int, time_str.split(":"))
+    if hours < 17:
+        hours += 24
+    return hours * 60 + minutes
+
+
+def slots_for_conflicts(time_str, duration):
+    current_time = datetime.strptime(time_str, "%H:%M")
+    return tuple(
+        (current_time + timedelta(minutes=i * 30)).strftime("%H:%M") for i in range(max(1, duration // 30))
+    )
+
+
+def slots_for_calendar(time_str, duration):
+    start_time = datetime.strptime(time_str, "%H:%M")
+    cells = []
+    for i in range((duration + 29) // 30):
+        slot_time = start_time + timedelta(minutes=i * 30)
+        cells.append(f"{slot_time.hour:02d}:{(slot_time.minute // 30) * 30:02d}")
+    return tuple(cells)
+
+
+def blocked_for_event(time_str, duration, blocked_start, blocked_end):
+    start = time_to_sort_key(time_str)
+    return start < time_to_sort_key(blocked_end) and time_to_sort_key(blocked_start) < start + duration
+
+
+# Test 1: Sort keys and vote distances
+print("Test 1: Sort keys and vote minutes for every minute of the day")
+print("-" * 70)
+for t in ALL_TIMES:
+    assert time_slots.sort_key(t) == time_to_sort_key(t), t
+    assert time_slots.vote_minutes(t) == vote_time_to_minutes(t), t
+    assert time_slots.format_minutes(time_slots.minutes(t)) == t
+    assert time_slots.is_next_day(t) == (int(t[:2]) < 3)
+assert time_slots.sort_key("9:05") == time_to_sort_key("9:05")
+assert time_slots.minutes("24:00") == time_slots.minutes("00:00")
+assert sorted(["01:00", "23:30", "17:00", "00:00"], key=time_slots.sort_key) == ["17:00", "23:30", "00:00", "01:00"]
+print("✅ PASSED\n")
+
+# Test 2: Slot expansion used by conflict resolution and the calendar
+print("Test 2: Occupied slots and calendar cells")
+print("-" * 70)
+for t in ALL_TIMES[::5]:
+    for duration in DURATIONS:
+        assert time_slots.occupied_slots(t, duration) == slots_for_conflicts(t, duration), (t, duration)
+        assert time_slots.calendar_cells(t, duration) == slots_for_calendar(t, duration), (t, duration)
+print(f"Breaking Army at 23:30: {time_slots.occupied_slots('23:30', 120)}")
+print("✅ PASSED\n")
+
+# Test 3: Blocked periods, including one past midnight
+print("Test 3: Event-specific blocked periods")
+print("-" * 70)
+for blocked_start, blocked_end in (("20:30", "22:00"), ("23:30", "01:00")):
+    for t in ALL_TIMES[::15]:
+        for duration in DURATIONS:
+            expected = blocked_for_event(t, duration, blocked_start, blocked_end)
+            assert time_slots.overlaps_period(t, duration, blocked_start, blocked_end) == expected, (t, duration)
+assert time_slots.in_period("21:00", "20:30", "22:00")
+assert not time_slots.in_period("22:00", "20:30", "22:00")
+assert not time_slots.in_period("24:00", "20:30", "22:00")
+print("✅ PASSED\n")
+
+# Test 4: Timing
+print("Test 4: Timing (100k lookups)")
+print("-" * 70)
+sample = ALL_TIMES * 70
+start = time.perf_counter()
+for t in sample:
+    time_to_sort_key(t)
+    slots_for_conflicts(t, 60)
+parsed_time = time.perf_counter() - start
+start = time.perf_counter()
+for t in sample:
+    time_slots.sort_key(t)
+    time_slots.occupied_slots(t, 60)
+index_time = time.perf_counter() - start
+print(f"Parsing: {parsed_time * 1000:.1f} ms, index: {index_time * 1000:.1f} ms")
+print("✅ PASSED\n")
+
+print("=" * 70)
+print("ALL TESTS PASSED! ✅")
+print("=" * 70)
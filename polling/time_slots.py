@@ -0,0 +1,134 @@
+"""Precomputed HH:MM lookups shared by the poll logic, the calendar renderer and notifications.
+
+Every "HH:MM" string the cog deals with is mapped to integers once at import time, so sort keys,
+slot expansion and overlap/blocked checks are dict or tuple lookups instead of repeated parsing.
+The tables are read-only.
+
+Times follow the cog's night rule: the event window starts at 17:00, and 00:00-02:59 belong to
+the previous day's evening (so "Monday 01:00" is Monday night).
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple
+
+DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+DAY_INDEX = MappingProxyType({day: i for i, day in enumerate(DAYS)})
+
+MINUTES_PER_DAY = 24 * 60
+# Start of the event window, sort keys count minutes from here
+WINDOW_START = 17 * 60
+# Times before this belong to the previous day's evening
+NEXT_DAY_CUTOFF = 3 * 60
+# Vote scoring measures distances with the day boundary at 17:00
+VOTE_CUTOFF = 17 * 60
+SLOT_MINUTES = 30
+
+# minute of day -> "HH:MM"
+CLOCK = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY))
+
+
+def _wrap(minute_of_day: int, cutoff: int) -> int:
+    return minute_of_day + MINUTES_PER_DAY if minute_of_day < cutoff else minute_of_day
+
+
+_CLOCK_MINUTES = {text: m for m, text in enumerate(CLOCK)}
+_CLOCK_MINUTES["24:00"] = 0
+# "HH:MM" -> minutes since midnight of the evening the time belongs to (00:30 -> 1470)
+_MINUTES = MappingProxyType({text: _wrap(m, NEXT_DAY_CUTOFF) for text, m in _CLOCK_MINUTES.items()})
+_VOTE_MINUTES = MappingProxyType({text: _wrap(m, VOTE_CUTOFF) for text, m in _CLOCK_MINUTES.items()})
+
+
+def clock_minutes(time_str: str) -> int:
+    """Minutes since midnight, without any wrapping ("01:30" -> 90)"""
+    try:
+        return _CLOCK_MINUTES[time_str]
+    except KeyError:
+        # Unpadded or otherwise unusual input ("9:05"), parsed the slow way
+        hours, minutes = map(int, time_str.split(":"))
+        return (hours * 60 + minutes) % MINUTES_PER_DAY
+
+
+def minutes(time_str: str) -> int:
+    """Minutes since midnight of the evening the time belongs to (03:00 wrap)"""
+    try:
+        return _MINUTES[time_str]
+    except KeyError:
+        return _wrap(clock_minutes(time_str), NEXT_DAY_CUTOFF)
+
+
+def vote_minutes(time_str: str) -> int:
+    """Minutes used for vote distances (17:00 wrap, unchanged so stored tallies stay valid)"""
+    try:
+        return _VOTE_MINUTES[time_str]
+    except KeyError:
+        return _wrap(clock_minutes(time_str), VOTE_CUTOFF)
+
+
+def sort_key(time_str: str) -> int:
+    """Minutes since 17:00, with 00:00-02:59 sorted after 23:59"""
+    return minutes(time_str) - WINDOW_START
+
+
+def is_next_day(time_str: str) -> bool:
+    """Whether the time falls after midnight of its evening (00:00-02:59)"""
+    return clock_minutes(time_str) < NEXT_DAY_CUTOFF
+
+
+def format_minutes(value: int) -> str:
+    """Minutes (wrapped or not) back to "HH:MM\""""
+    return CLOCK[value % MINUTES_PER_DAY]
+
+
+def add_minutes(time_str: str, delta: int) -> str:
+    return CLOCK[(clock_minutes(time_str) + delta) % MINUTES_PER_DAY]
+
+
+@lru_cache(maxsize=4096)
+def occupied_slots(time_str: str, duration: int) -> Tuple[str, ...]:
+    """Start times of the 30-minute steps an event occupies for conflict resolution
+
+    Always at least one step; partial steps at the end are not counted.
+    """
+    start = clock_minutes(time_str)
+    return tuple(
+        CLOCK[(start + i * SLOT_MINUTES) % MINUTES_PER_DAY] for i in range(max(1, duration // SLOT_MINUTES))
+    )
+
+
+@lru_cache(maxsize=4096)
+def cell_mask(time_str: str, duration: int) -> int:
+    """occupied_slots as a bitmask, one bit per minute of day a step starts at"""
+    mask = 0
+    for cell in occupied_slots(time_str, duration):
+        mask |= 1 << _CLOCK_MINUTES[cell]
+    return mask
+
+
+@lru_cache(maxsize=4096)
+def calendar_cells(time_str: str, duration: int) -> Tuple[str, ...]:
+    """30-minute calendar rows an event is drawn in, aligned to :00/:30
+
+    Partial steps at the end count as a full row.
+    """
+    start = clock_minutes(time_str)
+    cells = []
+    for i in range((duration + SLOT_MINUTES - 1) // SLOT_MINUTES):
+        m = (start + i * SLOT_MINUTES) % MINUTES_PER_DAY
+        cells.append(CLOCK[m - m % SLOT_MINUTES])
+    return tuple(cells)
+
+
+def ranges_overlap(start1: int, end1: int, start2: int, end2: int) -> bool:
+    return start1 < end2 and start2 < end1
+
+
+def overlaps_period(time_str: str, duration: int, period_start: str, period_end: str) -> bool:
+    """Whether an event starting at time_str overlaps the [period_start, period_end) period"""
+    start = minutes(time_str)
+    return ranges_overlap(start, start + duration, minutes(period_start), minutes(period_end))
+
+
+def in_period(time_str: str, period_start: str, period_end: str) -> bool:
+    """Whether time_str lies within [period_start, period_end)"""
+    return minutes(period_start) <= minutes(time_str) < minutes(period_end)
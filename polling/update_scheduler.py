@@ -0,0 +1,81 @@
+"""Debounced, coalesced poll message/calendar updates."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+log = logging.getLogger("red.asdas-cogs.polling")
+
+# Minimum seconds between two updates of the same poll
+UPDATE_INTERVAL = 10
+
+PollKey = Tuple[int, str]  # (guild_id, poll_id)
+
+
+class PollUpdateScheduler:
+    """
+    Votes mark a poll dirty instead of re-rendering it directly.
+
+    One worker per dirty poll runs the update callback with the latest state, at most once per
+    `interval` seconds. The first vote after a quiet period is applied immediately; votes arriving
+    while an update is pending or running are folded into the next one. A worker stays until its
+    poll has been quiet for `interval` seconds, then forgets when the poll was last updated.
+    """
+
+    def __init__(self, callback: Callable[[int, str, bool], Awaitable], interval: float = UPDATE_INTERVAL):
+        self._callback = callback
+        self.interval = interval
+        # poll -> whether the pending update is a full one (weekly calendars + website export)
+        self._pending: Dict[PollKey, bool] = {}
+        self._workers: Dict[PollKey, asyncio.Task] = {}
+        self._last_run: Dict[PollKey, float] = {}
+        self.requested = 0
+        self.performed = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def mark_dirty(self, guild_id: int, poll_id: str, full: bool = True):
+        key = (guild_id, str(poll_id))
+        self.requested += 1
+        if key in self._pending:
+            self.coalesced += 1
+            self._pending[key] = self._pending[key] or full
+        else:
+            self._pending[key] = full
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = asyncio.create_task(self._work(key))
+
+    async def _work(self, key: PollKey):
+        try:
+            while True:
+                wait = self._last_run.get(key, float("-inf")) + self.interval - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                if key not in self._pending:
+                    # Quiet for a whole interval, the next vote may update right away
+                    self._last_run.pop(key, None)
+                    break
+                full = self._pending.pop(key)
+                self._last_run[key] = time.monotonic()
+                try:
+                    await self._callback(key[0], key[1], full)
+                except Exception as e:
+                    self.failed += 1
+                    log.error(f"Error updating poll {key[1]}: {e}", exc_info=True)
+                self.performed += 1
+        finally:
+            if self._workers.get(key) is asyncio.current_task():
+                del self._workers[key]
+
+    def close(self):
+        for task in self._workers.values():
+            task.cancel()
+        self._workers.clear()
+        self._pending.clear()
+        self._last_run.clear()
@@ -17,6 +17,7 @@ except ImportError:
 
 # Import voting modals
 from .voting_modals import CombinedSimpleEventsModal, BreakingArmyVoteModal, ShowdownVoteModal, SwordTrialVoteModal
+from .render_pool import RenderQueueFull, RenderRateLimited
 
 log = logging.getLogger("red.asdas-cogs.polling")
 
@@ -251,7 +252,7 @@ class EventPollView(discord.ui.View):
             selections = poll_data.get("selections", {})
 
             # Calculate winning times using weighted point system
-            winning_times = self.cog._calculate_winning_times_weighted(selections)
+            winning_times = self.cog._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
             # Format all results inline (no buttons needed)
             results_text = self.cog.format_all_results_inline(winning_times, selections)
@@ -481,11 +482,9 @@ class PartyModal(discord.ui.View):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
 
                 # Store the selection
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = {"time": self.selected_time}
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: {"time": self.selected_time}})
                 poll_data = polls[self.poll_id]
 
             # Update the poll embed
@@ -540,9 +539,7 @@ class PartyModal(discord.ui.View):
                 return
 
             user_id_str = str(self.user_id)
-            if user_id_str in polls[self.poll_id]["selections"]:
-                if self.event_name in polls[self.poll_id]["selections"][user_id_str]:
-                    del polls[self.poll_id]["selections"][user_id_str][self.event_name]
+            self.cog._clear_user_votes(polls[self.poll_id], user_id_str, self.event_name)
 
             poll_data = polls[self.poll_id]
 
@@ -574,26 +571,8 @@ class PartyModal(discord.ui.View):
             pass
 
     async def _update_poll_display(self, interaction: discord.Interaction, poll_data: Dict):
-        """Update the poll embed and calendar"""
-        try:
-            channel = interaction.guild.get_channel(poll_data["channel_id"])
-            if channel:
-                message = await channel.fetch_message(poll_data["message_id"])
-                updated_embed = await self.cog._create_poll_embed(
-                    poll_data["title"],
-                    self.guild_id,
-                    self.poll_id
-                )
-                updated_embed.set_footer(text="Click the buttons below to set your preferences")
-                await message.edit(embed=updated_embed)
-
-            # Update any live calendar messages for this poll
-            await self.cog._update_calendar_messages(interaction.guild, poll_data, self.poll_id)
-
-            # Check if we need to create initial weekly snapshot (for first vote)
-            await self.cog._check_and_create_initial_snapshot(interaction.guild, self.poll_id)
-        except Exception:
-            pass
+        """Queue an update of the poll embed and calendar (coalesced with other votes)"""
+        await self.cog._queue_poll_update(self.guild_id, self.poll_id, full=False)
 
     async def _get_user_selections_text(self) -> str:
         """Get formatted text of user's current selections"""
@@ -767,8 +746,7 @@ class FixedDaysModal(discord.ui.View):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
+                user_selections = polls[self.poll_id]["selections"].get(user_id_str, {})
 
                 # Store as list format
                 event_info = self.events[self.event_name]
@@ -780,14 +758,14 @@ class FixedDaysModal(discord.ui.View):
                         selections_list.append({"time": self.selected_times[day]})
                     else:
                         # Keep existing selection if available, otherwise None
-                        existing = polls[self.poll_id]["selections"][user_id_str].get(self.event_name, [])
+                        existing = user_selections.get(self.event_name, [])
                         idx = days.index(day)
                         if isinstance(existing, list) and idx < len(existing):
                             selections_list.append(existing[idx])
                         else:
                             selections_list.append(None)
 
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = selections_list
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: selections_list})
                 poll_data = polls[self.poll_id]
 
             # Update the poll embed
@@ -842,9 +820,7 @@ class FixedDaysModal(discord.ui.View):
                 return
 
             user_id_str = str(self.user_id)
-            if user_id_str in polls[self.poll_id]["selections"]:
-                if self.event_name in polls[self.poll_id]["selections"][user_id_str]:
-                    del polls[self.poll_id]["selections"][user_id_str][self.event_name]
+            self.cog._clear_user_votes(polls[self.poll_id], user_id_str, self.event_name)
 
             poll_data = polls[self.poll_id]
 
@@ -876,26 +852,8 @@ class FixedDaysModal(discord.ui.View):
             pass
 
     async def _update_poll_display(self, interaction: discord.Interaction, poll_data: Dict):
-        """Update the poll embed and calendar"""
-        try:
-            channel = interaction.guild.get_channel(poll_data["channel_id"])
-            if channel:
-                message = await channel.fetch_message(poll_data["message_id"])
-                updated_embed = await self.cog._create_poll_embed(
-                    poll_data["title"],
-                    self.guild_id,
-                    self.poll_id
-                )
-                updated_embed.set_footer(text="Click the buttons below to set your preferences")
-                await message.edit(embed=updated_embed)
-
-            # Update any live calendar messages for this poll
-            await self.cog._update_calendar_messages(interaction.guild, poll_data, self.poll_id)
-
-            # Check if we need to create initial weekly snapshot (for first vote)
-            await self.cog._check_and_create_initial_snapshot(interaction.guild, self.poll_id)
-        except Exception:
-            pass
+        """Queue an update of the poll embed and calendar (coalesced with other votes)"""
+        await self.cog._queue_poll_update(self.guild_id, self.poll_id, full=False)
 
     async def _get_user_selections_text(self) -> str:
         """Get formatted text of user's current selections"""
@@ -1155,8 +1113,7 @@ class WeeklyEventModal(discord.ui.View):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
+                user_selections = polls[self.poll_id]["selections"].get(user_id_str, {})
 
                 # Get existing selections to preserve slots we're not updating
                 if self.num_slots == 1:
@@ -1166,7 +1123,7 @@ class WeeklyEventModal(discord.ui.View):
                     ]
                 else:
                     # For 2-slot events, store as two-item list
-                    existing = polls[self.poll_id]["selections"][user_id_str].get(self.event_name, [None, None])
+                    existing = user_selections.get(self.event_name, [None, None])
                     if not isinstance(existing, list):
                         existing = [None, None]
 
@@ -1175,7 +1132,7 @@ class WeeklyEventModal(discord.ui.View):
                         {"day": self.selected_slot2_day, "time": self.selected_slot2_time} if has_slot2 else (existing[1] if len(existing) > 1 else None)
                     ]
 
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = selections_list
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: selections_list})
                 poll_data = polls[self.poll_id]
 
             # Update the poll embed
@@ -1230,9 +1187,7 @@ class WeeklyEventModal(discord.ui.View):
                 return
 
             user_id_str = str(self.user_id)
-            if user_id_str in polls[self.poll_id]["selections"]:
-                if self.event_name in polls[self.poll_id]["selections"][user_id_str]:
-                    del polls[self.poll_id]["selections"][user_id_str][self.event_name]
+            self.cog._clear_user_votes(polls[self.poll_id], user_id_str, self.event_name)
 
             poll_data = polls[self.poll_id]
 
@@ -1264,26 +1219,8 @@ class WeeklyEventModal(discord.ui.View):
             pass
 
     async def _update_poll_display(self, interaction: discord.Interaction, poll_data: Dict):
-        """Update the poll embed and calendar"""
-        try:
-            channel = interaction.guild.get_channel(poll_data["channel_id"])
-            if channel:
-                message = await channel.fetch_message(poll_data["message_id"])
-                updated_embed = await self.cog._create_poll_embed(
-                    poll_data["title"],
-                    self.guild_id,
-                    self.poll_id
-                )
-                updated_embed.set_footer(text="Click the buttons below to set your preferences")
-                await message.edit(embed=updated_embed)
-
-            # Update any live calendar messages for this poll
-            await self.cog._update_calendar_messages(interaction.guild, poll_data, self.poll_id)
-
-            # Check if we need to create initial weekly snapshot (for first vote)
-            await self.cog._check_and_create_initial_snapshot(interaction.guild, self.poll_id)
-        except Exception:
-            pass
+        """Queue an update of the poll embed and calendar (coalesced with other votes)"""
+        await self.cog._queue_poll_update(self.guild_id, self.poll_id, full=False)
 
     async def _get_user_selections_text(self) -> str:
         """Get formatted text of user's current selections"""
@@ -1502,6 +1439,20 @@ class TimezoneModal(discord.ui.Modal, title="Generate Calendar in Your Timezone"
 
         poll_data = polls[self.poll_id]
 
+        # Personal renders are rate limited per user
+        try:
+            self.cog.render_pool.check_user(interaction.user.id)
+        except RenderRateLimited as e:
+            await interaction.response.send_message(
+                f"⏳ Please wait {e.retry_after:.0f}s before generating another calendar.",
+                view=DismissibleView(),
+                ephemeral=True
+            )
+            return
+
+        # Rendering may have to wait for the render pool, so acknowledge the interaction first
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
         # Calculate winning times - use cached snapshot for weekly calendars
         # Always get selections for total voter count
         selections = poll_data.get("selections", {})
@@ -1511,10 +1462,10 @@ class TimezoneModal(discord.ui.Modal, title="Generate Calendar in Your Timezone"
             winning_times = poll_data.get("weekly_snapshot_winning_times", {})
             if not winning_times:
                 # Fallback to live data if no snapshot exists yet
-                winning_times = self.cog._calculate_winning_times_weighted(selections)
+                winning_times = self.cog._calculate_winning_times_weighted(selections, poll_data.get("tally"))
         else:
             # Use live selections for real-time calendars
-            winning_times = self.cog._calculate_winning_times_weighted(selections)
+            winning_times = self.cog._calculate_winning_times_weighted(selections, poll_data.get("tally"))
 
         # Convert to calendar data format first
         from datetime import datetime
@@ -1556,13 +1507,24 @@ class TimezoneModal(discord.ui.Modal, title="Generate Calendar in Your Timezone"
 
                 converted_calendar_data[event_name][new_day] = converted_time
 
-        # Generate calendar image with the user's timezone
-        image_buffer = user_tz_renderer.render_calendar(
-            converted_calendar_data,
-            self.cog.events,
-            [], # No blocked times anymore
-            len(selections)
-        )
+        # Generate calendar image with the user's timezone on the render pool
+        # Identical (poll, timezone) requests in flight share one render
+        try:
+            image_buffer = BytesIO(await self.cog.render_pool.render(
+                user_tz_renderer.render_calendar,
+                converted_calendar_data,
+                self.cog.events,
+                [], # No blocked times anymore
+                len(selections),
+                key=(self.guild_id, self.poll_id, self.is_weekly, timezone_str)
+            ))
+        except RenderQueueFull:
+            await interaction.followup.send(
+                "⏳ Too many calendars are being generated right now. Please try again in a minute.",
+                view=DismissibleView(),
+                ephemeral=True
+            )
+            return
         
         # Create embed
         embed = discord.Embed(
@@ -1576,7 +1538,7 @@ class TimezoneModal(discord.ui.Modal, title="Generate Calendar in Your Timezone"
         embed.set_image(url=f"attachment://calendar_{timezone_str.replace('/', '_')}.png")
         
         # Send as ephemeral message with dismissible view
-        await interaction.response.send_message(
+        await interaction.followup.send(
             embed=embed,
             file=calendar_file,
             view=DismissibleView(),
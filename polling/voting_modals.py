@@ -191,29 +191,28 @@ class CombinedSimpleEventsModal(Modal, title="Party / Catch-Up"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
+                votes = {}
 
                 # Save Party vote
                 if "Party" in self.selects:
                     party_select = self.selects["Party"]["time"]
                     if party_select.values:
-                        polls[self.poll_id]["selections"][user_id_str]["Party"] = {"time": party_select.values[0]}
+                        votes["Party"] = {"time": party_select.values[0]}
 
                 # Save Hero's Realm vote
                 if "Hero's Realm (Catch-up)" in self.selects:
                     day_select = self.selects["Hero's Realm (Catch-up)"]["day"]
                     time_select = self.selects["Hero's Realm (Catch-up)"]["time"]
                     if day_select.values and time_select.values:
-                        polls[self.poll_id]["selections"][user_id_str]["Hero's Realm (Catch-up)"] = [{
+                        votes["Hero's Realm (Catch-up)"] = [{
                             "day": day_select.values[0],
                             "time": time_select.values[0]
                         }]
 
-                poll_data = polls[self.poll_id]
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, votes)
 
             # Update the poll embed
-            await self.cog._update_poll_message(self.guild_id, self.poll_id, poll_data)
+            await self.cog._queue_poll_update(self.guild_id, self.poll_id)
 
         except Exception as e:
             log.error(f"Error in CombinedSimpleEventsModal.on_submit: {e}", exc_info=True)
@@ -455,14 +454,10 @@ class SimpleEventVoteModal(Modal, title="Vote for Event Times"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
-
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = selection
-                poll_data = polls[self.poll_id]
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: selection})
 
             # Update the poll embed
-            await self.cog._update_poll_message(self.guild_id, self.poll_id, poll_data)
+            await self.cog._queue_poll_update(self.guild_id, self.poll_id)
 
         except Exception as e:
             log.error(f"Error in SimpleEventVoteModal.on_submit: {e}", exc_info=True)
@@ -646,14 +641,10 @@ class BreakingArmyVoteModal(Modal, title="Vote: Breaking Army"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
-
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = selection
-                poll_data = polls[self.poll_id]
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: selection})
 
             # Update the poll embed
-            await self.cog._update_poll_message(self.guild_id, self.poll_id, poll_data)
+            await self.cog._queue_poll_update(self.guild_id, self.poll_id)
 
         except Exception as e:
             log.error(f"Error in BreakingArmyVoteModal.on_submit: {e}", exc_info=True)
@@ -837,14 +828,10 @@ class ShowdownVoteModal(Modal, title="Vote: Showdown"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
-
-                polls[self.poll_id]["selections"][user_id_str][self.event_name] = selection
-                poll_data = polls[self.poll_id]
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, {self.event_name: selection})
 
             # Update the poll embed
-            await self.cog._update_poll_message(self.guild_id, self.poll_id, poll_data)
+            await self.cog._queue_poll_update(self.guild_id, self.poll_id)
 
         except Exception as e:
             log.error(f"Error in ShowdownVoteModal.on_submit: {e}", exc_info=True)
@@ -1001,8 +988,7 @@ class SwordTrialVoteModal(Modal, title="Vote: Sword Trial"):
                     return
 
                 user_id_str = str(self.user_id)
-                if user_id_str not in polls[self.poll_id]["selections"]:
-                    polls[self.poll_id]["selections"][user_id_str] = {}
+                votes = {}
 
                 # Save Sword Trial (Wed/Fri)
                 if hasattr(self, 'wed_select') and hasattr(self, 'fri_select'):
@@ -1015,7 +1001,7 @@ class SwordTrialVoteModal(Modal, title="Vote: Sword Trial"):
                         selections.append({"time": self.fri_select.values[0]})
                     else:
                         selections.append(None)
-                    polls[self.poll_id]["selections"][user_id_str]["Sword Trial"] = selections
+                    votes["Sword Trial"] = selections
 
                 # Save Sword Trial Echo (Mon)
                 if hasattr(self, 'mon_select'):
@@ -1024,11 +1010,11 @@ class SwordTrialVoteModal(Modal, title="Vote: Sword Trial"):
                         selections.append({"time": self.mon_select.values[0]})
                     else:
                         selections.append(None)
-                    polls[self.poll_id]["selections"][user_id_str]["Sword Trial (Echo)"] = selections
+                    votes["Sword Trial (Echo)"] = selections
 
-                poll_data = polls[self.poll_id]
+                self.cog._set_user_votes(polls[self.poll_id], user_id_str, votes)
 
-            await self.cog._update_poll_message(self.guild_id, self.poll_id, poll_data)
+            await self.cog._queue_poll_update(self.guild_id, self.poll_id)
 
         except Exception as e:
             log.error(f"Error in SwordTrialVoteModal.on_submit: {e}", exc_info=True)
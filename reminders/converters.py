@@ -122,7 +122,7 @@ class TimeConverter(commands.Converter):
     ]:
         cog = ctx.bot.get_cog("Reminders")
         utc_now = datetime.datetime.now(tz=datetime.timezone.utc).replace(second=0, microsecond=0)
-        timezone = await cog.config.user(ctx.author).timezone()
+        timezone = await cog.get_user_timezone(ctx.author.id)
         if timezone is None:
             if (timezone_cog := ctx.bot.get_cog("Timezone")) is not None:
                 try:
@@ -130,7 +130,7 @@ class TimeConverter(commands.Converter):
                 except AttributeError:
                     pass
             if timezone is not None:
-                await cog.config.user(ctx.author).timezone.set(timezone)
+                await cog.set_user_timezone(ctx.author.id, timezone)
             else:
                 timezone = "UTC"
         tz = pytz.timezone(timezone)
@@ -537,7 +537,7 @@ class ContentConverter(commands.Converter):  # no longer used
 class ExistingReminderConverter(commands.Converter):
     async def convert(self, ctx: commands.Context, argument: str) -> typing.Any:
         cog = ctx.bot.get_cog("Reminders")
-        if ctx.author.id not in cog.cache or not (reminders := cog.cache[ctx.author.id]):
+        if not (reminders := await cog.get_user_reminders(ctx.author.id)):
             raise commands.BadArgument(_("You haven't any reminders."))
         if argument == "last":
             return sorted(reminders.values(), key=lambda r: r.created_at)[-1]
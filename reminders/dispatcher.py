@@ -0,0 +1,189 @@
+import typing  # isort:skip
+
+import asyncio
+import datetime
+import heapq
+
+MAX_CONCURRENT_REMINDERS = 10
+# Re-check the wall clock at least this often while sleeping.
+MAX_SLEEP = 60
+
+
+class ReminderEntry:
+    """When a reminder is due next: all that is kept in memory for reminders that aren't loaded."""
+
+    __slots__ = ("expires_at", "user_id", "reminder_id")
+
+    def __init__(self, expires_at: float, user_id: int, reminder_id: int) -> None:
+        self.expires_at: float = expires_at  # POSIX timestamp.
+        self.user_id: int = user_id
+        self.reminder_id: int = reminder_id
+
+    def __lt__(self, other: "ReminderEntry") -> bool:
+        return self.expires_at < other.expires_at
+
+    def __repr__(self) -> str:
+        return f"<ReminderEntry {self.user_id}#{self.reminder_id} at {self.expires_at}>"
+
+
+def index_reminders(
+    all_users: typing.Dict[int, typing.Dict[str, typing.Any]]
+) -> typing.List[ReminderEntry]:
+    """When each stored reminder is due, from `Config.all_users()`, without creating `Reminder` objects."""
+    return [
+        ReminderEntry(int(reminder_data["next_expires_at"]), user_id, int(reminder_id))
+        for user_id, user_data in all_users.items()
+        for reminder_id, reminder_data in user_data.get("reminders", {}).items()
+    ]
+
+
+class ReminderDispatcher:
+    """Sleep until the earliest due reminder instead of scanning every reminder on a fixed interval.
+
+    Reminders are kept as `ReminderEntry` on a heap keyed on `next_expires_at`. The heap is built
+    at load from the stored reminders without creating `Reminder` objects, then updated by
+    `Reminder.save` and `Reminder.delete`. A reminder is only loaded (with the other reminders of
+    its user, see `Reminders.get_user_reminders`) once it is due. Entries are invalidated lazily:
+    an entry is only processed if it is still the latest schedule of the reminder. Due reminders
+    are processed concurrently, at most `max_concurrent` at a time.
+    """
+
+    def __init__(self, cog, max_concurrent: int = MAX_CONCURRENT_REMINDERS) -> None:
+        self.cog = cog
+        self._heap: typing.List[ReminderEntry] = []
+        self._scheduled: typing.Dict[typing.Tuple[int, int], ReminderEntry] = {}
+        self._wake: asyncio.Event = asyncio.Event()
+        self._semaphore: asyncio.BoundedSemaphore = asyncio.BoundedSemaphore(max_concurrent)
+        self._tasks: typing.Set[asyncio.Task] = set()
+        self._task: typing.Optional[asyncio.Task] = None
+
+        self.processed: int = 0
+        self.failed: int = 0
+        self.wakeups: int = 0
+        self.max_delay: float = 0.0
+
+    @staticmethod
+    def now() -> datetime.datetime:
+        return datetime.datetime.now(tz=datetime.timezone.utc)
+
+    @property
+    def scheduled(self) -> int:
+        return len(self._scheduled)
+
+    @property
+    def running(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def next_due(self) -> typing.Optional[datetime.datetime]:
+        if (entry := min(self._scheduled.values(), default=None)) is None:
+            return None
+        return datetime.datetime.fromtimestamp(entry.expires_at, tz=datetime.timezone.utc)
+
+    def schedule(self, reminder) -> None:
+        key = (reminder.user_id, reminder.id)
+        if reminder.next_expires_at is None:
+            self._scheduled.pop(key, None)
+            return
+        expires_at = reminder.next_expires_at.timestamp()
+        if (entry := self._scheduled.get(key)) is not None and entry.expires_at == expires_at:
+            return
+        entry = self._scheduled[key] = ReminderEntry(expires_at, reminder.user_id, reminder.id)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            # New earliest reminder: shorten the current sleep.
+            self._wake.set()
+        if len(self._heap) > 2 * len(self._scheduled) + 64:
+            self._heap = [
+                entry
+                for entry in self._heap
+                if self._scheduled.get((entry.user_id, entry.reminder_id)) is entry
+            ]
+            heapq.heapify(self._heap)
+
+    def unschedule(self, reminder) -> None:
+        self._scheduled.pop((reminder.user_id, reminder.id), None)
+
+    def start(self, entries: typing.Iterable[ReminderEntry] = ()) -> None:
+        """Start dispatching, with the stored reminders that aren't loaded yet."""
+        entries = sorted(entries)  # A sorted list is a valid heap.
+        for entry in entries:
+            self._scheduled.setdefault((entry.user_id, entry.reminder_id), entry)
+        if self._heap:
+            entries.extend(self._heap)
+            heapq.heapify(entries)
+        self._heap = entries
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _pop_due(self, timestamp: float) -> typing.Iterator[ReminderEntry]:
+        while self._heap and self._heap[0].expires_at <= timestamp:
+            entry = heapq.heappop(self._heap)
+            key = (entry.user_id, entry.reminder_id)
+            if self._scheduled.get(key) is not entry:
+                continue  # Rescheduled or deleted since.
+            del self._scheduled[key]
+            yield entry
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            utc_now = self.now()
+            for entry in self._pop_due(utc_now.timestamp()):
+                await self._semaphore.acquire()
+                task = asyncio.create_task(self._process(entry, utc_now))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            timeout = MAX_SLEEP
+            if self._heap:
+                timeout = min(
+                    MAX_SLEEP, max(0.0, self._heap[0].expires_at - self.now().timestamp())
+                )
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+    async def _process(self, entry: ReminderEntry, utc_now: datetime.datetime) -> None:
+        reminders, reminder = {}, None
+        try:
+            self.max_delay = max(self.max_delay, self.now().timestamp() - entry.expires_at)
+            reminders = await self.cog.get_user_reminders(entry.user_id)
+            if (reminder := reminders.get(entry.reminder_id)) is None:
+                return  # Removed without `Reminder.delete` (user data deletion...).
+            try:
+                await reminder.process(utc_now=utc_now)
+                self.processed += 1
+            except RuntimeError as e:
+                self.failed += 1
+                self.cog.logger.error(str(e), exc_info=e)
+        except Exception as e:
+            self.failed += 1
+            self.cog.logger.error(
+                f"Unexpected error while processing the reminder {entry.user_id}#{entry.reminder_id}.",
+                exc_info=e,
+            )
+        finally:
+            try:
+                # A reminder that didn't reschedule itself is over, even if processing it failed:
+                # otherwise it would fire again on every restart.
+                if (
+                    reminder is not None
+                    and reminder.next_expires_at is None
+                    and reminders.get(reminder.id) is reminder
+                ):
+                    await reminder.delete(batch=True)
+            except Exception as e:
+                self.cog.logger.error(
+                    f"Unexpected error while deleting the reminder {entry.user_id}#{entry.reminder_id}.",
+                    exc_info=e,
+                )
+            finally:
+                self._semaphore.release()
@@ -0,0 +1,144 @@
+import typing  # isort:skip
+
+import asyncio
+import collections
+
+# Batched writes are flushed at most this many seconds after the first one.
+FLUSH_DELAY = 5
+# ... or as soon as this many reminders are waiting.
+MAX_PENDING = 500
+
+
+class ReminderWriter:
+    """Coalesce the reminder writes of the delivery hot path and flush them to Config in bulk.
+
+    `queue_save` and `queue_delete` only record the latest state of a reminder; repeated changes
+    of the same reminder collapse into one write. A flush writes each user's changes with a single
+    Config round trip. Changes are only dropped from the dirty set once written (a failed flush is
+    retried on the next one), and everything is flushed on cog unload. A crash can therefore only
+    lose the last `FLUSH_DELAY` seconds of reschedules: those occurrences are delivered again on
+    restart, never skipped.
+
+    User-initiated changes go through `write` instead, which is durable before it returns and
+    supersedes anything still pending for that reminder.
+    """
+
+    def __init__(self, cog, flush_delay: float = FLUSH_DELAY) -> None:
+        self.cog = cog
+        self.flush_delay: float = flush_delay
+        # (user_id, reminder_id) -> JSON data, or None to delete the reminder.
+        self._pending: typing.Dict[typing.Tuple[int, int], typing.Optional[dict]] = {}
+        # Delivered reminders not yet added to `total_sent`.
+        self._sent: int = 0
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._full: asyncio.Event = asyncio.Event()
+        self._flush_task: typing.Optional[asyncio.Task] = None
+
+        self.queued: int = 0
+        self.written: int = 0
+        self.flushes: int = 0
+        self.round_trips: int = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def count_sent(self) -> None:
+        self._sent += 1
+        self._start_flush_task()
+
+    def queue_save(self, reminder) -> None:
+        self._queue((reminder.user_id, reminder.id), reminder.to_json())
+
+    def queue_delete(self, reminder) -> None:
+        self._queue((reminder.user_id, reminder.id), None)
+
+    def _queue(self, key: typing.Tuple[int, int], data: typing.Optional[dict]) -> None:
+        self._pending[key] = data
+        self.queued += 1
+        self._start_flush_task()
+        if len(self._pending) >= MAX_PENDING:
+            self._full.set()
+
+    def _start_flush_task(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        while self._pending or self._sent:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_delay)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            try:
+                # Shielded, so that `close` never interrupts a flush in the middle of a write.
+                await asyncio.shield(self.flush())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.cog.logger.error("Error while saving the reminders.", exc_info=e)
+
+    async def discard(self, user_id: int) -> None:
+        """Drop the pending changes of a user whose reminders are about to be cleared."""
+        async with self._lock:  # A running flush could write them back otherwise.
+            for key in [key for key in self._pending if key[0] == user_id]:
+                del self._pending[key]
+
+    async def write(self, reminder, delete: bool = False) -> None:
+        async with self._lock:
+            self._pending.pop((reminder.user_id, reminder.id), None)
+            self.round_trips += 1
+            if delete:
+                await self.cog.config.user_from_id(reminder.user_id).clear_raw(
+                    "reminders", reminder.id
+                )
+            else:
+                await self.cog.config.user_from_id(reminder.user_id).set_raw(
+                    "reminders", reminder.id, value=reminder.to_json()
+                )
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if self._sent:
+                sent, self._sent = self._sent, 0
+                try:
+                    self.round_trips += 1
+                    await self.cog.config.total_sent.set(await self.cog.config.total_sent() + sent)
+                except Exception:
+                    self._sent += sent
+                    raise
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            by_user: typing.DefaultDict[
+                int, typing.Dict[int, typing.Optional[dict]]
+            ] = collections.defaultdict(dict)
+            for (user_id, reminder_id), data in pending.items():
+                by_user[user_id][reminder_id] = data
+            self.flushes += 1
+            error = None
+            for user_id, changes in by_user.items():
+                try:
+                    self.round_trips += 1
+                    async with self.cog.config.user_from_id(user_id).reminders() as reminders:
+                        for reminder_id, data in changes.items():
+                            if data is None:
+                                reminders.pop(str(reminder_id), None)
+                            else:
+                                reminders[str(reminder_id)] = data
+                except Exception as e:
+                    # Keep them for the next flush, unless they have changed since.
+                    for reminder_id, data in changes.items():
+                        self._pending.setdefault((user_id, reminder_id), data)
+                    error = e
+                else:
+                    self.written += len(changes)
+            if error is not None:
+                raise error
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
@@ -1,4 +1,4 @@
-from AAA3A_utils import Cog, CogsUtils, Loop, Settings, Menu  # isort:skip
+from AAA3A_utils import Cog, CogsUtils, Settings, Menu  # isort:skip
 from redbot.core import commands, app_commands, Config  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
@@ -22,6 +22,8 @@ from .converters import (
     TimezoneConverter,
 )  # NOQA
 from .dashboard_integration import DashboardIntegration
+from .dispatcher import ReminderDispatcher, index_reminders
+from .persistence import ReminderWriter
 from .types import Content, Reminder, Repeat, RepeatRule
 from .views import ReminderView
 
@@ -100,7 +102,11 @@ class Reminders(DashboardIntegration, Cog):
             reminders={},
         )
 
+        # Users whose reminders have been loaded, see `get_user_reminders`.
         self.cache: typing.Dict[int, typing.Dict[int, Reminder]] = {}
+        self.dispatcher: ReminderDispatcher = ReminderDispatcher(cog=self)
+        self.writer: ReminderWriter = ReminderWriter(cog=self)
+        self.timezones: typing.Dict[int, typing.Optional[str]] = {}
 
         _settings: typing.Dict[
             str, typing.Dict[str, typing.Union[typing.List[str], bool, str]]
@@ -136,7 +142,7 @@ class Reminders(DashboardIntegration, Cog):
             },
             "seconds_allowed": {
                 "converter": bool,
-                "description": "Check reminders every 30 seconds instead of every 1 minute, to allow reminders with precise duration.",
+                "description": "Allow reminders with precise duration (to the second).",
             },
             "replies": {
                 "converter": bool,
@@ -164,30 +170,16 @@ class Reminders(DashboardIntegration, Cog):
         await super().cog_load()
         await self.settings.add_commands()
         self.bot.tree.add_command(remind_message_context_menu)
-        all_reminders = await self.config.all_users()
-        for user_id in all_reminders:
-            for reminder_id, reminder_data in all_reminders[user_id].get("reminders", {}).items():
-                try:
-                    reminder = Reminder.from_json(cog=self, user_id=user_id, data=reminder_data)
-                except OSError:
-                    await self.config.user_from_id(user_id).clear_raw("reminders", reminder_id)
-                    continue
-                if user_id not in self.cache:
-                    self.cache[user_id] = {}
-                self.cache[user_id][int(reminder_id)] = reminder
-        seconds_allowed = await self.config.seconds_allowed()
-        self.loops.append(
-            Loop(
-                cog=self,
-                name="Check Reminders",
-                function=self.reminders_loop,
-                minutes=0 if seconds_allowed else 1,
-                seconds=30 if seconds_allowed else 0,
-            )
-        )
+        all_users = await self.config.all_users()
+        for user_id, user_data in all_users.items():
+            self.timezones[user_id] = user_data.get("timezone")
+        # Only index when each reminder is due: `Reminder` objects are created on demand.
+        self.dispatcher.start(index_reminders(all_users))
 
     async def cog_unload(self) -> None:
         self.bot.tree.remove_command(remind_message_context_menu.name)
+        await self.dispatcher.stop()
+        await self.writer.close()
         await super().cog_unload()
 
     async def red_delete_data_for_user(
@@ -203,8 +195,36 @@ class Reminders(DashboardIntegration, Cog):
             del self.cache[user_id]
         except KeyError:
             pass
+        self.timezones.pop(user_id, None)
+        await self.writer.discard(user_id)
         await self.config.user_from_id(user_id).clear()
 
+    async def get_user_reminders(self, user_id: int) -> typing.Dict[int, Reminder]:
+        """Get the reminders of a user, loading them from the config the first time."""
+        if (reminders := self.cache.get(user_id)) is not None:
+            return reminders
+        reminders = {}
+        for reminder_id, reminder_data in (
+            await self.config.user_from_id(user_id).reminders()
+        ).items():
+            try:
+                reminder = Reminder.from_json(cog=self, user_id=user_id, data=reminder_data)
+            except OSError:
+                await self.config.user_from_id(user_id).clear_raw("reminders", reminder_id)
+                continue
+            reminders[int(reminder_id)] = reminder
+        # Loaded concurrently by someone else in the meantime?
+        return self.cache.setdefault(user_id, reminders)
+
+    async def get_user_timezone(self, user_id: int) -> typing.Optional[str]:
+        if user_id not in self.timezones:
+            self.timezones[user_id] = await self.config.user_from_id(user_id).timezone()
+        return self.timezones[user_id]
+
+    async def set_user_timezone(self, user_id: int, timezone: typing.Optional[str]) -> None:
+        await self.config.user_from_id(user_id).timezone.set(timezone)
+        self.timezones[user_id] = timezone
+
     async def red_get_data_for_user(self, *, user_id: int) -> typing.Dict[str, io.BytesIO]:
         """Get all data about the user."""
         # sourcery skip: merge-dict-assign
@@ -217,6 +237,7 @@ class Reminders(DashboardIntegration, Cog):
             Config.GUILD: {},
         }
 
+        await self.writer.flush()
         data[Config.USER] = await self.config.user_from_id(user_id).all()
 
         _data = deepcopy(data)
@@ -228,25 +249,6 @@ class Reminders(DashboardIntegration, Cog):
         file = io.BytesIO(str(data).encode(encoding="utf-8"))
         return {f"{self.qualified_name}.json": file}
 
-    async def reminders_loop(self, utc_now: datetime.datetime = None) -> bool:
-        if utc_now is None:
-            utc_now = datetime.datetime.now(tz=datetime.timezone.utc)
-        executed = False
-        cache = {user_id: reminders.copy() for user_id, reminders in self.cache.copy().items()}
-        for reminders in cache.values():
-            for reminder in reminders.values():
-                reminder: Reminder
-                if reminder.next_expires_at is None:
-                    await reminder.delete()
-                    continue
-                if reminder.next_expires_at <= utc_now:
-                    executed = True
-                    try:
-                        await reminder.process(utc_now=utc_now)
-                    except RuntimeError as e:
-                        self.logger.error(str(e), exc_info=e)
-        return executed
-
     async def create_reminder(
         self,
         user_id: int,
@@ -262,7 +264,8 @@ class Reminders(DashboardIntegration, Cog):
         if created_at is None:
             created_at = datetime.datetime.now(tz=datetime.timezone.utc)
         reminder_id = 1
-        while reminder_id in self.cache.get(user_id, {}):
+        reminders = await self.get_user_reminders(user_id)
+        while reminder_id in reminders:
             reminder_id += 1
         reminder_kwargs = dict(
             cog=self,
@@ -309,7 +312,7 @@ class Reminders(DashboardIntegration, Cog):
         config = await self.config.all()
         minimum_user_reminders = config["maximum_user_reminders"]
         if (
-            len(self.cache.get(ctx.author.id, {})) > minimum_user_reminders
+            len(await self.get_user_reminders(ctx.author.id)) > minimum_user_reminders
             and ctx.author.id not in ctx.bot.owner_ids
         ):
             raise commands.UserFeedbackCheckFailure(
@@ -454,7 +457,7 @@ class Reminders(DashboardIntegration, Cog):
         config = await self.config.all()
         minimum_user_reminders = config["maximum_user_reminders"]
         if (
-            len(self.cache.get(ctx.author.id, {})) > minimum_user_reminders
+            len(await self.get_user_reminders(ctx.author.id)) > minimum_user_reminders
             and ctx.author.id not in ctx.bot.owner_ids
         ):
             raise commands.UserFeedbackCheckFailure(
@@ -656,7 +659,7 @@ class Reminders(DashboardIntegration, Cog):
         config = await self.config.all()
         minimum_user_reminders = config["maximum_user_reminders"]
         if (
-            len(self.cache.get(ctx.author.id, {})) > minimum_user_reminders
+            len(await self.get_user_reminders(ctx.author.id)) > minimum_user_reminders
             and ctx.author.id not in ctx.bot.owner_ids
         ):
             raise commands.UserFeedbackCheckFailure(
@@ -774,7 +777,7 @@ class Reminders(DashboardIntegration, Cog):
         config = await self.config.all()
         minimum_user_reminders = config["maximum_user_reminders"]
         if (
-            len(self.cache.get(ctx.author.id, {})) > minimum_user_reminders
+            len(await self.get_user_reminders(ctx.author.id)) > minimum_user_reminders
             and ctx.author.id not in ctx.bot.owner_ids
         ):
             raise commands.UserFeedbackCheckFailure(
@@ -909,7 +912,7 @@ class Reminders(DashboardIntegration, Cog):
         Example: `Europe/Paris`, `America/New_York`...
         You can find a list of valid timezones at: https://timezonedb.com/time-zones.
         """
-        await self.config.user(ctx.author).timezone.set(timezone)
+        await self.set_user_timezone(ctx.author.id, timezone)
         await ctx.send(_("Your timezone has been set to `{timezone}`.").format(timezone=timezone))
 
     @commands.bot_has_permissions(embed_links=True)
@@ -928,7 +931,7 @@ class Reminders(DashboardIntegration, Cog):
         - `created`: Display them in order of creating.
         - `id`: Display them in order of their ID.
         """
-        if ctx.author.id not in self.cache or not (reminders := self.cache[ctx.author.id]):
+        if not (reminders := await self.get_user_reminders(ctx.author.id)):
             raise commands.BadArgument(_("You haven't any reminders."))
         if content_type is not None:
             reminders = {
@@ -1170,7 +1173,7 @@ class Reminders(DashboardIntegration, Cog):
     @reminder.command()
     async def clear(self, ctx: commands.Context, confirmation: bool = False) -> None:
         """Clear all your existing reminders."""
-        if ctx.author.id not in self.cache or not self.cache[ctx.author.id]:
+        if not await self.get_user_reminders(ctx.author.id):
             raise commands.BadArgument(_("You haven't any reminders."))
         if not confirmation and not ctx.assume_yes:
             embed: discord.Embed = discord.Embed()
@@ -1182,6 +1185,7 @@ class Reminders(DashboardIntegration, Cog):
             ):
                 await CogsUtils.delete_message(ctx.message)
                 return
+        await self.writer.discard(ctx.author.id)
         await self.config.user(ctx.author).reminders.clear()
         try:
             del self.cache[ctx.author.id]
@@ -1204,7 +1208,7 @@ class Reminders(DashboardIntegration, Cog):
             __, time, repeat = await TimeConverter().convert(ctx, time)
         except commands.BadArgument as e:
             raise commands.UserFeedbackCheckFailure(str(e))
-        timezone = await self.config.user(ctx.author).timezone() or "UTC"
+        timezone = await self.get_user_timezone(ctx.author.id) or "UTC"
         embeds = []
         for __ in range(repeat_times):
             embed: discord.Embed = discord.Embed(
@@ -1301,7 +1305,7 @@ class Reminders(DashboardIntegration, Cog):
         self, ctx: commands.Context, user: discord.User, confirmation: bool = False
     ) -> None:
         """Clear all existing reminders for a user."""
-        if user.id not in self.cache or not self.cache[user.id]:
+        if not await self.get_user_reminders(user.id):
             raise commands.BadArgument(_("This user haven't any reminders."))
         if not confirmation and not ctx.assume_yes:
             embed: discord.Embed = discord.Embed()
@@ -1315,6 +1319,7 @@ class Reminders(DashboardIntegration, Cog):
             ):
                 await CogsUtils.delete_message(ctx.message)
                 return
+        await self.writer.discard(user.id)
         await self.config.user(user).reminders.clear()
         try:
             del self.cache[user.id]
@@ -1326,6 +1331,31 @@ class Reminders(DashboardIntegration, Cog):
     async def getdebugloopstatus(self, ctx: commands.Context) -> None:
         """Get an embed to check loop status."""
         embeds = [loop.get_debug_embed() for loop in self.loops]
+        dispatcher = self.dispatcher
+        embed: discord.Embed = discord.Embed(
+            title="Reminders Dispatcher", color=await ctx.embed_color()
+        )
+        embed.add_field(name="Scheduled", value=str(dispatcher.scheduled))
+        embed.add_field(name="Running", value=str(dispatcher.running))
+        embed.add_field(
+            name="Next Due",
+            value=(
+                f"<t:{int(next_due.timestamp())}:R>"
+                if (next_due := dispatcher.next_due) is not None
+                else "None"
+            ),
+        )
+        embed.add_field(name="Processed", value=f"{dispatcher.processed} ({dispatcher.failed} failed)")
+        embed.add_field(name="Wake-ups", value=str(dispatcher.wakeups))
+        embed.add_field(name="Max Delay", value=f"{dispatcher.max_delay:.2f}s")
+        writer = self.writer
+        embed.add_field(
+            name="Batched Writes",
+            value=f"{writer.queued} queued, {writer.written} written in {writer.flushes} flushes, {writer.pending} pending",
+            inline=False,
+        )
+        embed.add_field(name="Config Writes", value=str(writer.round_trips))
+        embeds.insert(0, embed)
         await Menu(pages=embeds).start(ctx)
 
     @configuration.command(aliases=["migratefrompcx"])
@@ -1362,7 +1392,7 @@ class Reminders(DashboardIntegration, Cog):
                     ctx.bot.get_user(int(user_id)) is not None
                     and reminder_data["expires"] >= utc_now_timestamp
                 ):
-                    while reminder_id in self.cache.get(int(user_id), {}):
+                    while reminder_id in await self.get_user_reminders(int(user_id)):
                         reminder_id += 1
                     reminder = Reminder(
                         cog=self,
@@ -1416,9 +1446,9 @@ class Reminders(DashboardIntegration, Cog):
             for __, reminder_data in old_guilds_data[guild_id].get("tasks", {}).items():
                 user_id = reminder_data["author_id"]
                 if ctx.bot.get_user(user_id) is not None:
-                    while reminder_id in self.cache.get(user_id, {}):
+                    while reminder_id in await self.get_user_reminders(user_id):
                         reminder_id += 1
-                    timezone = await self.config.user_from_id(user_id).timezone()
+                    timezone = await self.get_user_timezone(user_id)
                     triggers = []
                     for trigger in reminder_data["data"]["triggers"]:
                         if trigger["type"] == "interval":
@@ -1457,7 +1487,7 @@ class Reminders(DashboardIntegration, Cog):
                             )
                             if trigger["tzinfo"] and timezone is None:
                                 timezone = trigger["tzinfo"]
-                                await self.config.user_from_id(user_id).timezone.set(timezone)
+                                await self.set_user_timezone(user_id, timezone)
                     repeat = Repeat.from_json(triggers)
                     expires_at = await repeat.next_trigger(
                         last_expires_at=utc_now, utc_now=utc_now, timezone=timezone or "UTC"
@@ -1503,7 +1533,7 @@ class Reminders(DashboardIntegration, Cog):
     async def get_existing_user_reminders_for_assistant(
         self, user: typing.Union[discord.Member, discord.User], *args, **kwargs
     ):
-        if not (reminders := self.cache.get(user.id, {})):
+        if not (reminders := await self.get_user_reminders(user.id)):
             return "This user haven't any reminders."
         reminders = sorted(
             [
@@ -1,5 +1,8 @@
 """Tests for Reminders cog."""
 
+import asyncio
+import datetime
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import sys
@@ -9,6 +12,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from reminders.reminders import Reminders
 
+# Load tests and benchmarks are slow and only print their numbers: run them with RUN_BENCHMARKS=1.
+benchmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="benchmark, set RUN_BENCHMARKS=1 to run"
+)
+
 
 @pytest.mark.asyncio
 class TestRemindersCog:
@@ -37,3 +45,365 @@ class TestRemindersCog:
         assert hasattr(cog, 'remind')
         assert hasattr(cog, 'remindme')
         assert hasattr(cog, 'reminderset')
+
+
+class FakeReminder:
+    """Minimal stand-in for `Reminder` with the attributes the dispatcher uses."""
+
+    def __init__(self, cog, user_id, reminder_id, next_expires_at, repeat=None):
+        self.cog = cog
+        self.user_id = user_id
+        self.id = reminder_id
+        self.next_expires_at = next_expires_at
+        self.repeat = repeat
+        self.fired = []
+
+    async def save(self, batch=False):
+        self.cog.cache.setdefault(self.user_id, {})[self.id] = self
+        self.cog.dispatcher.schedule(self)
+
+    async def delete(self, batch=False):
+        self.next_expires_at = None
+        self.cog.dispatcher.unschedule(self)
+        self.cog.cache.get(self.user_id, {}).pop(self.id, None)
+
+    async def process(self, utc_now):
+        self.fired.append(utc_now)
+        if self.repeat is not None:
+            self.next_expires_at += self.repeat
+            await self.save()
+        else:
+            self.next_expires_at = None
+
+
+@pytest.mark.asyncio
+class TestReminderDispatcher:
+    """Test suite for the heap-based reminder dispatcher."""
+
+    @pytest.fixture
+    def cog(self):
+        from reminders.dispatcher import ReminderDispatcher
+
+        cog = MagicMock()
+        cog.cache = {}
+
+        async def get_user_reminders(user_id):
+            return cog.cache.setdefault(user_id, {})
+
+        cog.get_user_reminders = get_user_reminders
+        cog.dispatcher = ReminderDispatcher(cog, max_concurrent=2)
+        yield cog
+
+    async def test_due_reminders_fire_once(self, cog):
+        """Test that due reminders are processed once and then removed."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        reminders = [FakeReminder(cog, 1, i, now + datetime.timedelta(seconds=0.1)) for i in range(5)]
+        for reminder in reminders:
+            await reminder.save()
+        cog.dispatcher.start()
+        await asyncio.sleep(0.5)
+        await cog.dispatcher.stop()
+        assert all(len(reminder.fired) == 1 for reminder in reminders)
+        assert not cog.cache[1]
+        assert cog.dispatcher.scheduled == 0
+
+    async def test_reschedule_and_delete(self, cog):
+        """Test that saving reschedules a reminder and deleting drops it."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        repeating = FakeReminder(cog, 1, 1, now, repeat=datetime.timedelta(seconds=0.2))
+        deleted = FakeReminder(cog, 2, 1, now + datetime.timedelta(seconds=0.1))
+        await repeating.save()
+        await deleted.save()
+        cog.dispatcher.start()
+        await deleted.delete()
+        await asyncio.sleep(0.5)
+        await cog.dispatcher.stop()
+        assert len(repeating.fired) >= 2
+        assert not deleted.fired
+        assert cog.dispatcher.scheduled == 1
+
+    async def test_earlier_reminder_wakes_dispatcher(self, cog):
+        """Test that a reminder saved while sleeping is delivered on time."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        await FakeReminder(cog, 1, 1, now + datetime.timedelta(hours=1)).save()
+        cog.dispatcher.start()
+        await asyncio.sleep(0)
+        soon = FakeReminder(cog, 1, 2, now + datetime.timedelta(seconds=0.1))
+        await soon.save()
+        await asyncio.sleep(0.3)
+        await cog.dispatcher.stop()
+        assert len(soon.fired) == 1
+
+    async def test_failed_reminder_is_deleted(self, cog):
+        """Test that a reminder that is over is deleted even if processing it raised."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        reminder = FakeReminder(cog, 1, 1, now)
+
+        async def process(utc_now):
+            reminder.next_expires_at = None
+            raise AttributeError("'NoneType' object has no attribute 'timestamp'")
+
+        reminder.process = process
+        await reminder.save()
+        cog.dispatcher.start()
+        await asyncio.sleep(0.1)
+        await cog.dispatcher.stop()
+        assert not cog.cache[1]
+        assert cog.dispatcher.failed == 1
+
+    async def test_repeat_ends(self, cog):
+        """Test that a repeating reminder is delivered one last time, then deleted, when its repeat ends."""
+        from reminders.types import Reminder, Repeat
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        cog.views = {}
+        cog.writer.write = AsyncMock()
+        cog.get_user_timezone = AsyncMock(return_value="UTC")
+        cog.bot.get_user.return_value.create_dm = AsyncMock()
+        reminder = Reminder(
+            cog=cog,
+            user_id=1,
+            id=1,
+            jump_url=None,
+            snooze=False,
+            me_too=False,
+            content={"type": "event", "event_name": "reminder_test", "args": [], "kwargs": {}},
+            destination=None,
+            targets=None,
+            created_at=now,
+            expires_at=now,
+            last_expires_at=None,
+            next_expires_at=now,
+            repeat=Repeat(rules=[]),  # No rule triggers again.
+        )
+        await reminder.save()
+        cog.dispatcher.start()
+        await asyncio.sleep(0.1)
+        await cog.dispatcher.stop()
+        cog.bot.dispatch.assert_called_once_with("reminder_test", reminder)
+        assert reminder.next_expires_at is None
+        assert not cog.cache[1]
+        cog.writer.queue_save.assert_not_called()
+        cog.writer.queue_delete.assert_called_with(reminder)
+        assert cog.dispatcher.processed == 1 and cog.dispatcher.scheduled == 0
+
+
+class FakeValue:
+    """Config value with a fixed latency per round trip."""
+
+    def __init__(self, config, data, key):
+        self.config = config
+        self.data = data
+        self.key = key
+
+    async def __call__(self):
+        await self.config.round_trip()
+        return self.data.get(self.key)
+
+    async def set(self, value):
+        await self.config.round_trip()
+        self.data[self.key] = value
+
+
+class FakeRemindersValue(FakeValue):
+    def __call__(self):
+        value = self
+
+        class _Context:
+            def __await__(self):
+                return FakeValue.__call__(value).__await__()
+
+            async def __aenter__(self):
+                await value.config.round_trip()
+                return value.data.setdefault(value.key, {})
+
+            async def __aexit__(self, *args):
+                await value.config.round_trip()
+
+        return _Context()
+
+
+class FakeUserGroup:
+    def __init__(self, config, user_id):
+        self.config = config
+        self.data = config.users.setdefault(user_id, {"timezone": None, "reminders": {}})
+        self.timezone = FakeValue(config, self.data, "timezone")
+        self.reminders = FakeRemindersValue(config, self.data, "reminders")
+
+    async def set_raw(self, *keys, value):
+        await self.config.round_trip()
+        self.data["reminders"][str(keys[1])] = value
+
+    async def clear_raw(self, *keys):
+        await self.config.round_trip()
+        self.data["reminders"].pop(str(keys[1]), None)
+
+
+class FakeConfig:
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self.users = {}
+        self.globals = {"total_sent": 0}
+        self.total_sent = FakeValue(self, self.globals, "total_sent")
+
+    async def round_trip(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+
+    def user_from_id(self, user_id):
+        return FakeUserGroup(self, user_id)
+
+
+@benchmark
+@pytest.mark.asyncio
+class TestReminderPersistenceLoad:
+    """Load test: a repeating reminder firing for many users at the same minute."""
+
+    USERS = 300
+    LATENCY = 0.002
+
+    async def test_delivery_rate(self):
+        from reminders.dispatcher import ReminderDispatcher
+        from reminders.persistence import ReminderWriter
+        from reminders.reminders import Reminders
+        from reminders.types import Reminder, Repeat, RepeatRule
+
+        class Cog:
+            get_user_reminders = Reminders.get_user_reminders
+            get_user_timezone = Reminders.get_user_timezone
+
+        cog = Cog()
+        cog.config = FakeConfig(latency=self.LATENCY)
+        cog.bot = MagicMock()
+        cog.bot.get_user.return_value.create_dm = AsyncMock()
+        cog.logger = MagicMock()
+        cog.views = {}
+        cog.cache = {}
+        cog.timezones = {}
+        cog.dispatcher = ReminderDispatcher(cog, max_concurrent=10)
+        cog.writer = ReminderWriter(cog, flush_delay=60)
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc).replace(microsecond=0)
+        for user_id in range(self.USERS):
+            await Reminder(
+                cog=cog,
+                user_id=user_id,
+                id=1,
+                jump_url=None,
+                snooze=False,
+                me_too=False,
+                content={"type": "event", "event_name": "load_test", "args": [], "kwargs": {}},
+                destination=None,
+                targets=None,
+                created_at=now,
+                expires_at=now,
+                last_expires_at=None,
+                next_expires_at=now,
+                repeat=Repeat(
+                    rules=[
+                        RepeatRule(
+                            type="sample",
+                            value={"minutes": 1},
+                            start_trigger=None,
+                            first_trigger=None,
+                            last_trigger=None,
+                        )
+                    ]
+                ),
+            ).save()
+        cog.config.calls = 0
+
+        start = asyncio.get_running_loop().time()
+        cog.dispatcher.start()
+        while cog.bot.dispatch.call_count < self.USERS:
+            await asyncio.sleep(0.01)
+        elapsed = asyncio.get_running_loop().time() - start
+        hot_path_calls = cog.config.calls
+        await cog.dispatcher.stop()
+        await cog.writer.close()
+        print(
+            f"{self.USERS / elapsed:.0f} reminders/s, {hot_path_calls} Config round trips while"
+            f" delivering, {cog.config.calls} in total"
+        )
+
+        # One timezone read per user on the first delivery, no write on the hot path.
+        assert hot_path_calls <= self.USERS
+        assert all(
+            cog.config.users[user_id]["reminders"]["1"]["next_expires_at"] > int(now.timestamp())
+            for user_id in range(self.USERS)
+        )
+        # Delivered again: the timezones are cached now.
+        cog.config.calls = 0
+        for reminders in cog.cache.values():
+            await reminders[1].process()
+        assert cog.config.calls == 0
+        await cog.writer.close()
+
+
+@benchmark
+class TestReminderStartup:
+    """Startup benchmark: indexing 100k stored reminders versus loading them all."""
+
+    USERS = 20_000
+    REMINDERS_PER_USER = 5
+
+    def all_users(self):
+        now = int(datetime.datetime.now(tz=datetime.timezone.utc).timestamp())
+        return {
+            user_id: {
+                "timezone": None,
+                "reminders": {
+                    str(reminder_id): {
+                        "id": reminder_id,
+                        "jump_url": "https://discord.com/channels/0/0/0",
+                        "content": {"type": "text", "text": f"Reminder {user_id}#{reminder_id}"},
+                        "created_at": now,
+                        "expires_at": now + user_id * 60 + reminder_id,
+                        "next_expires_at": now + user_id * 60 + reminder_id,
+                    }
+                    for reminder_id in range(1, self.REMINDERS_PER_USER + 1)
+                },
+            }
+            for user_id in range(self.USERS)
+        }
+
+    def measure(self, load):
+        import time
+        import tracemalloc
+
+        all_users = self.all_users()
+        tracemalloc.start()
+        start = time.perf_counter()
+        loaded = load(all_users)
+        elapsed = time.perf_counter() - start
+        del all_users
+        retained, __ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return loaded, elapsed, retained
+
+    def test_startup_index(self):
+        from reminders.dispatcher import index_reminders
+        from reminders.types import Reminder
+
+        def load_all(all_users):
+            cache = {}
+            for user_id, user_data in all_users.items():
+                for reminder_id, reminder_data in user_data["reminders"].items():
+                    cache.setdefault(user_id, {})[int(reminder_id)] = Reminder.from_json(
+                        cog=None, user_id=user_id, data=reminder_data
+                    )
+            return cache
+
+        total = self.USERS * self.REMINDERS_PER_USER
+        cache, eager_time, eager_memory = self.measure(load_all)
+        assert sum(len(reminders) for reminders in cache.values()) == total
+        del cache
+        # What `Reminders.cog_load` hands to the dispatcher.
+        entries, index_time, index_memory = self.measure(index_reminders)
+        assert len({(entry.user_id, entry.reminder_id) for entry in entries}) == total
+        print(
+            f"{total} reminders: loading all {eager_time:.2f}s / {eager_memory / 2**20:.1f} MiB,"
+            f" index {index_time:.2f}s / {index_memory / 2**20:.1f} MiB"
+        )
+        assert index_memory < eager_memory / 2
@@ -572,15 +572,17 @@ class Reminder:
             jump_url=self.jump_url,
         )
 
-    async def save(self) -> None:
-        if self.user_id not in self.cog.cache:
-            self.cog.cache[self.user_id] = {}
-        self.cog.cache[self.user_id][self.id] = self
-        data = self.to_json()
-        await self.cog.config.user_from_id(self.user_id).set_raw("reminders", self.id, value=data)
+    async def save(self, batch: bool = False) -> None:
+        """`batch`: Only queue the write, for the delivery hot path (see `ReminderWriter`)."""
+        (await self.cog.get_user_reminders(self.user_id))[self.id] = self
+        self.cog.dispatcher.schedule(self)
+        if batch:
+            self.cog.writer.queue_save(self)
+        else:
+            await self.cog.writer.write(self)
         return self
 
-    async def delete(self) -> None:
+    async def delete(self, batch: bool = False) -> None:
         for view in self.cog.views.values():
             if (
                 isinstance(view, (ReminderView, RepeatView))
@@ -590,11 +592,15 @@ class Reminder:
                 await view.on_timeout()
                 view.stop()
         self.next_expires_at = None
+        self.cog.dispatcher.unschedule(self)
         try:
             del self.cog.cache[self.user_id][self.id]
         except KeyError:
             pass
-        await self.cog.config.user_from_id(self.user_id).clear_raw("reminders", self.id)
+        if batch:
+            self.cog.writer.queue_delete(self)
+        else:
+            await self.cog.writer.write(self, delete=True)
 
     def substitute_variables(self, text: str) -> str:
         """Substitute variables in reminder text with their values.
@@ -719,12 +725,15 @@ class Reminder:
             utc_now = datetime.datetime.now(tz=datetime.timezone.utc)
         if not testing:
             self.last_expires_at = self.next_expires_at
-            timezone = (await self.cog.config.user_from_id(self.user_id).timezone()) or "UTC"
+            timezone = (await self.cog.get_user_timezone(self.user_id)) or "UTC"
             if self.repeat is not None:
                 self.next_expires_at = await self.repeat.next_trigger(
                     last_expires_at=self.last_expires_at, utc_now=utc_now, timezone=timezone
                 )
-                await self.save()
+                if self.next_expires_at is not None:
+                    await self.save(batch=True)
+                else:  # The repeat has ended.
+                    await self.delete(batch=True)
             else:
                 self.next_expires_at = None
         if (user := self.cog.bot.get_user(self.user_id)) is None:
@@ -938,11 +947,9 @@ class Reminder:
                 raise RuntimeError(
                     f"The message was not sent correctly for the reminder {self.user_id}#{self.id}@{self.content['type']}. The reminder has been deleted."
                 )
-            total_sent = await self.cog.config.total_sent()
-            total_sent += 1
-            await self.cog.config.total_sent.set(total_sent)
+            self.cog.writer.count_sent()
             if self.next_expires_at is None and not testing:
-                await self.delete()
+                await self.delete(batch=True)
             return (
                 (context if self.content["type"] == "command" else message)
                 if self.content["type"] != "event"
@@ -214,7 +214,7 @@ class ReminderView(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ) -> None:
         timezone = pytz.timezone(
-            await self.cog.config.user_from_id(self.reminder.user_id).timezone() or "UTC"
+            await self.cog.get_user_timezone(self.reminder.user_id) or "UTC"
         )
         await interaction.response.send_modal(EditReminderModal(self, timezone=timezone))
 
@@ -259,7 +259,8 @@ class ReminderView(discord.ui.View):
             )
             return
         reminder_id = 1
-        while reminder_id in self.cog.cache.get(interaction.user.id, {}):
+        reminders = await self.cog.get_user_reminders(interaction.user.id)
+        while reminder_id in reminders:
             reminder_id += 1
         utc_now = datetime.datetime.now(tz=datetime.timezone.utc)
         reminder = self.cog.Reminder(
@@ -594,7 +595,8 @@ class SnoozeView(discord.ui.View):
         self, interaction: discord.Interaction, timedelta: dateutil.relativedelta.relativedelta
     ) -> typing.Any:
         reminder_id = 1
-        while reminder_id in self.cog.cache.get(self.reminder.user_id, {}):
+        reminders = await self.cog.get_user_reminders(self.reminder.user_id)
+        while reminder_id in reminders:
             reminder_id += 1
         utc_now = datetime.datetime.now(tz=datetime.timezone.utc)
         expires_at = utc_now + timedelta
@@ -674,7 +676,7 @@ class SnoozeView(discord.ui.View):
         row=1,
     )
     async def tomorrow(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        timezone = (await self.cog.config.user_from_id(self.reminder.user_id).timezone()) or "UTC"
+        timezone = (await self.cog.get_user_timezone(self.reminder.user_id)) or "UTC"
         tz = pytz.timezone(timezone)
         now = datetime.datetime.now(tz=tz)
         tomorrow = (now + dateutil.relativedelta.relativedelta(days=1)).replace(
@@ -691,7 +693,7 @@ class SnoozeView(discord.ui.View):
         row=1,
     )
     async def monday(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        timezone = (await self.cog.config.user_from_id(self.reminder.user_id).timezone()) or "UTC"
+        timezone = (await self.cog.get_user_timezone(self.reminder.user_id)) or "UTC"
         tz = pytz.timezone(timezone)
         now = datetime.datetime.now(tz=tz)
         next_monday = now + dateutil.relativedelta.relativedelta(days=(7 - now.weekday()))